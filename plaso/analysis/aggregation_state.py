@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""State of the values aggregated by an analysis plugin."""
+
+from __future__ import unicode_literals
+
+import collections
+import pickle
+import sqlite3
+
+from plaso.analysis import temporary_state
+
+
+class AggregationState(temporary_state.TemporaryDatabaseState):
+  """State of the values aggregated by an analysis plugin.
+
+  The state consists of named sets, counters and groups. A set contains
+  distinct values, a counter contains a count per key and a group contains
+  the values added per key. Keys and set values must be integers or strings,
+  the values of a group can be any object that can be pickled.
+
+  The state is kept in memory up to a maximum number of values, after which
+  it is written to a temporary SQLite database, which SQLite removes when it
+  is closed, so that the memory usage of an analysis plugin does not grow
+  with the number of events.
+  """
+
+  _CREATE_TABLE_QUERIES = [
+      'CREATE TABLE set_values (name TEXT, value, PRIMARY KEY (name, value))',
+      ('CREATE TABLE counter_values (name TEXT, key, count INTEGER, '
+       'PRIMARY KEY (name, key))'),
+      'CREATE TABLE group_keys (name TEXT, key, PRIMARY KEY (name, key))',
+      'CREATE TABLE group_values (name TEXT, key, value BLOB)',
+      'CREATE INDEX group_values_name_key ON group_values (name, key)']
+
+  _SELECT_COUNTER_VALUES_QUERY = (
+      'SELECT key, count FROM counter_values WHERE name = ? ORDER BY key')
+
+  _SELECT_GROUP_VALUES_QUERY = (
+      'SELECT group_keys.key, group_values.value FROM group_keys '
+      'JOIN group_values ON group_values.name = group_keys.name '
+      'AND group_values.key = group_keys.key '
+      'WHERE group_keys.name = ? '
+      'ORDER BY group_keys.rowid, group_values.rowid')
+
+  _SELECT_SET_VALUES_QUERY = (
+      'SELECT value FROM set_values WHERE name = ? ORDER BY value')
+
+  DEFAULT_MAXIMUM_NUMBER_OF_BUFFERED_VALUES = 100000
+
+  def __init__(
+      self, maximum_number_of_buffered_values=(
+          DEFAULT_MAXIMUM_NUMBER_OF_BUFFERED_VALUES)):
+    """Initializes the state of the values aggregated by an analysis plugin.
+
+    Args:
+      maximum_number_of_buffered_values (Optional[int]): maximum number of
+          values that are buffered in memory before they are written to the
+          database.
+    """
+    super(AggregationState, self).__init__()
+    self._counters = {}
+    self._groups = {}
+    self._maximum_number_of_buffered_values = (
+        maximum_number_of_buffered_values)
+    self._number_of_buffered_values = 0
+    self._sets = {}
+
+  def _BufferedValueAdded(self):
+    """Accounts for a value added to the buffer.
+
+    The buffered state is written to the database when the maximum number of
+    buffered values is reached.
+    """
+    self._number_of_buffered_values += 1
+    if (self._number_of_buffered_values >=
+        self._maximum_number_of_buffered_values):
+      self.Flush()
+
+  def AddGroupValue(self, group_name, key, value):
+    """Adds a value to a group.
+
+    Args:
+      group_name (str): name of the group.
+      key (int|str): key of the values in the group.
+      value (object): value to add, which must be possible to pickle.
+    """
+    group = self._groups.get(group_name, None)
+    if group is None:
+      group = collections.OrderedDict()
+      self._groups[group_name] = group
+
+    group.setdefault(key, []).append(value)
+    self._BufferedValueAdded()
+
+  def AddSetValue(self, set_name, value):
+    """Adds a value to a set.
+
+    Args:
+      set_name (str): name of the set.
+      value (int|str): value to add.
+    """
+    values = self._sets.setdefault(set_name, set())
+    if value not in values:
+      values.add(value)
+      self._BufferedValueAdded()
+
+  def Close(self):
+    """Closes the state, which removes the temporary database."""
+    super(AggregationState, self).Close()
+
+    self._counters = {}
+    self._groups = {}
+    self._number_of_buffered_values = 0
+    self._sets = {}
+
+  def Flush(self):
+    """Writes the buffered state to the database."""
+    if not self._number_of_buffered_values:
+      return
+
+    connection = self._GetConnection()
+
+    for set_name, values in self._sets.items():
+      connection.executemany(
+          'INSERT OR IGNORE INTO set_values (name, value) VALUES (?, ?)',
+          [(set_name, value) for value in values])
+
+    for counter_name, counts in self._counters.items():
+      connection.executemany(
+          'INSERT OR IGNORE INTO counter_values (name, key, count) '
+          'VALUES (?, ?, 0)', [(counter_name, key) for key in counts])
+      connection.executemany(
+          'UPDATE counter_values SET count = count + ? '
+          'WHERE name = ? AND key = ?', [
+              (count, counter_name, key) for key, count in counts.items()])
+
+    for group_name, group in self._groups.items():
+      connection.executemany(
+          'INSERT OR IGNORE INTO group_keys (name, key) VALUES (?, ?)',
+          [(group_name, key) for key in group])
+      connection.executemany(
+          'INSERT INTO group_values (name, key, value) VALUES (?, ?, ?)', [
+              (group_name, key, sqlite3.Binary(pickle.dumps(value, protocol=2)))
+              for key, values in group.items() for value in values])
+
+    connection.commit()
+
+    self._counters = {}
+    self._groups = {}
+    self._number_of_buffered_values = 0
+    self._sets = {}
+
+  def GetCounterValues(self, counter_name):
+    """Retrieves the counts of a counter.
+
+    Args:
+      counter_name (str): name of the counter.
+
+    Yields:
+      tuple[int|str, int]: key and count, in ascending order of key.
+    """
+    if not self._connection:
+      counts = self._counters.get(counter_name, {})
+      for key in sorted(counts):
+        yield key, counts[key]
+      return
+
+    self.Flush()
+
+    cursor = self._connection.execute(
+        self._SELECT_COUNTER_VALUES_QUERY, (counter_name, ))
+    for key, count in cursor:
+      yield key, count
+
+  def GetGroups(self, group_name):
+    """Retrieves the values of a group.
+
+    Args:
+      group_name (str): name of the group.
+
+    Yields:
+      tuple[int|str, list[object]]: key and values added with the key, in
+          the order the keys and values were first added.
+    """
+    if not self._connection:
+      for key, values in self._groups.get(group_name, {}).items():
+        yield key, list(values)
+      return
+
+    self.Flush()
+
+    cursor = self._connection.execute(
+        self._SELECT_GROUP_VALUES_QUERY, (group_name, ))
+
+    last_key = None
+    values = []
+    for key, value_data in cursor:
+      if values and key != last_key:
+        yield last_key, values
+        values = []
+
+      last_key = key
+      values.append(pickle.loads(bytes(value_data)))
+
+    if values:
+      yield last_key, values
+
+  def GetSetValues(self, set_name):
+    """Retrieves the values of a set.
+
+    Args:
+      set_name (str): name of the set.
+
+    Yields:
+      int|str: value, in ascending order.
+    """
+    if not self._connection:
+      for value in sorted(self._sets.get(set_name, [])):
+        yield value
+      return
+
+    self.Flush()
+
+    cursor = self._connection.execute(
+        self._SELECT_SET_VALUES_QUERY, (set_name, ))
+    for value, in cursor:
+      yield value
+
+  def IncrementCounter(self, counter_name, key, increment=1):
+    """Increments the count of a key of a counter.
+
+    Args:
+      counter_name (str): name of the counter.
+      key (int|str): key to count.
+      increment (Optional[int]): value to increment the count with.
+    """
+    counts = self._counters.setdefault(counter_name, {})
+    if key in counts:
+      counts[key] += increment
+    else:
+      counts[key] = increment
+      self._BufferedValueAdded()
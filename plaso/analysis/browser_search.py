@@ -39,10 +39,10 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
   _EVENT_TAG_COMMENT = 'Browser Search'
   _EVENT_TAG_LABELS = ['browser_search']
 
-  # TODO: use groups to build a single RE.
-
   # Here we define filters and callback methods for all hits on each filter.
-  _URL_FILTERS = frozenset([
+  # The filters are applied in order, the order determines in which order
+  # the search terms of an URL that matches multiple filters are added.
+  _URL_FILTERS = (
       ('Bing', re.compile(r'bing\.com/search'), '_ExtractSearchQueryFromURL'),
       ('DuckDuckGo', re.compile(r'duckduckgo\.com'),
        '_ExtractDuckDuckGoSearchQuery'),
@@ -63,12 +63,32 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
        '_ExtractYandexSearchQuery'),
       ('Youtube', re.compile(r'youtube\.com'),
        '_ExtractYouTubeSearchQuery'),
-  ])
+  )
+
+  # Single expression that matches if any of the filters matches, so that
+  # URLs that are not search URLs, which are the majority, are only searched
+  # once.
+  _URL_FILTERS_EXPRESSION = re.compile('|'.join([
+      '(?:{0:s})'.format(url_expression.pattern)
+      for _, url_expression, _ in _URL_FILTERS]))
+
+  # Maximum number of URLs of which the search queries are cached.
+  _MAXIMUM_CACHED_URLS = 4096
 
   def __init__(self):
     """Initializes an analysis plugin."""
     super(BrowserSearchPlugin, self).__init__()
     self._counter = collections.Counter()
+    self._search_queries_cache = collections.OrderedDict()
+    self._url_filters = []
+
+    for engine, url_expression, method_name in self._URL_FILTERS:
+      callback_method = getattr(self, method_name, None)
+      if not callback_method:
+        logger.warning('Missing method: {0:s}'.format(method_name))
+        continue
+
+      self._url_filters.append((engine, url_expression, callback_method))
 
     # Store a list of search terms in a timeline format.
     # The format is key = timestamp, value = (source, engine, search term).
@@ -252,6 +272,44 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
 
     return self._GetBetweenQEqualsAndAmpersand(url).replace('+', ' ')
 
+  def _GetSearchQueries(self, url):
+    """Retrieves the search queries of an URL.
+
+    Args:
+      url (str): URL.
+
+    Returns:
+      list[tuple[str, str]]: search engine and decoded search query, per
+          filter that matches the URL.
+    """
+    if not self._URL_FILTERS_EXPRESSION.search(url):
+      return []
+
+    search_queries = self._search_queries_cache.pop(url, None)
+    if search_queries is None:
+      search_queries = []
+      for engine, url_expression, callback_method in self._url_filters:
+        if not url_expression.search(url):
+          continue
+
+        search_query = callback_method(url)
+        if not search_query:
+          logger.warning('Missing search query for URL: {0:s}'.format(url))
+          continue
+
+        search_query = self._DecodeURL(search_query)
+        if search_query:
+          search_queries.append((engine, search_query))
+
+      if len(self._search_queries_cache) >= self._MAXIMUM_CACHED_URLS:
+        self._search_queries_cache.popitem(last=False)
+
+    # Re-insert the search queries so that the cache is ordered by least
+    # recently used.
+    self._search_queries_cache[url] = search_queries
+
+    return search_queries
+
   def _GetBetweenQEqualsAndAmpersand(self, url):
     """Retrieves the substring between the substrings 'q=' and '&'.
 
@@ -321,6 +379,10 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
     if not url:
       return
 
+    search_queries = self._GetSearchQueries(url)
+    if not search_queries:
+      return
+
     # TODO: refactor this the source should be used in formatting only.
     # Check if we are dealing with a web history event.
     source, _ = formatters_manager.FormattersManager.GetSourceStrings(event)
@@ -328,25 +390,7 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
     if source != 'WEBHIST':
       return
 
-    for engine, url_expression, method_name in self._URL_FILTERS:
-      callback_method = getattr(self, method_name, None)
-      if not callback_method:
-        logger.warning('Missing method: {0:s}'.format(callback_method))
-        continue
-
-      match = url_expression.search(url)
-      if not match:
-        continue
-
-      search_query = callback_method(url)
-      if not search_query:
-        logger.warning('Missing search query for URL: {0:s}'.format(url))
-        continue
-
-      search_query = self._DecodeURL(search_query)
-      if not search_query:
-        continue
-
+    for engine, search_query in search_queries:
       event_tag = self._CreateEventTag(
           event, self._EVENT_TAG_COMMENT, self._EVENT_TAG_LABELS)
       mediator.ProduceEventTag(event_tag)
@@ -3,59 +3,88 @@
 
 from __future__ import unicode_literals
 
-import re
-
-import requests
+import os
 
+from plaso.analysis import chrome_extension_resolvers
 from plaso.analysis import interface
-from plaso.analysis import logger
 from plaso.analysis import manager
 from plaso.containers import reports
 
 
 class ChromeExtensionPlugin(interface.AnalysisPlugin):
-  """Convert Chrome extension IDs into names, requires Internet connection."""
+  """Convert Chrome extension IDs into names.
+
+  The names are resolved with a local database of Chrome extensions, an
+  optional persistent cache and, unless disabled, the Chrome Web Store.
+  """
 
   NAME = 'chrome_extension'
 
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
-  _TITLE_RE = re.compile(r'<title>([^<]+)</title>')
-  _WEB_STORE_URL = 'https://chrome.google.com/webstore/detail/{xid}?hl=en-US'
+  # Name of the local database of Chrome extensions in the data location.
+  _DATABASE_FILENAME = 'chrome_extensions.json'
+
+  _WEB_STORE_URL = (
+      chrome_extension_resolvers.WebStoreChromeExtensionResolver.
+      DEFAULT_WEB_STORE_URL)
 
   def __init__(self):
     """Initializes the Chrome extension analysis plugin."""
     super(ChromeExtensionPlugin, self).__init__()
-
-    # Saved list of already looked up extensions.
-    self._extensions = {}
+    self._cache_path = None
+    self._cache_time_to_live = (
+        chrome_extension_resolvers.CachingChromeExtensionResolver.
+        DEFAULT_TIME_TO_LIVE)
+    self._database_path = None
+    self._extension_identifiers_per_user = {}
+    self._network_deadline = (
+        chrome_extension_resolvers.WebStoreChromeExtensionResolver.
+        DEFAULT_DEADLINE)
     self._results = {}
+    self._use_network = True
 
     # TODO: see if these can be moved to arguments passed to ExamineEvent
     # or some kind of state object.
     self._sep = None
 
-  def _GetChromeWebStorePage(self, extension_identifier):
-    """Retrieves the page for the extension from the Chrome store website.
+  def _GetResolvers(self, mediator):
+    """Retrieves the chain of resolvers of the names of extensions.
 
     Args:
-      extension_identifier (str): Chrome extension identifier.
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfvfs.
 
     Returns:
-      str: page content or None.
+      list[ChromeExtensionResolver]: resolvers in the order they are used.
     """
-    web_store_url = self._WEB_STORE_URL.format(xid=extension_identifier)
-    try:
-      response = requests.get(web_store_url)
+    resolvers = []
+
+    database_path = self._database_path
+    if not database_path and mediator.data_location:
+      database_path = os.path.join(
+          mediator.data_location, self._DATABASE_FILENAME)
+
+    if database_path and os.path.isfile(database_path):
+      resolvers.append(
+          chrome_extension_resolvers.DatabaseChromeExtensionResolver(
+              database_path))
 
-    except (requests.ConnectionError, requests.HTTPError) as exception:
-      logger.warning((
-          '[{0:s}] unable to retrieve URL: {1:s} with error: {2!s}').format(
-              self.NAME, web_store_url, exception))
-      return None
+    resolver = None
+    if self._use_network:
+      resolver = chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+          deadline=self._network_deadline, web_store_url=self._WEB_STORE_URL)
 
-    return response.text
+    if self._cache_path:
+      resolver = chrome_extension_resolvers.CachingChromeExtensionResolver(
+          self._cache_path, resolver=resolver,
+          time_to_live=self._cache_time_to_live)
+
+    if resolver:
+      resolvers.append(resolver)
+
+    return resolvers
 
   def _GetPathSegmentSeparator(self, path):
     """Given a path give back the path separator as a best guess.
@@ -89,42 +118,34 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
 
     return '\\'
 
-  def _GetTitleFromChromeWebStore(self, extension_identifier):
-    """Retrieves the name of the extension from the Chrome store website.
+  def _ResolveTitles(self, mediator, extension_identifiers):
+    """Resolves the names of extensions.
 
     Args:
-      extension_identifier (str): Chrome extension identifier.
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfvfs.
+      extension_identifiers (list[str]): Chrome extension identifiers.
 
     Returns:
-      str: name of the extension or None.
+      dict[str, str]: name per extension identifier, of the extensions that
+          were resolved.
     """
-    # Check if we have already looked this extension up.
-    if extension_identifier in self._extensions:
-      return self._extensions.get(extension_identifier)
-
-    page_content = self._GetChromeWebStorePage(extension_identifier)
-    if not page_content:
-      logger.warning(
-          '[{0:s}] no data returned for extension identifier: {1:s}'.format(
-              self.NAME, extension_identifier))
-      return None
-
-    first_line, _, _ = page_content.partition('\n')
-    match = self._TITLE_RE.search(first_line)
-    name = None
-    if match:
-      title = match.group(1)
-      if title.startswith('Chrome Web Store - '):
-        name = title[19:]
-      elif title.endswith('- Chrome Web Store'):
-        name = title[:-19]
-
-    if not name:
-      self._extensions[extension_identifier] = 'UNKNOWN'
-      return None
-
-    self._extensions[extension_identifier] = name
-    return name
+    titles = {}
+    unresolved_identifiers = sorted(set(extension_identifiers))
+
+    for resolver in self._GetResolvers(mediator):
+      try:
+        if unresolved_identifiers:
+          titles.update(resolver.ResolveTitles(unresolved_identifiers))
+          unresolved_identifiers = [
+              extension_identifier
+              for extension_identifier in unresolved_identifiers
+              if extension_identifier not in titles]
+
+      finally:
+        resolver.Close()
+
+    return titles
 
   def CompileReport(self, mediator):
     """Compiles an analysis report.
@@ -136,6 +157,18 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
+    extension_identifiers = []
+    for identifiers in self._extension_identifiers_per_user.values():
+      extension_identifiers.extend(identifiers)
+
+    titles = self._ResolveTitles(mediator, extension_identifiers)
+
+    for user, identifiers in self._extension_identifiers_per_user.items():
+      self._results[user] = [
+          (titles.get(extension_identifier) or extension_identifier,
+           extension_identifier)
+          for extension_identifier in identifiers]
+
     lines_of_text = []
     for user, extensions in sorted(self._results.items()):
       lines_of_text.append(' == USER: {0:s} =='.format(user))
@@ -198,13 +231,46 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
       else:
         user = 'Not found ({0:s})'.format(filename)
 
-    extension_string = self._GetTitleFromChromeWebStore(extension_identifier)
-    if not extension_string:
-      extension_string = extension_identifier
+    # The names of the extensions are resolved when the report is compiled,
+    # so that examining events does not wait for network lookups.
+    extension_identifiers = self._extension_identifiers_per_user.setdefault(
+        user, [])
+    if extension_identifier not in extension_identifiers:
+      extension_identifiers.append(extension_identifier)
+
+  def SetCachePath(self, path, time_to_live=None):
+    """Sets the path of the persistent cache of the names of extensions.
+
+    Args:
+      path (str): path of the SQLite database file of the cache.
+      time_to_live (Optional[int]): number of seconds a cached name remains
+          valid, where None represents the default.
+    """
+    self._cache_path = path
+    if time_to_live is not None:
+      self._cache_time_to_live = time_to_live
+
+  def SetDatabasePath(self, path):
+    """Sets the path of the local database of Chrome extensions.
+
+    Args:
+      path (str): path of the JSON database file, where None represents the
+          database in the data location.
+    """
+    self._database_path = path
 
-    self._results.setdefault(user, [])
-    if (extension_string, extension_identifier) not in self._results[user]:
-      self._results[user].append((extension_string, extension_identifier))
+  def SetNetworkLookup(self, use_network, deadline=None):
+    """Sets if the names of extensions are looked up in the Chrome Web Store.
+
+    Args:
+      use_network (bool): True if names that cannot be resolved offline
+          should be looked up in the Chrome Web Store.
+      deadline (Optional[int]): number of seconds after which the lookups
+          are abandoned, where None represents the default.
+    """
+    self._use_network = use_network
+    if deadline is not None:
+      self._network_deadline = deadline
 
 
 manager.AnalysisPluginManager.RegisterPlugin(ChromeExtensionPlugin)
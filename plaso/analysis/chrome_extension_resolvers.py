@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+"""Resolvers of the titles of Chrome extensions."""
+
+from __future__ import unicode_literals
+
+import abc
+import io
+import json
+import multiprocessing
+import re
+import sqlite3
+import time
+
+from multiprocessing import pool
+
+import requests
+
+from plaso.analysis import logger
+
+
+class ChromeExtensionResolver(object):
+  """Resolver of the titles of Chrome extensions interface.
+
+  Resolvers can be chained, where the extension identifiers that a resolver
+  was not able to resolve are passed to the next resolver.
+  """
+
+  NAME = 'resolver'
+
+  def Close(self):
+    """Closes the resolver."""
+    return
+
+  @abc.abstractmethod
+  def ResolveTitles(self, extension_identifiers):
+    """Resolves the titles of Chrome extensions.
+
+    Args:
+      extension_identifiers (list[str]): Chrome extension identifiers.
+
+    Returns:
+      dict[str, str]: title per extension identifier, of the extensions that
+          were resolved, where the title is None if the extension is known to
+          have no title, such as an extension that is not in the Chrome Web
+          Store.
+    """
+
+
+class DatabaseChromeExtensionResolver(ChromeExtensionResolver):
+  """Resolves the titles of Chrome extensions with a local JSON database.
+
+  The database is a JSON object of the titles per extension identifier, for
+  example:
+
+  {
+    "apdfllckaahabafndbhieahigkjlhalf": "Google Drive",
+    "pjkljhegncpnkpknbcohdijeoejaedia": "Gmail"
+  }
+  """
+
+  NAME = 'database'
+
+  def __init__(self, path):
+    """Initializes a local database resolver.
+
+    Args:
+      path (str): path of the JSON database file.
+    """
+    super(DatabaseChromeExtensionResolver, self).__init__()
+    self._path = path
+    self._titles = None
+
+  def _ReadDatabase(self):
+    """Reads the JSON database file.
+
+    Returns:
+      dict[str, str]: title per extension identifier.
+    """
+    try:
+      with io.open(self._path, 'r', encoding='utf-8') as file_object:
+        titles = json.load(file_object)
+
+    except (IOError, ValueError) as exception:
+      logger.warning(
+          'Unable to read Chrome extensions database: {0:s} with error: '
+          '{1!s}'.format(self._path, exception))
+      return {}
+
+    if not isinstance(titles, dict):
+      logger.warning('Unsupported Chrome extensions database: {0:s}'.format(
+          self._path))
+      return {}
+
+    return titles
+
+  def ResolveTitles(self, extension_identifiers):
+    """Resolves the titles of Chrome extensions.
+
+    Args:
+      extension_identifiers (list[str]): Chrome extension identifiers.
+
+    Returns:
+      dict[str, str]: title per extension identifier, of the extensions that
+          are in the database.
+    """
+    if self._titles is None:
+      self._titles = self._ReadDatabase()
+
+    return {
+        extension_identifier: self._titles[extension_identifier]
+        for extension_identifier in extension_identifiers
+        if extension_identifier in self._titles}
+
+
+class CachingChromeExtensionResolver(ChromeExtensionResolver):
+  """Resolves the titles of Chrome extensions with a persistent cache.
+
+  The titles are stored in a SQLite database, so that analyzing the same
+  storage file again does not require network lookups. Extensions that are
+  known to have no title are cached as well. Extensions that are not in the
+  cache, or of which the cached title has expired, are resolved with the
+  wrapped resolver, if any.
+  """
+
+  NAME = 'cache'
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS chrome_extensions ('
+      'extension_identifier TEXT PRIMARY KEY, lookup_time INTEGER, '
+      'title TEXT)')
+
+  _INSERT_QUERY = (
+      'INSERT OR REPLACE INTO chrome_extensions (extension_identifier, '
+      'lookup_time, title) VALUES (?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT extension_identifier, title FROM chrome_extensions WHERE '
+      'lookup_time >= ? AND extension_identifier IN ({0:s})')
+
+  # Maximum number of extension identifiers per select query, SQLite limits
+  # the number of variables in a query to 999 by default.
+  _MAXIMUM_NUMBER_OF_IDENTIFIERS_PER_QUERY = 500
+
+  DEFAULT_TIME_TO_LIVE = 30 * 24 * 60 * 60
+
+  def __init__(self, path, resolver=None, time_to_live=DEFAULT_TIME_TO_LIVE):
+    """Initializes a caching resolver.
+
+    Args:
+      path (str): path of the SQLite database file of the cache.
+      resolver (Optional[ChromeExtensionResolver]): resolver of the
+          extensions that are not in the cache, where None represents that
+          only the cache is used.
+      time_to_live (Optional[int]): number of seconds a cached title remains
+          valid.
+
+    Raises:
+      ValueError: if the time to live is negative.
+    """
+    if time_to_live < 0:
+      raise ValueError('Invalid time to live: {0:d}.'.format(time_to_live))
+
+    super(CachingChromeExtensionResolver, self).__init__()
+    self._connection = None
+    self._path = path
+    self._resolver = resolver
+    self.time_to_live = time_to_live
+
+  def _GetConnection(self):
+    """Retrieves the connection to the database, opening it if needed.
+
+    Returns:
+      sqlite3.Connection: connection to the database.
+
+    Raises:
+      sqlite3.Error: if the database cannot be opened.
+    """
+    if not self._connection:
+      connection = sqlite3.connect(self._path)
+      try:
+        connection.execute(self._CREATE_TABLE_QUERY)
+        connection.commit()
+      except sqlite3.Error:
+        connection.close()
+        raise
+
+      self._connection = connection
+
+    return self._connection
+
+  def _GetCachedTitles(self, extension_identifiers):
+    """Retrieves cached titles.
+
+    Args:
+      extension_identifiers (list[str]): Chrome extension identifiers.
+
+    Returns:
+      dict[str, str]: title per extension identifier, of the extensions that
+          are in the cache and have not expired, where no titles are returned
+          if the cache cannot be read.
+    """
+    minimum_lookup_time = int(time.time()) - self.time_to_live
+
+    titles = {}
+    try:
+      connection = self._GetConnection()
+
+      for index in range(
+          0, len(extension_identifiers),
+          self._MAXIMUM_NUMBER_OF_IDENTIFIERS_PER_QUERY):
+        query_identifiers = extension_identifiers[
+            index:index + self._MAXIMUM_NUMBER_OF_IDENTIFIERS_PER_QUERY]
+        query = self._SELECT_QUERY.format(
+            ', '.join(['?'] * len(query_identifiers)))
+
+        cursor = connection.execute(
+            query, [minimum_lookup_time] + query_identifiers)
+        titles.update(cursor.fetchall())
+
+    except sqlite3.Error as exception:
+      logger.warning((
+          '[{0:s}] unable to read Chrome extension titles from cache: {1:s} '
+          'with error: {2!s}').format(self.NAME, self._path, exception))
+      return {}
+
+    return titles
+
+  def _StoreTitles(self, titles):
+    """Stores titles in the cache.
+
+    Titles that cannot be stored are not cached, which does not prevent
+    the titles from being resolved.
+
+    Args:
+      titles (dict[str, str]): title per extension identifier.
+    """
+    lookup_time = int(time.time())
+
+    try:
+      connection = self._GetConnection()
+      connection.executemany(self._INSERT_QUERY, [
+          (extension_identifier, lookup_time, title)
+          for extension_identifier, title in titles.items()])
+      connection.commit()
+
+    except sqlite3.Error as exception:
+      logger.warning((
+          '[{0:s}] unable to store Chrome extension titles in cache: {1:s} '
+          'with error: {2!s}').format(self.NAME, self._path, exception))
+
+  def Close(self):
+    """Closes the resolver."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+    if self._resolver:
+      self._resolver.Close()
+
+  def ResolveTitles(self, extension_identifiers):
+    """Resolves the titles of Chrome extensions.
+
+    Args:
+      extension_identifiers (list[str]): Chrome extension identifiers.
+
+    Returns:
+      dict[str, str]: title per extension identifier, of the extensions that
+          were resolved.
+    """
+    titles = self._GetCachedTitles(list(extension_identifiers))
+
+    uncached_identifiers = [
+        extension_identifier for extension_identifier in extension_identifiers
+        if extension_identifier not in titles]
+
+    if self._resolver and uncached_identifiers:
+      resolved_titles = self._resolver.ResolveTitles(uncached_identifiers)
+      if resolved_titles:
+        self._StoreTitles(resolved_titles)
+        titles.update(resolved_titles)
+
+    return titles
+
+
+class WebStoreChromeExtensionResolver(ChromeExtensionResolver):
+  """Resolves the titles of Chrome extensions with the Chrome Web Store.
+
+  The Chrome Web Store pages of the extensions are retrieved by multiple
+  threads. Extensions of which the page was not retrieved before the
+  deadline are not resolved. The timeout of a request is bounded by the
+  time remaining until the deadline, so that the threads do not outlive
+  the deadline by waiting for a response.
+  """
+
+  NAME = 'web_store'
+
+  _TITLE_RE = re.compile(r'<title>([^<]+)</title>')
+
+  DEFAULT_WEB_STORE_URL = (
+      'https://chrome.google.com/webstore/detail/{xid}?hl=en-US')
+
+  # Number of seconds after which the network lookups are abandoned.
+  DEFAULT_DEADLINE = 60
+
+  DEFAULT_NUMBER_OF_THREADS = 8
+
+  # Maximum number of seconds to wait for a response of the Chrome Web Store.
+  _REQUEST_TIMEOUT = 10
+
+  def __init__(
+      self, deadline=DEFAULT_DEADLINE,
+      number_of_threads=DEFAULT_NUMBER_OF_THREADS,
+      web_store_url=DEFAULT_WEB_STORE_URL):
+    """Initializes a Chrome Web Store resolver.
+
+    Args:
+      deadline (Optional[int]): number of seconds after which the network
+          lookups are abandoned.
+      number_of_threads (Optional[int]): number of threads that retrieve
+          Chrome Web Store pages.
+      web_store_url (Optional[str]): format string of the URL of the Chrome
+          Web Store page of an extension, where {xid} is replaced by the
+          extension identifier.
+    """
+    super(WebStoreChromeExtensionResolver, self).__init__()
+    self._deadline = deadline
+    self._number_of_threads = number_of_threads
+    self._web_store_url = web_store_url
+
+  def _GetChromeWebStorePage(self, extension_identifier, deadline):
+    """Retrieves the page for the extension from the Chrome store website.
+
+    Args:
+      extension_identifier (str): Chrome extension identifier.
+      deadline (float): time after which the page is no longer retrieved,
+          as number of seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      tuple[int, str]: HTTP status code and page content or None if the page
+          could not be retrieved before the deadline.
+    """
+    timeout = min(self._REQUEST_TIMEOUT, deadline - time.time())
+    if timeout <= 0:
+      return None
+
+    web_store_url = self._web_store_url.format(xid=extension_identifier)
+    try:
+      response = requests.get(web_store_url, timeout=timeout)
+
+    except requests.RequestException as exception:
+      logger.warning((
+          '[{0:s}] unable to retrieve URL: {1:s} with error: {2!s}').format(
+              self.NAME, web_store_url, exception))
+      return None
+
+    return response.status_code, response.text
+
+  def _GetTitleFromChromeWebStore(self, extension_identifier, deadline):
+    """Retrieves the name of the extension from the Chrome store website.
+
+    Args:
+      extension_identifier (str): Chrome extension identifier.
+      deadline (float): time after which the page is no longer retrieved,
+          as number of seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      tuple[bool, str]: True if the extension was resolved and the name of the
+          extension or None if the extension has no name.
+    """
+    result = self._GetChromeWebStorePage(extension_identifier, deadline)
+    if not result:
+      return False, None
+
+    status_code, page_content = result
+
+    # The Chrome Web Store does not know the extension.
+    if status_code == 404:
+      return True, None
+
+    if status_code != 200 or not page_content:
+      logger.warning((
+          '[{0:s}] no data returned for extension identifier: {1:s}').format(
+              self.NAME, extension_identifier))
+      return False, None
+
+    first_line, _, _ = page_content.partition('\n')
+    match = self._TITLE_RE.search(first_line)
+    name = None
+    if match:
+      title = match.group(1)
+      if title.startswith('Chrome Web Store - '):
+        name = title[19:]
+      elif title.endswith('- Chrome Web Store'):
+        name = title[:-19]
+
+    return True, name or None
+
+  def ResolveTitles(self, extension_identifiers):
+    """Resolves the titles of Chrome extensions.
+
+    Args:
+      extension_identifiers (list[str]): Chrome extension identifiers.
+
+    Returns:
+      dict[str, str]: title per extension identifier, of the extensions of
+          which the Chrome Web Store page was retrieved before the deadline.
+    """
+    if not extension_identifiers:
+      return {}
+
+    deadline = time.time() + self._deadline
+
+    thread_pool = pool.ThreadPool(
+        min(self._number_of_threads, len(extension_identifiers)))
+
+    try:
+      async_results = [
+          (extension_identifier, thread_pool.apply_async(
+              self._GetTitleFromChromeWebStore,
+              (extension_identifier, deadline)))
+          for extension_identifier in extension_identifiers]
+
+      titles = {}
+      for index, (extension_identifier, async_result) in enumerate(
+          async_results):
+        try:
+          is_resolved, title = async_result.get(
+              timeout=max(0, deadline - time.time()))
+        except multiprocessing.TimeoutError:
+          logger.warning((
+              '[{0:s}] deadline exceeded, {1:d} extensions not resolved.'
+              ).format(self.NAME, len(extension_identifiers) - index))
+          break
+
+        if is_resolved:
+          titles[extension_identifier] = title
+
+    finally:
+      # Threads that are still waiting for a response are stopped when the
+      # request times out, which is no later than the deadline.
+      thread_pool.terminate()
+
+    return titles
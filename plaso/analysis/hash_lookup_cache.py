@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache of the results of hash lookups."""
+
+from __future__ import unicode_literals
+
+import json
+import sqlite3
+import threading
+import time
+
+from plaso.analysis import logger
+
+
+class HashLookupCache(object):
+  """Persistent cache of the results of hash lookups.
+
+  The results are stored in a SQLite database per analyzer, hash type and
+  digest, so that analyzing the same storage file again does not require
+  remote lookups. Results older than the time to live are looked up again.
+
+  The cache can be used by multiple threads. Errors of the database are
+  logged and treated as cache misses, so that a damaged or locked cache does
+  not stop the analysis.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS hash_lookups ('
+      'analyzer TEXT, hash_type TEXT, digest TEXT, lookup_time INTEGER, '
+      'hash_information TEXT, PRIMARY KEY (analyzer, hash_type, digest))')
+
+  _INSERT_QUERY = (
+      'INSERT OR REPLACE INTO hash_lookups (analyzer, hash_type, digest, '
+      'lookup_time, hash_information) VALUES (?, ?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT digest, hash_information FROM hash_lookups WHERE analyzer = ? '
+      'AND hash_type = ? AND lookup_time >= ? AND digest IN ({0:s})')
+
+  # Maximum number of digests per select query, SQLite limits the number of
+  # variables in a query to 999 by default.
+  _MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY = 500
+
+  DEFAULT_TIME_TO_LIVE = 7 * 24 * 60 * 60
+
+  def __init__(self, path, time_to_live=DEFAULT_TIME_TO_LIVE):
+    """Initializes a hash lookup cache.
+
+    Args:
+      path (str): path of the SQLite database file of the cache.
+      time_to_live (Optional[int]): number of seconds a cached result remains
+          valid.
+
+    Raises:
+      ValueError: if the time to live is negative.
+    """
+    if time_to_live < 0:
+      raise ValueError('Invalid time to live: {0:d}.'.format(time_to_live))
+
+    super(HashLookupCache, self).__init__()
+    self._connection = None
+    self._lock = threading.Lock()
+    self._path = path
+    self.time_to_live = time_to_live
+
+  def _GetConnection(self):
+    """Retrieves the connection to the database, opening it if needed.
+
+    Returns:
+      sqlite3.Connection: connection to the database.
+
+    Raises:
+      sqlite3.Error: if the database cannot be opened.
+    """
+    if not self._connection:
+      # The connection is used by the threads of the analyzer, access is
+      # serialized by the lock.
+      connection = sqlite3.connect(self._path, check_same_thread=False)
+      try:
+        connection.execute(self._CREATE_TABLE_QUERY)
+        connection.commit()
+      except sqlite3.Error:
+        connection.close()
+        raise
+
+      self._connection = connection
+
+    return self._connection
+
+  def AddHashInformation(
+      self, analyzer_name, hash_type, hash_information_per_digest):
+    """Adds hash lookup results to the cache.
+
+    Results without hash information, which analyzers return when a lookup
+    failed, are not cached.
+
+    Args:
+      analyzer_name (str): name of the analyzer.
+      hash_type (str): type of the hash, such as "md5".
+      hash_information_per_digest (dict[str, object]): hash information per
+          digest, which must be serializable to JSON.
+    """
+    lookup_time = int(time.time())
+    rows = [
+        (analyzer_name, hash_type, digest.lower(), lookup_time,
+         json.dumps(hash_information))
+        for digest, hash_information in hash_information_per_digest.items()
+        if hash_information is not None]
+
+    if not rows:
+      return
+
+    with self._lock:
+      try:
+        connection = self._GetConnection()
+        connection.executemany(self._INSERT_QUERY, rows)
+        connection.commit()
+      except sqlite3.Error as exception:
+        logger.warning((
+            'Unable to add hash information to lookup cache: {0:s} with '
+            'error: {1!s}').format(self._path, exception))
+
+  def Close(self):
+    """Closes the cache."""
+    with self._lock:
+      if self._connection:
+        self._connection.close()
+        self._connection = None
+
+  def GetHashInformation(self, analyzer_name, hash_type, digests):
+    """Retrieves cached hash lookup results.
+
+    Args:
+      analyzer_name (str): name of the analyzer.
+      hash_type (str): type of the hash, such as "md5".
+      digests (list[str]): digests to look up.
+
+    Returns:
+      dict[str, object]: hash information per digest, of the digests that are
+          in the cache and have not expired. No digests are returned if the
+          cache cannot be read.
+    """
+    digests_per_lower_case_digest = {}
+    for digest in digests:
+      digests_per_lower_case_digest.setdefault(digest.lower(), []).append(
+          digest)
+
+    lower_case_digests = list(digests_per_lower_case_digest.keys())
+    minimum_lookup_time = int(time.time()) - self.time_to_live
+
+    rows = []
+    with self._lock:
+      try:
+        connection = self._GetConnection()
+
+        for index in range(
+            0, len(lower_case_digests),
+            self._MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY):
+          query_digests = lower_case_digests[
+              index:index + self._MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY]
+          query = self._SELECT_QUERY.format(
+              ', '.join(['?'] * len(query_digests)))
+
+          cursor = connection.execute(query, [
+              analyzer_name, hash_type, minimum_lookup_time] + query_digests)
+          rows.extend(cursor.fetchall())
+
+      except sqlite3.Error as exception:
+        logger.warning((
+            'Unable to read hash information from lookup cache: {0:s} with '
+            'error: {1!s}').format(self._path, exception))
+        return {}
+
+    hash_information_per_digest = {}
+    for lower_case_digest, hash_information in rows:
+      hash_information = json.loads(hash_information)
+      for digest in digests_per_lower_case_digest[lower_case_digest]:
+        hash_information_per_digest[digest] = hash_information
+
+    return hash_information_per_digest
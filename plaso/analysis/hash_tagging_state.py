@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""State of the events pending a hash lookup of a hash tagging plugin."""
+
+from __future__ import unicode_literals
+
+import pickle
+import sqlite3
+
+from plaso.analysis import temporary_state
+
+
+class HashTaggingState(temporary_state.TemporaryDatabaseState):
+  """State of the events pending a hash lookup.
+
+  The identifiers of the events per path specification and the path
+  specifications per hash are stored in a temporary SQLite database, which
+  SQLite removes when it is closed, so that the memory usage of a hash
+  tagging plugin does not grow with the number of events. The state is
+  buffered in memory and written to the database in batches.
+  """
+
+  _CREATE_TABLE_QUERIES = [
+      'CREATE TABLE event_identifiers (path_spec TEXT, event_identifier BLOB)',
+      'CREATE INDEX event_identifiers_path_spec ON event_identifiers '
+      '(path_spec)',
+      'CREATE TABLE path_specs (digest TEXT, path_spec TEXT)',
+      'CREATE INDEX path_specs_digest ON path_specs (digest)',
+      'CREATE TABLE digests (digest TEXT PRIMARY KEY)']
+
+  _SELECT_EVENT_IDENTIFIERS_QUERY = (
+      'SELECT path_specs.digest, event_identifiers.event_identifier '
+      'FROM (SELECT DISTINCT digest, path_spec FROM path_specs '
+      'WHERE digest IN ({0:s})) AS path_specs '
+      'JOIN event_identifiers '
+      'ON event_identifiers.path_spec = path_specs.path_spec '
+      'ORDER BY path_specs.digest, event_identifiers.rowid')
+
+  _SELECT_NUMBER_OF_PATH_SPECS_QUERY = (
+      'SELECT digest, COUNT(*) FROM path_specs WHERE digest IN ({0:s}) '
+      'GROUP BY digest')
+
+  # Maximum number of rows that are buffered in memory before they are
+  # written to the database.
+  _MAXIMUM_NUMBER_OF_BUFFERED_ROWS = 10000
+
+  # Maximum number of digests per select query, SQLite limits the number of
+  # variables in a query to 999 by default.
+  _MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY = 500
+
+  def __init__(self):
+    """Initializes the state of the events pending a hash lookup."""
+    super(HashTaggingState, self).__init__()
+    self._event_identifier_rows = []
+    self._path_spec_rows = []
+
+  def AddEventIdentifier(self, path_spec_key, event_identifier):
+    """Adds the identifier of an event.
+
+    Args:
+      path_spec_key (str): comparable string of the path specification of
+          the file the event was extracted from.
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      list[str]: digests that need to be looked up, which are only returned
+          when the buffered state is written to the database.
+    """
+    event_identifier_data = pickle.dumps(event_identifier, protocol=2)
+    self._event_identifier_rows.append(
+        (path_spec_key, sqlite3.Binary(event_identifier_data)))
+
+    if len(self._event_identifier_rows) < (
+        self._MAXIMUM_NUMBER_OF_BUFFERED_ROWS):
+      return []
+
+    return self.Flush()
+
+  def AddHash(self, digest, path_spec_key):
+    """Adds the hash of the file of a path specification.
+
+    Args:
+      digest (str): hash of the file.
+      path_spec_key (str): comparable string of the path specification of
+          the file.
+
+    Returns:
+      list[str]: digests that need to be looked up, which are only returned
+          when the buffered state is written to the database.
+    """
+    self._path_spec_rows.append((digest, path_spec_key))
+
+    if len(self._path_spec_rows) < self._MAXIMUM_NUMBER_OF_BUFFERED_ROWS:
+      return []
+
+    return self.Flush()
+
+  def Close(self):
+    """Closes the state, which removes the temporary database."""
+    super(HashTaggingState, self).Close()
+
+    self._event_identifier_rows = []
+    self._path_spec_rows = []
+
+  def Flush(self):
+    """Writes the buffered state to the database.
+
+    Returns:
+      list[str]: digests that were not added before and need to be looked up,
+          in the order they were added.
+    """
+    if not self._event_identifier_rows and not self._path_spec_rows:
+      return []
+
+    connection = self._GetConnection()
+
+    digests = []
+    for digest, _ in self._path_spec_rows:
+      cursor = connection.execute(
+          'INSERT OR IGNORE INTO digests (digest) VALUES (?)', (digest, ))
+      if cursor.rowcount == 1:
+        digests.append(digest)
+
+    connection.executemany(
+        'INSERT INTO path_specs (digest, path_spec) VALUES (?, ?)',
+        self._path_spec_rows)
+    connection.executemany(
+        'INSERT INTO event_identifiers (path_spec, event_identifier) '
+        'VALUES (?, ?)', self._event_identifier_rows)
+    connection.commit()
+
+    self._event_identifier_rows = []
+    self._path_spec_rows = []
+
+    return digests
+
+  def GetEventIdentifiers(self, digests):
+    """Retrieves the identifiers of the events of files with specific hashes.
+
+    Args:
+      digests (list[str]): hashes of the files.
+
+    Yields:
+      tuple[str, int, list[AttributeContainerIdentifier]]: hash of the file,
+          number of path specifications with the hash and identifiers of the
+          events extracted from the files, in ascending order of hash.
+    """
+    self.Flush()
+
+    connection = self._GetConnection()
+
+    digests = sorted(set(digests))
+    for index in range(
+        0, len(digests), self._MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY):
+      query_digests = digests[
+          index:index + self._MAXIMUM_NUMBER_OF_DIGESTS_PER_QUERY]
+      query_variables = ', '.join(['?'] * len(query_digests))
+
+      cursor = connection.execute(
+          self._SELECT_NUMBER_OF_PATH_SPECS_QUERY.format(query_variables),
+          query_digests)
+      number_of_path_specs_per_digest = dict(cursor.fetchall())
+
+      event_identifiers_per_digest = {}
+      cursor = connection.execute(
+          self._SELECT_EVENT_IDENTIFIERS_QUERY.format(query_variables),
+          query_digests)
+      for digest, event_identifier_data in cursor:
+        event_identifier = pickle.loads(bytes(event_identifier_data))
+        event_identifiers_per_digest.setdefault(digest, []).append(
+            event_identifier)
+
+      for digest in query_digests:
+        number_of_path_specs = number_of_path_specs_per_digest.get(digest, 0)
+        if number_of_path_specs:
+          yield (digest, number_of_path_specs,
+                 event_identifiers_per_digest.get(digest, []))
@@ -9,6 +9,8 @@ import sys
 import threading
 import time
 
+from multiprocessing import pool
+
 if sys.version_info[0] < 3:
   import Queue  # pylint: disable=import-error
 else:
@@ -25,7 +27,9 @@ try:
 except ImportError:
   urllib3 = None
 
+from plaso.analysis import aggregation_state
 from plaso.analysis import definitions
+from plaso.analysis import hash_tagging_state
 from plaso.analysis import logger
 from plaso.containers import events
 from plaso.containers import reports
@@ -115,6 +119,99 @@ class AnalysisPlugin(object):
     """
 
 
+class AggregatingAnalysisPlugin(AnalysisPlugin):
+  """An interface for plugins that aggregate values of events.
+
+  The plugin provides named sets, counters and groups of values, which are
+  written to a temporary database when the number of values in memory
+  exceeds a maximum.
+  """
+
+  # The maximum number of aggregated values that are kept in memory.
+  _MAXIMUM_NUMBER_OF_BUFFERED_VALUES = (
+      aggregation_state.AggregationState.
+      DEFAULT_MAXIMUM_NUMBER_OF_BUFFERED_VALUES)
+
+  def __init__(self):
+    """Initializes an aggregating analysis plugin."""
+    super(AggregatingAnalysisPlugin, self).__init__()
+    self._aggregation_state = aggregation_state.AggregationState(
+        maximum_number_of_buffered_values=(
+            self._MAXIMUM_NUMBER_OF_BUFFERED_VALUES))
+
+  def _AddToGroup(self, group_name, key, value):
+    """Adds a value to a group.
+
+    Args:
+      group_name (str): name of the group.
+      key (int|str): key of the values in the group.
+      value (object): value to add, which must be possible to pickle.
+    """
+    self._aggregation_state.AddGroupValue(group_name, key, value)
+
+  def _AddToSet(self, set_name, value):
+    """Adds a value to a set.
+
+    Args:
+      set_name (str): name of the set.
+      value (int|str): value to add.
+    """
+    self._aggregation_state.AddSetValue(set_name, value)
+
+  def _CloseAggregationState(self):
+    """Closes the aggregation state, which discards the aggregated values.
+
+    This function should be called when the report has been compiled.
+    """
+    self._aggregation_state.Close()
+
+  def _GetCounterValues(self, counter_name):
+    """Retrieves the counts of a counter.
+
+    Args:
+      counter_name (str): name of the counter.
+
+    Returns:
+      generator(tuple[int|str, int]): key and count, in ascending order of
+          key.
+    """
+    return self._aggregation_state.GetCounterValues(counter_name)
+
+  def _GetGroups(self, group_name):
+    """Retrieves the values of a group.
+
+    Args:
+      group_name (str): name of the group.
+
+    Returns:
+      generator(tuple[int|str, list[object]]): key and values added with the
+          key, in the order the keys and values were first added.
+    """
+    return self._aggregation_state.GetGroups(group_name)
+
+  def _GetSetValues(self, set_name):
+    """Retrieves the values of a set.
+
+    Args:
+      set_name (str): name of the set.
+
+    Returns:
+      generator(int|str): values, in ascending order.
+    """
+    return self._aggregation_state.GetSetValues(set_name)
+
+  def _IncrementCounter(self, counter_name, key, increment=1):
+    """Increments the count of a key of a counter.
+
+    Args:
+      counter_name (str): name of the counter.
+      key (int|str): key to count.
+      increment (Optional[int]): value to increment the count with.
+    """
+    self._aggregation_state.IncrementCounter(
+        counter_name, key, increment=increment)
+
+
 class HashTaggingAnalysisPlugin(AnalysisPlugin):
   """An interface for plugins that tag events based on the source file hash.
 
@@ -135,6 +232,10 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
   DEFAULT_QUEUE_TIMEOUT = 4
   SECONDS_BETWEEN_STATUS_LOG_MESSAGES = 30
 
+  # The maximum number of hash analysis results of which the events are tagged
+  # at once.
+  _MAXIMUM_NUMBER_OF_HASH_ANALYSES_PER_BATCH = 1000
+
   def __init__(self, analyzer_class):
     """Initializes a hash tagging analysis plugin.
 
@@ -146,39 +247,40 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     self._analysis_queue_timeout = self.DEFAULT_QUEUE_TIMEOUT
     self._analyzer_started = False
     self._comment = 'Tag applied by {0:s} analysis plugin'.format(self.NAME)
-    self._event_identifiers_by_pathspec = collections.defaultdict(list)
-    self._hash_pathspecs = collections.defaultdict(list)
     self._requester_class = None
+    self._tagging_state = hash_tagging_state.HashTaggingState()
     self._time_of_last_status_log = time.time()
     self.hash_analysis_queue = Queue.Queue()
     self.hash_queue = Queue.Queue()
 
     self._analyzer = analyzer_class(self.hash_queue, self.hash_analysis_queue)
 
-  def _HandleHashAnalysis(self, hash_analysis):
-    """Deals with the results of the analysis of a hash.
+  def _HandleHashAnalyses(
+      self, mediator, hash_analyses, path_specs_per_labels_counter):
+    """Deals with the results of the analysis of hashes.
 
-    This method ensures that labels are generated for the hash,
-    then tags all events derived from files with that hash.
+    This method ensures that labels are generated for the hashes, then tags
+    all events derived from files with these hashes, in ascending order of
+    hash.
 
     Args:
-      hash_analysis (HashAnalysis): hash analysis plugin's results for a given
-          hash.
-
-    Returns:
-      tuple: containing:
-
-        list[dfvfs.PathSpec]: pathspecs that had the hash value looked up.
-        list[str]: labels that corresponds to the hash value that was looked up.
-        list[EventTag]: event tags for all events that were extracted from the
-            path specifications.
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      hash_analyses (list[HashAnalysis]): hash analysis plugin's results.
+      path_specs_per_labels_counter (collections.Counter): number of path
+          specifications per label, which is updated with the labels of the
+          hashes.
     """
-    tags = []
-    labels = self.GenerateLabels(hash_analysis.hash_information)
-    path_specifications = self._hash_pathspecs.pop(hash_analysis.subject_hash)
-    for path_specification in path_specifications:
-      event_identifiers = self._event_identifiers_by_pathspec.pop(
-          path_specification, [])
+    labels_per_digest = {}
+    for hash_analysis in hash_analyses:
+      labels_per_digest[hash_analysis.subject_hash] = self.GenerateLabels(
+          hash_analysis.hash_information)
+
+    for digest, number_of_path_specs, event_identifiers in (
+        self._tagging_state.GetEventIdentifiers(labels_per_digest.keys())):
+      labels = labels_per_digest[digest]
+      for label in labels:
+        path_specs_per_labels_counter[label] += number_of_path_specs
 
       if not labels:
         continue
@@ -188,9 +290,7 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
         event_tag.SetEventIdentifier(event_identifier)
         event_tag.AddLabels(labels)
 
-        tags.append(event_tag)
-
-    return path_specifications, labels, tags
+        mediator.ProduceEventTag(event_tag)
 
   def _EnsureRequesterStarted(self):
     """Checks if the analyzer is running and starts it if not."""
@@ -198,6 +298,15 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
       self._analyzer.start()
       self._analyzer_started = True
 
+  def _QueueHashes(self, digests):
+    """Queues hashes to be looked up by the analyzer.
+
+    Args:
+      digests (list[str]): hashes to look up.
+    """
+    for digest in digests:
+      self.hash_queue.put(digest)
+
   def ExamineEvent(self, mediator, event):
     """Evaluates whether an event contains the right data for a hash lookup.
 
@@ -208,11 +317,18 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     """
     self._EnsureRequesterStarted()
 
-    path_spec = event.pathspec
-    event_identifiers = self._event_identifiers_by_pathspec[path_spec]
+    path_spec = getattr(event, 'pathspec', None)
+    if not path_spec:
+      # Events that did not originate from a file cannot be tagged based on
+      # the hash of a file.
+      return
+
+    path_spec_key = path_spec.comparable
 
     event_identifier = event.GetIdentifier()
-    event_identifiers.append(event_identifier)
+    digests = self._tagging_state.AddEventIdentifier(
+        path_spec_key, event_identifier)
+    self._QueueHashes(digests)
 
     if event.data_type not in self.DATA_TYPES or not self._analyzer.lookup_hash:
       return
@@ -227,12 +343,11 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
               self._analyzer.lookup_hash, display_name))
       return
 
-    path_specs = self._hash_pathspecs[lookup_hash]
-    path_specs.append(path_spec)
-    # There may be multiple path specification that have the same hash. We only
-    # want to look them up once.
-    if len(path_specs) == 1:
-      self.hash_queue.put(lookup_hash)
+    # There may be multiple path specification that have the same hash. The
+    # tagging state only returns a hash the first time it is added, so that it
+    # is only looked up once.
+    digests = self._tagging_state.AddHash(lookup_hash, path_spec_key)
+    self._QueueHashes(digests)
 
   def _ContinueReportCompilation(self):
     """Determines if the plugin should continue trying to compile the report.
@@ -274,27 +389,43 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     Returns:
       AnalysisReport: report.
     """
+    digests = self._tagging_state.Flush()
+    self._QueueHashes(digests)
+
     # TODO: refactor to update the counter on demand instead of
     # during reporting.
     path_specs_per_labels_counter = collections.Counter()
-    tags = []
+    hash_analyses = []
     while self._ContinueReportCompilation():
       try:
         self._LogProgressUpdateIfReasonable()
-        hash_analysis = self.hash_analysis_queue.get(
-            timeout=self._analysis_queue_timeout)
+        if hash_analyses:
+          hash_analysis = self.hash_analysis_queue.get_nowait()
+        else:
+          hash_analysis = self.hash_analysis_queue.get(
+              timeout=self._analysis_queue_timeout)
       except Queue.Empty:
         # The result queue is empty, but there could still be items that need
-        # to be processed by the analyzer.
+        # to be processed by the analyzer. Tag the events of the results that
+        # have arrived in the meantime.
+        if hash_analyses:
+          self._HandleHashAnalyses(
+              mediator, hash_analyses, path_specs_per_labels_counter)
+          hash_analyses = []
         continue
-      pathspecs, labels, new_tags = self._HandleHashAnalysis(
-          hash_analysis)
 
-      tags.extend(new_tags)
-      for label in labels:
-        path_specs_per_labels_counter[label] += len(pathspecs)
+      hash_analyses.append(hash_analysis)
+      if len(hash_analyses) >= self._MAXIMUM_NUMBER_OF_HASH_ANALYSES_PER_BATCH:
+        self._HandleHashAnalyses(
+            mediator, hash_analyses, path_specs_per_labels_counter)
+        hash_analyses = []
+
+    if hash_analyses:
+      self._HandleHashAnalyses(
+          mediator, hash_analyses, path_specs_per_labels_counter)
 
     self._analyzer.SignalAbort()
+    self._tagging_state.Close()
 
     lines_of_text = ['{0:s} hash tagging results'.format(self.NAME)]
     for label, count in sorted(path_specs_per_labels_counter.items()):
@@ -305,9 +436,6 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     lines_of_text.append('')
     report_text = '\n'.join(lines_of_text)
 
-    for event_tag in tags:
-      mediator.ProduceEventTag(event_tag)
-
     return reports.AnalysisReport(
         plugin_name=self.NAME, text=report_text)
 
@@ -329,6 +457,10 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
           self._analyzer.seconds_spent_analyzing, analyses_performed)
 
     batches_remaining, _ = divmod(number_of_hashes, hashes_per_batch)
+    if not wait_time_per_batch:
+      batches_remaining, _ = divmod(
+          batches_remaining, self._analyzer.number_of_concurrent_batches)
+
     estimated_seconds_per_batch = average_analysis_time + wait_time_per_batch
     return batches_remaining * estimated_seconds_per_batch
 
@@ -346,6 +478,16 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
       list[str]: list of labels to apply to events.
     """
 
+  def SetLookupCache(self, lookup_cache):
+    """Sets the lookup cache.
+
+    The analysis results are cached under the name of the plugin.
+
+    Args:
+      lookup_cache (HashLookupCache): lookup cache of the analysis results.
+    """
+    self._analyzer.SetLookupCache(lookup_cache, self.NAME)
+
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
 
@@ -360,25 +502,39 @@ class HashAnalyzer(threading.Thread):
 
   This interface should be implemented once for each hash analysis plugin.
 
+  Hashes are collected into batches of at most hashes per batch. A batch is
+  analyzed when it is full or when no more hashes were added within the batch
+  wait time. Batches can be analyzed concurrently, for example to hide the
+  latency of a remote lookup service.
+
   Attributes:
     analyses_performed (int): number of analysis batches completed by this
         analyzer.
     hashes_per_batch (int): maximum number of hashes to analyze at once.
     lookup_hash (str): name of the hash attribute to look up.
+    number_of_concurrent_batches (int): maximum number of batches that are
+        analyzed concurrently.
     seconds_spent_analyzing (int): number of seconds this analyzer has spent
         performing analysis (as opposed to waiting on queues, etc.)
-    wait_after_analysis (int): number of seconds the analyzer will sleep for
-        after analyzing a batch of hashes.
+    wait_after_analysis (int): number of seconds the analyzer will wait for
+        after analyzing a batch of hashes before it analyzes the next batch.
+        Batches are not analyzed concurrently if set.
   """
-  # How long to wait for new items to be added to the the input queue.
-  EMPTY_QUEUE_WAIT_TIME = 4
+  # How long to wait for more hashes to be added to a batch after the first
+  # hash of the batch was added to the input queue.
+  BATCH_WAIT_TIME = 0.5
+
+  # How long to wait for new items to be added to the the input queue before
+  # checking if the analyzer was signaled to abort.
+  EMPTY_QUEUE_WAIT_TIME = 1
 
   # List of lookup hashes supported by the analyzer.
   SUPPORTED_HASHES = []
 
   def __init__(
       self, hash_queue, hash_analysis_queue, hashes_per_batch=1,
-      lookup_hash='sha256', wait_after_analysis=0):
+      lookup_hash='sha256', number_of_concurrent_batches=1,
+      wait_after_analysis=0):
     """Initializes a hash analyzer.
 
     Args:
@@ -387,21 +543,102 @@ class HashAnalyzer(threading.Thread):
           HashAnalysis objects to.
       hashes_per_batch (Optional[int]): number of hashes to analyze at once.
       lookup_hash (Optional[str]): name of the hash attribute to look up.
+      number_of_concurrent_batches (Optional[int]): maximum number of
+          batches that are analyzed concurrently.
       wait_after_analysis (Optional[int]): number of seconds to wait after each
           batch is analyzed.
     """
     super(HashAnalyzer, self).__init__()
-    self._abort = False
+    self._abort_event = threading.Event()
     self._hash_queue = hash_queue
     self._hash_analysis_queue = hash_analysis_queue
+    self._lock = threading.Lock()
+    self._lookup_cache = None
+    self._lookup_cache_name = None
     self.analyses_performed = 0
     self.hashes_per_batch = hashes_per_batch
     self.lookup_hash = lookup_hash
+    self.number_of_concurrent_batches = number_of_concurrent_batches
     self.seconds_spent_analyzing = 0
     self.wait_after_analysis = wait_after_analysis
 
+  def _AnalyzeHashes(self, hashes, semaphore=None):
+    """Analyzes hashes and queues the analysis results.
+
+    Args:
+      hashes (list[str]): hashes to look up.
+      semaphore (Optional[threading.BoundedSemaphore]): semaphore to release
+          after the hashes have been analyzed.
+    """
+    try:
+      time_before_analysis = time.time()
+      try:
+        hash_analyses = self.Analyze(hashes)
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.error('Unable to analyze hashes with error: {0!s}'.format(
+            exception))
+        hash_analyses = []
+
+      seconds_spent_analyzing = time.time() - time_before_analysis
+
+      if self._lookup_cache and hash_analyses:
+        hash_information_per_digest = {
+            hash_analysis.subject_hash: hash_analysis.hash_information
+            for hash_analysis in hash_analyses}
+        self._lookup_cache.AddHashInformation(
+            self._lookup_cache_name, self.lookup_hash,
+            hash_information_per_digest)
+
+      with self._lock:
+        self.seconds_spent_analyzing += seconds_spent_analyzing
+        self.analyses_performed += 1
+
+      self._QueueHashAnalyses(hashes, hash_analyses)
+
+    finally:
+      if semaphore:
+        semaphore.release()
+
+  def _GetCachedHashAnalyses(self, hashes):
+    """Queues the cached analysis results of hashes.
+
+    Args:
+      hashes (list[str]): hashes to look up.
+
+    Returns:
+      list[str]: hashes that were not in the lookup cache.
+    """
+    if not self._lookup_cache:
+      return hashes
+
+    hash_information_per_digest = self._lookup_cache.GetHashInformation(
+        self._lookup_cache_name, self.lookup_hash, hashes)
+    if not hash_information_per_digest:
+      return hashes
+
+    cached_hashes = []
+    hash_analyses = []
+    uncached_hashes = []
+    for digest in hashes:
+      if digest not in hash_information_per_digest:
+        uncached_hashes.append(digest)
+        continue
+
+      hash_information = hash_information_per_digest[digest]
+      hash_analysis = HashAnalysis(digest, hash_information)
+      cached_hashes.append(digest)
+      hash_analyses.append(hash_analysis)
+
+    self._QueueHashAnalyses(cached_hashes, hash_analyses)
+
+    return uncached_hashes
+
   def _GetHashes(self, target_queue, max_hashes):
-    """Retrieves a list of items from a queue.
+    """Retrieves a batch of items from a queue.
+
+    Blocks until the first item is available or the empty queue wait time
+    has passed, then retrieves items until the batch is full or no more items
+    were added within the batch wait time.
 
     Args:
       target_queue (Queue.queue): queue to retrieve hashes from.
@@ -413,14 +650,41 @@ class HashAnalyzer(threading.Thread):
           The list may have no elements if the target_queue is empty.
     """
     hashes = []
-    for _ in range(0, max_hashes):
+    deadline = None
+    while len(hashes) < max_hashes:
+      if deadline is None:
+        timeout = self.EMPTY_QUEUE_WAIT_TIME
+      else:
+        timeout = deadline - time.time()
+        if timeout <= 0:
+          break
+
       try:
-        item = target_queue.get_nowait()
+        item = target_queue.get(timeout=timeout)
       except Queue.Empty:
-        continue
+        break
+
       hashes.append(item)
+      if deadline is None:
+        deadline = time.time() + self.BATCH_WAIT_TIME
+
     return hashes
 
+  def _QueueHashAnalyses(self, hashes, hash_analyses):
+    """Queues analysis results and marks the corresponding hashes as done.
+
+    Args:
+      hashes (list[str]): hashes that were looked up.
+      hash_analyses (list[HashAnalysis]): analysis results.
+    """
+    for hash_analysis in hash_analyses:
+      self._hash_analysis_queue.put(hash_analysis)
+
+    # Every hash is marked as done, including hashes without an analysis
+    # result, so that the plugin does not wait for them.
+    for _ in hashes:
+      self._hash_queue.task_done()
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Analyze(self, hashes):
@@ -437,21 +701,57 @@ class HashAnalyzer(threading.Thread):
   # not follow the style guide.
   def run(self):
     """The method called by the threading library to start the thread."""
-    while not self._abort:
-      hashes = self._GetHashes(self._hash_queue, self.hashes_per_batch)
-      if hashes:
-        time_before_analysis = time.time()
-        hash_analyses = self.Analyze(hashes)
-        current_time = time.time()
-        self.seconds_spent_analyzing += current_time - time_before_analysis
-        self.analyses_performed += 1
-        for hash_analysis in hash_analyses:
-          self._hash_analysis_queue.put(hash_analysis)
-          self._hash_queue.task_done()
-        time.sleep(self.wait_after_analysis)
-      else:
-        # Wait for some more hashes to be added to the queue.
-        time.sleep(self.EMPTY_QUEUE_WAIT_TIME)
+    thread_pool = None
+    semaphore = None
+    if self.number_of_concurrent_batches > 1 and not self.wait_after_analysis:
+      thread_pool = pool.ThreadPool(self.number_of_concurrent_batches)
+      semaphore = threading.BoundedSemaphore(
+          self.number_of_concurrent_batches)
+
+    next_analysis_time = None
+
+    try:
+      while not self._abort_event.is_set():
+        hashes = self._GetHashes(self._hash_queue, self.hashes_per_batch)
+        hashes = self._GetCachedHashAnalyses(hashes)
+        if not hashes:
+          continue
+
+        if thread_pool:
+          # Wait for a concurrent batch to complete, so that the hashes that
+          # are added to the queue in the meantime are collected into fuller
+          # batches.
+          semaphore.acquire()
+          thread_pool.apply_async(self._AnalyzeHashes, (hashes, semaphore))
+          continue
+
+        if next_analysis_time:
+          wait_time = next_analysis_time - time.time()
+          if wait_time > 0:
+            self._abort_event.wait(wait_time)
+
+        self._AnalyzeHashes(hashes)
+
+        if self.wait_after_analysis:
+          next_analysis_time = time.time() + self.wait_after_analysis
+
+    finally:
+      if thread_pool:
+        thread_pool.close()
+        thread_pool.join()
+
+      if self._lookup_cache:
+        self._lookup_cache.Close()
+
+  def SetLookupCache(self, lookup_cache, name):
+    """Sets the lookup cache.
+
+    Args:
+      lookup_cache (HashLookupCache): lookup cache of the analysis results.
+      name (str): name of the analyzer in the lookup cache.
+    """
+    self._lookup_cache = lookup_cache
+    self._lookup_cache_name = name
 
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
@@ -469,7 +769,7 @@ class HashAnalyzer(threading.Thread):
 
   def SignalAbort(self):
     """Instructs this analyzer to stop running."""
-    self._abort = True
+    self._abort_event.set()
 
 
 class HTTPHashAnalyzer(HashAnalyzer):
@@ -0,0 +1,710 @@
+# -*- coding: utf-8 -*-
+"""Analysis plugin to look up files in a local hash set and tag events.
+
+The hash set is stored in a hash set file, which contains:
+* a file header;
+* a Bloom filter of the digests;
+* the binary digests, sorted and of a fixed size.
+
+The Bloom filter is read into memory and answers most lookups of digests
+that are not in the hash set. Other lookups are answered by a binary search
+of the memory mapped digests.
+"""
+
+from __future__ import unicode_literals
+
+import binascii
+import heapq
+import math
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from plaso.analysis import interface
+from plaso.analysis import logger
+from plaso.analysis import manager
+
+
+class HashSetFile(object):
+  """Hash set file.
+
+  Attributes:
+    digest_size (int): size of the digests in bytes.
+    number_of_digests (int): number of digests in the hash set.
+  """
+
+  _FILE_SIGNATURE = b'plasohs\x00'
+
+  _FORMAT_VERSION = 1
+
+  # The file header contains: the signature, the format version, the size
+  # of the digests, the number of digests, the size of the Bloom filter in
+  # bytes and the number of Bloom filter hash functions.
+  _FILE_HEADER = struct.Struct('<8sIIQQI')
+
+  _BLOOM_FILTER_HASHES = struct.Struct('<QQ')
+
+  def __init__(self):
+    """Initializes a hash set file."""
+    super(HashSetFile, self).__init__()
+    self._bloom_filter = None
+    self._bloom_filter_number_of_bits = 0
+    self._digests_offset = 0
+    self._file_object = None
+    self._mmap = None
+    self._number_of_bloom_filter_hashes = 0
+    self.digest_size = 0
+    self.number_of_digests = 0
+
+  @classmethod
+  def _GetBloomFilterBitIndexes(
+      cls, digest, number_of_bits, number_of_hashes):
+    """Retrieves the Bloom filter bit indexes of a digest.
+
+    The digests are cryptographic hashes, therefore the bit indexes are
+    derived from the first 16 bytes of the digest with double hashing.
+
+    Args:
+      digest (bytes): binary digest.
+      number_of_bits (int): number of bits in the Bloom filter.
+      number_of_hashes (int): number of Bloom filter hash functions.
+
+    Returns:
+      list[int]: Bloom filter bit indexes.
+    """
+    first_hash, second_hash = cls._BLOOM_FILTER_HASHES.unpack_from(digest)
+    second_hash |= 1
+    return [
+        (first_hash + index * second_hash) % number_of_bits
+        for index in range(number_of_hashes)]
+
+  @classmethod
+  def _GetBloomFilterSize(cls, maximum_number_of_digests):
+    """Determines the size of the Bloom filter.
+
+    The Bloom filter is sized for a false positive rate of about 1 percent,
+    which requires 10 bits and 7 hash functions per digest.
+
+    Args:
+      maximum_number_of_digests (int): maximum number of digests the Bloom
+          filter should contain.
+
+    Returns:
+      tuple[int, int]: size of the Bloom filter in bytes and the number of
+          Bloom filter hash functions.
+    """
+    bloom_filter_size = int(math.ceil(
+        max(maximum_number_of_digests, 1) * 10 / 8.0))
+    return bloom_filter_size, 7
+
+  def _ContainsInBloomFilter(self, digest):
+    """Determines if a digest is possibly in the Bloom filter.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Returns:
+      bool: False if the digest is not in the hash set, True if it possibly
+          is.
+    """
+    bit_indexes = self._GetBloomFilterBitIndexes(
+        digest, self._bloom_filter_number_of_bits,
+        self._number_of_bloom_filter_hashes)
+    for bit_index in bit_indexes:
+      if not self._bloom_filter[bit_index >> 3] & (1 << (bit_index & 7)):
+        return False
+    return True
+
+  def Close(self):
+    """Closes the hash set file.
+
+    Raises:
+      IOError: if the hash set file is not opened.
+      OSError: if the hash set file is not opened.
+    """
+    if not self._file_object:
+      raise IOError('Hash set file not opened.')
+
+    if self._mmap:
+      self._mmap.close()
+      self._mmap = None
+
+    self._file_object.close()
+    self._file_object = None
+    self._bloom_filter = None
+
+  def Contains(self, digest):
+    """Determines if a digest is in the hash set.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Returns:
+      bool: True if the digest is in the hash set.
+    """
+    if len(digest) != self.digest_size or not self.number_of_digests:
+      return False
+
+    if not self._ContainsInBloomFilter(digest):
+      return False
+
+    lower_index = 0
+    upper_index = self.number_of_digests
+    while lower_index < upper_index:
+      middle_index = (lower_index + upper_index) // 2
+      offset = self._digests_offset + middle_index * self.digest_size
+      middle_digest = self._mmap[offset:offset + self.digest_size]
+      if middle_digest < digest:
+        lower_index = middle_index + 1
+      elif middle_digest > digest:
+        upper_index = middle_index
+      else:
+        return True
+
+    return False
+
+  def GetDigests(self):
+    """Retrieves the digests of the hash set.
+
+    Yields:
+      bytes: binary digest, in ascending order.
+    """
+    offset = self._digests_offset
+    for _ in range(self.number_of_digests):
+      yield self._mmap[offset:offset + self.digest_size]
+      offset += self.digest_size
+
+  def Open(self, path):
+    """Opens the hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Raises:
+      IOError: if the hash set file is already opened or is not supported.
+      OSError: if the hash set file is already opened or is not supported.
+    """
+    if self._file_object:
+      raise IOError('Hash set file already opened.')
+
+    file_object = open(path, 'rb')
+
+    try:
+      file_header_data = file_object.read(self._FILE_HEADER.size)
+      if len(file_header_data) != self._FILE_HEADER.size:
+        raise IOError('Unable to read hash set file header.')
+
+      (signature, format_version, digest_size, number_of_digests,
+       bloom_filter_size, number_of_bloom_filter_hashes) = (
+           self._FILE_HEADER.unpack(file_header_data))
+
+      if signature != self._FILE_SIGNATURE:
+        raise IOError('Unsupported hash set file signature.')
+
+      if format_version != self._FORMAT_VERSION:
+        raise IOError(
+            'Unsupported hash set file format version: {0:d}'.format(
+                format_version))
+
+      if digest_size < self._BLOOM_FILTER_HASHES.size or not bloom_filter_size:
+        raise IOError('Unsupported hash set file digest or Bloom filter size.')
+
+      bloom_filter = bytearray(file_object.read(bloom_filter_size))
+      if len(bloom_filter) != bloom_filter_size:
+        raise IOError('Unable to read hash set file Bloom filter.')
+
+      digests_offset = self._FILE_HEADER.size + bloom_filter_size
+      file_size = os.fstat(file_object.fileno()).st_size
+      if file_size < digests_offset + number_of_digests * digest_size:
+        raise IOError('Hash set file is truncated.')
+
+      mmap_object = None
+      if number_of_digests:
+        mmap_object = mmap.mmap(
+            file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (IOError, OSError, mmap.error, struct.error) as exception:
+      file_object.close()
+      raise IOError('Unable to open hash set file with error: {0!s}'.format(
+          exception))
+
+    self._bloom_filter = bloom_filter
+    self._bloom_filter_number_of_bits = bloom_filter_size * 8
+    self._digests_offset = digests_offset
+    self._file_object = file_object
+    self._mmap = mmap_object
+    self._number_of_bloom_filter_hashes = number_of_bloom_filter_hashes
+    self.digest_size = digest_size
+    self.number_of_digests = number_of_digests
+
+
+class HashSetFileWriter(object):
+  """Hash set file writer.
+
+  The digests are added from hash lists, such as the NSRL Reference Data Set
+  (RDS) NSRLFile.txt or a plain-text list of hexadecimal digests, and from
+  existing hash set files. The latter is used to compact a hash set file with
+  one or more delta hash lists into a new hash set file.
+
+  Digests are sorted in memory in batches. Batches that exceed the maximum
+  number of digests in memory are written to temporary files, which are
+  merged when the hash set file is written.
+  """
+
+  # Column names in the NSRL RDS NSRLFile.txt header per hash type.
+  _RDS_COLUMN_NAMES = {
+      'md5': b'"MD5"',
+      'sha1': b'"SHA-1"',
+      'sha256': b'"SHA-256"'}
+
+  _RDS_HEADER_SIGNATURE = b'"SHA-1"'
+
+  def __init__(self, hash_type, maximum_number_of_digests_in_memory=1000000):
+    """Initializes a hash set file writer.
+
+    Args:
+      hash_type (str): type of the hash, such as "md5", "sha1" or "sha256".
+      maximum_number_of_digests_in_memory (Optional[int]): maximum number of
+          digests that are kept in memory before they are written to
+          a temporary file.
+
+    Raises:
+      ValueError: if the hash type is not supported.
+    """
+    digest_size = LocalHashSetAnalyzer.DIGEST_SIZES.get(hash_type, None)
+    if not digest_size:
+      raise ValueError('Unsupported hash type: {0!s}'.format(hash_type))
+
+    super(HashSetFileWriter, self).__init__()
+    self._digests = []
+    self._hash_set_paths = []
+    self._hash_type = hash_type
+    self._maximum_number_of_digests_in_memory = (
+        maximum_number_of_digests_in_memory)
+    self._number_of_spilled_digests = 0
+    self._spill_file_paths = []
+    self._temporary_directory = None
+    self.digest_size = digest_size
+
+  def _GetSpilledDigests(self, path):
+    """Retrieves the digests of a temporary file.
+
+    Args:
+      path (str): path of the temporary file.
+
+    Yields:
+      bytes: binary digest, in ascending order.
+    """
+    with open(path, 'rb') as file_object:
+      while True:
+        digest = file_object.read(self.digest_size)
+        if len(digest) != self.digest_size:
+          break
+        yield digest
+
+  def _SpillDigests(self):
+    """Writes the sorted digests in memory to a temporary file."""
+    if not self._temporary_directory:
+      self._temporary_directory = tempfile.mkdtemp(prefix='plaso-hashset-')
+
+    path = os.path.join(self._temporary_directory, '{0:d}.digests'.format(
+        len(self._spill_file_paths)))
+
+    self._digests.sort()
+    with open(path, 'wb') as file_object:
+      file_object.write(b''.join(self._digests))
+
+    self._number_of_spilled_digests += len(self._digests)
+    self._spill_file_paths.append(path)
+    self._digests = []
+
+  def AddDigest(self, digest):
+    """Adds a digest.
+
+    Args:
+      digest (bytes): binary digest.
+
+    Raises:
+      ValueError: if the size of the digest is not supported.
+    """
+    if len(digest) != self.digest_size:
+      raise ValueError('Unsupported digest size: {0:d}'.format(len(digest)))
+
+    self._digests.append(digest)
+    if len(self._digests) >= self._maximum_number_of_digests_in_memory:
+      self._SpillDigests()
+
+  def AddHashList(self, path):
+    """Adds the digests of a hash list.
+
+    The hash list is either an NSRL RDS NSRLFile.txt or a plain-text file with
+    a hexadecimal digest at the start of every line. Empty lines and lines
+    that start with "#" are ignored.
+
+    Args:
+      path (str): path of the hash list.
+
+    Returns:
+      tuple[int, int]: number of digests added and the number of lines that
+          did not contain a supported digest.
+
+    Raises:
+      ValueError: if the hash list does not contain digests of the hash type.
+    """
+    column_index = None
+    number_of_digests = 0
+    number_of_invalid_lines = 0
+
+    with open(path, 'rb') as file_object:
+      for line_number, line in enumerate(file_object):
+        line = line.strip()
+        if line_number == 0 and line.startswith(self._RDS_HEADER_SIGNATURE):
+          column_names = line.split(b',')
+          column_name = self._RDS_COLUMN_NAMES[self._hash_type]
+          if column_name not in column_names:
+            raise ValueError(
+                'NSRL RDS hash list does not contain {0:s} hashes.'.format(
+                    self._hash_type))
+
+          column_index = column_names.index(column_name)
+          continue
+
+        if not line or line.startswith(b'#'):
+          continue
+
+        if column_index is None:
+          hexdigest = line.split(None, 1)[0]
+        else:
+          values = line.split(b',', column_index + 1)
+          hexdigest = values[column_index].strip(b'"')
+
+        try:
+          digest = binascii.unhexlify(hexdigest)
+        except (TypeError, ValueError):
+          digest = None
+
+        if not digest or len(digest) != self.digest_size:
+          number_of_invalid_lines += 1
+          continue
+
+        self.AddDigest(digest)
+        number_of_digests += 1
+
+    return number_of_digests, number_of_invalid_lines
+
+  def AddHashSetFile(self, path):
+    """Adds the digests of a hash set file.
+
+    The hash set file is only read when the hash set file is written.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Raises:
+      IOError: if the hash set file is not supported.
+      OSError: if the hash set file is not supported.
+    """
+    hash_set_file = HashSetFile()
+    hash_set_file.Open(path)
+    digest_size = hash_set_file.digest_size
+    hash_set_file.Close()
+
+    if digest_size != self.digest_size:
+      raise IOError('Unsupported hash set file digest size: {0:d}'.format(
+          digest_size))
+
+    self._hash_set_paths.append(path)
+
+  def Write(self, path):
+    """Writes the hash set file.
+
+    The digests are written to a temporary file first, hence the path can be
+    that of one of the added hash set files.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Returns:
+      int: number of digests in the hash set file.
+    """
+    # pylint: disable=protected-access
+    self._digests.sort()
+
+    hash_set_files = []
+    maximum_number_of_digests = (
+        self._number_of_spilled_digests + len(self._digests))
+    digest_generators = [iter(self._digests)]
+
+    for spill_file_path in self._spill_file_paths:
+      digest_generators.append(self._GetSpilledDigests(spill_file_path))
+
+    for hash_set_path in self._hash_set_paths:
+      hash_set_file = HashSetFile()
+      hash_set_file.Open(hash_set_path)
+      hash_set_files.append(hash_set_file)
+
+      maximum_number_of_digests += hash_set_file.number_of_digests
+      digest_generators.append(hash_set_file.GetDigests())
+
+    bloom_filter_size, number_of_bloom_filter_hashes = (
+        HashSetFile._GetBloomFilterSize(maximum_number_of_digests))
+    bloom_filter = bytearray(bloom_filter_size)
+    bloom_filter_number_of_bits = bloom_filter_size * 8
+
+    temporary_path = '{0:s}.tmp'.format(path)
+    number_of_digests = 0
+
+    try:
+      with open(temporary_path, 'wb') as file_object:
+        file_object.write(b'\x00' * (
+            HashSetFile._FILE_HEADER.size + bloom_filter_size))
+
+        last_digest = None
+        digests = []
+        for digest in heapq.merge(*digest_generators):
+          if digest == last_digest:
+            continue
+
+          bit_indexes = HashSetFile._GetBloomFilterBitIndexes(
+              digest, bloom_filter_number_of_bits,
+              number_of_bloom_filter_hashes)
+          for bit_index in bit_indexes:
+            bloom_filter[bit_index >> 3] |= 1 << (bit_index & 7)
+
+          digests.append(digest)
+          if len(digests) >= 65536:
+            file_object.write(b''.join(digests))
+            digests = []
+
+          last_digest = digest
+          number_of_digests += 1
+
+        file_object.write(b''.join(digests))
+
+        file_header_data = HashSetFile._FILE_HEADER.pack(
+            HashSetFile._FILE_SIGNATURE, HashSetFile._FORMAT_VERSION,
+            self.digest_size, number_of_digests, bloom_filter_size,
+            number_of_bloom_filter_hashes)
+
+        file_object.seek(0, os.SEEK_SET)
+        file_object.write(file_header_data)
+        file_object.write(bytes(bloom_filter))
+
+    finally:
+      for hash_set_file in hash_set_files:
+        hash_set_file.Close()
+
+    if os.path.exists(path):
+      os.remove(path)
+    os.rename(temporary_path, path)
+
+    return number_of_digests
+
+  def Close(self):
+    """Removes the temporary files."""
+    if self._temporary_directory:
+      shutil.rmtree(self._temporary_directory, True)
+      self._temporary_directory = None
+
+    self._digests = []
+    self._number_of_spilled_digests = 0
+    self._spill_file_paths = []
+
+
+class LocalHashSetAnalyzer(interface.HashAnalyzer):
+  """Analyzes file hashes by consulting a local hash set file.
+
+  Attributes:
+    analyses_performed (int): number of analysis batches completed by this
+        analyzer.
+    hashes_per_batch (int): maximum number of hashes to analyze at once.
+    number_of_concurrent_batches (int): maximum number of batches that are
+        analyzed concurrently.
+    seconds_spent_analyzing (int): number of seconds this analyzer has spent
+        performing analysis (as opposed to waiting on queues, etc.)
+    wait_after_analysis (int): number of seconds the analyzer will wait for
+        after analyzing a batch of hashes before it analyzes the next batch.
+  """
+
+  DIGEST_SIZES = {
+      'md5': 16,
+      'sha1': 20,
+      'sha256': 32}
+
+  SUPPORTED_HASHES = ['md5', 'sha1', 'sha256']
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a local hash set analyzer thread.
+
+    Args:
+      hash_queue (Queue.queue): contains hashes to be analyzed.
+      hash_analysis_queue (Queue.queue): that the analyzer will append
+          HashAnalysis objects this queue.
+    """
+    super(LocalHashSetAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self._hash_set_file = None
+    self._hash_set_path = None
+    self.hashes_per_batch = 1000
+
+  def _CloseHashSetFile(self):
+    """Closes the hash set file if opened."""
+    if self._hash_set_file:
+      self._hash_set_file.Close()
+      self._hash_set_file = None
+
+  def _OpenHashSetFile(self):
+    """Opens the hash set file.
+
+    Returns:
+      HashSetFile: hash set file or None if the hash set file cannot be
+          opened or does not contain digests of the lookup hash.
+    """
+    if not self._hash_set_path:
+      logger.error('Missing hash set file path.')
+      return None
+
+    hash_set_file = HashSetFile()
+    try:
+      hash_set_file.Open(self._hash_set_path)
+    except (IOError, OSError) as exception:
+      logger.error(
+          'Unable to open hash set file: {0:s} with error: {1!s}'.format(
+              self._hash_set_path, exception))
+      return None
+
+    digest_size = self.DIGEST_SIZES.get(self.lookup_hash, None)
+    if hash_set_file.digest_size != digest_size:
+      logger.error(
+          'Hash set file: {0:s} does not contain {1:s} hashes.'.format(
+              self._hash_set_path, self.lookup_hash))
+      hash_set_file.Close()
+      return None
+
+    return hash_set_file
+
+  def Analyze(self, hashes):
+    """Looks up hashes in the hash set file.
+
+    Args:
+      hashes (list[str]): hash values to look up.
+
+    Returns:
+      list[HashAnalysis]: analysis results, or an empty list on error.
+    """
+    if not self._hash_set_file:
+      self._hash_set_file = self._OpenHashSetFile()
+      if not self._hash_set_file:
+        self.SignalAbort()
+        return []
+
+    hash_analyses = []
+    for digest in hashes:
+      try:
+        binary_digest = binascii.unhexlify(digest)
+      except (TypeError, ValueError):
+        logger.error('Unable to decode digest: {0!s}.'.format(digest))
+        binary_digest = b''
+
+      response = self._hash_set_file.Contains(binary_digest)
+
+      hash_analysis = interface.HashAnalysis(digest, response)
+      hash_analyses.append(hash_analysis)
+
+    return hash_analyses
+
+  def SetHashSetPath(self, path):
+    """Sets the path of the hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+    """
+    self._CloseHashSetFile()
+    self._hash_set_path = path
+
+  def TestHashSet(self):
+    """Tests the hash set file.
+
+    Returns:
+      bool: True if the hash set file can be opened and contains digests of
+          the lookup hash.
+    """
+    hash_set_file = self._OpenHashSetFile()
+    if not hash_set_file:
+      return False
+
+    hash_set_file.Close()
+    return True
+
+  # This method is part of the threading.Thread interface, hence its name does
+  # not follow the style guide.
+  def run(self):
+    """The method called by the threading library to start the thread."""
+    try:
+      super(LocalHashSetAnalyzer, self).run()
+    finally:
+      self._CloseHashSetFile()
+
+
+class LocalHashSetAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
+  """Analysis plugin for looking up hashes in a local hash set file."""
+
+  # Known file hash sets, such as the NSRL, contain files of all different
+  # types so look up all files.
+  DATA_TYPES = ['fs:stat', 'fs:stat:ntfs']
+
+  URLS = [
+      ('https://www.nist.gov/itl/ssd/software-quality-group/'
+       'national-software-reference-library-nsrl')]
+
+  NAME = 'local_hashset'
+
+  def __init__(self):
+    """Initializes a local hash set analysis plugin."""
+    super(LocalHashSetAnalysisPlugin, self).__init__(LocalHashSetAnalyzer)
+    self._label = None
+
+  def GenerateLabels(self, hash_information):
+    """Generates a list of strings that will be used in the event tag.
+
+    Args:
+      hash_information (bool): whether the analyzer found the hash in the
+          hash set file.
+
+    Returns:
+      list[str]: strings describing the results from the hash set file.
+    """
+    if hash_information:
+      return [self._label]
+    return []
+
+  def SetHashSetPath(self, path):
+    """Sets the path of the hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+    """
+    self._analyzer.SetHashSetPath(path)
+
+  def SetLabel(self, label):
+    """Sets the tagging label.
+
+    Args:
+      label (str): label to apply to events extracted from files that are
+          present in the hash set.
+    """
+    self._label = label
+
+  def TestHashSet(self):
+    """Tests the hash set file.
+
+    Returns:
+      bool: True if the hash set file can be opened and contains digests of
+          the lookup hash.
+    """
+    return self._analyzer.TestHashSet()
+
+
+manager.AnalysisPluginManager.RegisterPlugin(LocalHashSetAnalysisPlugin)
@@ -17,10 +17,12 @@ class NsrlsvrAnalyzer(interface.HashAnalyzer):
     analyses_performed (int): number of analysis batches completed by this
         analyzer.
     hashes_per_batch (int): maximum number of hashes to analyze at once.
+    number_of_concurrent_batches (int): maximum number of batches that are
+        analyzed concurrently.
     seconds_spent_analyzing (int): number of seconds this analyzer has spent
         performing analysis (as opposed to waiting on queues, etc.)
-    wait_after_analysis (int): number of seconds the analyzer will sleep for
-        after analyzing a batch of hashes.
+    wait_after_analysis (int): number of seconds the analyzer will wait for
+        after analyzing a batch of hashes before it analyzes the next batch.
   """
   _RECEIVE_BUFFER_SIZE = 4096
   _SOCKET_TIMEOUT = 3
@@ -40,6 +42,7 @@ class NsrlsvrAnalyzer(interface.HashAnalyzer):
     self._host = None
     self._port = None
     self.hashes_per_batch = 100
+    self.number_of_concurrent_batches = 4
 
   def _GetSocket(self):
     """Establishes a connection to an nsrlsvr instance.
@@ -72,8 +75,6 @@ class NsrlsvrAnalyzer(interface.HashAnalyzer):
       logger.error('Unable to encode digest: {0!s} to ASCII.'.format(digest))
       return False
 
-    response = None
-
     try:
       nsrl_socket.sendall(query)
       response = nsrl_socket.recv(self._RECEIVE_BUFFER_SIZE)
@@ -81,9 +82,10 @@ class NsrlsvrAnalyzer(interface.HashAnalyzer):
     except socket.error as exception:
       logger.error('Unable to query nsrlsvr with error: {0!s}.'.format(
           exception))
+      return None
 
     if not response:
-      return False
+      return None
 
     # Strip end-of-line characters since they can differ per platform on which
     # nsrlsvr is running.
@@ -9,7 +9,7 @@ from plaso.containers import reports
 from plaso.lib import definitions
 
 
-class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
+class SessionizeAnalysisPlugin(interface.AggregatingAnalysisPlugin):
   """Analysis plugin that labels events by session."""
 
   NAME = 'sessionize'
@@ -24,9 +24,8 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
     """Initializes a sessionize analysis plugin."""
     super(SessionizeAnalysisPlugin, self).__init__()
     self._maximum_pause_microseconds = self._DEFAULT_MAXIMUM_PAUSE
-    self._session_counter = 0
-    self._events_per_session = []
     self._number_of_event_tags = 0
+    self._session_counter = 0
     self._session_end_timestamp = None
 
   def SetMaximumPause(self, maximum_pause_minutes):
@@ -49,14 +48,21 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
+    number_of_sessions = 0
+    if self._session_end_timestamp is not None:
+      number_of_sessions = self._session_counter + 1
+
     report_text = [
         'Sessionize plugin identified {0:d} sessions and '
         'applied {1:d} tags.'.format(
-            len(self._events_per_session), self._number_of_event_tags)]
-    for session, event_count in enumerate(self._events_per_session):
+            number_of_sessions, self._number_of_event_tags)]
+    for session, event_count in self._GetCounterValues('events_per_session'):
       report_text.append('\tSession {0:d}: {1:d} events'.format(
           session, event_count))
     report_text = '\n'.join(report_text)
+
+    self._CloseAggregationState()
+
     return reports.AnalysisReport(plugin_name=self.NAME, text=report_text)
 
   def ExamineEvent(self, mediator, event):
@@ -67,20 +73,13 @@ class SessionizeAnalysisPlugin(interface.AnalysisPlugin):
           plugins and other components, such as storage and dfvfs.
       event (EventObject): event to examine.
     """
-    if self._session_end_timestamp is None:
-      self._session_end_timestamp = (
-          event.timestamp + self._maximum_pause_microseconds)
-      self._events_per_session.append(0)
-
-    if event.timestamp > self._session_end_timestamp:
+    if (self._session_end_timestamp is not None and
+        event.timestamp > self._session_end_timestamp):
       self._session_counter += 1
-      self._events_per_session.append(0)
 
     self._session_end_timestamp = (
         event.timestamp + self._maximum_pause_microseconds)
-    # The counter for the current session is the always the last item in
-    # the list.
-    self._events_per_session[-1] += 1
+    self._IncrementCounter('events_per_session', self._session_counter)
 
     label = 'session_{0:d}'.format(self._session_counter)
     event_tag = self._CreateEventTag(event, self._EVENT_TAG_COMMENT, [label])
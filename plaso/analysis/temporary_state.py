@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""State of an analysis plugin that is stored in a temporary database."""
+
+from __future__ import unicode_literals
+
+import sqlite3
+
+
+class TemporaryDatabaseState(object):
+  """State of an analysis plugin that is stored in a temporary database.
+
+  The state is stored in a temporary SQLite database, which SQLite removes
+  when it is closed, so that the memory usage of an analysis plugin does not
+  grow with the number of events. The database is created when it is first
+  used.
+  """
+
+  # Queries to create the tables of the database, which are defined by
+  # the subclass.
+  _CREATE_TABLE_QUERIES = []
+
+  def __init__(self):
+    """Initializes the state."""
+    super(TemporaryDatabaseState, self).__init__()
+    self._connection = None
+
+  def _GetConnection(self):
+    """Retrieves the connection to the database, creating it if needed.
+
+    Returns:
+      sqlite3.Connection: connection to the database.
+    """
+    if not self._connection:
+      # An empty filename creates a temporary database on disk. The database
+      # does not need to survive a crash, hence it has no rollback journal.
+      self._connection = sqlite3.connect('')
+      self._connection.execute('PRAGMA journal_mode=OFF')
+      self._connection.execute('PRAGMA synchronous=OFF')
+      for query in self._CREATE_TABLE_QUERIES:
+        self._connection.execute(query)
+
+    return self._connection
+
+  def Close(self):
+    """Closes the state, which removes the temporary database."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
@@ -14,7 +14,7 @@ from plaso.analysis import manager
 from plaso.containers import reports
 
 
-class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
+class UniqueDomainsVisitedPlugin(interface.AggregatingAnalysisPlugin):
   """A plugin to generate a list all domains visited.
 
   This plugin will extract domains from browser history events extracted by
@@ -33,11 +33,6 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
       'macosx:lsquarantine', 'msiecf:redirected', 'msiecf:url',
       'msie:webcache:container', 'opera:history', 'safari:history:visit'])
 
-  def __init__(self):
-    """Initializes the domains visited plugin."""
-    super(UniqueDomainsVisitedPlugin, self).__init__()
-    self._domains = []
-
   def ExamineEvent(self, mediator, event):
     """Analyzes an event and extracts domains from it.
 
@@ -55,12 +50,9 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
     url = getattr(event, 'url', None)
     if url is None:
       return
-    parsed_url = urlparse.urlparse(url)
+    parsed_url = urlparse.urlsplit(url)
     domain = getattr(parsed_url, 'netloc', None)
-    if domain in self._domains:
-      # We've already found an event containing this domain.
-      return
-    self._domains.append(domain)
+    self._AddToSet('domains', domain)
 
   def CompileReport(self, mediator):
     """Compiles an analysis report.
@@ -73,8 +65,8 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
       AnalysisReport: the analysis report.
     """
     lines_of_text = ['Listing domains visited by all users']
-    for domain in sorted(self._domains):
-      lines_of_text.append(domain)
+    lines_of_text.extend(self._GetSetValues('domains'))
+    self._CloseAggregationState()
 
     lines_of_text.append('')
     report_text = '\n'.join(lines_of_text)
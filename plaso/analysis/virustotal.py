@@ -32,6 +32,7 @@ class VirusTotalAnalyzer(interface.HTTPHashAnalyzer):
         hash_queue, hash_analysis_queue, **kwargs)
     self._api_key = None
     self._checked_for_old_python_version = False
+    self.number_of_concurrent_batches = 4
 
   def _QueryHashes(self, digests):
     """Queries VirusTotal for a specfic hashes.
@@ -132,6 +133,7 @@ class VirusTotalAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
     minute.
     """
     self._analyzer.hashes_per_batch = 4
+    self._analyzer.number_of_concurrent_batches = 1
     self._analyzer.wait_after_analysis = 60
     self._analysis_queue_timeout = self._analyzer.wait_after_analysis + 1
 
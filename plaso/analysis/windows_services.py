@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import json
+
 import yaml
 
 from plaso.analysis import interface
@@ -160,39 +162,12 @@ class WindowsService(yaml.YAMLObject):
         self.start_type, '{0:d}'.format(self.start_type))
 
 
-class WindowsServiceCollection(object):
-  """Class to hold and de-duplicate Windows Services."""
-
-  def __init__(self):
-    """Initialize a collection that holds Windows Service."""
-    super(WindowsServiceCollection, self).__init__()
-    self._services = []
-
-  def AddService(self, new_service):
-    """Add a new service to the list of ones we know about.
+class WindowsServicesAnalysisPlugin(interface.AggregatingAnalysisPlugin):
+  """Provides a single list of for Windows services found in the Registry.
 
-    Args:
-      new_service (WindowsService): the service to add.
-    """
-    for service in self._services:
-      if new_service == service:
-        # If this service is the same as one we already know about, we
-        # just want to add where it came from.
-        service.sources.append(new_service.sources[0])
-        return
-
-    # We only add a new object to our list if we don't have
-    # an identical one already.
-    self._services.append(new_service)
-
-  @property
-  def services(self):
-    """list[WindowsService]: services in this collection."""
-    return self._services
-
-
-class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
-  """Provides a single list of for Windows services found in the Registry."""
+  Services that are the same, other than the sources where they were found,
+  are grouped, where the group key is a JSON representation of the service.
+  """
 
   NAME = 'windows_services'
 
@@ -203,7 +178,40 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
     """Initializes the Windows Services plugin."""
     super(WindowsServicesAnalysisPlugin, self).__init__()
     self._output_format = 'text'
-    self._service_collection = WindowsServiceCollection()
+
+  def _GetServiceKey(self, service):
+    """Retrieves the key of a service in the group of services.
+
+    Args:
+      service (WindowsService): service.
+
+    Returns:
+      str: JSON representation of the attributes of the service, other than
+          the sources.
+    """
+    service_attributes = {
+        'image_path': service.image_path,
+        'name': service.name,
+        'object_name': service.object_name,
+        'service_dll': service.service_dll,
+        'service_type': service.service_type,
+        'start_type': service.start_type}
+    return json.dumps(service_attributes, sort_keys=True)
+
+  def _GetServices(self):
+    """Retrieves the services, with the sources where they were found.
+
+    Returns:
+      list[WindowsService]: services, in the order they were first found.
+    """
+    services = []
+    for service_key, sources in self._GetGroups('services'):
+      service_attributes = json.loads(service_key)
+      service = WindowsService(source=sources[0], **service_attributes)
+      service.sources = sources
+      services.append(service)
+
+    return services
 
   def _FormatServiceText(self, service):
     """Produces a human readable multi-line string representing the service.
@@ -237,14 +245,16 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: report.
     """
+    services = self._GetServices()
+    self._CloseAggregationState()
+
     # TODO: move YAML representation out of plugin and into serialization.
     lines_of_text = []
     if self._output_format == 'yaml':
-      lines_of_text.append(
-          yaml.safe_dump_all(self._service_collection.services))
+      lines_of_text.append(yaml.safe_dump_all(services))
     else:
       lines_of_text.append('Listing Windows Services')
-      for service in self._service_collection.services:
+      for service in services:
         lines_of_text.append(self._FormatServiceText(service))
         lines_of_text.append('')
 
@@ -267,7 +277,8 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
     if event_data_type == 'windows:registry:service':
       # Create and store the service.
       service = WindowsService.FromEvent(event)
-      self._service_collection.AddService(service)
+      service_key = self._GetServiceKey(service)
+      self._AddToGroup('services', service_key, service.sources[0])
 
   def SetOutputFormat(self, output_format):
     """Sets the output format of the generated report.
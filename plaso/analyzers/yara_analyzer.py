@@ -3,6 +3,10 @@
 
 from __future__ import unicode_literals
 
+import hashlib
+import os
+import tempfile
+
 import yara
 
 from plaso.analyzers import interface
@@ -13,7 +17,16 @@ from plaso.lib import definitions
 
 
 class YaraAnalyzer(interface.BaseAnalyzer):
-  """Analyzer that matches Yara rules."""
+  """Analyzer that matches Yara rules.
+
+  The rules are matched against all the data of a file in a single pass, so
+  that conditions that depend on the offset of a string or on the size of
+  the file, such as "$mz at 0" or "filesize", are evaluated correctly. The
+  data of a file that fits in a single block is matched in memory. The data
+  of a larger file is written to a temporary file that is matched after the
+  last block was analyzed. Files larger than the file size limit are not
+  matched.
+  """
 
   # pylint: disable=no-member
 
@@ -22,33 +35,194 @@ class YaraAnalyzer(interface.BaseAnalyzer):
 
   PROCESSING_STATUS_HINT = definitions.PROCESSING_STATUS_YARA_SCAN
 
-  INCREMENTAL_ANALYZER = False
+  INCREMENTAL_ANALYZER = True
 
   _ATTRIBUTE_NAME = 'yara_match'
   _MATCH_TIMEOUT = 60
 
+  _TEMPORARY_FILE_PREFIX = 'plaso-yara-'
+
+  # Maximum size of the data of a file that is matched, which bounds the
+  # size of the temporary file.
+  DEFAULT_FILE_SIZE_LIMIT = 256 * 1024 * 1024
+
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
-    self._matches = []
+    self._data = None
+    self._data_size = 0
+    self._file_size_limit = self.DEFAULT_FILE_SIZE_LIMIT
     self._rules = None
+    self._temporary_directory = None
+    self._temporary_file_object = None
+    self._temporary_path = None
+    self._unscannable = False
 
-  def Analyze(self, data):
-    """Analyzes a block of data, attempting to match Yara rules to it.
+  def _GetCachedRulesPath(self, rules_string, cache_directory):
+    """Retrieves the path of the compiled rules in the cache.
 
     Args:
-      data(bytes): a block of data.
+      rules_string (str): Yara rule definitions.
+      cache_directory (str): path of the directory of the compiled rules
+          cache.
+
+    Returns:
+      str: path of the compiled rules, which depends on the Yara version and
+          the hash of the rule definitions.
     """
-    if not self._rules:
-      return
+    rules_hash = hashlib.sha256(rules_string.encode('utf-8')).hexdigest()
+    filename = 'yara-{0:s}-{1:s}.yarc'.format(
+        getattr(yara, '__version__', 'unknown'), rules_hash)
+    return os.path.join(cache_directory, filename)
+
+  def _LoadCachedRules(self, path):
+    """Loads compiled rules from the cache.
+
+    Args:
+      path (str): path of the compiled rules.
+
+    Returns:
+      yara.Rules: compiled rules or None if not available.
+    """
+    if not os.path.isfile(path):
+      return None
+
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
-    except yara.YaraTimeoutError:
+      return yara.load(filepath=path)
+    except yara.Error as exception:
+      logger.warning(
+          'Unable to load compiled Yara rules: {0:s} with error: {1!s}'.format(
+              path, exception))
+
+    return None
+
+  def _SaveCachedRules(self, rules, path):
+    """Saves compiled rules to the cache.
+
+    The rules are written to a temporary file that is renamed afterwards, so
+    that other processes do not load partially written rules.
+
+    Args:
+      rules (yara.Rules): compiled rules.
+      path (str): path of the compiled rules.
+    """
+    temporary_path = None
+    try:
+      file_descriptor, temporary_path = tempfile.mkstemp(
+          suffix='.yarc', dir=os.path.dirname(path))
+      os.close(file_descriptor)
+
+      rules.save(filepath=temporary_path)
+      os.rename(temporary_path, path)
+      temporary_path = None
+
+    except (OSError, yara.Error) as exception:
+      # Another process could have saved the rules first, which prevents
+      # the rename on Windows.
+      logger.warning(
+          'Unable to save compiled Yara rules: {0:s} with error: {1!s}'.format(
+              path, exception))
+
+    finally:
+      if temporary_path and os.path.exists(temporary_path):
+        os.remove(temporary_path)
+
+  def _Match(self):
+    """Matches the rules against the analyzed data.
+
+    Returns:
+      list[str]: names of the rules that matched.
+    """
+    try:
+      if self._temporary_path:
+        matches = self._rules.match(
+            filepath=self._temporary_path, timeout=self._MATCH_TIMEOUT)
+      else:
+        matches = self._rules.match(
+            data=self._data, timeout=self._MATCH_TIMEOUT)
+
+    except yara.TimeoutError:
       logger.error('Could not process file within timeout: {0:d}'.format(
           self._MATCH_TIMEOUT))
-    except yara.YaraError as exception:
+      return []
+
+    except yara.Error as exception:
       logger.error('Error processing file with Yara: {0!s}.'.format(
           exception))
+      return []
+
+    return [match.rule for match in matches]
+
+  def _RemoveTemporaryFile(self):
+    """Closes and removes the temporary file, if any."""
+    if self._temporary_file_object:
+      try:
+        self._temporary_file_object.close()
+      except (IOError, OSError) as exception:
+        # Closing flushes buffered data, which fails if the disk is full.
+        logger.warning(
+            'Unable to close temporary file with error: {0!s}'.format(
+                exception))
+
+      self._temporary_file_object = None
+
+    if self._temporary_path:
+      try:
+        os.remove(self._temporary_path)
+      except OSError as exception:
+        logger.warning((
+            'Unable to remove temporary file: {0:s} with error: '
+            '{1!s}').format(self._temporary_path, exception))
+
+      self._temporary_path = None
+
+  def Analyze(self, data):
+    """Analyzes a block of data, attempting to match Yara rules to it.
+
+    The first block is kept in memory. When a file consists of more than
+    one block, the blocks are written to a temporary file instead. If the
+    temporary file cannot be written or the file exceeds the file size
+    limit, the file is not matched.
+
+    Args:
+      data(bytes): a block of data.
+    """
+    if self._rules is None or self._unscannable:
+      return
+
+    self._data_size += len(data)
+    if self._file_size_limit and self._data_size > self._file_size_limit:
+      logger.debug((
+          'File size exceeds Yara file size limit: {0:d}, file will not be '
+          'matched.').format(self._file_size_limit))
+
+      self._data = None
+      self._unscannable = True
+      self._RemoveTemporaryFile()
+      return
+
+    if self._data is None and not self._temporary_file_object:
+      self._data = data
+      return
+
+    try:
+      if not self._temporary_file_object:
+        file_descriptor, self._temporary_path = tempfile.mkstemp(
+            dir=self._temporary_directory, prefix=self._TEMPORARY_FILE_PREFIX)
+        self._temporary_file_object = os.fdopen(file_descriptor, 'wb')
+        self._temporary_file_object.write(self._data)
+        self._data = None
+
+      self._temporary_file_object.write(data)
+
+    except (IOError, OSError) as exception:
+      logger.error((
+          'Unable to write data to temporary file with error: {0!s}, file '
+          'will not be matched.').format(exception))
+
+      self._data = None
+      self._unscannable = True
+      self._RemoveTemporaryFile()
 
   def GetResults(self):
     """Retrieves results of the most recent analysis.
@@ -56,24 +230,80 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     Returns:
       list[AnalyzerResult]: results.
     """
+    if self._temporary_file_object:
+      try:
+        self._temporary_file_object.close()
+        self._temporary_file_object = None
+
+      except (IOError, OSError) as exception:
+        logger.error((
+            'Unable to close temporary file with error: {0!s}, file will '
+            'not be matched.').format(exception))
+
+        self._unscannable = True
+        self._RemoveTemporaryFile()
+
+    matched_rule_names = []
+    if self._rules is not None and not self._unscannable and (
+        self._data is not None or self._temporary_path):
+      matched_rule_names = self._Match()
+
     result = analyzer_result.AnalyzerResult()
     result.analyzer_name = self.NAME
     result.attribute_name = self._ATTRIBUTE_NAME
-    rule_names = [match.rule for match in self._matches]
-    result.attribute_value = ','.join(rule_names)
+    result.attribute_value = ','.join(matched_rule_names)
     return [result]
 
   def Reset(self):
     """Resets the internal state of the analyzer."""
-    self._matches = []
+    self._data = None
+    self._data_size = 0
+    self._unscannable = False
+    self._RemoveTemporaryFile()
+
+  def SetFileSizeLimit(self, file_size_limit):
+    """Sets the maximum size of the data of a file that is matched.
+
+    Args:
+      file_size_limit (int): maximum size of the data of a file in bytes,
+          where 0 represents no limit.
+    """
+    self._file_size_limit = file_size_limit
 
-  def SetRules(self, rules_string):
+  def SetRules(self, rules_string, cache_directory=None):
     """Sets the rules that the Yara analyzer will use.
 
     Args:
       rules_string(str): Yara rule definitions
+      cache_directory (Optional[str]): path of the directory to cache the
+          compiled rules in, where None represents the rules are compiled
+          without a cache.
+
+    Raises:
+      yara.Error: if the rule definitions cannot be compiled.
+    """
+    rules = None
+    cached_rules_path = None
+    if cache_directory:
+      cached_rules_path = self._GetCachedRulesPath(
+          rules_string, cache_directory)
+      rules = self._LoadCachedRules(cached_rules_path)
+
+    if rules is None:
+      rules = yara.compile(source=rules_string)
+      if cached_rules_path:
+        self._SaveCachedRules(rules, cached_rules_path)
+
+    self._rules = rules
+
+  def SetTemporaryDirectory(self, temporary_directory):
+    """Sets the directory of the temporary files.
+
+    Args:
+      temporary_directory (str): path of the directory of the temporary
+          files, where None represents the default temporary directory.
     """
-    self._rules = yara.compile(source=rules_string)
+    self._temporary_directory = temporary_directory
 
 
 manager.AnalyzersManager.RegisterAnalyzer(YaraAnalyzer)
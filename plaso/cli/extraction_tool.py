@@ -10,9 +10,6 @@ from dfvfs.resolver import context as dfvfs_context
 # The following import makes sure the analyzers are registered.
 from plaso import analyzers  # pylint: disable=unused-import
 
-# The following import makes sure the parsers are registered.
-from plaso import parsers  # pylint: disable=unused-import
-
 from plaso.cli import logger
 from plaso.cli import storage_media_tool
 from plaso.cli import tool_options
@@ -52,6 +49,7 @@ class ExtractionTool(
         input_reader=input_reader, output_writer=output_writer)
     self._artifacts_registry = None
     self._buffer_size = 0
+    self._metrics_port = None
     self._mount_path = None
     self._operating_system = None
     self._parser_filter_expression = None
@@ -63,11 +61,14 @@ class ExtractionTool(
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
     self._single_process_mode = False
+    self._storage_compression_level = None
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._text_prepend = None
     self._use_zeromq = True
+    self._yara_file_size_limit = None
+    self._yara_rules_cache_directory = None
     self._yara_rules_string = None
 
   def _CreateProcessingConfiguration(self, knowledge_base):
@@ -96,10 +97,14 @@ class ExtractionTool(
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.yara_file_size_limit = self._yara_file_size_limit
+    configuration.extraction.yara_rules_cache_directory = (
+        self._yara_rules_cache_directory)
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
     configuration.input_source.mount_path = self._mount_path
     configuration.log_filename = self._log_file
+    configuration.metrics_port = self._metrics_port
     configuration.parser_filter_expression = self._parser_filter_expression
     configuration.preferred_year = self._preferred_year
     configuration.profiling.directory = self._profiling_directory
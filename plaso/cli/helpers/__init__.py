@@ -4,6 +4,7 @@
 from plaso.cli.helpers import analysis_plugins
 from plaso.cli.helpers import artifact_definitions
 from plaso.cli.helpers import artifact_filters
+from plaso.cli.helpers import chrome_extension_analysis
 from plaso.cli.helpers import data_location
 from plaso.cli.helpers import date_filters
 from plaso.cli.helpers import dynamic_output
@@ -11,8 +12,11 @@ from plaso.cli.helpers import elastic_output
 from plaso.cli.helpers import event_filters
 from plaso.cli.helpers import extraction
 from plaso.cli.helpers import filter_file
+from plaso.cli.helpers import hash_lookup_cache
 from plaso.cli.helpers import hashers
 from plaso.cli.helpers import language
+from plaso.cli.helpers import local_hashset_analysis
+from plaso.cli.helpers import metrics
 from plaso.cli.helpers import mysql_4n6time_output
 from plaso.cli.helpers import nsrlsvr_analysis
 from plaso.cli.helpers import output_modules
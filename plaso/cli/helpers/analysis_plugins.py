@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import sys
 
+from plaso.analysis import interface as analysis_interface
 from plaso.analysis import manager as analysis_manager
 from plaso.cli import tools
 from plaso.cli.helpers import interface
@@ -47,6 +48,14 @@ class AnalysisPluginsArgumentsHelper(interface.ArgumentsHelper):
       names = None
 
     if names and names != ['list']:
+      plugin_classes = dict(analysis_manager.AnalysisPluginManager.GetPlugins())
+      for name in names:
+        plugin_class = plugin_classes.get(name, None)
+        if plugin_class and issubclass(
+            plugin_class, analysis_interface.HashTaggingAnalysisPlugin):
+          names.append('hash_lookup_cache')
+          break
+
       manager.ArgumentHelperManager.AddCommandLineArguments(
           argument_group, category='analysis', names=names)
 
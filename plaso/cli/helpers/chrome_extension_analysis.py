@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""The Chrome extension analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import os
+
+from plaso.analysis import chrome_extension
+from plaso.analysis import chrome_extension_resolvers
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class ChromeExtensionAnalysisArgumentsHelper(interface.ArgumentsHelper):
+  """Chrome extension analysis plugin CLI arguments helper."""
+
+  NAME = 'chrome_extension'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the Chrome extension analysis plugin.'
+
+  _DEFAULT_DEADLINE = (
+      chrome_extension_resolvers.WebStoreChromeExtensionResolver.
+      DEFAULT_DEADLINE)
+
+  _DEFAULT_TIME_TO_LIVE = (
+      chrome_extension_resolvers.CachingChromeExtensionResolver.
+      DEFAULT_TIME_TO_LIVE)
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        '--chrome-extension-cache', '--chrome_extension_cache',
+        dest='chrome_extension_cache', type=str, action='store',
+        default=None, metavar='PATH', help=(
+            'Path of a SQLite database file to cache the names of Chrome '
+            'extensions in, so that analyzing the same extensions again does '
+            'not require network lookups.'))
+
+    argument_group.add_argument(
+        '--chrome-extension-cache-ttl', '--chrome_extension_cache_ttl',
+        dest='chrome_extension_cache_ttl', type=int, action='store',
+        default=cls._DEFAULT_TIME_TO_LIVE, metavar='SECONDS', help=(
+            'Number of seconds a cached name of a Chrome extension remains '
+            'valid, the default is: {0:d}.').format(cls._DEFAULT_TIME_TO_LIVE))
+
+    argument_group.add_argument(
+        '--chrome-extension-database', '--chrome_extension_database',
+        dest='chrome_extension_database', type=str, action='store',
+        default=None, metavar='PATH', help=(
+            'Path of a JSON file with the names of Chrome extensions per '
+            'extension identifier, the default is chrome_extensions.json in '
+            'the data location.'))
+
+    argument_group.add_argument(
+        '--chrome-extension-deadline', '--chrome_extension_deadline',
+        dest='chrome_extension_deadline', type=int, action='store',
+        default=cls._DEFAULT_DEADLINE, metavar='SECONDS', help=(
+            'Number of seconds after which the Chrome Web Store lookups are '
+            'abandoned, lookups that are waiting for a response time out at '
+            'the deadline, the default is: {0:d}.').format(
+                cls._DEFAULT_DEADLINE))
+
+    argument_group.add_argument(
+        '--chrome-extension-offline', '--chrome_extension_offline',
+        dest='chrome_extension_offline', action='store_true', default=False,
+        help=(
+            'Do not look up the names of Chrome extensions in the Chrome Web '
+            'Store.'))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (ChromeExtensionPlugin): analysis plugin to configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(analysis_plugin, chrome_extension.ChromeExtensionPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of ChromeExtensionPlugin')
+
+    database_path = cls._ParseStringOption(
+        options, 'chrome_extension_database')
+    if database_path and not os.path.isfile(database_path):
+      raise errors.BadConfigOption(
+          'No such Chrome extensions database file: {0:s}.'.format(
+              database_path))
+
+    analysis_plugin.SetDatabasePath(database_path)
+
+    cache_path = cls._ParseStringOption(options, 'chrome_extension_cache')
+    if cache_path:
+      time_to_live = cls._ParseNumericOption(
+          options, 'chrome_extension_cache_ttl',
+          default_value=cls._DEFAULT_TIME_TO_LIVE)
+      if time_to_live < 0:
+        raise errors.BadConfigOption(
+            'Chrome extension cache time to live value {0:d} is not '
+            'supported. Value must be 0 or greater.'.format(time_to_live))
+
+      analysis_plugin.SetCachePath(cache_path, time_to_live=time_to_live)
+
+    deadline = cls._ParseNumericOption(
+        options, 'chrome_extension_deadline',
+        default_value=cls._DEFAULT_DEADLINE)
+    if deadline < 0:
+      raise errors.BadConfigOption(
+          'Chrome extension deadline value {0:d} is not supported. Value '
+          'must be 0 or greater.'.format(deadline))
+
+    use_network = not getattr(options, 'chrome_extension_offline', False)
+    analysis_plugin.SetNetworkLookup(use_network, deadline=deadline)
+
+
+manager.ArgumentHelperManager.RegisterHelper(
+    ChromeExtensionAnalysisArgumentsHelper)
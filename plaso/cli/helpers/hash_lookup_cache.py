@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""The hash lookup cache CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import hash_lookup_cache
+from plaso.analysis import interface as analysis_interface
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class HashLookupCacheArgumentsHelper(interface.ArgumentsHelper):
+  """Hash lookup cache CLI arguments helper."""
+
+  NAME = 'hash_lookup_cache'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the cache of hash analysis plugins.'
+
+  _DEFAULT_TIME_TO_LIVE = hash_lookup_cache.HashLookupCache.DEFAULT_TIME_TO_LIVE
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--hash-lookup-cache', '--hash_lookup_cache', dest='hash_lookup_cache',
+        type=str, action='store', default=None, metavar='PATH', help=(
+            'Path of a SQLite database file to cache the results of hash '
+            'lookups in, so that analyzing the same files again does not '
+            'require remote lookups.'))
+
+    argument_group.add_argument(
+        '--hash-lookup-cache-ttl', '--hash_lookup_cache_ttl',
+        dest='hash_lookup_cache_ttl', type=int, action='store',
+        default=cls._DEFAULT_TIME_TO_LIVE, metavar='SECONDS', help=(
+            'Number of seconds a cached hash lookup result remains valid, '
+            'the default is: {0:d}.').format(cls._DEFAULT_TIME_TO_LIVE))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      analysis_plugin (HashTaggingAnalysisPlugin): analysis plugin to
+          configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(
+        analysis_plugin, analysis_interface.HashTaggingAnalysisPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of HashTaggingAnalysisPlugin')
+
+    path = cls._ParseStringOption(options, 'hash_lookup_cache')
+    if not path:
+      return
+
+    time_to_live = cls._ParseNumericOption(
+        options, 'hash_lookup_cache_ttl',
+        default_value=cls._DEFAULT_TIME_TO_LIVE)
+    if time_to_live < 0:
+      raise errors.BadConfigOption(
+          'Hash lookup cache time to live value {0:d} is not supported. '
+          'Value must be 0 or greater.'.format(time_to_live))
+
+    lookup_cache = hash_lookup_cache.HashLookupCache(
+        path, time_to_live=time_to_live)
+    analysis_plugin.SetLookupCache(lookup_cache)
+
+
+manager.ArgumentHelperManager.RegisterHelper(HashLookupCacheArgumentsHelper)
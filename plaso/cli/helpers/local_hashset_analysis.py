@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""The local hash set analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.analysis import local_hashset
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class LocalHashSetAnalysisArgumentsHelper(interface.ArgumentsHelper):
+  """Local hash set analysis plugin CLI arguments helper."""
+
+  NAME = 'local_hashset'
+  CATEGORY = 'analysis'
+  DESCRIPTION = 'Argument helper for the local hash set analysis plugin.'
+
+  _DEFAULT_HASH = 'md5'
+  _DEFAULT_LABEL = 'known_file'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        '--local-hashset-hash', '--local_hashset_hash',
+        dest='local_hashset_hash', type=str, action='store',
+        choices=local_hashset.LocalHashSetAnalyzer.SUPPORTED_HASHES,
+        default=cls._DEFAULT_HASH, metavar='HASH', help=(
+            'Type of hash to look up in the hash set file, the default is: '
+            '{0:s}. Supported options: {1:s}'.format(
+                cls._DEFAULT_HASH, ', '.join(
+                    local_hashset.LocalHashSetAnalyzer.SUPPORTED_HASHES))))
+
+    argument_group.add_argument(
+        '--local-hashset-label', '--local_hashset_label',
+        dest='local_hashset_label', type=str, action='store',
+        default=cls._DEFAULT_LABEL, metavar='LABEL', help=(
+            'Label to apply to events, the default is: '
+            '{0:s}.').format(cls._DEFAULT_LABEL))
+
+    argument_group.add_argument(
+        '--local-hashset-path', '--local_hashset_path',
+        dest='local_hashset_path', type=str, action='store', default=None,
+        metavar='PATH', help=(
+            'Path of the hash set file, as created by '
+            'utils/build_hashset.py, to look up hashes in.'))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (LocalHashSetAnalysisPlugin): analysis plugin to
+          configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when the hash set file is missing or not supported.
+    """
+    if not isinstance(
+        analysis_plugin, local_hashset.LocalHashSetAnalysisPlugin):
+      raise errors.BadConfigObject(
+          'Analysis plugin is not an instance of LocalHashSetAnalysisPlugin')
+
+    label = cls._ParseStringOption(
+        options, 'local_hashset_label', default_value=cls._DEFAULT_LABEL)
+    analysis_plugin.SetLabel(label)
+
+    lookup_hash = cls._ParseStringOption(
+        options, 'local_hashset_hash', default_value=cls._DEFAULT_HASH)
+    analysis_plugin.SetLookupHash(lookup_hash)
+
+    path = cls._ParseStringOption(options, 'local_hashset_path')
+    if not path:
+      raise errors.BadConfigOption('Missing hash set file path.')
+
+    analysis_plugin.SetHashSetPath(path)
+
+    if not analysis_plugin.TestHashSet():
+      raise errors.BadConfigOption(
+          'Unable to open hash set file: {0:s} with {1:s} hashes.'.format(
+              path, lookup_hash))
+
+
+manager.ArgumentHelperManager.RegisterHelper(
+    LocalHashSetAnalysisArgumentsHelper)
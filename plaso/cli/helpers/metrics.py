@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""The metrics CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.cli import tools
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class MetricsArgumentsHelper(interface.ArgumentsHelper):
+  """Metrics CLI arguments helper."""
+
+  NAME = 'metrics'
+  DESCRIPTION = 'Metrics command line arguments.'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--metrics_port', '--metrics-port', dest='metrics_port',
+        action='store', type=int, metavar='PORT', default=None, help=(
+            'Port of a HTTP server on 127.0.0.1 that exposes processing '
+            'metrics, such as events per second, parser timings, task queue '
+            'depths and memory usage per process, in the Prometheus text '
+            'format at /metrics. Use 0 to let the operating system select '
+            'a port. The metrics server is only available in multi process '
+            'mode and is disabled by default.'))
+
+  @classmethod
+  def ParseOptions(cls, options, configuration_object):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      configuration_object (CLITool): object to be configured by the argument
+          helper.
+
+    Raises:
+      BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(configuration_object, tools.CLITool):
+      raise errors.BadConfigObject(
+          'Configuration object is not an instance of CLITool')
+
+    metrics_port = cls._ParseNumericOption(options, 'metrics_port')
+
+    if metrics_port is not None and (metrics_port < 0 or metrics_port > 65535):
+      raise errors.BadConfigOption(
+          'Invalid metrics port value: {0:d} out of bounds.'.format(
+              metrics_port))
+
+    setattr(configuration_object, '_metrics_port', metrics_port)
+
+
+manager.ArgumentHelperManager.RegisterHelper(MetricsArgumentsHelper)
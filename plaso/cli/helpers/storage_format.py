@@ -29,6 +29,15 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
     """
     storage_formats = sorted(definitions.STORAGE_FORMATS)
 
+    argument_group.add_argument(
+        '--storage_compression_level', '--storage-compression-level',
+        dest='storage_compression_level', action='store', type=int,
+        metavar='LEVEL', default=None, help=(
+            'Compression level of the storage file, from 0 (no compression) '
+            'to 9 (best compression). Lower levels reduce the time spent '
+            'compressing at the cost of a larger storage file. The default '
+            'is the default of the storage format.'))
+
     argument_group.add_argument(
         '--storage_format', '--storage-format', action='store',
         choices=storage_formats, dest='storage_format', type=str,
@@ -49,7 +58,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: if the storage format is not defined or supported.
+      BadConfigOption: if the storage format is not defined or supported or
+          the storage compression level is not supported.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -63,6 +73,17 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Unsupported storage format: {0:s}'.format(storage_format))
 
+    storage_compression_level = cls._ParseNumericOption(
+        options, 'storage_compression_level')
+    if storage_compression_level is not None and (
+        storage_compression_level < 0 or storage_compression_level > 9):
+      raise errors.BadConfigOption(
+          'Unsupported storage compression level: {0:d}'.format(
+              storage_compression_level))
+
+    setattr(
+        configuration_object, '_storage_compression_level',
+        storage_compression_level)
     setattr(configuration_object, '_storage_format', storage_format)
 
 
@@ -26,6 +26,16 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--maximum_workers', '--maximum-workers', dest='maximum_workers',
+        action='store', type=int, default=0, metavar='WORKERS', help=(
+            'Maximum number of worker processes. If larger than the number '
+            'of worker processes, the number of worker processes is adapted '
+            'during extraction to the task queue depth, merge backlog, CPU '
+            'utilization, I/O wait and available memory, where --workers '
+            'defines the initial number of worker processes. The default is '
+            '0, which represents a fixed number of worker processes.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -65,6 +75,14 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid number of extraction workers value cannot be negative.')
 
+    maximum_number_of_extraction_workers = cls._ParseNumericOption(
+        options, 'maximum_workers', default_value=0)
+
+    if maximum_number_of_extraction_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid maximum number of extraction workers value cannot be '
+          'negative.')
+
     worker_memory_limit = cls._ParseNumericOption(
         options, 'worker_memory_limit')
 
@@ -72,6 +90,9 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid worker memory limit value cannot be negative.')
 
+    setattr(
+        configuration_object, '_maximum_number_of_extraction_workers',
+        maximum_number_of_extraction_workers)
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
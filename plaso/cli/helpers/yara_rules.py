@@ -4,9 +4,11 @@
 from __future__ import unicode_literals
 
 import io
+import os
 
 import yara
 
+from plaso.analyzers import yara_analyzer
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
@@ -30,11 +32,31 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--yara_file_size_limit', '--yara-file-size-limit',
+        dest='yara_file_size_limit', type=int, action='store',
+        default=yara_analyzer.YaraAnalyzer.DEFAULT_FILE_SIZE_LIMIT,
+        metavar='SIZE', help=(
+            'Define the maximum file size in bytes that Yara rules should be '
+            'matched against. Any larger file will be skipped. A size of 0 '
+            'represents no limit. Files larger than a single block are '
+            'written to the temporary directory to be matched, the default '
+            'is: {0:d}.').format(
+                yara_analyzer.YaraAnalyzer.DEFAULT_FILE_SIZE_LIMIT))
+
     argument_group.add_argument(
         '--yara_rules', '--yara-rules', dest='yara_rules_path',
         type=str, metavar='PATH', action='store', help=(
             'Path to a file containing Yara rules definitions.'))
 
+    argument_group.add_argument(
+        '--yara_rules_cache', '--yara-rules-cache',
+        dest='yara_rules_cache_directory', type=str, metavar='PATH',
+        action='store', help=(
+            'Path to a directory to cache the compiled Yara rules in, so '
+            'that the worker processes load the compiled rules instead of '
+            'compiling the rules definitions.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -46,11 +68,25 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when the Yara rules cache directory does not exist
+          or the Yara file size limit is negative.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    file_size_limit = cls._ParseNumericOption(
+        options, 'yara_file_size_limit',
+        default_value=yara_analyzer.YaraAnalyzer.DEFAULT_FILE_SIZE_LIMIT)
+    if file_size_limit < 0:
+      raise errors.BadConfigOption(
+          'Invalid Yara file size limit value cannot be negative.')
+
+    cache_directory = getattr(options, 'yara_rules_cache_directory', None)
+    if cache_directory and not os.path.isdir(cache_directory):
+      raise errors.BadConfigOption(
+          'No such Yara rules cache directory: {0:s}'.format(cache_directory))
+
     yara_rules_string = None
 
     path = getattr(options, 'yara_rules_path', None)
@@ -67,14 +103,20 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
       try:
         # We try to parse the rules here, to check that the definitions are
         # valid. We then pass the string definitions along to the workers, so
-        # that they don't need read access to the rules file.
-        yara.compile(source=yara_rules_string)
+        # that they don't need read access to the rules file. The compiled
+        # rules are stored in the cache, if any, for the workers to load.
+        analyzer_object = yara_analyzer.YaraAnalyzer()
+        analyzer_object.SetRules(
+            yara_rules_string, cache_directory=cache_directory)
 
       except yara.Error as exception:
         raise errors.BadConfigObject(
             'Unable to parse Yara rules in: {0:s} with error: {1!s}'.format(
                 path, exception))
 
+    setattr(configuration_object, '_yara_file_size_limit', file_size_limit)
+    setattr(
+        configuration_object, '_yara_rules_cache_directory', cache_directory)
     setattr(configuration_object, '_yara_rules_string', yara_rules_string)
 
 
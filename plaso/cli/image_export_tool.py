@@ -6,8 +6,17 @@ from __future__ import unicode_literals
 import argparse
 import codecs
 import io
+import json
 import os
+import tempfile
 import textwrap
+import threading
+
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue  # pylint: disable=import-error
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
 
 from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -29,6 +38,69 @@ from plaso.lib import loggers
 from plaso.lib import specification
 
 
+class _DataStreamExportTask(object):
+  """Data stream export task.
+
+  The data of the data stream is read by the main thread and passed to
+  an export worker thread, via the data blocks queue, that calculates
+  the digest hash and writes the data to a temporary file.
+
+  Attributes:
+    aborted (bool): True if reading the data stream failed and the export
+        should be discarded.
+    data_blocks (Queue.Queue): blocks of data of the data stream, where None
+        indicates the end of the data stream.
+    display_name (str): display name of the data stream.
+    end_of_data (bool): True if the end of the data stream was read from
+        the data blocks queue.
+    failed (bool): True if exporting the data stream failed and the data
+        stream no longer needs to be read.
+    output_writer (CLIOutputWriter): output writer.
+    target_directory (str): path of the directory of the exported file.
+    target_path (str): path of the exported file.
+    temporary_path (str): path of the temporary file the data is written to
+        or None if not created or already renamed to the target path.
+  """
+
+  def __init__(
+      self, display_name, output_writer, target_directory, target_path,
+      maximum_number_of_blocks=0):
+    """Initializes a data stream export task.
+
+    Args:
+      display_name (str): display name of the data stream.
+      output_writer (CLIOutputWriter): output writer.
+      target_directory (str): path of the directory of the exported file.
+      target_path (str): path of the exported file.
+      maximum_number_of_blocks (Optional[int]): maximum number of blocks of
+          data that can be queued, where 0 represents no limit.
+    """
+    super(_DataStreamExportTask, self).__init__()
+    self.aborted = False
+    self.data_blocks = Queue.Queue(maxsize=maximum_number_of_blocks)
+    self.display_name = display_name
+    self.end_of_data = False
+    self.failed = False
+    self.output_writer = output_writer
+    self.target_directory = target_directory
+    self.target_path = target_path
+    self.temporary_path = None
+
+  def ReadDataBlock(self):
+    """Reads a block of data from the data blocks queue.
+
+    Returns:
+      bytes: block of data or None if the end of the data stream was read.
+    """
+    if self.end_of_data:
+      return None
+
+    data = self.data_blocks.get()
+    if data is None:
+      self.end_of_data = True
+    return data
+
+
 class ImageExportTool(storage_media_tool.StorageMediaTool):
   """Class that implements the image export CLI tool.
 
@@ -57,7 +129,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _COPY_BUFFER_SIZE = 32768
 
-  _READ_BUFFER_SIZE = 4096
+  # Name of the file, stored in the destination directory, that contains
+  # the digest hashes of the exported file entries. The name starts with
+  # a character that is replaced in the names of exported files, so that
+  # it cannot collide with an exported file.
+  _DIGEST_INDEX_FILENAME = '$image_export_digests.jsonl'
+
+  # Maximum number of copy buffers queued per data stream, which bounds
+  # the memory used by a data stream export task to 2 MiB.
+  _MAXIMUM_NUMBER_OF_QUEUED_BLOCKS = 64
+
+  _NUMBER_OF_EXPORT_WORKERS = 4
+
+  _TEMPORARY_FILE_PREFIX = '.image_export-'
 
   # TODO: remove this redirect.
   _SOURCE_OPTION = 'image'
@@ -86,48 +170,30 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._artifacts_registry = None
     self._custom_artifacts_path = None
     self._destination_path = None
+    self._digest_index_file_object = None
     self._digests = {}
+    self._digests_lock = threading.Lock()
+    self._export_task_queue = None
+    self._export_workers = []
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
+    self._output_writer_lock = threading.Lock()
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._resolver_context = context.Context()
     self._skip_duplicates = True
     self._source_type = None
+    self._temporary_paths = set()
+    self._temporary_paths_lock = threading.Lock()
 
     self.has_filters = False
     self.list_signature_identifiers = False
 
-  def _CalculateDigestHash(self, file_entry, data_stream_name):
-    """Calculates a SHA-256 digest of the contents of the file entry.
-
-    Args:
-      file_entry (dfvfs.FileEntry): file entry whose content will be hashed.
-      data_stream_name (str): name of the data stream whose content is to be
-          hashed.
-
-    Returns:
-      str: hexadecimal representation of the SHA-256 hash or None if the digest
-          cannot be determined.
-    """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    if not file_object:
-      return None
-
-    try:
-      file_object.seek(0, os.SEEK_SET)
-
-      hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
-
-      data = file_object.read(self._READ_BUFFER_SIZE)
-      while data:
-        hasher_object.Update(data)
-        data = file_object.read(self._READ_BUFFER_SIZE)
-
-    finally:
-      file_object.close()
-
-    return hasher_object.GetStringDigest()
+  def _CloseDigestIndex(self):
+    """Closes the digest index."""
+    if self._digest_index_file_object:
+      self._digest_index_file_object.close()
+      self._digest_index_file_object = None
 
   def _CreateSanitizedDestination(
       self, source_file_entry, source_path_spec, source_data_stream_name,
@@ -204,11 +270,145 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
           path_spec, destination_path, output_writer,
           skip_duplicates=skip_duplicates)
 
+  def _ExportDataStream(self, task, skip_duplicates=True):
+    """Exports a data stream.
+
+    The data stream is hashed while it is written to a temporary file, which
+    is renamed to the target path when the content is not a duplicate.
+
+    Args:
+      task (_DataStreamExportTask): data stream export task.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
+
+    temporary_file_object = None
+    write_error = None
+
+    try:
+      file_descriptor, task.temporary_path = tempfile.mkstemp(
+          dir=task.target_directory, prefix=self._TEMPORARY_FILE_PREFIX)
+      with self._temporary_paths_lock:
+        self._temporary_paths.add(task.temporary_path)
+
+      temporary_file_object = os.fdopen(file_descriptor, 'wb')
+    except (IOError, OSError) as exception:
+      write_error = exception
+
+    try:
+      # Consume all the data blocks, including after a write error, otherwise
+      # the main thread would block on a full queue.
+      data = task.ReadDataBlock()
+      while data is not None:
+        if not write_error:
+          try:
+            hasher_object.Update(data)
+            temporary_file_object.write(data)
+          except (IOError, OSError) as exception:
+            write_error = exception
+
+        data = task.ReadDataBlock()
+
+    finally:
+      if temporary_file_object:
+        try:
+          temporary_file_object.close()
+        except (IOError, OSError) as exception:
+          write_error = write_error or exception
+
+    if task.aborted or write_error:
+      if write_error:
+        self._WriteOutput((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}\n').format(task.display_name, write_error),
+            output_writer=task.output_writer)
+
+      self._RemoveTemporaryFile(task)
+      return
+
+    digest = hasher_object.GetStringDigest()
+
+    with self._digests_lock:
+      duplicate_display_name = self._digests.get(digest, None)
+      if skip_duplicates and duplicate_display_name:
+        self._WriteOutput((
+            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
+            'digest: {2:s}\n').format(
+                task.display_name, duplicate_display_name, digest),
+            output_writer=task.output_writer)
+        self._RemoveTemporaryFile(task)
+        return
+
+      if os.path.exists(task.target_path):
+        self._WriteOutput((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'because exported file: {1:s} already exists.\n').format(
+                task.display_name, task.target_path),
+            output_writer=task.output_writer)
+        self._RemoveTemporaryFile(task)
+        return
+
+      try:
+        os.rename(task.temporary_path, task.target_path)
+      except OSError as exception:
+        self._WriteOutput((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}\n').format(task.display_name, exception),
+            output_writer=task.output_writer)
+        self._RemoveTemporaryFile(task)
+        return
+
+      with self._temporary_paths_lock:
+        self._temporary_paths.discard(task.temporary_path)
+
+      task.temporary_path = None
+
+      if not duplicate_display_name:
+        self._digests[digest] = task.display_name
+        self._WriteDigestIndexEntry(digest, task.display_name)
+
+  def _ExportWorkerMain(self, skip_duplicates=True):
+    """The main loop of an export worker thread.
+
+    An unexpected error exporting a data stream is reported and the export
+    continues with the next data stream. The remaining data blocks of the
+    data stream are consumed, so that the main thread does not block on
+    a full queue.
+
+    Args:
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    task = self._export_task_queue.get()
+    while task is not None:
+      try:
+        self._ExportDataStream(task, skip_duplicates=skip_duplicates)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        task.failed = True
+
+        self._WriteOutput((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}\n').format(task.display_name, exception),
+            output_writer=task.output_writer)
+        logger.exception(exception)
+
+        self._RemoveTemporaryFile(task)
+
+        while task.ReadDataBlock() is not None:
+          pass
+
+      task = self._export_task_queue.get()
+
   def _ExtractDataStream(
       self, file_entry, data_stream_name, destination_path, output_writer,
       skip_duplicates=True):
     """Extracts a data stream.
 
+    The data stream is read once by the main thread and its data is passed
+    to an export worker thread, that hashes and writes it.
+
     Args:
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream_name (str): name of the data stream.
@@ -216,64 +416,77 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       output_writer (CLIOutputWriter): output writer.
       skip_duplicates (Optional[bool]): True if files with duplicate content
           should be skipped.
+
+    Raises:
+      RuntimeError: if the export workers have not been started.
     """
     if not data_stream_name and not file_entry.IsFile():
       return
 
+    if not self._export_workers:
+      raise RuntimeError('Export workers not started.')
+
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
-    if skip_duplicates:
-      try:
-        digest = self._CalculateDigestHash(file_entry, data_stream_name)
-      except (IOError, dfvfs_errors.BackEndError) as exception:
-        output_writer.Write((
-            '[skipping] unable to read content of file entry: {0:s} '
-            'with error: {1!s}\n').format(display_name, exception))
-        return
-
-      if not digest:
-        output_writer.Write(
-            '[skipping] unable to read content of file entry: {0:s}\n'.format(
-                display_name))
-        return
-
-      duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
-        output_writer.Write((
-            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
-            'digest: {2:s}\n').format(
-                display_name, duplicate_display_name, digest))
-        return
-
-      self._digests[digest] = display_name
-
     target_directory, target_filename = self._CreateSanitizedDestination(
         file_entry, file_entry.path_spec, data_stream_name, destination_path)
 
-    if not os.path.isdir(target_directory):
-      os.makedirs(target_directory)
-
     target_path = os.path.join(target_directory, target_filename)
 
+    # Check the target path before reading the data stream, so that a resumed
+    # export does not read data streams that were previously exported.
     if os.path.exists(target_path):
-      output_writer.Write((
+      self._WriteOutput((
           '[skipping] unable to export contents of file entry: {0:s} '
           'because exported file: {1:s} already exists.\n').format(
-              display_name, target_path))
+              display_name, target_path), output_writer=output_writer)
       return
 
     try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
     except (IOError, dfvfs_errors.BackEndError) as exception:
-      output_writer.Write((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'with error: {1!s}\n').format(display_name, exception))
+      self._WriteOutput((
+          '[skipping] unable to read content of file entry: {0:s} '
+          'with error: {1!s}\n').format(display_name, exception),
+          output_writer=output_writer)
+      return
+
+    if not file_object:
+      self._WriteOutput(
+          '[skipping] unable to read content of file entry: {0:s}\n'.format(
+              display_name), output_writer=output_writer)
+      return
+
+    try:
+      if not os.path.isdir(target_directory):
+        os.makedirs(target_directory)
+
+      task = _DataStreamExportTask(
+          display_name, output_writer, target_directory, target_path,
+          maximum_number_of_blocks=self._MAXIMUM_NUMBER_OF_QUEUED_BLOCKS)
+      self._export_task_queue.put(task)
 
       try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+        file_object.seek(0, os.SEEK_SET)
+
+        data = file_object.read(self._COPY_BUFFER_SIZE)
+        while data and not task.failed:
+          task.data_blocks.put(data)
+          data = file_object.read(self._COPY_BUFFER_SIZE)
+
+      except (IOError, dfvfs_errors.BackEndError) as exception:
+        task.aborted = True
+        self._WriteOutput((
+            '[skipping] unable to read content of file entry: {0:s} '
+            'with error: {1!s}\n').format(display_name, exception),
+            output_writer=output_writer)
+
+      finally:
+        task.data_blocks.put(None)
+
+    finally:
+      file_object.close()
 
   def _ExtractFileEntry(
       self, path_spec, destination_path, output_writer, skip_duplicates=True):
@@ -491,6 +704,51 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         specification_store, signature_identifiers)
     self._filter_collection.AddFilter(file_entry_filter)
 
+  def _OpenDigestIndex(self, destination_path):
+    """Opens the digest index.
+
+    The digest hashes of a previous export into the same destination are
+    read, so that content that was previously exported is skipped, and
+    the digest hashes of newly exported content are appended.
+
+    Args:
+      destination_path (str): path where the extracted files are stored.
+    """
+    path = os.path.join(destination_path, self._DIGEST_INDEX_FILENAME)
+
+    try:
+      file_object = io.open(path, 'a+b')
+    except (IOError, OSError) as exception:
+      logger.error((
+          'Unable to open digest index: {0:s} with error: {1!s}').format(
+              path, exception))
+      return
+
+    file_object.seek(0, os.SEEK_SET)
+
+    line = b''
+    for line in file_object:
+      try:
+        json_dict = json.loads(line.decode('utf-8'))
+        digest = json_dict['sha256']
+        display_name = json_dict['display_name']
+
+      except (KeyError, TypeError, ValueError):
+        logger.warning('Unable to parse digest index entry: {0!s}'.format(
+            line))
+        continue
+
+      self._digests.setdefault(digest, display_name)
+
+    file_object.seek(0, os.SEEK_END)
+
+    # Terminate an entry that was partially written by an interrupted export,
+    # so that it does not corrupt the next entry.
+    if line and not line.endswith(b'\n'):
+      file_object.write(b'\n')
+
+    self._digest_index_file_object = file_object
+
   def _PreprocessSources(self, extraction_engine):
     """Preprocesses the sources.
 
@@ -558,33 +816,116 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
-  def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
-    """Writes the contents of the source file entry to a destination file.
+  def _RemoveFile(self, path):
+    """Removes a file, ignoring errors.
+
+    Args:
+      path (str): path of the file.
+    """
+    try:
+      os.remove(path)
+    except (IOError, OSError):
+      pass
+
+  def _RemoveTemporaryFile(self, task):
+    """Removes the temporary file of a data stream export task, if any.
+
+    Args:
+      task (_DataStreamExportTask): data stream export task.
+    """
+    if task.temporary_path:
+      self._RemoveFile(task.temporary_path)
+
+      with self._temporary_paths_lock:
+        self._temporary_paths.discard(task.temporary_path)
+
+      task.temporary_path = None
+
+  def _RemoveTemporaryFiles(self):
+    """Removes the temporary files left by the export.
+
+    Temporary files are left when an export was interrupted. Only the
+    temporary files created by this export are removed, other files in
+    the destination directory are left untouched.
+    """
+    with self._temporary_paths_lock:
+      temporary_paths = sorted(self._temporary_paths)
+      self._temporary_paths = set()
+
+    for temporary_path in temporary_paths:
+      self._RemoveFile(temporary_path)
+
+  def _StartExportWorkers(self, skip_duplicates=True):
+    """Starts the export worker threads.
+
+    Args:
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    self._export_task_queue = Queue.Queue()
+
+    for _ in range(self._NUMBER_OF_EXPORT_WORKERS):
+      export_worker = threading.Thread(
+          name='image_export_worker', target=self._ExportWorkerMain,
+          kwargs={'skip_duplicates': skip_duplicates})
+      export_worker.daemon = True
+      export_worker.start()
+
+      self._export_workers.append(export_worker)
+
+  def _StopExportWorkers(self):
+    """Stops the export worker threads.
+
+    This function waits for the queued data streams to be exported.
+    """
+    for _ in self._export_workers:
+      self._export_task_queue.put(None)
+
+    for export_worker in self._export_workers:
+      export_worker.join()
 
-    Note that this function will overwrite an existing file.
+    self._export_task_queue = None
+    self._export_workers = []
+
+  def _WriteDigestIndexEntry(self, digest, display_name):
+    """Writes an entry to the digest index.
+
+    The entry is written when the content is exported, so that an export
+    that is interrupted can be resumed without exporting the content again.
+    The digests lock must be held by the caller.
 
     Args:
-      file_entry (dfvfs.FileEntry): file entry whose content is to be written.
-      data_stream_name (str): name of the data stream whose content is to be
-          written.
-      destination_file (str): path of the destination file.
+      digest (str): SHA-256 digest hash of the exported content.
+      display_name (str): display name of the exported data stream.
     """
-    source_file_object = file_entry.GetFileObject(
-        data_stream_name=data_stream_name)
-    if not source_file_object:
+    if not self._digest_index_file_object:
       return
 
+    json_string = json.dumps(
+        {'display_name': display_name, 'sha256': digest}, sort_keys=True)
+
     try:
-      with open(destination_file, 'wb') as destination_file_object:
-        source_file_object.seek(0, os.SEEK_SET)
+      self._digest_index_file_object.write(
+          '{0:s}\n'.format(json_string).encode('utf-8'))
+      self._digest_index_file_object.flush()
 
-        data = source_file_object.read(self._COPY_BUFFER_SIZE)
-        while data:
-          destination_file_object.write(data)
-          data = source_file_object.read(self._COPY_BUFFER_SIZE)
+    except (IOError, OSError) as exception:
+      logger.error(
+          'Unable to write digest index entry with error: {0!s}'.format(
+              exception))
 
-    finally:
-      source_file_object.close()
+  def _WriteOutput(self, string, output_writer):
+    """Writes a string to an output writer.
+
+    The output writer is shared by the main thread and the export worker
+    threads.
+
+    Args:
+      string (str): string to write.
+      output_writer (CLIOutputWriter): output writer.
+    """
+    with self._output_writer_lock:
+      output_writer.Write(string)
 
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
@@ -783,16 +1124,25 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not os.path.isdir(self._destination_path):
       os.makedirs(self._destination_path)
 
-    if self._artifact_filters or self._filter_file:
-      self._ExtractWithFilter(
-          self._source_path_specs, self._destination_path, self._output_writer,
-          self._artifact_filters, self._filter_file,
-          self._artifact_definitions_path, self._custom_artifacts_path,
-          skip_duplicates=self._skip_duplicates)
-    else:
-      self._Extract(
-          self._source_path_specs, self._destination_path, self._output_writer,
-          skip_duplicates=self._skip_duplicates)
+    self._OpenDigestIndex(self._destination_path)
+    self._StartExportWorkers(skip_duplicates=self._skip_duplicates)
+
+    try:
+      if self._artifact_filters or self._filter_file:
+        self._ExtractWithFilter(
+            self._source_path_specs, self._destination_path,
+            self._output_writer, self._artifact_filters, self._filter_file,
+            self._artifact_definitions_path, self._custom_artifacts_path,
+            skip_duplicates=self._skip_duplicates)
+      else:
+        self._Extract(
+            self._source_path_specs, self._destination_path,
+            self._output_writer, skip_duplicates=self._skip_duplicates)
+
+    finally:
+      self._StopExportWorkers()
+      self._CloseDigestIndex()
+      self._RemoveTemporaryFiles()
 
     self._output_writer.Write('Export completed.\n')
     self._output_writer.Write('\n')
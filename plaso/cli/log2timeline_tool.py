@@ -12,9 +12,6 @@ from dfvfs.lib import definitions as dfvfs_definitions
 
 import plaso
 
-# The following import makes sure the output modules are registered.
-from plaso import output  # pylint: disable=unused-import
-
 from plaso.analyzers.hashers import manager as hashers_manager
 from plaso.cli import extraction_tool
 from plaso.cli import logger
@@ -94,6 +91,7 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         input_reader=input_reader, output_writer=output_writer)
     self._command_line_arguments = None
     self._enable_sigsegv_handler = False
+    self._maximum_number_of_extraction_workers = 0
     self._number_of_extraction_workers = 0
     self._storage_serializer_format = definitions.SERIALIZER_FORMAT_JSON
     self._source_type = None
@@ -195,7 +193,7 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     self.AddLogFileOptions(info_group)
 
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
-        info_group, names=['status_view'])
+        info_group, names=['metrics', 'status_view'])
 
     output_group = argument_parser.add_argument_group('output arguments')
 
@@ -319,8 +317,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
 
     argument_helper_names = [
         'artifact_definitions', 'artifact_filters', 'extraction',
-        'filter_file', 'status_view', 'storage_file', 'storage_format',
-        'text_prepend', 'yara_rules']
+        'filter_file', 'metrics', 'status_view', 'storage_file',
+        'storage_format', 'text_prepend', 'yara_rules']
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
@@ -393,7 +391,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         preferred_year=self._preferred_year)
 
     storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
-        self._storage_format, session, self._storage_file_path)
+        self._storage_format, session, self._storage_file_path,
+        compression_level=self._storage_compression_level)
     if not storage_writer:
       raise errors.BadConfigOption(
           'Unsupported storage format: {0:s}'.format(self._storage_format))
@@ -445,6 +444,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
           session.identifier, self._source_path_specs, storage_writer,
           configuration, enable_sigsegv_handler=self._enable_sigsegv_handler,
           filter_find_specs=filter_find_specs,
+          maximum_number_of_worker_processes=(
+              self._maximum_number_of_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback,
           worker_memory_limit=self._worker_memory_limit)
@@ -11,12 +11,6 @@ import time
 # The following import makes sure the filters are registered.
 from plaso import filters  # pylint: disable=unused-import
 
-# The following import makes sure the formatters are registered.
-from plaso import formatters  # pylint: disable=unused-import
-
-# The following import makes sure the output modules are registered.
-from plaso import output   # pylint: disable=unused-import
-
 from plaso.analysis import manager as analysis_manager
 from plaso.cli import logger
 from plaso.cli import status_view
@@ -11,9 +11,6 @@ import textwrap
 
 from dfvfs.lib import definitions as dfvfs_definitions
 
-# The following import makes sure the output modules are registered.
-from plaso import output  # pylint: disable=unused-import
-
 from plaso.cli import extraction_tool
 from plaso.cli import logger
 from plaso.cli import status_view
@@ -104,6 +101,7 @@ class PstealTool(
     self._deduplicate_events = True
     self._enable_sigsegv_handler = False
     self._knowledge_base = knowledge_base.KnowledgeBase()
+    self._maximum_number_of_extraction_workers = 0
     self._number_of_analysis_reports = 0
     self._number_of_extraction_workers = 0
     self._output_format = None
@@ -285,7 +283,8 @@ class PstealTool(
         preferred_year=self._preferred_year)
 
     storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
-        self._storage_format, session, self._storage_file_path)
+        self._storage_format, session, self._storage_file_path,
+        compression_level=self._storage_compression_level)
     if not storage_writer:
       raise errors.BadConfigOption(
           'Unsupported storage format: {0:s}'.format(self._storage_format))
@@ -334,6 +333,8 @@ class PstealTool(
           configuration,
           enable_sigsegv_handler=self._enable_sigsegv_handler,
           filter_find_specs=filter_find_specs,
+          maximum_number_of_worker_processes=(
+              self._maximum_number_of_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback)
 
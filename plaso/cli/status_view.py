@@ -370,6 +370,29 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+  def _PrintWorkerPoolStatus(self, processing_status):
+    """Prints the status of the adaptive worker pool.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    if processing_status and processing_status.worker_pool_status:
+      worker_pool_status = processing_status.worker_pool_status
+
+      table_view = views.CLITabularTableView(
+          column_names=['Workers:', 'Current', 'Minimum', 'Maximum',
+                        'Last scaling'],
+          column_sizes=[15, 7, 15, 15, 0])
+
+      table_view.AddRow([
+          '', worker_pool_status.number_of_worker_processes,
+          worker_pool_status.minimum_number_of_worker_processes,
+          worker_pool_status.maximum_number_of_worker_processes,
+          worker_pool_status.last_scaling_reason or 'N/A'])
+
+      self._output_writer.Write('\n')
+      table_view.Write(self._output_writer)
+
   def GetAnalysisStatusUpdateCallback(self):
     """Retrieves the analysis status update callback function.
 
@@ -420,6 +443,7 @@ class StatusView(object):
 
     self._PrintProcessingTime(processing_status)
     self._PrintTasksStatus(processing_status)
+    self._PrintWorkerPoolStatus(processing_status)
     self._output_writer.Write('\n')
 
   def PrintExtractionSummary(self, processing_status):
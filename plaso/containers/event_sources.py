@@ -15,9 +15,20 @@ class EventSource(interface.AttributeContainer):
   or Application Compatibility cache.
 
   Attributes:
+    data_stream_name (str): name of the data stream that contains the record
+        range, where an empty string represents the default data stream.
     data_type (str): attribute container type indicator.
+    event_attributes (dict[str, object]): attributes to set on the events
+        produced from the record range, such as the results of the analyzers
+        of the data stream, or None if not set.
     file_entry_type (str): dfVFS file entry type.
+    file_size (int): size of the default data stream of the file entry in
+        bytes or None if not known.
+    parser_name (str): name of the parser that parses the record range.
     path_spec (dfvfs.PathSpec): path specification.
+    record_range (tuple[int, int]): first and last record of the range,
+        where the last record is not included, or None if the event source
+        does not represent a record range.
   """
   CONTAINER_TYPE = 'event_source'
   DATA_TYPE = None
@@ -29,9 +40,14 @@ class EventSource(interface.AttributeContainer):
       path_spec (Optional[dfvfs.PathSpec]): path specification.
     """
     super(EventSource, self).__init__()
+    self.data_stream_name = None
     self.data_type = self.DATA_TYPE
+    self.event_attributes = None
     self.file_entry_type = None
+    self.file_size = None
+    self.parser_name = None
     self.path_spec = path_spec
+    self.record_range = None
 
   # This method is necessary for heap sort.
   def __lt__(self, other):
@@ -55,4 +71,16 @@ class FileEntryEventSource(EventSource):
   DATA_TYPE = 'file_entry'
 
 
+class RecordRangeEventSource(EventSource):
+  """Record range event source.
+
+  The record range event source is an event source that represents a range
+  of records within a data stream, that is parsed by a specific parser. It
+  is used to parse the records of a large data stream in multiple tasks.
+  What represents a record, such as an entry index or an offset, is specific
+  to the parser.
+  """
+  DATA_TYPE = 'record_range'
+
+
 manager.AttributeContainersManager.RegisterAttributeContainer(EventSource)
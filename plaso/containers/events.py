@@ -13,6 +13,10 @@ from plaso.lib import py2to3
 class EventData(interface.AttributeContainer):
   """Event data attribute container.
 
+  Subclasses can declare their attributes in __slots__, attributes that
+  are not declared, such as attributes added by plugins, are stored in
+  the instance dictionary.
+
   Attributes:
     data_type (str): event data type indicator.
     offset (int): offset relative to the start of the data stream where
@@ -21,6 +25,8 @@ class EventData(interface.AttributeContainer):
   """
   CONTAINER_TYPE = 'event_data'
 
+  __slots__ = ('data_type', 'offset', 'query')
+
   def __init__(self, data_type=None):
     """Initializes an event data attribute container.
 
@@ -60,6 +66,14 @@ class EventObject(interface.AttributeContainer):
   # has a data type not the event itself.
   DATA_TYPE = None
 
+  # The fixed attributes are stored in slots, the attributes of the event
+  # data that are copied into the event are stored in the instance
+  # dictionary.
+  __slots__ = (
+      '_event_data_identifier', 'data_type', 'display_name', 'filename',
+      'hostname', 'inode', 'offset', 'pathspec', 'tag', 'timestamp',
+      'timestamp_desc')
+
   def __init__(self):
     """Initializes an event attribute container."""
     super(EventObject, self).__init__()
@@ -13,6 +13,8 @@ class AttributeContainerIdentifier(object):
   The value should be unique at runtime and in storage.
   """
 
+  __slots__ = ('_identifier',)
+
   def __init__(self):
     """Initializes an attribute container identifier."""
     super(AttributeContainerIdentifier, self).__init__()
@@ -39,15 +41,76 @@ class AttributeContainer(object):
 
   Attributes are public class members of an serializable type. Protected
   and private class members are not to be serialized.
+
+  Attributes that are declared in __slots__, by the attribute container or
+  one of its parent classes, are stored in slots instead of the instance
+  dictionary. The instance dictionary is still used for attributes that
+  are not declared.
   """
   CONTAINER_TYPE = None
 
+  __slots__ = ('__dict__', '_identifier', '_session_identifier')
+
+  # Names of all slots and of the public slots per attribute container class.
+  _SLOT_NAMES_PER_CLASS = {}
+
   def __init__(self):
     """Initializes an attribute container."""
     super(AttributeContainer, self).__init__()
     self._identifier = AttributeContainerIdentifier()
     self._session_identifier = None
 
+  def __getstate__(self):
+    """Retrieves the state of the attribute container for pickling.
+
+    Returns:
+      dict[str, object]: attribute values per name, including protected
+          attributes and attributes stored in slots.
+    """
+    state = dict(self.__dict__)
+    slot_names, _ = self._GetSlotNames()
+    for slot_name in slot_names:
+      try:
+        state[slot_name] = getattr(self, slot_name)
+      except AttributeError:
+        pass
+
+    return state
+
+  def __setstate__(self, state):
+    """Sets the state of the attribute container after unpickling.
+
+    Args:
+      state (dict[str, object]): attribute values per name, including
+          protected attributes and attributes stored in slots.
+    """
+    for attribute_name, attribute_value in iter(state.items()):
+      setattr(self, attribute_name, attribute_value)
+
+  @classmethod
+  def _GetSlotNames(cls):
+    """Retrieves the names of the attributes stored in slots.
+
+    Returns:
+      tuple[tuple[str], tuple[str]]: names of all the attributes and names of
+          the public attributes stored in slots.
+    """
+    slot_names = cls._SLOT_NAMES_PER_CLASS.get(cls, None)
+    if slot_names is None:
+      all_slot_names = []
+      for class_object in reversed(cls.__mro__):
+        for slot_name in class_object.__dict__.get('__slots__', []):
+          if slot_name not in ('__dict__', '__weakref__'):
+            all_slot_names.append(slot_name)
+
+      public_slot_names = [
+          slot_name for slot_name in all_slot_names if slot_name[0] != '_']
+
+      slot_names = (tuple(all_slot_names), tuple(public_slot_names))
+      cls._SLOT_NAMES_PER_CLASS[cls] = slot_names
+
+    return slot_names
+
   def CopyFromDict(self, attributes):
     """Copies the attribute container from a dictionary.
 
@@ -76,7 +139,9 @@ class AttributeContainer(object):
     Returns:
       list[str]: attribute names.
     """
-    attribute_names = []
+    _, attribute_names = self._GetSlotNames()
+    attribute_names = list(attribute_names)
+
     for attribute_name in iter(self.__dict__.keys()):
       # Not using startswith to improve performance.
       if attribute_name[0] == '_':
@@ -93,6 +158,12 @@ class AttributeContainer(object):
     Yields:
       tuple[str, object]: attribute name and value.
     """
+    _, slot_names = self._GetSlotNames()
+    for attribute_name in slot_names:
+      attribute_value = getattr(self, attribute_name, None)
+      if attribute_value is not None:
+        yield attribute_name, attribute_value
+
     for attribute_name, attribute_value in iter(self.__dict__.items()):
       # Not using startswith to improve performance.
       if attribute_name[0] == '_' or attribute_value is None:
@@ -115,11 +186,7 @@ class AttributeContainer(object):
       str: comparable string of the attribute values.
     """
     attributes = []
-    for attribute_name, attribute_value in sorted(self.__dict__.items()):
-      # Not using startswith to improve performance.
-      if attribute_name[0] == '_' or attribute_value is None:
-        continue
-
+    for attribute_name, attribute_value in sorted(self.GetAttributes()):
       if isinstance(attribute_value, dict):
         attribute_value = sorted(attribute_value.items())
 
@@ -21,8 +21,17 @@ class Task(interface.AttributeContainer):
     aborted (bool): True if the session was aborted.
     completion_time (int): time that the task was completed. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
+    data_stream_name (str): name of the data stream that contains the record
+        range, where an empty string represents the default data stream.
+    estimated_cost (float): estimated time to process the task in seconds
+        or None if not estimated.
+    event_attributes (dict[str, object]): attributes to set on the events
+        produced from the record range, such as the results of the analyzers
+        of the data stream, or None if not set.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
+    file_size (int): size of the default data stream of the file entry in
+        bytes or None if not known.
     has_retry (bool): True if the task was previously abandoned and a retry
         task was created, False otherwise.
     identifier (str): unique identifier of the task.
@@ -30,7 +39,10 @@ class Task(interface.AttributeContainer):
         processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
+    parser_name (str): name of the parser that parses the record range.
     path_spec (dfvfs.PathSpec): path specification.
+    record_range (tuple[int, int]): range of records to parse, where None
+        represents the entire path specification is processed.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -48,12 +60,18 @@ class Task(interface.AttributeContainer):
     super(Task, self).__init__()
     self.aborted = False
     self.completion_time = None
+    self.data_stream_name = None
+    self.estimated_cost = None
+    self.event_attributes = None
     self.file_entry_type = None
+    self.file_size = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
     self.merge_priority = None
+    self.parser_name = None
     self.path_spec = None
+    self.record_range = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -80,9 +98,15 @@ class Task(interface.AttributeContainer):
       Task: a task to retry a previously abandoned task.
     """
     retry_task = Task(session_identifier=self.session_identifier)
+    retry_task.data_stream_name = self.data_stream_name
+    retry_task.estimated_cost = self.estimated_cost
+    retry_task.event_attributes = self.event_attributes
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.file_size = self.file_size
     retry_task.merge_priority = self.merge_priority
+    retry_task.parser_name = self.parser_name
     retry_task.path_spec = self.path_spec
+    retry_task.record_range = self.record_range
     retry_task.storage_file_size = self.storage_file_size
 
     self.has_retry = True
@@ -64,6 +64,11 @@ class ExtractionConfiguration(interface.AttributeContainer):
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
         compressed streams should be processed.
+    yara_file_size_limit (int): maximum file size that Yara rules are
+        matched against, where 0 represents unlimited and None the default
+        limit of the Yara analyzer.
+    yara_rules_cache_directory (str): path of the directory to cache compiled
+        Yara rules in, where None represents that the rules are not cached.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -75,6 +80,8 @@ class ExtractionConfiguration(interface.AttributeContainer):
     self.hasher_names_string = None
     self.process_archives = False
     self.process_compressed_streams = True
+    self.yara_file_size_limit = None
+    self.yara_rules_cache_directory = None
     self.yara_rules_string = None
 
 
@@ -202,6 +209,9 @@ class ProcessingConfiguration(interface.AttributeContainer):
     filter_file (str): path to a file with find specifications.
     input_source (InputSourceConfiguration): input source configuration.
     log_filename (str): name of the log file.
+    metrics_port (int): port of the metrics HTTP server on the loopback
+        interface, where 0 represents a port selected by the operating system
+        and None represents that the metrics HTTP server is disabled.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
     preferred_year (int): preferred initial year value for year-less date and
@@ -223,6 +233,7 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.filter_file = None
     self.input_source = InputSourceConfiguration()
     self.log_filename = None
+    self.metrics_port = None
     self.parser_filter_expression = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
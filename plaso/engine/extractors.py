@@ -164,11 +164,15 @@ class EventExtractor(object):
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
 
+    parser_mediator.SetDataStreamName(data_stream_name)
+
     try:
       self._ParseFileEntryWithParser(
           parser_mediator, parser, file_entry, file_object=file_object)
 
     finally:
+      parser_mediator.SetDataStreamName(None)
+
       file_object.close()
 
   def _ParseFileEntryWithParser(
@@ -204,6 +208,7 @@ class EventExtractor(object):
 
     parser_mediator.SampleStartTiming(parser.NAME)
 
+    result = None
     try:
       if isinstance(parser, parsers_interface.FileEntryParser):
         parser.Parse(parser_mediator)
@@ -227,7 +232,8 @@ class EventExtractor(object):
       result = self._PARSE_RESULT_UNSUPPORTED
 
     finally:
-      parser_mediator.SampleStopTiming(parser.NAME)
+      parser_mediator.SampleStopTiming(
+          parser.NAME, parsed=result == self._PARSE_RESULT_SUCCESS)
       parser_mediator.SampleMemoryUsage(parser.NAME)
 
       new_reference_count = (
@@ -306,6 +312,8 @@ class EventExtractor(object):
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
 
+    parser_mediator.SetDataStreamName(data_stream_name)
+
     try:
       parser_names = self._GetSignatureMatchParserNames(file_object)
 
@@ -323,8 +331,34 @@ class EventExtractor(object):
             file_object=file_object)
 
     finally:
+      parser_mediator.SetDataStreamName(None)
+
       file_object.close()
 
+  def ParseDataStreamWithParser(
+      self, parser_mediator, file_entry, data_stream_name, parser_name):
+    """Parses a data stream of a file entry with a specific parser.
+
+    This is used to parse a record range of a data stream, that was produced
+    by the parser, when the record range is set in the parser mediator.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      parser_name (str): name of the parser.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    parser = self._parsers.get(parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(parser_name))
+
+    self._ParseDataStreamWithParser(
+        parser_mediator, parser, file_entry, data_stream_name)
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata e.g. file system data.
 
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import re
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -324,6 +325,31 @@ class PathHelper(object):
 
     return '{0:s}:{1:s}'.format(path_spec.type_indicator, relative_path)
 
+  @classmethod
+  def GetFileTypeForPath(cls, path):
+    """Retrieves an indication of the type of a file from its path.
+
+    The type is used to relate files that are likely to be parsed by the
+    same parser, before the file is parsed.
+
+    Args:
+      path (str): path or name of the file.
+
+    Returns:
+      str: lower case extension of the filename, such as ".evtx", the lower
+          case filename if it has no extension, such as "system", or None if
+          the path has no filename.
+    """
+    if not path:
+      return None
+
+    filename = re.split(r'[/\\]', path)[-1].lower()
+    if not filename:
+      return None
+
+    _, extension = os.path.splitext(filename)
+    return extension or filename
+
   @classmethod
   def GetRelativePathForPathSpec(cls, path_spec, mount_path=None):
     """Retrieves the relative path of a path specification.
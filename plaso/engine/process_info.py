@@ -24,6 +24,34 @@ class ProcessInfo(object):
 
     self._process = psutil.Process(pid)
 
+  def GetCPUUtilization(self):
+    """Retrieves the CPU utilization of the process.
+
+    The utilization is measured since the previous call, hence the first
+    call returns 0.0.
+
+    Returns:
+      float: CPU utilization as a percentage of a single CPU or None
+          if not available.
+    """
+    try:
+      return self._process.cpu_percent(interval=None)
+    except psutil.NoSuchProcess:
+      return None
+
+  def GetCreationTime(self):
+    """Retrieves the time the process was created.
+
+    Returns:
+      float: time the process was created, which contains the number of
+          seconds since January 1, 1970, 00:00:00 UTC, or None if not
+          available.
+    """
+    try:
+      return self._process.create_time()
+    except psutil.NoSuchProcess:
+      return None
+
   def GetUsedMemory(self):
     """Retrieves the amount of memory used by the process.
 
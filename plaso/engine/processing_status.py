@@ -318,6 +318,9 @@ class ProcessingStatus(object):
     start_time (float): time that the processing was started. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     tasks_status (TasksStatus): status information about tasks.
+    worker_pool_status (WorkerPoolStatus): status information about the
+        worker pool or None if the number of worker processes is not
+        adapted during processing.
   """
 
   def __init__(self):
@@ -331,6 +334,7 @@ class ProcessingStatus(object):
     self.foreman_status = None
     self.start_time = time.time()
     self.tasks_status = None
+    self.worker_pool_status = None
 
   @property
   def workers_status(self):
@@ -467,6 +471,44 @@ class ProcessingStatus(object):
     """
     self.tasks_status = tasks_status
 
+  def UpdateWorkerPoolStatus(
+      self, minimum_number_of_worker_processes,
+      maximum_number_of_worker_processes, number_of_worker_processes,
+      scaling_reason=None):
+    """Updates the worker pool status.
+
+    Args:
+      minimum_number_of_worker_processes (int): minimum number of worker
+          processes.
+      maximum_number_of_worker_processes (int): maximum number of worker
+          processes.
+      number_of_worker_processes (int): number of worker processes.
+      scaling_reason (Optional[str]): reason the number of worker processes
+          was changed, where None represents that the number of worker
+          processes was not changed by a scaling decision.
+    """
+    if not self.worker_pool_status:
+      self.worker_pool_status = WorkerPoolStatus()
+
+    worker_pool_status = self.worker_pool_status
+
+    if scaling_reason:
+      if number_of_worker_processes > (
+          worker_pool_status.number_of_worker_processes):
+        worker_pool_status.number_of_scale_ups += 1
+      elif number_of_worker_processes < (
+          worker_pool_status.number_of_worker_processes):
+        worker_pool_status.number_of_scale_downs += 1
+
+      worker_pool_status.last_scaling_reason = scaling_reason
+      worker_pool_status.last_scaling_time = time.time()
+
+    worker_pool_status.maximum_number_of_worker_processes = (
+        maximum_number_of_worker_processes)
+    worker_pool_status.minimum_number_of_worker_processes = (
+        minimum_number_of_worker_processes)
+    worker_pool_status.number_of_worker_processes = number_of_worker_processes
+
   # pylint: disable=too-many-arguments
   def UpdateWorkerStatus(
       self, identifier, status, pid, used_memory, display_name,
@@ -550,3 +592,35 @@ class TasksStatus(object):
     self.number_of_tasks_pending_merge = 0
     self.number_of_tasks_processing = 0
     self.total_number_of_tasks = 0
+
+
+class WorkerPoolStatus(object):
+  """The status of the worker pool.
+
+  Attributes:
+    last_scaling_reason (str): reason of the last scaling decision or None
+        if the number of worker processes has not been changed.
+    last_scaling_time (float): time of the last scaling decision, which
+        contains the number of seconds since January 1, 1970, 00:00:00 UTC,
+        or None if the number of worker processes has not been changed.
+    maximum_number_of_worker_processes (int): maximum number of worker
+        processes.
+    minimum_number_of_worker_processes (int): minimum number of worker
+        processes.
+    number_of_scale_downs (int): number of times the number of worker
+        processes was decreased.
+    number_of_scale_ups (int): number of times the number of worker
+        processes was increased.
+    number_of_worker_processes (int): number of worker processes.
+  """
+
+  def __init__(self):
+    """Initializes a worker pool status."""
+    super(WorkerPoolStatus, self).__init__()
+    self.last_scaling_reason = None
+    self.last_scaling_time = None
+    self.maximum_number_of_worker_processes = 0
+    self.minimum_number_of_worker_processes = 0
+    self.number_of_scale_downs = 0
+    self.number_of_scale_ups = 0
+    self.number_of_worker_processes = 0
@@ -104,6 +104,25 @@ class SampleFileProfiler(object):
     self._sample_file = None
 
 
+class CountersProfiler(SampleFileProfiler):
+  """The counters profiler."""
+
+  _FILENAME_PREFIX = 'counters'
+
+  _FILE_HEADER = 'Time\tName\tValue\n'
+
+  def Sample(self, counter_name, value):
+    """Takes a sample of a counter for profiling.
+
+    Args:
+      counter_name (str): name of the counter to sample.
+      value (int): value of the counter.
+    """
+    sample_time = time.time()
+    sample = '{0:f}\t{1:s}\t{2:d}\n'.format(sample_time, counter_name, value)
+    self._WritesString(sample)
+
+
 class CPUTimeProfiler(SampleFileProfiler):
   """The CPU time profiler."""
 
@@ -281,7 +300,7 @@ class TasksProfiler(SampleFileProfiler):
 
   _FILENAME_PREFIX = 'tasks'
 
-  _FILE_HEADER = 'Time\tIdentifier\tStatus\n'
+  _FILE_HEADER = 'Time\tIdentifier\tStatus\tFile size\tEstimated cost\n'
 
   def Sample(self, task, status):
     """Takes a sample of the status of a task for profiling.
@@ -291,6 +310,15 @@ class TasksProfiler(SampleFileProfiler):
       status (str): status.
     """
     sample_time = time.time()
-    sample = '{0:f}\t{1:s}\t{2:s}\n'.format(
-        sample_time, task.identifier, status)
+
+    file_size = ''
+    if task.file_size is not None:
+      file_size = '{0:d}'.format(task.file_size)
+
+    estimated_cost = ''
+    if task.estimated_cost is not None:
+      estimated_cost = '{0:f}'.format(task.estimated_cost)
+
+    sample = '{0:f}\t{1:s}\t{2:s}\t{3:s}\t{4:s}\n'.format(
+        sample_time, task.identifier, status, file_size, estimated_cost)
     self._WritesString(sample)
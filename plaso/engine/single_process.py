@@ -242,7 +242,8 @@ class SingleProcessEngine(engine.BaseEngine):
 
     extraction_worker = worker.EventExtractionWorker(
         parser_filter_expression=(
-            processing_configuration.parser_filter_expression))
+            processing_configuration.parser_filter_expression),
+        temporary_directory=processing_configuration.temporary_directory)
 
     extraction_worker.SetExtractionConfiguration(
         processing_configuration.extraction)
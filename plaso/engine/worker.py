@@ -34,6 +34,8 @@ class EventExtractionWorker(object):
   Attributes:
     last_activity_timestamp (int): timestamp received that indicates the last
         time activity was observed.
+    number_of_processed_bytes (int): size of the data streams from which
+        content was extracted.
     processing_status (str): human readable status indication such as:
         'Extracting', 'Hashing'.
   """
@@ -74,7 +76,7 @@ class EventExtractionWorker(object):
   _TYPES_WITH_ROOT_METADATA = frozenset([
       dfvfs_definitions.TYPE_INDICATOR_GZIP])
 
-  def __init__(self, parser_filter_expression=None):
+  def __init__(self, parser_filter_expression=None, temporary_directory=None):
     """Initializes an event extraction worker.
 
     Args:
@@ -89,6 +91,8 @@ class EventExtractionWorker(object):
             data/presets.yaml for the list of predefined presets).
           * A name of a single parser (case insensitive), e.g. msiecf.
           * A glob name for a single parser, e.g. '*msie*' (case insensitive).
+      temporary_directory (Optional[str]): path of the directory for temporary
+          files.
     """
     super(EventExtractionWorker, self).__init__()
     self._abort = False
@@ -100,8 +104,10 @@ class EventExtractionWorker(object):
     self._process_archives = None
     self._process_compressed_streams = None
     self._processing_profiler = None
+    self._temporary_directory = temporary_directory
 
     self.last_activity_timestamp = 0.0
+    self.number_of_processed_bytes = 0
     self.processing_status = definitions.PROCESSING_STATUS_IDLE
 
   def _AnalyzeDataStream(self, mediator, file_entry, data_stream_name):
@@ -172,49 +178,52 @@ class EventExtractionWorker(object):
         file_size > self._hasher_file_size_limit):
       return
 
-    file_object.seek(0, os.SEEK_SET)
-
-    data = file_object.read(maximum_read_size)
-    while data:
-      if self._abort:
-        break
+    try:
+      file_object.seek(0, os.SEEK_SET)
 
-      for analyzer_object in self._analyzers:
+      data = file_object.read(maximum_read_size)
+      while data:
         if self._abort:
           break
 
-        if (not analyzer_object.INCREMENTAL_ANALYZER and
-            file_size > analyzer_object.SIZE_LIMIT):
-          continue
+        for analyzer_object in self._analyzers:
+          if self._abort:
+            break
 
-        if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
-            self._hasher_file_size_limit and
-            file_size > self._hasher_file_size_limit):
-          continue
+          if (not analyzer_object.INCREMENTAL_ANALYZER and
+              file_size > analyzer_object.SIZE_LIMIT):
+            continue
 
-        self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+          if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
+              self._hasher_file_size_limit and
+              file_size > self._hasher_file_size_limit):
+            continue
 
-        analyzer_object.Analyze(data)
+          self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
 
-        self.last_activity_timestamp = time.time()
+          analyzer_object.Analyze(data)
 
-      data = file_object.read(maximum_read_size)
+          self.last_activity_timestamp = time.time()
 
-    display_name = mediator.GetDisplayName()
-    for analyzer_object in self._analyzers:
-      if self._abort:
-        break
+        data = file_object.read(maximum_read_size)
 
-      for result in analyzer_object.GetResults():
-        logger.debug((
-            '[AnalyzeFileObject] attribute {0:s}:{1:s} calculated for '
-            'file: {2:s}.').format(
-                result.attribute_name, result.attribute_value, display_name))
+      display_name = mediator.GetDisplayName()
+      for analyzer_object in self._analyzers:
+        if self._abort:
+          break
 
-        mediator.AddEventAttribute(
-            result.attribute_name, result.attribute_value)
+        for result in analyzer_object.GetResults():
+          logger.debug((
+              '[AnalyzeFileObject] attribute {0:s}:{1:s} calculated for '
+              'file: {2:s}.').format(
+                  result.attribute_name, result.attribute_value, display_name))
 
-      analyzer_object.Reset()
+          mediator.AddEventAttribute(
+              result.attribute_name, result.attribute_value)
+
+    finally:
+      for analyzer_object in self._analyzers:
+        analyzer_object.Reset()
 
     self.processing_status = definitions.PROCESSING_STATUS_RUNNING
 
@@ -331,6 +340,12 @@ class EventExtractionWorker(object):
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
 
+    # Note that the stat object only provides the size of the default data
+    # stream.
+    if not data_stream_name:
+      stat_object = file_entry.GetStat()
+      self.number_of_processed_bytes += getattr(stat_object, 'size', 0) or 0
+
     self.processing_status = definitions.PROCESSING_STATUS_RUNNING
 
     self.last_activity_timestamp = time.time()
@@ -597,6 +612,9 @@ class EventExtractionWorker(object):
       if stat_object:
         event_source.file_entry_type = stat_object.type
 
+        if stat_object.type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+          event_source.file_size = getattr(stat_object, 'size', None)
+
       mediator.ProduceEventSource(event_source)
 
       self.last_activity_timestamp = time.time()
@@ -766,18 +784,30 @@ class EventExtractionWorker(object):
     analyzer_object.SetHasherNames(hasher_names_string)
     self._analyzers.append(analyzer_object)
 
-  def _SetYaraRules(self, yara_rules_string):
+  def _SetYaraRules(
+      self, yara_rules_string, cache_directory=None, file_size_limit=None):
     """Sets the Yara rules.
 
     Args:
       yara_rules_string (str): unparsed Yara rule definitions.
+      cache_directory (Optional[str]): path of the directory to cache the
+          compiled Yara rules in, where None represents the rules are not
+          cached.
+      file_size_limit (Optional[int]): maximum file size that the Yara rules
+          are matched against, where 0 represents unlimited and None the
+          default limit of the Yara analyzer.
     """
     if not yara_rules_string:
       return
 
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'yara')
-    analyzer_object.SetRules(yara_rules_string)
+    analyzer_object.SetRules(
+        yara_rules_string, cache_directory=cache_directory)
+    analyzer_object.SetTemporaryDirectory(self._temporary_directory)
+    if file_size_limit is not None:
+      analyzer_object.SetFileSizeLimit(file_size_limit)
+
     self._analyzers.append(analyzer_object)
 
   def GetAnalyzerNames(self):
@@ -823,6 +853,63 @@ class EventExtractionWorker(object):
       self.last_activity_timestamp = time.time()
       self.processing_status = definitions.PROCESSING_STATUS_IDLE
 
+  def ProcessRecordRange(
+      self, mediator, path_spec, data_stream_name, parser_name, record_range,
+      event_attributes=None):
+    """Processes a record range of a data stream.
+
+    Only the records in the range are parsed, the file entry metadata and
+    the other records are processed by the task that produced the record
+    range. The data stream is not analyzed again, instead the attributes
+    of the task that produced the record range, such as the analyzer
+    results, are set on the events.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      data_stream_name (str): name of the data stream that contains
+          the records.
+      parser_name (str): name of the parser that parses the records.
+      record_range (tuple[int, int]): first and last record of the range,
+          where the last record is not included.
+      event_attributes (Optional[dict[str, object]]): attributes to set on
+          the events produced from the record range.
+    """
+    self.last_activity_timestamp = time.time()
+    self.processing_status = definitions.PROCESSING_STATUS_RUNNING
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=mediator.resolver_context)
+
+    if file_entry is None:
+      display_name = mediator.GetDisplayNameForPathSpec(path_spec)
+      logger.warning(
+          'Unable to open file entry with path spec: {0:s}'.format(
+              display_name))
+      self.processing_status = definitions.PROCESSING_STATUS_IDLE
+      return
+
+    mediator.SetFileEntry(file_entry)
+    mediator.SetRecordRange(record_range)
+
+    mediator.ClearEventAttributes()
+    if event_attributes:
+      for attribute_name, attribute_value in iter(event_attributes.items()):
+        mediator.AddEventAttribute(attribute_name, attribute_value)
+
+    try:
+      self.processing_status = definitions.PROCESSING_STATUS_EXTRACTING
+
+      self._event_extractor.ParseDataStreamWithParser(
+          mediator, file_entry, data_stream_name, parser_name)
+
+    finally:
+      mediator.ResetFileEntry()
+
+      self.last_activity_timestamp = time.time()
+      self.processing_status = definitions.PROCESSING_STATUS_IDLE
+
   # TODO: move the functionality of this method into the constructor.
   def SetExtractionConfiguration(self, configuration):
     """Sets the extraction configuration settings.
@@ -834,7 +921,10 @@ class EventExtractionWorker(object):
     self._SetHashers(configuration.hasher_names_string)
     self._process_archives = configuration.process_archives
     self._process_compressed_streams = configuration.process_compressed_streams
-    self._SetYaraRules(configuration.yara_rules_string)
+    self._SetYaraRules(
+        configuration.yara_rules_string,
+        cache_directory=configuration.yara_rules_cache_directory,
+        file_size_limit=configuration.yara_file_size_limit)
 
   def SetProcessingProfiler(self, processing_profiler):
     """Sets the parsers profiler.
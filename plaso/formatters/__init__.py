@@ -1,104 +1,6 @@
 # -*- coding: utf-8 -*-
-"""This file contains an import statement for each formatter."""
+"""The event formatters.
 
-from plaso.formatters import amcache
-from plaso.formatters import android_app_usage
-from plaso.formatters import android_calls
-from plaso.formatters import android_sms
-from plaso.formatters import android_webview
-from plaso.formatters import android_webviewcache
-from plaso.formatters import apache_access
-from plaso.formatters import appcompatcache
-from plaso.formatters import appusage
-from plaso.formatters import asl
-from plaso.formatters import bash_history
-from plaso.formatters import bencode_parser
-from plaso.formatters import bsm
-from plaso.formatters import ccleaner
-from plaso.formatters import chrome
-from plaso.formatters import chrome_autofill
-from plaso.formatters import chrome_cache
-from plaso.formatters import chrome_cookies
-from plaso.formatters import chrome_extension_activity
-from plaso.formatters import chrome_preferences
-from plaso.formatters import cron
-from plaso.formatters import cups_ipp
-from plaso.formatters import docker
-from plaso.formatters import dpkg
-from plaso.formatters import file_history
-from plaso.formatters import file_system
-from plaso.formatters import firefox
-from plaso.formatters import firefox_cache
-from plaso.formatters import firefox_cookies
-from plaso.formatters import fseventsd
-from plaso.formatters import ganalytics
-from plaso.formatters import gdrive
-from plaso.formatters import gdrive_synclog
-from plaso.formatters import hangouts_messages
-from plaso.formatters import iis
-from plaso.formatters import imessage
-from plaso.formatters import ipod
-from plaso.formatters import java_idx
-from plaso.formatters import kik_ios
-from plaso.formatters import kodi
-from plaso.formatters import ls_quarantine
-from plaso.formatters import mac_appfirewall
-from plaso.formatters import mac_document_versions
-from plaso.formatters import mac_keychain
-from plaso.formatters import mac_notificationcenter
-from plaso.formatters import mac_securityd
-from plaso.formatters import mac_wifi
-from plaso.formatters import mackeeper_cache
-from plaso.formatters import mactime
-from plaso.formatters import mcafeeav
-from plaso.formatters import msie_webcache
-from plaso.formatters import msiecf
-from plaso.formatters import officemru
-from plaso.formatters import olecf
-from plaso.formatters import opera
-from plaso.formatters import oxml
-from plaso.formatters import pe
-from plaso.formatters import plist
-from plaso.formatters import pls_recall
-from plaso.formatters import popcontest
-from plaso.formatters import recycler
-from plaso.formatters import safari
-from plaso.formatters import safari_cookies
-from plaso.formatters import sam_users
-from plaso.formatters import santa
-from plaso.formatters import sccm
-from plaso.formatters import selinux
-from plaso.formatters import shell_items
-from plaso.formatters import shutdown
-from plaso.formatters import skydrivelog
-from plaso.formatters import skype
-from plaso.formatters import sophos_av
-from plaso.formatters import srum
-from plaso.formatters import ssh
-from plaso.formatters import symantec
-from plaso.formatters import syslog
-from plaso.formatters import systemd_journal
-from plaso.formatters import tango_android
-from plaso.formatters import task_scheduler
-from plaso.formatters import text
-from plaso.formatters import trendmicroav
-from plaso.formatters import twitter_android
-from plaso.formatters import twitter_ios
-from plaso.formatters import userassist
-from plaso.formatters import utmp
-from plaso.formatters import utmpx
-from plaso.formatters import windows
-from plaso.formatters import windows_timeline
-from plaso.formatters import winevt
-from plaso.formatters import winevtx
-from plaso.formatters import winfirewall
-from plaso.formatters import winjob
-from plaso.formatters import winlnk
-from plaso.formatters import winprefetch
-from plaso.formatters import winreg
-from plaso.formatters import winregservice
-from plaso.formatters import winrestore
-from plaso.formatters import xchatlog
-from plaso.formatters import xchatscrollback
-from plaso.formatters import zeitgeist
-from plaso.formatters import zsh_extended_history
+The Python modules that register formatters are imported on demand by
+the formatters manager, as defined by the formatters manifest.
+"""
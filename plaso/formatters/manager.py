@@ -3,8 +3,11 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
 from plaso.formatters import default
 from plaso.formatters import logger
+from plaso.formatters import manifest
 
 
 class FormattersManager(object):
@@ -13,6 +16,18 @@ class FormattersManager(object):
   _formatter_classes = {}
   _formatter_objects = {}
 
+  @classmethod
+  def _ImportFormatterModule(cls, data_type):
+    """Imports the Python module that registers the formatter of a data type.
+
+    Args:
+      data_type (str): lower case data type, where data types that are not
+          in the manifest are ignored.
+    """
+    module_name = manifest.FORMATTERS.get(data_type, None)
+    if module_name:
+      importlib.import_module(module_name)
+
   @classmethod
   def DeregisterFormatter(cls, formatter_class):
     """Deregisters a formatter class.
@@ -48,6 +63,9 @@ class FormattersManager(object):
     if data_type not in cls._formatter_objects:
       formatter_object = None
 
+      if data_type not in cls._formatter_classes:
+        cls._ImportFormatterModule(data_type)
+
       if data_type in cls._formatter_classes:
         formatter_class = cls._formatter_classes[data_type]
         # TODO: remove the need to instantiate the Formatter classes
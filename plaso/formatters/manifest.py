@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""The formatters manifest.
+
+The manifest maps the data type of an event to the Python module that
+registers its formatter. It is used by the formatters manager to only import
+the modules of the formatters that are used.
+"""
+
+from __future__ import unicode_literals
+
+
+FORMATTERS = {
+    'android:event:call': 'plaso.formatters.android_calls',
+    'android:event:last_resume_time': 'plaso.formatters.android_app_usage',
+    'android:messaging:hangouts': 'plaso.formatters.hangouts_messages',
+    'android:messaging:sms': 'plaso.formatters.android_sms',
+    'android:webviewcache': 'plaso.formatters.android_webviewcache',
+    'apache:access': 'plaso.formatters.apache_access',
+    'av:mcafee:accessprotectionlog': 'plaso.formatters.mcafeeav',
+    'av:symantec:scanlog': 'plaso.formatters.symantec',
+    'av:trendmicro:scan': 'plaso.formatters.trendmicroav',
+    'av:trendmicro:webrep': 'plaso.formatters.trendmicroav',
+    'bash:history:command': 'plaso.formatters.bash_history',
+    'bsm:event': 'plaso.formatters.bsm',
+    'ccleaner:update': 'plaso.formatters.ccleaner',
+    'chrome:autofill:entry': 'plaso.formatters.chrome_autofill',
+    'chrome:cache:entry': 'plaso.formatters.chrome_cache',
+    'chrome:cookie:entry': 'plaso.formatters.chrome_cookies',
+    'chrome:extension_activity:activity_log': (
+        'plaso.formatters.chrome_extension_activity'),
+    'chrome:history:file_downloaded': 'plaso.formatters.chrome',
+    'chrome:history:page_visited': 'plaso.formatters.chrome',
+    'chrome:preferences:clear_history': 'plaso.formatters.chrome_preferences',
+    'chrome:preferences:content_settings:exceptions': (
+        'plaso.formatters.chrome_preferences'),
+    'chrome:preferences:extension_installation': (
+        'plaso.formatters.chrome_preferences'),
+    'chrome:preferences:extensions_autoupdater': (
+        'plaso.formatters.chrome_preferences'),
+    'cookie:google:analytics:utma': 'plaso.formatters.ganalytics',
+    'cookie:google:analytics:utmb': 'plaso.formatters.ganalytics',
+    'cookie:google:analytics:utmt': 'plaso.formatters.ganalytics',
+    'cookie:google:analytics:utmz': 'plaso.formatters.ganalytics',
+    'cups:ipp:event': 'plaso.formatters.cups_ipp',
+    'docker:json:container': 'plaso.formatters.docker',
+    'docker:json:container:log': 'plaso.formatters.docker',
+    'docker:json:layer': 'plaso.formatters.docker',
+    'dpkg:line': 'plaso.formatters.dpkg',
+    'file_history:namespace:event': 'plaso.formatters.file_history',
+    'firefox:cache:record': 'plaso.formatters.firefox_cache',
+    'firefox:cookie:entry': 'plaso.formatters.firefox_cookies',
+    'firefox:downloads:download': 'plaso.formatters.firefox',
+    'firefox:places:bookmark': 'plaso.formatters.firefox',
+    'firefox:places:bookmark_annotation': 'plaso.formatters.firefox',
+    'firefox:places:bookmark_folder': 'plaso.formatters.firefox',
+    'firefox:places:page_visited': 'plaso.formatters.firefox',
+    'fs:mactime:line': 'plaso.formatters.mactime',
+    'fs:ntfs:usn_change': 'plaso.formatters.file_system',
+    'fs:stat': 'plaso.formatters.file_system',
+    'fs:stat:ntfs': 'plaso.formatters.file_system',
+    'gdrive:snapshot:cloud_entry': 'plaso.formatters.gdrive',
+    'gdrive:snapshot:local_entry': 'plaso.formatters.gdrive',
+    'gdrive_sync:log:line': 'plaso.formatters.gdrive_synclog',
+    'iis:log:line': 'plaso.formatters.iis',
+    'imessage:event:chat': 'plaso.formatters.imessage',
+    'ios:kik:messaging': 'plaso.formatters.kik_ios',
+    'ipod:device:entry': 'plaso.formatters.ipod',
+    'java:download:idx': 'plaso.formatters.java_idx',
+    'kodi:videos:viewing': 'plaso.formatters.kodi',
+    'linux:utmp:event': 'plaso.formatters.utmp',
+    'mac:appfirewall:line': 'plaso.formatters.mac_appfirewall',
+    'mac:asl:event': 'plaso.formatters.asl',
+    'mac:document_versions:file': 'plaso.formatters.mac_document_versions',
+    'mac:keychain:application': 'plaso.formatters.mac_keychain',
+    'mac:keychain:internet': 'plaso.formatters.mac_keychain',
+    'mac:notificationcenter:db': 'plaso.formatters.mac_notificationcenter',
+    'mac:securityd:line': 'plaso.formatters.mac_securityd',
+    'mac:utmpx:event': 'plaso.formatters.utmpx',
+    'mac:wifilog:line': 'plaso.formatters.mac_wifi',
+    'mackeeper:cache': 'plaso.formatters.mackeeper_cache',
+    'macos:fseventsd:record': 'plaso.formatters.fseventsd',
+    'macosx:application_usage': 'plaso.formatters.appusage',
+    'macosx:lsquarantine': 'plaso.formatters.ls_quarantine',
+    'metadata:openxml': 'plaso.formatters.oxml',
+    'msie:webcache:container': 'plaso.formatters.msie_webcache',
+    'msie:webcache:containers': 'plaso.formatters.msie_webcache',
+    'msie:webcache:leak_file': 'plaso.formatters.msie_webcache',
+    'msie:webcache:partitions': 'plaso.formatters.msie_webcache',
+    'msiecf:leak': 'plaso.formatters.msiecf',
+    'msiecf:redirected': 'plaso.formatters.msiecf',
+    'msiecf:url': 'plaso.formatters.msiecf',
+    'olecf:dest_list:entry': 'plaso.formatters.olecf',
+    'olecf:document_summary_info': 'plaso.formatters.olecf',
+    'olecf:item': 'plaso.formatters.olecf',
+    'olecf:summary_info': 'plaso.formatters.olecf',
+    'opera:history:entry': 'plaso.formatters.opera',
+    'opera:history:typed_entry': 'plaso.formatters.opera',
+    'p2p:bittorrent:transmission': 'plaso.formatters.bencode_parser',
+    'p2p:bittorrent:utorrent': 'plaso.formatters.bencode_parser',
+    'pe:compilation:compilation_time': 'plaso.formatters.pe',
+    'pe:delay_import:import_time': 'plaso.formatters.pe',
+    'pe:import:import_time': 'plaso.formatters.pe',
+    'pe:load_config:modification_time': 'plaso.formatters.pe',
+    'pe:resource:creation_time': 'plaso.formatters.pe',
+    'plist:key': 'plaso.formatters.plist',
+    'plsrecall:event': 'plaso.formatters.pls_recall',
+    'popularity_contest:log:event': 'plaso.formatters.popcontest',
+    'popularity_contest:session:event': 'plaso.formatters.popcontest',
+    'safari:cookie:entry': 'plaso.formatters.safari_cookies',
+    'safari:history:visit': 'plaso.formatters.safari',
+    'safari:history:visit_sqlite': 'plaso.formatters.safari',
+    'santa:diskmount': 'plaso.formatters.santa',
+    'santa:execution': 'plaso.formatters.santa',
+    'santa:file_system_event': 'plaso.formatters.santa',
+    'selinux:line': 'plaso.formatters.selinux',
+    'shell:zsh:history': 'plaso.formatters.zsh_extended_history',
+    'skydrive:log:line': 'plaso.formatters.skydrivelog',
+    'skydrive:log:old:line': 'plaso.formatters.skydrivelog',
+    'skype:event:account': 'plaso.formatters.skype',
+    'skype:event:call': 'plaso.formatters.skype',
+    'skype:event:chat': 'plaso.formatters.skype',
+    'skype:event:sms': 'plaso.formatters.skype',
+    'skype:event:transferfile': 'plaso.formatters.skype',
+    'software_management:sccm:log': 'plaso.formatters.sccm',
+    'sophos:av:log': 'plaso.formatters.sophos_av',
+    'syslog:comment': 'plaso.formatters.syslog',
+    'syslog:cron:task_run': 'plaso.formatters.cron',
+    'syslog:line': 'plaso.formatters.syslog',
+    'syslog:ssh:failed_connection': 'plaso.formatters.ssh',
+    'syslog:ssh:login': 'plaso.formatters.ssh',
+    'syslog:ssh:opened_connection': 'plaso.formatters.ssh',
+    'systemd:journal': 'plaso.formatters.systemd_journal',
+    'systemd:journal:dirty': 'plaso.formatters.systemd_journal',
+    'tango:android:contact': 'plaso.formatters.tango_android',
+    'tango:android:conversation': 'plaso.formatters.tango_android',
+    'tango:android:message': 'plaso.formatters.tango_android',
+    'task_scheduler:task_cache:entry': 'plaso.formatters.task_scheduler',
+    'text:entry': 'plaso.formatters.text',
+    'twitter:android:contact': 'plaso.formatters.twitter_android',
+    'twitter:android:search': 'plaso.formatters.twitter_android',
+    'twitter:android:status': 'plaso.formatters.twitter_android',
+    'twitter:ios:contact': 'plaso.formatters.twitter_ios',
+    'twitter:ios:status': 'plaso.formatters.twitter_ios',
+    'webview:cookie': 'plaso.formatters.android_webview',
+    'windows:distributed_link_tracking:creation': 'plaso.formatters.windows',
+    'windows:evt:record': 'plaso.formatters.winevt',
+    'windows:evtx:record': 'plaso.formatters.winevtx',
+    'windows:firewall:log_entry': 'plaso.formatters.winfirewall',
+    'windows:lnk:link': 'plaso.formatters.winlnk',
+    'windows:metadata:deleted_item': 'plaso.formatters.recycler',
+    'windows:prefetch:execution': 'plaso.formatters.winprefetch',
+    'windows:registry:amcache': 'plaso.formatters.amcache',
+    'windows:registry:amcache:programs': 'plaso.formatters.amcache',
+    'windows:registry:appcompatcache': 'plaso.formatters.appcompatcache',
+    'windows:registry:installation': 'plaso.formatters.windows',
+    'windows:registry:key_value': 'plaso.formatters.winreg',
+    'windows:registry:list': 'plaso.formatters.windows',
+    'windows:registry:network': 'plaso.formatters.windows',
+    'windows:registry:office_mru': 'plaso.formatters.officemru',
+    'windows:registry:sam_users': 'plaso.formatters.sam_users',
+    'windows:registry:service': 'plaso.formatters.winregservice',
+    'windows:registry:shutdown': 'plaso.formatters.shutdown',
+    'windows:registry:userassist': 'plaso.formatters.userassist',
+    'windows:restore_point:info': 'plaso.formatters.winrestore',
+    'windows:shell_item:file_entry': 'plaso.formatters.shell_items',
+    'windows:srum:application_usage': 'plaso.formatters.srum',
+    'windows:srum:network_connectivity': 'plaso.formatters.srum',
+    'windows:srum:network_usage': 'plaso.formatters.srum',
+    'windows:tasks:job': 'plaso.formatters.winjob',
+    'windows:timeline:generic': 'plaso.formatters.windows_timeline',
+    'windows:timeline:user_engaged': 'plaso.formatters.windows_timeline',
+    'windows:volume:creation': 'plaso.formatters.windows',
+    'xchat:log:line': 'plaso.formatters.xchatlog',
+    'xchat:scrollback:line': 'plaso.formatters.xchatscrollback',
+    'zeitgeist:activity': 'plaso.formatters.zeitgeist'}
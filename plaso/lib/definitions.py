@@ -9,10 +9,12 @@ MICROSECONDS_PER_MINUTE = 60000000
 
 COMPRESSION_FORMAT_NONE = 'none'
 COMPRESSION_FORMAT_ZLIB = 'zlib'
+COMPRESSION_FORMAT_ZLIB_DICTIONARY = 'zlib_dictionary'
 
 COMPRESSION_FORMATS = frozenset([
     COMPRESSION_FORMAT_NONE,
-    COMPRESSION_FORMAT_ZLIB])
+    COMPRESSION_FORMAT_ZLIB,
+    COMPRESSION_FORMAT_ZLIB_DICTIONARY])
 
 DEFAULT_WORKER_MEMORY_LIMIT = 2048 * 1024 * 1024
 
@@ -15,6 +15,7 @@ from plaso.engine import engine
 from plaso.engine import process_info
 from plaso.lib import definitions
 from plaso.multi_processing import logger
+from plaso.multi_processing import metrics
 from plaso.multi_processing import plaso_xmlrpc
 
 
@@ -46,6 +47,8 @@ class MultiProcessEngine(engine.BaseEngine):
     self._debug_output = False
     self._name = 'Main'
     self._log_filename = None
+    self._metrics = None
+    self._metrics_server = None
     self._pid = os.getpid()
     self._process_information = process_info.ProcessInfo(self._pid)
     self._process_information_per_pid = {}
@@ -336,6 +339,20 @@ class MultiProcessEngine(engine.BaseEngine):
     self._rpc_clients_per_pid[pid] = rpc_client
     self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
 
+  def _StartMetricsServer(self, port):
+    """Starts the metrics HTTP server.
+
+    Args:
+      port (int): port to listen on for requests, where 0 represents
+          a port selected by the operating system.
+    """
+    self._metrics = metrics.ProcessingMetrics()
+    self._metrics_server = metrics.MetricsHTTPServer(self._metrics)
+
+    if not self._metrics_server.Start(port):
+      self._metrics = None
+      self._metrics_server = None
+
   def _StartStatusUpdateThread(self):
     """Starts the status update thread."""
     self._status_update_active = True
@@ -347,6 +364,14 @@ class MultiProcessEngine(engine.BaseEngine):
   def _StatusUpdateThreadMain(self):
     """Main function of the status update thread."""
 
+  def _StopMetricsServer(self):
+    """Stops the metrics HTTP server."""
+    if self._metrics_server:
+      self._metrics_server.Stop()
+
+    self._metrics = None
+    self._metrics_server = None
+
   def _StopMonitoringProcess(self, process):
     """Stops monitoring a process.
 
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""Processing metrics and HTTP server to expose them.
+
+The metrics are exposed in the Prometheus text-based exposition format.
+"""
+
+from __future__ import unicode_literals
+
+import socket
+import sys
+import threading
+import time
+
+# pylint: disable=import-error,wrong-import-order
+if sys.version_info[0] < 3:
+  import BaseHTTPServer
+  import SocketServer
+else:
+  from http import server as BaseHTTPServer
+  import socketserver as SocketServer
+
+# pylint: disable=wrong-import-position
+from plaso.multi_processing import logger
+
+
+class ProcessingMetrics(object):
+  """Processing metrics.
+
+  The metrics are aggregated from the processing status that is maintained
+  by the foreman and the status information that is received from the worker
+  processes.
+  """
+
+  _CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+  def __init__(self):
+    """Initializes processing metrics."""
+    super(ProcessingMetrics, self).__init__()
+    self._events_per_second_per_process = {}
+    self._last_activity_timestamp_per_process = {}
+    self._lock = threading.Lock()
+    self._number_of_processed_bytes_per_process = {}
+    self._parser_timings_per_process = {}
+    self._previous_number_of_events_per_process = {}
+    self._startup_time_per_process = {}
+    self._text = ''
+
+  def _FormatLabels(self, labels):
+    """Formats metric labels.
+
+    Args:
+      labels (list[tuple[str, object]]): label names and values.
+
+    Returns:
+      str: formatted labels.
+    """
+    label_strings = []
+    for name, value in labels:
+      value = '{0!s}'.format(value)
+      value = value.replace('\\', '\\\\').replace('"', '\\"').replace(
+          '\n', '\\n')
+      label_strings.append('{0:s}="{1:s}"'.format(name, value))
+
+    return '{{{0:s}}}'.format(','.join(label_strings))
+
+  def _GetLines(self, processing_status, timestamp):
+    """Retrieves the lines of the metrics.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+      timestamp (float): time of the update, which contains the number of
+          seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      list[str]: lines of the metrics.
+    """
+    process_status_objects = []
+    if processing_status.foreman_status:
+      process_status_objects.append(processing_status.foreman_status)
+    process_status_objects.extend(processing_status.workers_status)
+
+    process_samples = {
+        'events': [],
+        'events_per_second': [],
+        'idle_seconds': [],
+        'processed_bytes': [],
+        'sources': [],
+        'startup_time': [],
+        'status': [],
+        'used_memory': [],
+        'warnings': []}
+    parser_samples = []
+
+    for process_status in process_status_objects:
+      identifier = process_status.identifier
+      labels = [('process', identifier), ('pid', process_status.pid)]
+
+      number_of_events = process_status.number_of_produced_events or 0
+      events_per_second = self._UpdateEventsPerSecond(
+          identifier, number_of_events, timestamp)
+
+      process_samples['events'].append((labels, number_of_events))
+      process_samples['events_per_second'].append((labels, events_per_second))
+      process_samples['sources'].append((
+          labels, process_status.number_of_produced_sources or 0))
+      process_samples['status'].append((
+          labels + [('status', process_status.status)], 1))
+      process_samples['used_memory'].append((
+          labels, process_status.used_memory or 0))
+      process_samples['warnings'].append((
+          labels, process_status.number_of_produced_warnings or 0))
+
+      last_activity_timestamp = self._last_activity_timestamp_per_process.get(
+          identifier, None)
+      if last_activity_timestamp:
+        process_samples['idle_seconds'].append((
+            labels, max(0.0, timestamp - last_activity_timestamp)))
+
+      number_of_processed_bytes = (
+          self._number_of_processed_bytes_per_process.get(identifier, None))
+      if number_of_processed_bytes is not None:
+        process_samples['processed_bytes'].append((
+            labels, number_of_processed_bytes))
+
+      startup_time = self._startup_time_per_process.get(identifier, None)
+      if startup_time is not None:
+        process_samples['startup_time'].append((labels, startup_time))
+
+      parser_timings = self._parser_timings_per_process.get(identifier, {})
+      for parser_name, parser_time in sorted(parser_timings.items()):
+        parser_samples.append((
+            [('process', identifier), ('parser', parser_name)], parser_time))
+
+    lines = []
+    self._WriteMetric(
+        lines, 'plaso_process_events_total', 'counter',
+        'Number of events produced by the process.',
+        process_samples['events'])
+    self._WriteMetric(
+        lines, 'plaso_process_events_per_second', 'gauge',
+        'Number of events produced by the process per second.',
+        process_samples['events_per_second'])
+    self._WriteMetric(
+        lines, 'plaso_process_event_sources_total', 'counter',
+        'Number of event sources produced by the process.',
+        process_samples['sources'])
+    self._WriteMetric(
+        lines, 'plaso_process_warnings_total', 'counter',
+        'Number of extraction warnings produced by the process.',
+        process_samples['warnings'])
+    self._WriteMetric(
+        lines, 'plaso_process_processed_bytes_total', 'counter',
+        'Size of the data streams processed by the process in bytes.',
+        process_samples['processed_bytes'])
+    self._WriteMetric(
+        lines, 'plaso_process_used_memory_bytes', 'gauge',
+        'Amount of memory used by the process in bytes.',
+        process_samples['used_memory'])
+    self._WriteMetric(
+        lines, 'plaso_process_idle_seconds', 'gauge',
+        'Number of seconds since the process last reported activity.',
+        process_samples['idle_seconds'])
+    self._WriteMetric(
+        lines, 'plaso_process_startup_seconds', 'gauge',
+        'Time between the creation of the process and the start of '
+        'processing in seconds.', process_samples['startup_time'])
+    self._WriteMetric(
+        lines, 'plaso_process_status', 'gauge',
+        'Status of the process.', process_samples['status'])
+    self._WriteMetric(
+        lines, 'plaso_parser_seconds_total', 'counter',
+        'Time spent by the process in the parser in seconds.',
+        parser_samples)
+
+    tasks_status = processing_status.tasks_status
+    if tasks_status:
+      self._WriteMetric(
+          lines, 'plaso_tasks', 'gauge', 'Number of tasks per state.', [
+              ([('state', 'queued')], tasks_status.number_of_queued_tasks),
+              ([('state', 'processing')],
+               tasks_status.number_of_tasks_processing),
+              ([('state', 'pending_merge')],
+               tasks_status.number_of_tasks_pending_merge),
+              ([('state', 'abandoned')],
+               tasks_status.number_of_abandoned_tasks)])
+      self._WriteMetric(
+          lines, 'plaso_tasks_total', 'counter', 'Number of tasks.',
+          [([], tasks_status.total_number_of_tasks)])
+
+    worker_pool_status = processing_status.worker_pool_status
+    if worker_pool_status:
+      self._WriteMetric(
+          lines, 'plaso_worker_processes', 'gauge',
+          'Number of worker processes in the adaptive worker pool.', [
+              ([('bound', 'current')],
+               worker_pool_status.number_of_worker_processes),
+              ([('bound', 'minimum')],
+               worker_pool_status.minimum_number_of_worker_processes),
+              ([('bound', 'maximum')],
+               worker_pool_status.maximum_number_of_worker_processes)])
+      self._WriteMetric(
+          lines, 'plaso_worker_pool_scaling_total', 'counter',
+          'Number of times the adaptive worker pool was scaled.', [
+              ([('direction', 'up')], worker_pool_status.number_of_scale_ups),
+              ([('direction', 'down')],
+               worker_pool_status.number_of_scale_downs)])
+
+    self._WriteMetric(
+        lines, 'plaso_processing_start_time_seconds', 'gauge',
+        'Time the processing was started in seconds since the epoch.',
+        [([], processing_status.start_time)])
+
+    return lines
+
+  def _UpdateEventsPerSecond(self, identifier, number_of_events, timestamp):
+    """Updates the number of events per second of a process.
+
+    Args:
+      identifier (str): identifier of the process.
+      number_of_events (int): number of events produced by the process.
+      timestamp (float): time of the update, which contains the number of
+          seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      float: number of events per second.
+    """
+    previous_timestamp, previous_number_of_events = (
+        self._previous_number_of_events_per_process.get(
+            identifier, (None, None)))
+
+    events_per_second = self._events_per_second_per_process.get(
+        identifier, 0.0)
+
+    if previous_timestamp is not None and timestamp > previous_timestamp:
+      events_per_second = (
+          float(max(0, number_of_events - previous_number_of_events)) /
+          (timestamp - previous_timestamp))
+
+    self._events_per_second_per_process[identifier] = events_per_second
+    self._previous_number_of_events_per_process[identifier] = (
+        timestamp, number_of_events)
+
+    return events_per_second
+
+  def _WriteMetric(self, lines, name, metric_type, description, samples):
+    """Writes a metric.
+
+    Args:
+      lines (list[str]): lines of the metrics to append to.
+      name (str): name of the metric.
+      metric_type (str): type of the metric, such as "counter" or "gauge".
+      description (str): description of the metric.
+      samples (list[tuple[list[tuple[str, object]], object]]): labels and
+          value of the samples of the metric.
+    """
+    if not samples:
+      return
+
+    lines.append('# HELP {0:s} {1:s}'.format(name, description))
+    lines.append('# TYPE {0:s} {1:s}'.format(name, metric_type))
+
+    for labels, value in samples:
+      if labels:
+        labels = self._FormatLabels(labels)
+      else:
+        labels = ''
+
+      if isinstance(value, float):
+        value = repr(value)
+      else:
+        value = '{0!s}'.format(value)
+
+      lines.append('{0:s}{1:s} {2:s}'.format(name, labels, value))
+
+  @property
+  def content_type(self):
+    """str: content type of the metrics text."""
+    return self._CONTENT_TYPE
+
+  def GetText(self):
+    """Retrieves the metrics text.
+
+    Returns:
+      str: metrics in the Prometheus text-based exposition format.
+    """
+    with self._lock:
+      return self._text
+
+  def UpdateProcessingStatus(self, processing_status):
+    """Updates the metrics from the processing status.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    timestamp = time.time()
+
+    with self._lock:
+      lines = self._GetLines(processing_status, timestamp)
+      lines.append('')
+      self._text = '\n'.join(lines)
+
+  def UpdateProcessStatus(self, identifier, process_status):
+    """Updates the metrics from the status information of a process.
+
+    Args:
+      identifier (str): identifier of the process.
+      process_status (dict[str, object]): status values received from
+          the process.
+    """
+    if not process_status:
+      return
+
+    with self._lock:
+      last_activity_timestamp = process_status.get(
+          'last_activity_timestamp', None)
+      if last_activity_timestamp:
+        self._last_activity_timestamp_per_process[identifier] = (
+            last_activity_timestamp)
+
+      # XML RPC does not support integer values > 2 GiB so the number of
+      # processed bytes is formatted as a string.
+      number_of_processed_bytes = process_status.get(
+          'number_of_processed_bytes', None)
+      if number_of_processed_bytes is not None:
+        self._number_of_processed_bytes_per_process[identifier] = int(
+            number_of_processed_bytes, 10)
+
+      parser_timings = process_status.get('parser_timings', None)
+      if parser_timings is not None:
+        self._parser_timings_per_process[identifier] = dict(parser_timings)
+
+      startup_time = process_status.get('startup_time', None)
+      if startup_time is not None:
+        self._startup_time_per_process[identifier] = startup_time
+
+
+class MetricsHTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """Metrics HTTP request handler."""
+
+  # pylint: disable=invalid-name
+
+  def do_GET(self):
+    """Handles a HTTP GET request."""
+    path, _, _ = self.path.partition('?')
+    if path not in ('/', '/metrics'):
+      self.send_error(404)
+      return
+
+    metrics = self.server.metrics
+    data = metrics.GetText().encode('utf-8')
+
+    self.send_response(200)
+    self.send_header('Content-Type', metrics.content_type)
+    self.send_header('Content-Length', '{0:d}'.format(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+  # pylint: disable=redefined-builtin
+  def log_message(self, format, *args):
+    """Logs a HTTP request.
+
+    Args:
+      format (str): format string.
+      args (list[object]): format arguments.
+    """
+    logger.debug('Metrics server request: {0:s}'.format(format % args))
+
+
+class _ThreadedHTTPServer(
+    SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+  """HTTP server that handles each request in a separate thread.
+
+  A slow client therefore does not block other requests.
+  """
+
+  daemon_threads = True
+
+
+class MetricsHTTPServer(object):
+  """Threaded HTTP server that exposes processing metrics.
+
+  The server only binds to the loopback interface, since the metrics are
+  intended for local monitoring.
+  """
+
+  _HOSTNAME = '127.0.0.1'
+
+  _THREAD_NAME = 'metrics_http_server'
+
+  def __init__(self, metrics):
+    """Initializes a metrics HTTP server.
+
+    Args:
+      metrics (ProcessingMetrics): processing metrics.
+    """
+    super(MetricsHTTPServer, self).__init__()
+    self._http_server = None
+    self._metrics = metrics
+    self._server_thread = None
+
+  @property
+  def port(self):
+    """int: port the server is listening on or None if not started."""
+    if not self._http_server:
+      return None
+    return self._http_server.server_address[1]
+
+  def Start(self, port):
+    """Starts the metrics HTTP server.
+
+    Args:
+      port (int): port to listen on for requests, where 0 represents
+          a port selected by the operating system.
+
+    Returns:
+      bool: True if the metrics HTTP server was successfully started.
+    """
+    try:
+      self._http_server = _ThreadedHTTPServer(
+          (self._HOSTNAME, port), MetricsHTTPRequestHandler)
+    except socket.error as exception:
+      logger.warning((
+          'Unable to bind a metrics HTTP server on {0:s}:{1:d} with error: '
+          '{2!s}').format(self._HOSTNAME, port, exception))
+      return False
+
+    self._http_server.metrics = self._metrics
+
+    self._server_thread = threading.Thread(
+        name=self._THREAD_NAME, target=self._http_server.serve_forever)
+    self._server_thread.daemon = True
+    self._server_thread.start()
+
+    logger.info('Metrics available at: http://{0:s}:{1:d}/metrics'.format(
+        self._HOSTNAME, self.port))
+    return True
+
+  def Stop(self):
+    """Stops the metrics HTTP server."""
+    if self._http_server:
+      self._http_server.shutdown()
+      self._http_server.server_close()
+      self._http_server = None
+
+    if self._server_thread:
+      self._server_thread.join()
+      self._server_thread = None
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Estimation of the cost of extraction tasks."""
+
+from __future__ import unicode_literals
+
+from plaso.containers import event_sources
+from plaso.engine import path_helper
+
+
+class TaskCostEstimator(object):
+  """Estimates the time needed to process an event source.
+
+  The estimate is derived from the size of the file entry and the throughput,
+  in bytes per second, of the parser as observed by the worker processes.
+
+  The parser of a file entry is only determined by the signature scan in the
+  worker process. Hence the parser is predicted from the parser that the
+  worker processes reported for files of the same type, such as files with
+  the same extension. If no parser was reported for the type of the file the
+  combined throughput of all parsers is used.
+  """
+
+  # Throughput used when no throughput has been observed, which is 10 MiB/s.
+  _DEFAULT_BYTES_PER_SECOND = 10.0 * 1024 * 1024
+
+  # Minimum amount of data, in bytes, a throughput must be observed over to
+  # be used.
+  _MINIMUM_OBSERVED_DATA_SIZE = 1024 * 1024
+
+  # Maximum number of file types for which the parser is tracked.
+  _MAXIMUM_NUMBER_OF_FILE_TYPES = 1024
+
+  def __init__(self):
+    """Initializes a task cost estimator."""
+    super(TaskCostEstimator, self).__init__()
+    self._bytes_per_second = self._DEFAULT_BYTES_PER_SECOND
+    self._bytes_per_second_per_parser = {}
+    self._parser_names_per_file_type = {}
+    self._parser_throughputs_per_process = {}
+
+  def _CalculateBytesPerSecond(self, data_size, parser_time):
+    """Calculates a throughput.
+
+    Args:
+      data_size (int): size of the data in bytes.
+      parser_time (float): time spent parsing the data in seconds.
+
+    Returns:
+      float: throughput in bytes per second or None if the observed data is
+          not sufficient to determine the throughput.
+    """
+    if data_size < self._MINIMUM_OBSERVED_DATA_SIZE or parser_time <= 0.0:
+      return None
+
+    return data_size / parser_time
+
+  def _UpdateBytesPerSecond(self):
+    """Updates the throughputs from the throughputs observed per process."""
+    data_size_per_parser = {}
+    parser_time_per_parser = {}
+
+    for parser_throughputs in self._parser_throughputs_per_process.values():
+      for parser_name, (data_size, parser_time) in iter(
+          parser_throughputs.items()):
+        data_size_per_parser[parser_name] = (
+            data_size_per_parser.get(parser_name, 0) + data_size)
+        parser_time_per_parser[parser_name] = (
+            parser_time_per_parser.get(parser_name, 0.0) + parser_time)
+
+    bytes_per_second_per_parser = {}
+    for parser_name, data_size in iter(data_size_per_parser.items()):
+      bytes_per_second = self._CalculateBytesPerSecond(
+          data_size, parser_time_per_parser[parser_name])
+      if bytes_per_second:
+        bytes_per_second_per_parser[parser_name] = bytes_per_second
+
+    bytes_per_second = self._CalculateBytesPerSecond(
+        sum(data_size_per_parser.values()),
+        sum(parser_time_per_parser.values()))
+
+    self._bytes_per_second = bytes_per_second or self._DEFAULT_BYTES_PER_SECOND
+    self._bytes_per_second_per_parser = bytes_per_second_per_parser
+
+  def EstimateCost(self, event_source):
+    """Estimates the time needed to process an event source.
+
+    Args:
+      event_source (EventSource): event source.
+
+    Returns:
+      float: estimated time in seconds or None if the cost cannot be estimated,
+          such as for a directory or a record range.
+    """
+    if event_source.data_type == (
+        event_sources.RecordRangeEventSource.DATA_TYPE):
+      return None
+
+    if event_source.file_size is None:
+      return None
+
+    parser_name = self.GetParserName(event_source)
+    bytes_per_second = self._bytes_per_second_per_parser.get(
+        parser_name, self._bytes_per_second)
+
+    return event_source.file_size / bytes_per_second
+
+  def GetBytesPerSecond(self, parser_name=None):
+    """Retrieves the throughput used in the estimates.
+
+    Args:
+      parser_name (Optional[str]): name of the parser, where None represents
+          the combined throughput of all parsers.
+
+    Returns:
+      float: throughput in bytes per second.
+    """
+    return self._bytes_per_second_per_parser.get(
+        parser_name, self._bytes_per_second)
+
+  def GetParserName(self, event_source):
+    """Predicts the parser of an event source.
+
+    Args:
+      event_source (EventSource): event source.
+
+    Returns:
+      str: name of the parser or None if not known.
+    """
+    if event_source.parser_name:
+      return event_source.parser_name
+
+    location = getattr(event_source.path_spec, 'location', None)
+    file_type = path_helper.PathHelper.GetFileTypeForPath(location)
+    return self._parser_names_per_file_type.get(file_type, None)
+
+  def UpdateParserNamesPerFileType(self, parser_names_per_file_type):
+    """Updates the parsers per file type observed by a worker process.
+
+    Args:
+      parser_names_per_file_type (dict[str, str]): name of the parser that
+          parsed a file per file type, as reported by the worker process.
+    """
+    for file_type, parser_name in iter(parser_names_per_file_type.items()):
+      if (file_type in self._parser_names_per_file_type or
+          len(self._parser_names_per_file_type) <
+          self._MAXIMUM_NUMBER_OF_FILE_TYPES):
+        self._parser_names_per_file_type[file_type] = parser_name
+
+  def UpdateParserThroughputs(self, identifier, parser_throughputs):
+    """Updates the parser throughputs observed by a worker process.
+
+    Args:
+      identifier (str): identifier of the worker process.
+      parser_throughputs (dict[str, list[str, float]]): size of the data in
+          bytes, formatted as a string, and time spent in seconds per parser,
+          as reported by the worker process.
+    """
+    self._parser_throughputs_per_process[identifier] = {
+        parser_name: (int(data_size, 10), parser_time)
+        for parser_name, (data_size, parser_time) in iter(
+            parser_throughputs.items())}
+
+    self._UpdateBytesPerSecond()
@@ -7,6 +7,7 @@ import heapq
 import logging
 import multiprocessing
 import os
+import sys
 import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -16,6 +17,7 @@ from plaso.containers import event_sources
 from plaso.containers import warnings
 from plaso.engine import extractors
 from plaso.engine import plaso_queue
+from plaso.engine import worker
 from plaso.engine import zeromq_queue
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -23,23 +25,29 @@ from plaso.lib import loggers
 from plaso.multi_processing import engine
 from plaso.multi_processing import logger
 from plaso.multi_processing import multi_process_queue
+from plaso.multi_processing import task_cost
 from plaso.multi_processing import task_manager
+from plaso.multi_processing import worker_pool
 from plaso.multi_processing import worker_process
 
 
 class _EventSourceHeap(object):
   """Class that defines an event source heap."""
 
-  def __init__(self, maximum_number_of_items=50000):
+  def __init__(self, maximum_number_of_items=50000, task_cost_estimator=None):
     """Initializes an event source heap.
 
     Args:
       maximum_number_of_items (Optional[int]): maximum number of items
           in the heap.
+      task_cost_estimator (Optional[TaskCostEstimator]): task cost estimator,
+          where None represents event sources are scheduled in the order
+          they were pushed.
     """
     super(_EventSourceHeap, self).__init__()
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
+    self._task_cost_estimator = task_cost_estimator
 
   def IsFull(self):
     """Determines if the heap is full.
@@ -56,7 +64,7 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
@@ -69,13 +77,24 @@ class _EventSourceHeap(object):
     Args:
       event_source (EventSource): event source.
     """
-    if event_source.file_entry_type == (
-        dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
+    estimated_cost = None
+
+    # Directories and record ranges are scheduled first since they are
+    # used to distribute the work over the workers.
+    if (event_source.file_entry_type == (
+        dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY) or
+        event_source.data_type == (
+            event_sources.RecordRangeEventSource.DATA_TYPE)):
       weight = 1
     else:
       weight = 100
+      if self._task_cost_estimator:
+        estimated_cost = self._task_cost_estimator.EstimateCost(event_source)
 
-    heap_values = (weight, time.time(), event_source)
+    # The most expensive event sources are scheduled first (longest processing
+    # time first) so that they do not end up as stragglers at the end of
+    # the extraction.
+    heap_values = (weight, -(estimated_cost or 0.0), time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -131,7 +150,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_produced_sources = 0
     self._number_of_produced_warnings = 0
     self._number_of_worker_processes = 0
+    self._number_of_worker_processes_to_stop = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._preinitialized_extraction_worker = None
     self._processing_configuration = None
     self._resolver_context = context.Context()
     self._session_identifier = None
@@ -140,8 +161,56 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._storage_merge_reader_on_hold = None
     self._task_queue = None
     self._task_queue_port = None
+    self._task_cost_estimator = task_cost.TaskCostEstimator()
     self._task_manager = task_manager.TaskManager()
     self._use_zeromq = use_zeromq
+    self._worker_pool_controller = None
+
+  def _CanForkWorkerProcesses(self):
+    """Determines if the worker processes are forked.
+
+    Returns:
+      bool: True if the worker processes are forked and inherit the memory
+          of the foreman, False otherwise.
+    """
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if get_start_method:
+      return get_start_method() == 'fork'
+
+    return sys.platform != 'win32'
+
+  def _CheckStoppedWorkerProcess(self, pid):
+    """Checks if a worker process was stopped by scaling down the worker pool.
+
+    A worker process that is asked to stop, exits after it dequeued an abort
+    message instead of a task. Such a process is no longer monitored and not
+    replaced.
+
+    Args:
+      pid (int): process identifier (PID) of a registered worker process.
+
+    Returns:
+      bool: True if the worker process was stopped by scaling down the worker
+          pool, False otherwise.
+    """
+    if not self._number_of_worker_processes_to_stop:
+      return False
+
+    process = self._processes_per_pid.get(pid, None)
+    if not process or process.is_alive() or process.exitcode != 0:
+      return False
+
+    self._number_of_worker_processes_to_stop -= 1
+
+    process_status = {
+        'processing_status': definitions.PROCESSING_STATUS_COMPLETED}
+    self._UpdateProcessingStatus(pid, process_status, 0)
+    self._StopMonitoringProcess(process)
+
+    logger.info('Worker process: {0:s} (PID: {1:d}) stopped.'.format(
+        process.name, pid))
+
+    return True
 
   def _FillEventSourceHeap(
       self, storage_writer, event_source_heap, start_with_first=False):
@@ -409,7 +478,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # TODO: protect task scheduler loop by catch all and
     # handle abort path.
 
-    event_source_heap = _EventSourceHeap()
+    event_source_heap = _EventSourceHeap(
+        task_cost_estimator=self._task_cost_estimator)
 
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
@@ -427,8 +497,19 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
         if not task and event_source:
           task = self._task_manager.CreateTask(self._session_identifier)
+          task.estimated_cost = self._task_cost_estimator.EstimateCost(
+              event_source)
           task.file_entry_type = event_source.file_entry_type
+          task.file_size = event_source.file_size
           task.path_spec = event_source.path_spec
+
+          if event_source.data_type == (
+              event_sources.RecordRangeEventSource.DATA_TYPE):
+            task.data_stream_name = event_source.data_stream_name
+            task.event_attributes = event_source.event_attributes
+            task.parser_name = event_source.parser_name
+            task.record_range = event_source.record_range
+
           event_source = None
 
           self._number_of_consumed_sources += 1
@@ -506,7 +587,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         task_queue, storage_writer, self._artifacts_filter_helper,
         self.knowledge_base, self._session_identifier,
         self._processing_configuration,
-        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
+        enable_sigsegv_handler=self._enable_sigsegv_handler,
+        extraction_worker=self._preinitialized_extraction_worker,
+        name=process_name)
 
     # Remove all possible log handlers to prevent a child process from logging
     # to the main process log file and garbling the log. The log handlers are
@@ -546,7 +629,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       # Make a local copy of the PIDs in case the dict is changed by
       # the main thread.
       for pid in list(self._process_information_per_pid.keys()):
-        self._CheckStatusWorkerProcess(pid)
+        if not self._CheckStoppedWorkerProcess(pid):
+          self._CheckStatusWorkerProcess(pid)
 
       self._UpdateForemanProcessStatus()
 
@@ -556,6 +640,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       self._processing_status.UpdateTasksStatus(tasks_status)
 
+      if self._worker_pool_controller:
+        self._UpdateWorkerPool(tasks_status)
+
+      if self._metrics:
+        self._metrics.UpdateProcessingStatus(self._processing_status)
+
       if self._status_update_callback:
         self._status_update_callback(self._processing_status)
 
@@ -692,6 +782,20 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         number_of_consumed_reports, number_of_produced_reports,
         number_of_consumed_warnings, number_of_produced_warnings)
 
+    if self._metrics:
+      self._metrics.UpdateProcessStatus(process.name, process_status)
+
+    parser_names_per_file_type = process_status.get(
+        'parser_names_per_file_type', None)
+    if parser_names_per_file_type:
+      self._task_cost_estimator.UpdateParserNamesPerFileType(
+          parser_names_per_file_type)
+
+    parser_throughputs = process_status.get('parser_throughputs', None)
+    if parser_throughputs:
+      self._task_cost_estimator.UpdateParserThroughputs(
+          process.name, parser_throughputs)
+
     task_identifier = process_status.get('task_identifier', '')
     if not task_identifier:
       return
@@ -704,11 +808,118 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           'Worker {0:s} is processing unknown task: {1:s}.'.format(
               process.name, task_identifier))
 
+  def _UpdateWorkerPool(self, tasks_status):
+    """Updates the number of worker processes from the observed load.
+
+    Args:
+      tasks_status (TasksStatus): status information about tasks.
+    """
+    cpu_utilizations = []
+    used_memory = []
+    for process_information in self._process_information_per_pid.values():
+      cpu_utilization = process_information.GetCPUUtilization()
+      if cpu_utilization is not None:
+        cpu_utilizations.append(cpu_utilization)
+
+      used_memory.append(process_information.GetUsedMemory() or 0)
+
+    number_of_idle_worker_processes = 0
+    for worker_status in self._processing_status.workers_status:
+      if (worker_status.pid in self._process_information_per_pid and
+          worker_status.status == definitions.PROCESSING_STATUS_IDLE):
+        number_of_idle_worker_processes += 1
+
+    available_memory, io_wait_percentage = (
+        self._worker_pool_controller.GetSystemResourceUsage())
+
+    # Worker processes that were asked to stop but have not yet exited are
+    # not considered part of the worker pool.
+    number_of_worker_processes = (
+        len(self._process_information_per_pid) -
+        self._number_of_worker_processes_to_stop)
+
+    # The event sources that have not been scheduled as a task are both
+    # the event sources in the event source heap and the written event
+    # sources that have not yet been read into the event source heap.
+    number_of_pending_event_sources = max(
+        0, self._number_of_produced_sources -
+        self._number_of_consumed_sources)
+
+    new_number_of_worker_processes, reason = (
+        self._worker_pool_controller.DetermineNumberOfWorkers(
+            number_of_worker_processes, number_of_pending_event_sources,
+            tasks_status.number_of_tasks_pending_merge,
+            number_of_idle_worker_processes, cpu_utilizations, used_memory,
+            available_memory, io_wait_percentage, time.time()))
+
+    scaling_reason = None
+    if new_number_of_worker_processes > number_of_worker_processes:
+      logger.info((
+          'Scaling up worker processes from {0:d} to {1:d}, reason: '
+          '{2:s}.').format(
+              number_of_worker_processes, new_number_of_worker_processes,
+              reason))
+
+      for _ in range(
+          new_number_of_worker_processes - number_of_worker_processes):
+        # First argument to _StartWorkerProcess is not used.
+        extraction_process = self._StartWorkerProcess(
+            '', self._storage_writer)
+        if not extraction_process:
+          logger.error('Unable to create additional worker process.')
+          break
+
+      scaling_reason = reason
+
+    elif new_number_of_worker_processes < number_of_worker_processes:
+      # Worker processes are asked to stop by an abort message on the task
+      # queue, which is dequeued by the next worker process that requests
+      # a task, so that no task is interrupted and has to be retried.
+      number_of_worker_processes_to_stop = 0
+      for _ in range(
+          number_of_worker_processes - new_number_of_worker_processes):
+        try:
+          self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+        except errors.QueueFull:
+          break
+
+        number_of_worker_processes_to_stop += 1
+
+      self._number_of_worker_processes_to_stop += (
+          number_of_worker_processes_to_stop)
+
+      if not number_of_worker_processes_to_stop:
+        logger.debug((
+            'Unable to scale down worker processes, reason: {0:s}, task '
+            'queue full.').format(reason))
+
+      else:
+        logger.info((
+            'Scaling down worker processes from {0:d} to {1:d}, reason: '
+            '{2:s}.').format(
+                number_of_worker_processes,
+                number_of_worker_processes - (
+                    number_of_worker_processes_to_stop), reason))
+
+        scaling_reason = reason
+
+    # Worker processes that were asked to stop are not reported as part of
+    # the worker pool, including those asked to stop in this update.
+    number_of_worker_processes = (
+        len(self._process_information_per_pid) -
+        self._number_of_worker_processes_to_stop)
+
+    self._processing_status.UpdateWorkerPoolStatus(
+        self._worker_pool_controller.minimum_number_of_workers,
+        self._worker_pool_controller.maximum_number_of_workers,
+        number_of_worker_processes, scaling_reason=scaling_reason)
+
   def ProcessSources(
       self, session_identifier, source_path_specs, storage_writer,
       processing_configuration, enable_sigsegv_handler=False,
-      filter_find_specs=None, number_of_worker_processes=0,
-      status_update_callback=None, worker_memory_limit=None):
+      filter_find_specs=None, maximum_number_of_worker_processes=0,
+      number_of_worker_processes=0, status_update_callback=None,
+      worker_memory_limit=None):
     """Processes the sources and extract events.
 
     Args:
@@ -722,7 +933,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           should be enabled.
       filter_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
           used in path specification extraction.
-      number_of_worker_processes (Optional[int]): number of worker processes.
+      maximum_number_of_worker_processes (Optional[int]): maximum number of
+          worker processes, where a value larger than the number of worker
+          processes enables adapting the number of worker processes to
+          the observed load during processing and 0 represents a fixed
+          number of worker processes.
+      number_of_worker_processes (Optional[int]): number of worker processes,
+          which is the initial number of worker processes if the number of
+          worker processes is adapted during processing.
       status_update_callback (Optional[function]): callback function for status
           updates.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
@@ -757,8 +975,31 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       number_of_worker_processes = cpu_count
 
+    if maximum_number_of_worker_processes:
+      number_of_worker_processes = min(
+          number_of_worker_processes, maximum_number_of_worker_processes)
+
+    if maximum_number_of_worker_processes > number_of_worker_processes:
+      minimum_number_of_worker_processes = min(
+          number_of_worker_processes, self._WORKER_PROCESSES_MINIMUM)
+
+      self._worker_pool_controller = worker_pool.WorkerPoolController(
+          minimum_number_of_worker_processes,
+          maximum_number_of_worker_processes)
+
+      self._processing_status.UpdateWorkerPoolStatus(
+          minimum_number_of_worker_processes,
+          maximum_number_of_worker_processes, number_of_worker_processes)
+
+      logger.info((
+          'Adapting number of worker processes between {0:d} and {1:d}, '
+          'starting with {2:d}.').format(
+              minimum_number_of_worker_processes,
+              maximum_number_of_worker_processes, number_of_worker_processes))
+
     self._enable_sigsegv_handler = enable_sigsegv_handler
     self._number_of_worker_processes = number_of_worker_processes
+    self._number_of_worker_processes_to_stop = 0
 
     if worker_memory_limit is None:
       self._worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
@@ -774,6 +1015,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._session_identifier = session_identifier
     self._status_update_callback = status_update_callback
     self._storage_writer = storage_writer
+    self._task_cost_estimator = task_cost.TaskCostEstimator()
 
     # Set up the task queue.
     if not self._use_zeromq:
@@ -793,6 +1035,22 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._task_queue.Open()
       self._task_queue_port = self._task_queue.port
 
+    # A forked worker process inherits a copy of the extraction worker, hence
+    # the parsers, signature scanner and Yara rules are initialized once
+    # instead of on every start of a worker process.
+    if self._CanForkWorkerProcesses():
+      start_time = time.time()
+
+      self._preinitialized_extraction_worker = worker.EventExtractionWorker(
+          parser_filter_expression=(
+              processing_configuration.parser_filter_expression),
+          temporary_directory=processing_configuration.temporary_directory)
+      self._preinitialized_extraction_worker.SetExtractionConfiguration(
+          processing_configuration.extraction)
+
+      logger.debug('Initialized extraction worker in {0:.3f} seconds.'.format(
+          time.time() - start_time))
+
     self._StartProfiling(self._processing_configuration.profiling)
     self._task_manager.StartProfiling(
         self._processing_configuration.profiling, self._name)
@@ -813,6 +1071,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         logger.error('Unable to create worker process: {0:d}'.format(
             worker_number))
 
+    if processing_configuration.metrics_port is not None:
+      self._StartMetricsServer(processing_configuration.metrics_port)
+
     self._StartStatusUpdateThread()
 
     try:
@@ -838,6 +1099,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
+      self._StopMetricsServer()
 
       if self._serializers_profiler:
         storage_writer.SetSerializersProfiler(None)
@@ -888,8 +1150,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._processing_configuration = None
 
     self._filter_find_specs = None
+    self._preinitialized_extraction_worker = None
     self._session_identifier = None
     self._status_update_callback = None
     self._storage_writer = None
+    self._worker_pool_controller = None
 
     return self._processing_status
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Adaptive sizing of the worker process pool."""
+
+from __future__ import unicode_literals
+
+import psutil
+
+
+class WorkerPoolController(object):
+  """Determines the number of worker processes from the observed load.
+
+  The controller scales the number of worker processes:
+  * down when the available system memory does not provide headroom for
+    the current worker processes;
+  * down when the foreman cannot keep up with merging the task results;
+  * down when the worker processes are mostly waiting on I/O;
+  * down when worker processes are idle and there are no pending event
+    sources;
+  * up when there are more pending event sources than worker processes,
+    the worker processes are CPU bound and there is sufficient memory
+    headroom for additional worker processes.
+
+  Consecutive scaling decisions are at least a cool down period apart so
+  that the effect of a previous decision can be observed first.
+  """
+
+  # Minimum number of seconds between scaling decisions.
+  _COOL_DOWN_PERIOD = 30.0
+
+  # Average worker CPU utilization, as a percentage of a single CPU, above
+  # which the worker processes are considered CPU bound.
+  _CPU_BOUND_UTILIZATION = 75.0
+
+  # Average worker CPU utilization, as a percentage of a single CPU, below
+  # which the worker processes are considered to be waiting.
+  _CPU_WAITING_UTILIZATION = 25.0
+
+  # Percentage of system CPU time spent waiting on I/O above which the
+  # system is considered I/O bound.
+  _IO_BOUND_PERCENTAGE = 30.0
+
+  # Number of tasks pending merge per worker process above which the
+  # foreman is considered to be the bottleneck.
+  _MAXIMUM_MERGE_BACKLOG_PER_WORKER = 4
+
+  # Minimum amount of memory, in bytes, that is assumed to be used by
+  # a worker process.
+  _MINIMUM_WORKER_MEMORY = 256 * 1024 * 1024
+
+  def __init__(self, minimum_number_of_workers, maximum_number_of_workers):
+    """Initializes a worker pool controller.
+
+    Args:
+      minimum_number_of_workers (int): minimum number of worker processes.
+      maximum_number_of_workers (int): maximum number of worker processes.
+
+    Raises:
+      ValueError: if the minimum or maximum number of worker processes is
+          invalid.
+    """
+    if minimum_number_of_workers < 1:
+      raise ValueError('Invalid minimum number of worker processes.')
+
+    if maximum_number_of_workers < minimum_number_of_workers:
+      raise ValueError('Invalid maximum number of worker processes.')
+
+    super(WorkerPoolController, self).__init__()
+    self._last_scaling_time = None
+    self.maximum_number_of_workers = maximum_number_of_workers
+    self.minimum_number_of_workers = minimum_number_of_workers
+
+  def _GetScaleUpStep(self, number_of_workers):
+    """Retrieves the number of worker processes to add when scaling up.
+
+    Args:
+      number_of_workers (int): current number of worker processes.
+
+    Returns:
+      int: number of worker processes to add.
+    """
+    return max(1, number_of_workers // 4)
+
+  def DetermineNumberOfWorkers(
+      self, number_of_workers, number_of_pending_event_sources,
+      number_of_tasks_pending_merge, number_of_idle_workers,
+      cpu_utilizations, used_memory, available_memory, io_wait_percentage,
+      timestamp):
+    """Determines the number of worker processes.
+
+    Args:
+      number_of_workers (int): current number of worker processes.
+      number_of_pending_event_sources (int): number of event sources that
+          have not yet been scheduled as a task.
+      number_of_tasks_pending_merge (int): number of tasks that have been
+          processed and are waiting to be merged by the foreman.
+      number_of_idle_workers (int): number of worker processes that are not
+          processing a task.
+      cpu_utilizations (list[float]): CPU utilization per worker process,
+          as a percentage of a single CPU.
+      used_memory (list[int]): amount of memory in bytes used per worker
+          process.
+      available_memory (int): amount of system memory in bytes that is
+          available without swapping or None if not available.
+      io_wait_percentage (float): percentage of system CPU time spent
+          waiting on I/O or None if not available.
+      timestamp (float): current time, which contains the number of seconds
+          since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      tuple[int, str]: number of worker processes and the reason of the
+          scaling decision, where the reason is None if the number of worker
+          processes should not change.
+    """
+    if (self._last_scaling_time is not None and
+        timestamp < self._last_scaling_time + self._COOL_DOWN_PERIOD):
+      return number_of_workers, None
+
+    if number_of_workers < self.minimum_number_of_workers:
+      return self.minimum_number_of_workers, 'below minimum'
+
+    if number_of_workers > self.maximum_number_of_workers:
+      return self.maximum_number_of_workers, 'above maximum'
+
+    if used_memory:
+      worker_memory = max(self._MINIMUM_WORKER_MEMORY, max(used_memory))
+    else:
+      worker_memory = self._MINIMUM_WORKER_MEMORY
+
+    if cpu_utilizations:
+      cpu_utilization = sum(cpu_utilizations) / len(cpu_utilizations)
+    else:
+      cpu_utilization = 0.0
+
+    can_scale_down = number_of_workers > self.minimum_number_of_workers
+    can_scale_up = number_of_workers < self.maximum_number_of_workers
+
+    reason = None
+    number_of_workers_delta = 0
+
+    if can_scale_down and available_memory is not None and (
+        available_memory < worker_memory):
+      reason = 'memory pressure'
+      number_of_workers_delta = -1
+
+    elif can_scale_down and number_of_tasks_pending_merge > (
+        number_of_workers * self._MAXIMUM_MERGE_BACKLOG_PER_WORKER):
+      reason = 'merge backlog'
+      number_of_workers_delta = -1
+
+    elif can_scale_down and io_wait_percentage is not None and (
+        io_wait_percentage >= self._IO_BOUND_PERCENTAGE and
+        cpu_utilization < self._CPU_WAITING_UTILIZATION):
+      reason = 'I/O bound'
+      number_of_workers_delta = -1
+
+    elif can_scale_down and number_of_pending_event_sources == 0 and (
+        number_of_idle_workers > 1):
+      reason = 'idle workers'
+      number_of_workers_delta = -1
+
+    elif can_scale_up and (
+        number_of_pending_event_sources > number_of_workers and
+        cpu_utilization >= self._CPU_BOUND_UTILIZATION):
+      number_of_workers_delta = min(
+          self._GetScaleUpStep(number_of_workers),
+          self.maximum_number_of_workers - number_of_workers)
+
+      if available_memory is not None:
+        number_of_workers_delta = min(
+            number_of_workers_delta,
+            (available_memory // worker_memory) - 1)
+
+      if number_of_workers_delta > 0:
+        reason = 'CPU bound with pending event sources'
+
+    if not reason:
+      return number_of_workers, None
+
+    self._last_scaling_time = timestamp
+
+    return number_of_workers + number_of_workers_delta, reason
+
+  def GetSystemResourceUsage(self):
+    """Retrieves the system resource usage.
+
+    Returns:
+      tuple[int, float]: amount of system memory in bytes that is available
+          without swapping and the percentage of system CPU time spent waiting
+          on I/O since the previous call, where a value is None if not
+          available on the platform.
+    """
+    try:
+      available_memory = psutil.virtual_memory().available
+    except (AttributeError, OSError):
+      available_memory = None
+
+    try:
+      cpu_times_percent = psutil.cpu_times_percent(interval=None)
+    except (AttributeError, OSError):
+      cpu_times_percent = None
+
+    # I/O wait is only available on Linux.
+    io_wait_percentage = getattr(cpu_times_percent, 'iowait', None)
+
+    return available_memory, io_wait_percentage
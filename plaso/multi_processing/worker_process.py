@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import time
+
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver
@@ -21,12 +23,17 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
   def __init__(
       self, task_queue, storage_writer, artifacts_filter_helper,
-      knowledge_base, session_identifier, processing_configuration, **kwargs):
+      knowledge_base, session_identifier, processing_configuration,
+      extraction_worker=None, **kwargs):
     """Initializes a worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
     multiprocessing.Process.
 
+    An extraction worker that was initialized by the parent process can only
+    be used if the process is forked, since the parser and analyzer objects
+    cannot be pickled.
+
     Args:
       task_queue (PlasoQueue): task queue.
       storage_writer (StorageWriter): storage writer for a session storage.
@@ -37,6 +44,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       session_identifier (str): identifier of the session.
       processing_configuration (ProcessingConfiguration): processing
           configuration.
+      extraction_worker (Optional[EventExtractionWorker]): extraction worker
+          initialized with the processing configuration by the parent process,
+          where None represents the extraction worker is initialized by
+          the worker process.
       kwargs: keyword arguments to pass to multiprocessing.Process.
     """
     super(WorkerProcess, self).__init__(processing_configuration, **kwargs)
@@ -49,7 +60,9 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._number_of_consumed_events = 0
     self._number_of_consumed_sources = 0
     self._parser_mediator = None
+    self._preinitialized_extraction_worker = extraction_worker
     self._session_identifier = session_identifier
+    self._startup_time = None
     self._status = definitions.PROCESSING_STATUS_INITIALIZED
     self._storage_writer = storage_writer
     self._task = None
@@ -68,18 +81,34 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
           self._parser_mediator.number_of_produced_event_sources)
       number_of_produced_warnings = (
           self._parser_mediator.number_of_produced_warnings)
+      parser_names_per_file_type = dict(
+          self._parser_mediator.parser_names_per_file_type)
+      parser_timings = dict(self._parser_mediator.parser_timings)
+
+      # XML RPC does not support integer values > 2 GiB so the sizes are
+      # formatted as a string.
+      parser_throughputs = {
+          parser_name: ['{0:d}'.format(data_size), parser_time]
+          for parser_name, (data_size, parser_time) in iter(
+              self._parser_mediator.parser_throughputs.items())}
     else:
       number_of_produced_events = None
       number_of_produced_sources = None
       number_of_produced_warnings = None
+      parser_names_per_file_type = None
+      parser_throughputs = None
+      parser_timings = None
 
     if self._extraction_worker and self._parser_mediator:
       last_activity_timestamp = max(
           self._extraction_worker.last_activity_timestamp,
           self._parser_mediator.last_activity_timestamp)
+      number_of_processed_bytes = (
+          self._extraction_worker.number_of_processed_bytes)
       processing_status = self._extraction_worker.processing_status
     else:
       last_activity_timestamp = 0.0
+      number_of_processed_bytes = 0
       processing_status = self._status
 
     task_identifier = getattr(self._task, 'identifier', '')
@@ -94,6 +123,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     # XML RPC does not support integer values > 2 GiB so we format them
     # as a string.
+    number_of_processed_bytes = '{0:d}'.format(number_of_processed_bytes)
     used_memory = '{0:d}'.format(used_memory)
 
     status = {
@@ -104,11 +134,16 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
         'number_of_consumed_events': self._number_of_consumed_events,
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_consumed_warnings': None,
+        'number_of_processed_bytes': number_of_processed_bytes,
         'number_of_produced_event_tags': None,
         'number_of_produced_events': number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
         'number_of_produced_warnings': number_of_produced_warnings,
+        'parser_names_per_file_type': parser_names_per_file_type,
+        'parser_throughputs': parser_throughputs,
+        'parser_timings': parser_timings,
         'processing_status': processing_status,
+        'startup_time': self._startup_time,
         'task_identifier': task_identifier,
         'used_memory': used_memory}
 
@@ -116,6 +151,12 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
   def _Main(self):
     """The main loop."""
+    start_time = None
+    if self._process_information:
+      start_time = self._process_information.GetCreationTime()
+    if start_time is None:
+      start_time = time.time()
+
     # We need a resolver context per process to prevent multi processing
     # issues with file objects stored in images.
     resolver_context = context.Context()
@@ -139,15 +180,25 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._parser_mediator.SetInputSourceConfiguration(
         self._processing_configuration.input_source)
 
-    # We need to initialize the parser and hasher objects after the process
-    # has forked otherwise on Windows the "fork" will fail with
-    # a PickleError for Python modules that cannot be pickled.
-    self._extraction_worker = worker.EventExtractionWorker(
-        parser_filter_expression=(
-            self._processing_configuration.parser_filter_expression))
+    # The records of large data streams are split in ranges, that are
+    # scheduled as separate tasks, to distribute them over the workers.
+    self._parser_mediator.SetSplitRecordRanges(True)
 
-    self._extraction_worker.SetExtractionConfiguration(
-        self._processing_configuration.extraction)
+    if self._preinitialized_extraction_worker:
+      self._extraction_worker = self._preinitialized_extraction_worker
+
+    else:
+      # We need to initialize the parser and hasher objects after the process
+      # has forked otherwise on Windows the "fork" will fail with
+      # a PickleError for Python modules that cannot be pickled.
+      self._extraction_worker = worker.EventExtractionWorker(
+          parser_filter_expression=(
+              self._processing_configuration.parser_filter_expression),
+          temporary_directory=(
+              self._processing_configuration.temporary_directory))
+
+      self._extraction_worker.SetExtractionConfiguration(
+          self._processing_configuration.extraction)
 
     self._parser_mediator.StartProfiling(
         self._processing_configuration.profiling, self._name,
@@ -163,8 +214,11 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     if self._storage_profiler:
       self._storage_writer.SetStorageProfiler(self._storage_profiler)
 
-    logger.debug('Worker: {0!s} (PID: {1:d}) started.'.format(
-        self._name, self._pid))
+    self._startup_time = time.time() - start_time
+
+    logger.debug((
+        'Worker: {0!s} (PID: {1:d}) started in {2:.3f} seconds.').format(
+            self._name, self._pid, self._startup_time))
 
     self._status = definitions.PROCESSING_STATUS_RUNNING
 
@@ -260,6 +314,43 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
             '{0:s}.').format(self._current_display_name))
         logger.exception(exception)
 
+  def _ProcessRecordRange(self, extraction_worker, parser_mediator, task):
+    """Processes a record range.
+
+    Args:
+      extraction_worker (worker.ExtractionWorker): extraction worker.
+      parser_mediator (ParserMediator): parser mediator.
+      task (Task): task that defines the record range.
+    """
+    self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
+        task.path_spec)
+
+    try:
+      extraction_worker.ProcessRecordRange(
+          parser_mediator, task.path_spec, task.data_stream_name,
+          task.parser_name, task.record_range,
+          event_attributes=task.event_attributes)
+
+    except dfvfs_errors.CacheFullError:
+      # TODO: signal engine of failure.
+      self._abort = True
+      logger.error((
+          'ABORT: detected cache full error while processing record range '
+          'of: {0:s}').format(self._current_display_name))
+
+    except Exception as exception:  # pylint: disable=broad-except
+      parser_mediator.ProduceExtractionWarning((
+          'unable to process record range: {0:d} - {1:d} with error: '
+          '{2!s}').format(
+              task.record_range[0], task.record_range[1], exception),
+          path_spec=task.path_spec)
+
+      if self._processing_configuration.debug_output:
+        logger.warning((
+            'Unhandled exception while processing record range of: '
+            '{0:s}.').format(self._current_display_name))
+        logger.exception(exception)
+
   def _ProcessTask(self, task):
     """Processes a task.
 
@@ -286,8 +377,12 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     try:
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
+      if task.record_range:
+        self._ProcessRecordRange(
+            self._extraction_worker, self._parser_mediator, task)
+      else:
+        self._ProcessPathSpec(
+            self._extraction_worker, self._parser_mediator, task.path_spec)
       self._number_of_consumed_sources += 1
 
       if self._guppy_memory_profiler:
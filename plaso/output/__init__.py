@@ -1,20 +1,6 @@
 # -*- coding: utf-8 -*-
-"""This file imports Python modules that register output modules."""
+"""The output modules.
 
-from plaso.output import dynamic
-from plaso.output import elastic
-from plaso.output import json_line
-from plaso.output import json_out
-from plaso.output import kml
-from plaso.output import l2t_csv
-from plaso.output import mysql_4n6time
-from plaso.output import null
-from plaso.output import rawpy
-from plaso.output import sqlite_4n6time
-from plaso.output import timesketch_out
-from plaso.output import tln
-from plaso.output import xlsx
-
-# These Python modules do not register output modules, but are super classes
-# used by output modules in other python modules.
-# from plaso.output import shared_4n6time
+The Python modules that register output modules are imported on demand by
+the output manager, as defined by the output modules manifest.
+"""
@@ -3,9 +3,12 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
 from plaso.lib import py2to3
 
 from plaso.output import interface
+from plaso.output import manifest
 
 
 class OutputManager(object):
@@ -14,6 +17,23 @@ class OutputManager(object):
   _disabled_output_classes = {}
   _output_classes = {}
 
+  @classmethod
+  def _ImportOutputModules(cls, names=None):
+    """Imports the Python modules that register output modules.
+
+    Args:
+      names (Optional[list[str]]): names of the output modules to import,
+          where None represents all output modules in the manifest. Names
+          that are not in the manifest are ignored.
+    """
+    if names is None:
+      names = manifest.OUTPUT_MODULES.keys()
+
+    for name in names:
+      module_name = manifest.OUTPUT_MODULES.get(name, None)
+      if module_name:
+        importlib.import_module(module_name)
+
   @classmethod
   def DeregisterOutput(cls, output_class):
     """Deregisters an output class.
@@ -47,6 +67,8 @@ class OutputManager(object):
     Yields:
       tuple[str, type]: output module name and class.
     """
+    cls._ImportOutputModules()
+
     for _, output_class in iter(cls._disabled_output_classes.items()):
       yield output_class.NAME, output_class
 
@@ -68,6 +90,8 @@ class OutputManager(object):
       raise ValueError('Name attribute is not a string.')
 
     name = name.lower()
+    cls._ImportOutputModules(names=[name])
+
     if name not in cls._output_classes:
       raise KeyError(
           'Name: [{0:s}] not registered as an output module.'.format(name))
@@ -81,6 +105,8 @@ class OutputManager(object):
     Yields:
       tuple[str, type]: output class name and type object.
     """
+    cls._ImportOutputModules()
+
     for _, output_class in iter(cls._output_classes.items()):
       yield output_class.NAME, output_class
 
@@ -97,7 +123,10 @@ class OutputManager(object):
     if not isinstance(name, py2to3.STRING_TYPES):
       return False
 
-    return name.lower() in cls._output_classes
+    name = name.lower()
+    cls._ImportOutputModules(names=[name])
+
+    return name in cls._output_classes
 
   @classmethod
   def IsLinearOutputModule(cls, name):
@@ -110,6 +139,7 @@ class OutputManager(object):
       True: if the output module is linear.
     """
     name = name.lower()
+    cls._ImportOutputModules(names=[name])
 
     output_class = cls._output_classes.get(name, None)
     if not output_class:
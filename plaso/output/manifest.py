@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""The output modules manifest.
+
+The manifest maps the name of an output module to the Python module that
+registers it. It is used by the output manager to only import the Python
+modules of the output modules that are used.
+"""
+
+from __future__ import unicode_literals
+
+
+OUTPUT_MODULES = {
+    '4n6time_mysql': 'plaso.output.mysql_4n6time',
+    '4n6time_sqlite': 'plaso.output.sqlite_4n6time',
+    'dynamic': 'plaso.output.dynamic',
+    'elastic': 'plaso.output.elastic',
+    'json': 'plaso.output.json_out',
+    'json_line': 'plaso.output.json_line',
+    'kml': 'plaso.output.kml',
+    'l2tcsv': 'plaso.output.l2t_csv',
+    'l2ttln': 'plaso.output.tln',
+    'null': 'plaso.output.null',
+    'rawpy': 'plaso.output.rawpy',
+    'timesketch': 'plaso.output.timesketch_out',
+    'tln': 'plaso.output.tln',
+    'xlsx': 'plaso.output.xlsx'}
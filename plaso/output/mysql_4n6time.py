@@ -19,10 +19,6 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
   NAME = '4n6time_mysql'
   DESCRIPTION = 'MySQL database output for the 4n6time tool.'
 
-  _META_FIELDS = frozenset([
-      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
-      'record_number'])
-
   _CREATE_TABLE_QUERY = (
       'CREATE TABLE IF NOT EXISTS log2timeline ('
       'rowid INT NOT NULL AUTO_INCREMENT, timezone VARCHAR(256), '
@@ -45,11 +41,12 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       'tag, offset, vss_store_number, URL, record_number, '
       'event_identifier, event_type, source_name, user_sid, computer_name, '
       'evidence) '
-      'VALUES (:timezone, :MACB, :source, :sourcetype, :type, :user, :host, '
-      ':description, :filename, :inode, :notes, :format, :extra, :datetime, '
-      ':reportnotes, :inreport, :tag, :offset, :vss_store_number, :URL, '
-      ':record_number, :event_identifier, :event_type, :source_name, '
-      ':user_sid, :computer_name, :evidence)')
+      'VALUES (%(timezone)s, %(MACB)s, %(source)s, %(sourcetype)s, %(type)s, '
+      '%(user)s, %(host)s, %(description)s, %(filename)s, %(inode)s, '
+      '%(notes)s, %(format)s, %(extra)s, %(datetime)s, %(reportnotes)s, '
+      '%(inreport)s, %(tag)s, %(offset)s, %(vss_store_number)s, %(URL)s, '
+      '%(record_number)s, %(event_identifier)s, %(event_type)s, '
+      '%(source_name)s, %(user_sid)s, %(computer_name)s, %(evidence)s)')
 
   def __init__(self, output_mediator):
     """Initializes the output module object.
@@ -60,7 +57,6 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     """
     super(MySQL4n6TimeOutputModule, self).__init__(output_mediator)
     self._connection = None
-    self._count = None
     self._cursor = None
     self._dbname = 'log2timeline'
     self._host = 'localhost'
@@ -68,51 +64,41 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     self._port = None
     self._user = 'root'
 
-  def _GetTags(self):
-    """Retrieves tags from the database.
+  def _InsertRows(self, rows):
+    """Inserts rows into the database.
 
-    Returns:
-      list[str]: tags.
-    """
-    all_tags = []
-    self._cursor.execute('SELECT DISTINCT tag FROM log2timeline')
-
-    # This cleans up the messy SQL return.
-    tag_row = self._cursor.fetchone()
-    while tag_row:
-      tag_string = tag_row[0]
-      if tag_string:
-        tags = tag_string.split(',')
-        for tag in tags:
-          if tag not in all_tags:
-            all_tags.append(tag)
-      tag_row = self._cursor.fetchone()
-
-    # TODO: make this method an iterator.
-    return all_tags
-
-  def _GetUniqueValues(self, field_name):
-    """Retrieves the unique values of a specific field from the database.
+    MySQLdb inserts the rows with a single multi-row INSERT statement. If
+    that fails the rows are inserted one by one, so that only the rows that
+    cannot be inserted are skipped. MySQLdb can split the rows over multiple
+    statements, hence the rows inserted by the failed batch are rolled back
+    first.
 
     Args:
-      field_name (str): name of the field.
+      rows (list[dict[str, object]]): sanitized event values of the rows.
 
     Returns:
-      dict[str, int]: number of instances of the field value per field name.
+      list[dict[str, object]]: sanitized event values of the rows that were
+          inserted.
     """
-    self._cursor.execute(
-        'SELECT {0:s}, COUNT({0:s}) FROM log2timeline GROUP BY {0:s}'.format(
-            field_name))
-
-    result = {}
-    row = self._cursor.fetchone()
-    while row:
-      if row[0]:
-        result[row[0]] = row[1]
-
-      row = self._cursor.fetchone()
+    try:
+      self._cursor.executemany(self._INSERT_QUERY, rows)
+      inserted_rows = rows
+
+    except MySQLdb.Error:
+      self._connection.rollback()
+
+      inserted_rows = []
+      for row in rows:
+        try:
+          self._cursor.execute(self._INSERT_QUERY, row)
+          inserted_rows.append(row)
+        except MySQLdb.Error as exception:
+          logger.warning(
+              'Unable to insert into database with error: {0!s}.'.format(
+                  exception))
 
-    return result
+    self._connection.commit()
+    return inserted_rows
 
   def Close(self):
     """Disconnects from the database.
@@ -120,6 +106,8 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     This method will create the necessary indices and commit outstanding
     transactions before disconnecting.
     """
+    self._FlushRows()
+
     # Build up indices for the fields specified in the args.
     # It will commit the inserts automatically before creating index.
     if not self._append:
@@ -134,18 +122,7 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     if self._set_status:
       self._set_status('Creating metadata...')
 
-    for field in self._META_FIELDS:
-      values = self._GetUniqueValues(field)
-      self._cursor.execute('DELETE FROM l2t_{0:s}s'.format(field))
-      for name, frequency in iter(values.items()):
-        self._cursor.execute((
-            'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) '
-            'VALUES("{1:s}", {2:d}) ').format(field, name, frequency))
-
-    self._cursor.execute('DELETE FROM l2t_tags')
-    for tag in self._GetTags():
-      self._cursor.execute(
-          'INSERT INTO l2t_tags (tag) VALUES ("{0:s}")'.format(tag))
+    self._WriteMetadata(self._cursor, '%s')
 
     if self._set_status:
       self._set_status('Database created.')
@@ -174,7 +151,12 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       if self._append:
         self._connection = MySQLdb.connect(
             self._host, self._user, self._password, self._dbname)
-        self._cursor = self._connection.cursor()
+      else:
+        # The database is created if it does not exist.
+        self._connection = MySQLdb.connect(
+            self._host, self._user, self._password)
+
+      self._cursor = self._connection.cursor()
 
       self._connection.set_character_set('utf8')
       self._cursor.execute('SET NAMES utf8')
@@ -225,6 +207,10 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
           '(0, "", "", "", "", "")')
       if self._set_status:
         self._set_status('Created table: l2t_disk')
+
+      if self._append:
+        self._AddMetadataFromTables(self._cursor)
+
     except MySQLdb.Error as exception:
       raise IOError('Unable to insert into database with error: {0!s}'.format(
           exception))
@@ -271,21 +257,7 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       return
 
     row = self._GetSanitizedEventValues(event)
-    try:
-      self._cursor.execute(self._INSERT_QUERY, row)
-    except MySQLdb.Error as exception:
-      logger.warning(
-          'Unable to insert into database with error: {0!s}.'.format(
-              exception))
-
-    self._count += 1
-
-    # TODO: Experiment if committing the current transaction
-    # every 10000 inserts is the optimal approach.
-    if self._count % 10000 == 0:
-      self._connection.commit()
-      if self._set_status:
-        self._set_status('Inserting event: {0:d}'.format(self._count))
+    self._BufferRow(row)
 
 
 manager.OutputManager.RegisterOutput(
@@ -3,6 +3,9 @@
 
 from __future__ import unicode_literals
 
+import abc
+import collections
+
 from dfdatetime import posix_time as dfdatetime_posix_time
 
 from plaso.lib import definitions
@@ -20,6 +23,16 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
   _DEFAULT_FIELDS = [
       'datetime', 'host', 'source', 'sourcetype', 'user', 'type']
 
+  # Fields of which the frequency of the values is stored in the l2t_[field]s
+  # metadata tables.
+  _META_FIELDS = frozenset([
+      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
+      'record_number'])
+
+  # Maximum number of rows that are buffered before they are inserted into
+  # the database.
+  _MAXIMUM_NUMBER_OF_BUFFERED_ROWS = 10000
+
   def __init__(self, output_mediator):
     """Initializes the output module object.
 
@@ -32,9 +45,119 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
     """
     super(Shared4n6TimeOutputModule, self).__init__(output_mediator)
     self._append = False
+    self._count = 0
     self._evidence = '-'
     self._fields = self._DEFAULT_FIELDS
+    self._meta_field_values = {
+        field: collections.Counter() for field in self._META_FIELDS}
+    self._rows = []
     self._set_status = None
+    self._tags = collections.OrderedDict()
+
+  def _AddMetadata(self, rows):
+    """Adds the metadata of rows that were inserted into the database.
+
+    The frequencies of the values of the metadata fields and the tags are
+    maintained while the rows are written, so that the metadata tables do
+    not have to be filled by querying the whole log2timeline table.
+
+    Args:
+      rows (list[dict[str, object]]): sanitized event values of the rows.
+    """
+    for field, counter in self._meta_field_values.items():
+      for row in rows:
+        value = row.get(field, None)
+        if value is None:
+          continue
+
+        # The values are stored as text in the database.
+        value = '{0!s}'.format(value)
+        if value:
+          counter[value] += 1
+
+    for row in rows:
+      tag_string = row.get('tag', None)
+      if tag_string:
+        for tag in tag_string.split(','):
+          self._tags[tag] = True
+
+  def _AddMetadataFromTables(self, cursor):
+    """Adds the metadata stored in the metadata tables.
+
+    This is used to update the metadata of an existing database, to which
+    rows are appended.
+
+    Args:
+      cursor (object): database cursor.
+    """
+    for field, counter in self._meta_field_values.items():
+      cursor.execute('SELECT {0:s}s, frequency FROM l2t_{0:s}s'.format(field))
+      for value, frequency in cursor.fetchall():
+        if value:
+          counter[value] += frequency
+
+    cursor.execute('SELECT tag FROM l2t_tags')
+    for tag, in cursor.fetchall():
+      if tag:
+        self._tags[tag] = True
+
+  def _BufferRow(self, row):
+    """Buffers a row to be inserted into the database.
+
+    Args:
+      row (dict[str, object]): sanitized event values.
+    """
+    self._rows.append(row)
+    if len(self._rows) >= self._MAXIMUM_NUMBER_OF_BUFFERED_ROWS:
+      self._FlushRows()
+
+  def _FlushRows(self):
+    """Inserts the buffered rows into the database."""
+    if not self._rows:
+      return
+
+    rows = self._rows
+    self._rows = []
+
+    inserted_rows = self._InsertRows(rows)
+    self._AddMetadata(inserted_rows)
+
+    self._count += len(rows)
+    if self._set_status:
+      self._set_status('Inserting event: {0:d}'.format(self._count))
+
+  @abc.abstractmethod
+  def _InsertRows(self, rows):
+    """Inserts rows into the database.
+
+    Args:
+      rows (list[dict[str, object]]): sanitized event values of the rows.
+
+    Returns:
+      list[dict[str, object]]: sanitized event values of the rows that were
+          inserted.
+    """
+
+  def _WriteMetadata(self, cursor, parameter_marker):
+    """Writes the metadata tables.
+
+    Args:
+      cursor (object): database cursor.
+      parameter_marker (str): marker of a parameter in a query, such as "?".
+    """
+    for field, counter in self._meta_field_values.items():
+      cursor.execute('DELETE FROM l2t_{0:s}s'.format(field))
+      if counter:
+        query = 'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) VALUES ({1:s})'
+        cursor.executemany(
+            query.format(field, ', '.join([parameter_marker] * 2)),
+            list(counter.items()))
+
+    cursor.execute('DELETE FROM l2t_tags')
+    if self._tags:
+      cursor.executemany(
+          'INSERT INTO l2t_tags (tag) VALUES ({0:s})'.format(parameter_marker),
+          [(tag, ) for tag in self._tags.keys()])
 
   def _FormatDateTime(self, event):
     """Formats the date and time.
@@ -21,10 +21,6 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
   DESCRIPTION = (
       'Saves the data in a SQLite database, used by the tool 4n6time.')
 
-  _META_FIELDS = frozenset([
-      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
-      'record_number'])
-
   _CREATE_TABLE_QUERY = (
       'CREATE TABLE log2timeline (timezone TEXT, '
       'MACB TEXT, source TEXT, sourcetype TEXT, type TEXT, '
@@ -60,48 +56,22 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     """
     super(SQLite4n6TimeOutputModule, self).__init__(output_mediator)
     self._connection = None
-    self._count = 0
     self._cursor = None
     self._filename = None
 
-  def _GetDistinctValues(self, field_name):
-    """Query database for unique field types.
+  def _InsertRows(self, rows):
+    """Inserts rows into the database.
 
     Args:
-      field_name (str): name of the filed to retrieve.
+      rows (list[dict[str, object]]): sanitized event values of the rows.
 
     Returns:
-      dict[str, int]: counts of field types by name.
+      list[dict[str, object]]: sanitized event values of the rows that were
+          inserted.
     """
-    self._cursor.execute(
-        'SELECT {0:s}, COUNT({0:s}) FROM log2timeline GROUP BY {0:s}'.format(
-            field_name))
-
-    result = {}
-    row = self._cursor.fetchone()
-    while row:
-      if row[0]:
-        result[row[0]] = row[1]
-      row = self._cursor.fetchone()
-    return result
-
-  def _ListTags(self):
-    """Query database for unique tag types."""
-    all_tags = []
-    self._cursor.execute('SELECT DISTINCT tag FROM log2timeline')
-
-    # This cleans up the messy SQL return.
-    tag_row = self._cursor.fetchone()
-    while tag_row:
-      tag_string = tag_row[0]
-      if tag_string:
-        tags = tag_string.split(',')
-        for tag in tags:
-          if tag not in all_tags:
-            all_tags.append(tag)
-      tag_row = self._cursor.fetchone()
-    # TODO: make this method an iterator.
-    return all_tags
+    self._cursor.executemany(self._INSERT_QUERY, rows)
+    self._connection.commit()
+    return rows
 
   def Close(self):
     """Disconnects from the database.
@@ -109,6 +79,8 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     This method will create the necessary indices and commit outstanding
     transactions before disconnecting.
     """
+    self._FlushRows()
+
     # Build up indices for the fields specified in the args.
     # It will commit the inserts automatically before creating index.
     if not self._append:
@@ -123,16 +95,7 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     if self._set_status:
       self._set_status('Creating metadata...')
 
-    for field in self._META_FIELDS:
-      values = self._GetDistinctValues(field)
-      self._cursor.execute('DELETE FROM l2t_{0:s}s'.format(field))
-      for name, frequency in iter(values.items()):
-        self._cursor.execute((
-            'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) '
-            'VALUES("{1:s}", {2:d}) ').format(field, name, frequency))
-    self._cursor.execute('DELETE FROM l2t_tags')
-    for tag in self._ListTags():
-      self._cursor.execute('INSERT INTO l2t_tags (tag) VALUES (?)', [tag])
+    self._WriteMetadata(self._cursor, '?')
 
     if self._set_status:
       self._set_status('Database created.')
@@ -195,6 +158,9 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       if self._set_status:
         self._set_status('Created table: l2t_disk')
 
+    else:
+      self._AddMetadataFromTables(self._cursor)
+
     self._count = 0
 
   def SetFilename(self, filename):
@@ -214,14 +180,7 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     # sqlite seems to support milli seconds precision but that seems
     # not to be used by 4n6time
     row = self._GetSanitizedEventValues(event)
-
-    self._cursor.execute(self._INSERT_QUERY, row)
-    self._count += 1
-    # Commit the current transaction every 10000 inserts.
-    if self._count % 10000 == 0:
-      self._connection.commit()
-      if self._set_status:
-        self._set_status('Inserting event: {0:d}'.format(self._count))
+    self._BufferRow(row)
 
 
 manager.OutputManager.RegisterOutput(SQLite4n6TimeOutputModule)
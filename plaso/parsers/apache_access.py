@@ -54,6 +54,8 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'apache_access'
   DESCRIPTION = 'Apache access Parser'
 
+  _RECORD_RANGE_SIZE = 64 * 1024 * 1024
+
   _PYPARSING_COMPONENTS = {
       'ip': text_parser.PyparsingConstants.IP_ADDRESS.setResultsName(
           'ip_address'),
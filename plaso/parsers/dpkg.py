@@ -60,6 +60,8 @@ class DpkgParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'dpkg'
   DESCRIPTION = 'Parser for Debian dpkg.log files.'
 
+  _RECORD_RANGE_SIZE = 64 * 1024 * 1024
+
   _ENCODING = 'utf-8'
 
   _DPKG_STARTUP = 'startup'
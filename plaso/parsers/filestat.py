@@ -26,6 +26,9 @@ class FileStatEventData(events.EventData):
 
   DATA_TYPE = 'fs:stat'
 
+  __slots__ = (
+      'file_entry_type', 'file_size', 'file_system_type', 'is_allocated')
+
   def __init__(self):
     """Initializes event data."""
     super(FileStatEventData, self).__init__(data_type=self.DATA_TYPE)
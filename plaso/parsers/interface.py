@@ -251,6 +251,64 @@ class FileObjectParser(BaseParser):
   # file offset seek needs to be performed.
   _INITIAL_FILE_OFFSET = 0
 
+  # The number of records per record range, where None represents that
+  # the parser does not support parsing the records in multiple ranges.
+  # What represents a record, such as an entry index or an offset, is
+  # specific to the parser.
+  _RECORD_RANGE_SIZE = None
+
+  def _GetRecordRange(self, parser_mediator, file_object, number_of_records):
+    """Retrieves the range of records to parse.
+
+    If the parser mediator has a record range set, for example by a task
+    that parses a specific range, this record range is returned. Otherwise
+    when the parser supports record ranges and the parser mediator allows
+    to split the records, the records are split in ranges. All but the first
+    record range are produced as event sources so they can be parsed by
+    other tasks.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object to parse.
+      number_of_records (int): number of records.
+
+    Returns:
+      tuple[int, int]: first and last record of the range to parse, where
+          the last record is not included.
+    """
+    record_range = parser_mediator.record_range
+    if record_range:
+      return record_range
+
+    if (not self._RECORD_RANGE_SIZE or
+        not parser_mediator.split_record_ranges or
+        number_of_records <= self._RECORD_RANGE_SIZE):
+      return 0, number_of_records
+
+    record_ranges = self._GetRecordRanges(file_object, number_of_records)
+    for record_range in record_ranges[1:]:
+      parser_mediator.ProduceRecordRangeEventSource(self.NAME, record_range)
+
+    return record_ranges[0]
+
+  # pylint: disable=unused-argument
+  def _GetRecordRanges(self, file_object, number_of_records):
+    """Splits the records in ranges.
+
+    Args:
+      file_object (dvfvs.FileIO): a file-like object to parse.
+      number_of_records (int): number of records.
+
+    Returns:
+      list[tuple[int, int]]: first and last record of the ranges, where
+          the last record is not included.
+    """
+    return [
+        (first_record, min(
+            first_record + self._RECORD_RANGE_SIZE, number_of_records))
+        for first_record in range(
+            0, number_of_records, self._RECORD_RANGE_SIZE)]
+
   def Parse(self, parser_mediator, file_object):
     """Parses a single file-like object.
 
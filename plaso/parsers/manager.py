@@ -3,11 +3,14 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
 import pysigscan
 
 from plaso.containers import artifacts
 from plaso.lib import specification
 from plaso.parsers import logger
+from plaso.parsers import manifest
 from plaso.parsers import presets
 
 
@@ -99,6 +102,36 @@ class ParsersManager(object):
 
     return sorted(parser_names)
 
+  @classmethod
+  def _ImportParserModules(cls, parser_names=None):
+    """Imports the Python modules that register parsers and their plugins.
+
+    Modules that depend on optional Python modules that cannot be imported
+    are skipped.
+
+    Args:
+      parser_names (Optional[list[str]]): names of the parsers to import,
+          where None represents all parsers in the manifest. Names that are
+          not in the manifest are ignored.
+
+    Raises:
+      ImportError: if a module that does not depend on optional Python
+          modules cannot be imported.
+    """
+    if parser_names is None:
+      parser_names = manifest.PARSERS.keys()
+
+    for parser_name in parser_names:
+      for module_name in manifest.PARSERS.get(parser_name, []):
+        try:
+          importlib.import_module(module_name)
+        except ImportError as exception:
+          if module_name not in manifest.OPTIONAL_MODULES:
+            raise
+
+          logger.debug('Unable to import parser module: {0:s} {1!s}'.format(
+              module_name, exception))
+
   @classmethod
   def _ReduceParserFilters(cls, includes, excludes):
     """Reduces the parsers and plugins to include and exclude.
@@ -311,6 +344,8 @@ class ParsersManager(object):
     Returns:
       BaseParser: parser object or None.
     """
+    cls._ImportParserModules(parser_names=[parser_name])
+
     parser_class = cls._parser_classes.get(parser_name, None)
     if parser_class:
       return parser_class()
@@ -329,6 +364,8 @@ class ParsersManager(object):
     """
     includes, excludes = cls._GetParserFilters(parser_filter_expression)
 
+    cls._ImportParserModules(parser_names=list(includes.keys()) or None)
+
     parser_objects = {}
     for parser_name, parser_class in iter(cls._parser_classes.items()):
       # If there are no includes all parsers are included by default.
@@ -381,6 +418,8 @@ class ParsersManager(object):
     """
     includes, excludes = cls._GetParserFilters(parser_filter_expression)
 
+    cls._ImportParserModules(parser_names=list(includes.keys()) or None)
+
     for parser_name, parser_class in iter(cls._parser_classes.items()):
       # If there are no includes all parsers are included by default.
       if not includes and parser_name in excludes:
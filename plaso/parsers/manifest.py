@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""The parsers manifest.
+
+The manifest maps the name of a parser to the Python modules that register
+the parser and its plugins. It is used by the parsers manager to only import
+the modules of the parsers that are used.
+"""
+
+from __future__ import unicode_literals
+
+
+# Modules that depend on optional Python modules, the parsers of these modules
+# are not available if the optional Python modules cannot be imported.
+OPTIONAL_MODULES = frozenset([
+    'plaso.parsers.systemd_journal'])
+
+
+PARSERS = {
+    'amcache': ['plaso.parsers.amcache'],
+    'android_app_usage': ['plaso.parsers.android_app_usage'],
+    'apache_access': ['plaso.parsers.apache_access'],
+    'asl_log': ['plaso.parsers.asl'],
+    'bash': ['plaso.parsers.bash_history'],
+    'bencode': [
+        'plaso.parsers.bencode_parser',
+        'plaso.parsers.bencode_plugins'],
+    'binary_cookies': ['plaso.parsers.safari_cookies'],
+    'bsm_log': ['plaso.parsers.bsm'],
+    'chrome_cache': ['plaso.parsers.chrome_cache'],
+    'chrome_preferences': ['plaso.parsers.chrome_preferences'],
+    'cups_ipp': ['plaso.parsers.cups_ipp'],
+    'custom_destinations': ['plaso.parsers.custom_destinations'],
+    'czip': ['plaso.parsers.czip', 'plaso.parsers.czip_plugins'],
+    'dockerjson': ['plaso.parsers.docker'],
+    'dpkg': ['plaso.parsers.dpkg'],
+    'esedb': ['plaso.parsers.esedb', 'plaso.parsers.esedb_plugins'],
+    'filestat': ['plaso.parsers.filestat'],
+    'firefox_cache': ['plaso.parsers.firefox_cache'],
+    'firefox_cache2': ['plaso.parsers.firefox_cache'],
+    'fsevents': ['plaso.parsers.fseventsd'],
+    'gdrive_synclog': ['plaso.parsers.gdrive_synclog'],
+    'java_idx': ['plaso.parsers.java_idx'],
+    'lnk': ['plaso.parsers.winlnk'],
+    'mac_appfirewall_log': ['plaso.parsers.mac_appfirewall'],
+    'mac_keychain': ['plaso.parsers.mac_keychain'],
+    'mac_securityd': ['plaso.parsers.mac_securityd'],
+    'mactime': ['plaso.parsers.mactime'],
+    'macwifi': ['plaso.parsers.mac_wifi'],
+    'mcafee_protection': ['plaso.parsers.mcafeeav'],
+    'mft': ['plaso.parsers.ntfs'],
+    'msiecf': ['plaso.parsers.msiecf'],
+    'olecf': ['plaso.parsers.olecf', 'plaso.parsers.olecf_plugins'],
+    'opera_global': ['plaso.parsers.opera'],
+    'opera_typed_history': ['plaso.parsers.opera'],
+    'pe': ['plaso.parsers.pe'],
+    'plist': ['plaso.parsers.plist', 'plaso.parsers.plist_plugins'],
+    'pls_recall': ['plaso.parsers.pls_recall'],
+    'popularity_contest': ['plaso.parsers.popcontest'],
+    'prefetch': ['plaso.parsers.winprefetch'],
+    'recycle_bin': ['plaso.parsers.recycler'],
+    'recycle_bin_info2': ['plaso.parsers.recycler'],
+    'rplog': ['plaso.parsers.winrestore'],
+    'santa': ['plaso.parsers.santa'],
+    'sccm': ['plaso.parsers.sccm'],
+    'selinux': ['plaso.parsers.selinux'],
+    'skydrive_log': ['plaso.parsers.skydrivelog'],
+    'skydrive_log_old': ['plaso.parsers.skydrivelog'],
+    'sophos_av': ['plaso.parsers.sophos_av'],
+    'sqlite': ['plaso.parsers.sqlite', 'plaso.parsers.sqlite_plugins'],
+    'symantec_scanlog': ['plaso.parsers.symantec'],
+    'syslog': ['plaso.parsers.syslog', 'plaso.parsers.syslog_plugins'],
+    'systemd_journal': ['plaso.parsers.systemd_journal'],
+    'trendmicro_url': ['plaso.parsers.trendmicroav'],
+    'trendmicro_vd': ['plaso.parsers.trendmicroav'],
+    'usnjrnl': ['plaso.parsers.ntfs'],
+    'utmp': ['plaso.parsers.utmp'],
+    'utmpx': ['plaso.parsers.utmpx'],
+    'winevt': ['plaso.parsers.winevt'],
+    'winevtx': ['plaso.parsers.winevtx'],
+    'winfirewall': ['plaso.parsers.winfirewall'],
+    'winiis': ['plaso.parsers.iis'],
+    'winjob': ['plaso.parsers.winjob'],
+    'winreg': ['plaso.parsers.winreg', 'plaso.parsers.winreg_plugins'],
+    'xchatlog': ['plaso.parsers.xchatlog'],
+    'xchatscrollback': ['plaso.parsers.xchatscrollback'],
+    'zsh_extended_history': ['plaso.parsers.zsh_extended_history']}
@@ -3,12 +3,14 @@
 
 from __future__ import unicode_literals
 
+import collections
 import copy
 import os
 import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
 
+from plaso.containers import event_sources
 from plaso.containers import warnings
 from plaso.engine import path_helper
 from plaso.engine import profilers
@@ -18,6 +20,32 @@ from plaso.lib import timelib
 from plaso.parsers import logger
 
 
+class FileEntryEnrichmentContext(object):
+  """File entry enrichment context.
+
+  The enrichment context contains the values that are added to every event
+  or event data produced for a file entry, which are constant for the file
+  entry and therefore only need to be determined once.
+
+  Attributes:
+    display_name (str): display name of the file entry.
+    filename (str): relative path of the file entry or None if not available.
+    inode (int): inode of the file entry or None if not available.
+    path_spec (dfvfs.PathSpec): path specification of the file entry.
+    usernames (dict[str, str]): usernames per user identifier that have been
+        looked up for events of the file entry.
+  """
+
+  def __init__(self):
+    """Initializes a file entry enrichment context."""
+    super(FileEntryEnrichmentContext, self).__init__()
+    self.display_name = None
+    self.filename = None
+    self.inode = None
+    self.path_spec = None
+    self.usernames = {}
+
+
 class ParserMediator(object):
   """Parser mediator.
 
@@ -35,6 +63,13 @@ class ParserMediator(object):
   _INT64_MIN = -1 << 63
   _INT64_MAX = (1 << 63) - 1
 
+  # Maximum number of event data identifiers that are cached per file entry.
+  _MAXIMUM_CACHED_EVENT_DATA = 128
+
+  # Maximum number of file types for which the parser is tracked, which
+  # bounds the size of the process status.
+  _MAXIMUM_NUMBER_OF_FILE_TYPES = 256
+
   def __init__(
       self, storage_writer, knowledge_base, artifacts_filter_helper=None,
       preferred_year=None, resolver_context=None, temporary_directory=None):
@@ -53,21 +88,32 @@ class ParserMediator(object):
     """
     super(ParserMediator, self).__init__()
     self._abort = False
+    self._counters_profiler = None
     self._cpu_time_profiler = None
+    self._data_stream_name = None
+    self._enrichment_context = None
+    self._enrichment_time = 0.0
+    self._event_data_cache = collections.OrderedDict()
+    self._event_data_cache_hits = 0
+    self._event_data_cache_lookups = 0
     self._extra_event_attributes = {}
     self._file_entry = None
     self._knowledge_base = knowledge_base
-    self._last_event_data_hash = None
-    self._last_event_data_identifier = None
     self._memory_profiler = None
     self._mount_path = None
     self._number_of_event_sources = 0
     self._number_of_events = 0
     self._number_of_warnings = 0
     self._parser_chain_components = []
+    self._parser_names_per_file_type = {}
+    self._parser_start_times = {}
+    self._parser_throughputs = {}
+    self._parser_timings = {}
     self._preferred_year = preferred_year
     self._process_information = None
+    self._record_range = None
     self._resolver_context = resolver_context
+    self._split_record_ranges = False
     self._storage_writer = storage_writer
     self._temporary_directory = temporary_directory
     self._text_prepend = None
@@ -110,16 +156,46 @@ class ParserMediator(object):
     """int: number of produced warnings."""
     return self._number_of_warnings
 
+  @property
+  def parser_names_per_file_type(self):
+    """dict[str, str]: name of the parser that most recently parsed a default
+        data stream per file type, as determined by the path helper."""
+    return self._parser_names_per_file_type
+
+  @property
+  def parser_throughputs(self):
+    """dict[str, list[int, float]]: size in bytes and time spent in seconds
+        per parser, of the default data streams that were parsed entirely by
+        the parser."""
+    return self._parser_throughputs
+
+  @property
+  def parser_timings(self):
+    """dict[str, float]: time spent per parser in seconds."""
+    return self._parser_timings
+
   @property
   def operating_system(self):
     """str: operating system or None if not set."""
     return self._knowledge_base.GetValue('operating_system')
 
+  @property
+  def record_range(self):
+    """tuple[int, int]: range of records to parse or None if not set."""
+    return self._record_range
+
   @property
   def resolver_context(self):
     """dfvfs.Context: resolver context."""
     return self._resolver_context
 
+  @property
+  def split_record_ranges(self):
+    """bool: True if the records of the data stream can be split in ranges."""
+    return bool(
+        self._split_record_ranges and self._file_entry and
+        self._data_stream_name is not None and self._record_range is None)
+
   @property
   def temporary_directory(self):
     """str: path of the directory for temporary files."""
@@ -135,6 +211,38 @@ class ParserMediator(object):
     """int: year."""
     return self._knowledge_base.year
 
+  def _GetContentIdentifierValue(self, value):
+    """Retrieves an identifier of an attribute value.
+
+    The identifier contains the type of the value, since values of different
+    types, such as True, 1 and 1.0, or a dictionary and a list of key and
+    value pairs, compare equal.
+
+    Args:
+      value (object): attribute value.
+
+    Returns:
+      tuple[str, object]: name of the type of the value and the value, where
+          the items of dictionaries, lists and tuples are converted into
+          tuples of their identifiers.
+
+    Raises:
+      TypeError: if the keys of a dictionary cannot be sorted.
+    """
+    type_name = type(value).__name__
+
+    if isinstance(value, dict):
+      value = tuple(sorted([
+          (self._GetContentIdentifierValue(dict_key),
+           self._GetContentIdentifierValue(dict_value))
+          for dict_key, dict_value in value.items()]))
+
+    elif isinstance(value, (list, tuple)):
+      value = tuple([
+          self._GetContentIdentifierValue(list_value) for list_value in value])
+
+    return type_name, value
+
   def _GetEarliestYearFromFileEntry(self):
     """Retrieves the year from the file entry date and time values.
 
@@ -174,6 +282,74 @@ class ParserMediator(object):
           'error: {0!s}').format(exception))
       return None
 
+  def _GetEnrichmentContext(self, file_entry):
+    """Retrieves the enrichment context of a file entry.
+
+    The enrichment context of the active file entry is cached until the
+    active file entry is set or reset.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      FileEntryEnrichmentContext: enrichment context.
+    """
+    is_active_file_entry = file_entry is self._file_entry
+    if is_active_file_entry and self._enrichment_context:
+      return self._enrichment_context
+
+    path_spec = getattr(file_entry, 'path_spec', None)
+
+    enrichment_context = FileEntryEnrichmentContext()
+    enrichment_context.path_spec = path_spec
+    enrichment_context.filename = (
+        path_helper.PathHelper.GetRelativePathForPathSpec(
+            path_spec, mount_path=self._mount_path))
+
+    # TODO: dfVFS refactor: move display name to output since the path
+    # specification contains the full information.
+    if not enrichment_context.filename:
+      enrichment_context.display_name = file_entry.name
+    else:
+      enrichment_context.display_name = self.GetDisplayNameForPathSpec(
+          path_spec)
+
+    stat_object = file_entry.GetStat()
+    inode_value = getattr(stat_object, 'ino', None)
+    if inode_value is not None:
+      enrichment_context.inode = self._GetInode(inode_value)
+
+    if is_active_file_entry:
+      self._enrichment_context = enrichment_context
+
+    return enrichment_context
+
+  def _GetEventDataContentIdentifier(self, event_data):
+    """Retrieves an identifier of the content of the event data.
+
+    The identifier is a tuple of the attribute names and value identifiers,
+    which is cheaper to build and hash than a comparable string of the
+    attribute values.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      tuple|str: identifier of the content of the event data.
+    """
+    try:
+      content_identifier = tuple(sorted([
+          (attribute_name, self._GetContentIdentifierValue(attribute_value))
+          for attribute_name, attribute_value in event_data.GetAttributes()]))
+      hash(content_identifier)
+
+    except TypeError:
+      # Attribute values such as sets are not hashable and dictionaries with
+      # keys that cannot be compared cannot be sorted.
+      content_identifier = event_data.GetAttributeValuesString()
+
+    return content_identifier
+
   def _GetInode(self, inode_value):
     """Retrieves the inode from the inode value.
 
@@ -234,6 +410,50 @@ class ParserMediator(object):
           'information with error: {0!s}').format(exception))
       return None
 
+  def _GetUsername(self, user_identifier, enrichment_context=None):
+    """Retrieves the username of an user identifier.
+
+    Args:
+      user_identifier (str): user identifier, either a UID or SID.
+      enrichment_context (Optional[FileEntryEnrichmentContext]): enrichment
+          context, that is used to cache the username.
+
+    Returns:
+      str: username.
+    """
+    if user_identifier is None:
+      return ''
+
+    if enrichment_context is None:
+      return self._knowledge_base.GetUsernameByIdentifier(user_identifier)
+
+    username = enrichment_context.usernames.get(user_identifier, None)
+    if username is None:
+      username = self._knowledge_base.GetUsernameByIdentifier(user_identifier)
+      enrichment_context.usernames[user_identifier] = username
+
+    return username
+
+  def _SampleEnrichmentTime(self):
+    """Takes a sample of the enrichment time counter for profiling."""
+    if self._counters_profiler and self._enrichment_time:
+      self._counters_profiler.Sample(
+          'enrichment_time_microseconds',
+          int(self._enrichment_time * 1000000))
+
+    self._enrichment_time = 0.0
+
+  def _SampleEventDataCache(self):
+    """Takes a sample of the event data cache counters for profiling."""
+    if self._counters_profiler and self._event_data_cache_lookups:
+      self._counters_profiler.Sample(
+          'event_data_cache_hits', self._event_data_cache_hits)
+      self._counters_profiler.Sample(
+          'event_data_cache_lookups', self._event_data_cache_lookups)
+
+    self._event_data_cache_hits = 0
+    self._event_data_cache_lookups = 0
+
   def AddEventAttribute(self, attribute_name, attribute_value):
     """Adds an attribute that will be set on all events produced.
 
@@ -254,6 +474,9 @@ class ParserMediator(object):
 
     self._extra_event_attributes[attribute_name] = attribute_value
 
+    # Cached event data does not contain the extra event attribute.
+    self._event_data_cache = collections.OrderedDict()
+
   def AppendToParserChain(self, plugin_or_parser):
     """Adds a parser or parser plugin to the parser chain.
 
@@ -264,6 +487,7 @@ class ParserMediator(object):
 
   def ClearEventAttributes(self):
     """Clears the extra event attributes."""
+    self._event_data_cache = collections.OrderedDict()
     self._extra_event_attributes = {}
 
   def ClearParserChain(self):
@@ -415,43 +639,45 @@ class ParserMediator(object):
     if not getattr(event, 'text_prepend', None) and self._text_prepend:
       event.text_prepend = self._text_prepend
 
+    if self._counters_profiler:
+      start_time = time.time()
+
     if file_entry is None:
       file_entry = self._file_entry
 
-    display_name = None
+    enrichment_context = None
     if file_entry:
-      event.pathspec = file_entry.path_spec
+      enrichment_context = self._GetEnrichmentContext(file_entry)
 
-      if not getattr(event, 'filename', None):
-        path_spec = getattr(file_entry, 'path_spec', None)
-        event.filename = path_helper.PathHelper.GetRelativePathForPathSpec(
-            path_spec, mount_path=self._mount_path)
+      event.pathspec = enrichment_context.path_spec
 
-      if not display_name:
-        # TODO: dfVFS refactor: move display name to output since the path
-        # specification contains the full information.
-        display_name = self.GetDisplayName(file_entry)
+      if not getattr(event, 'filename', None):
+        event.filename = enrichment_context.filename
 
-      stat_object = file_entry.GetStat()
-      inode_value = getattr(stat_object, 'ino', None)
       # TODO: refactor to ProcessEventData.
       # Note that we use getattr here since event can be either EventObject
       # or EventData.
-      if getattr(event, 'inode', None) is None and inode_value is not None:
-        event.inode = self._GetInode(inode_value)
+      if (getattr(event, 'inode', None) is None and
+          enrichment_context.inode is not None):
+        event.inode = enrichment_context.inode
 
-    if not getattr(event, 'display_name', None) and display_name:
-      event.display_name = display_name
+      if (not getattr(event, 'display_name', None) and
+          enrichment_context.display_name):
+        event.display_name = enrichment_context.display_name
 
     if not getattr(event, 'hostname', None) and self.hostname:
       event.hostname = self.hostname
 
     if not getattr(event, 'username', None):
       user_sid = getattr(event, 'user_sid', None)
-      username = self._knowledge_base.GetUsernameByIdentifier(user_sid)
+      username = self._GetUsername(
+          user_sid, enrichment_context=enrichment_context)
       if username:
         event.username = username
 
+    if self._counters_profiler:
+      self._enrichment_time += time.time() - start_time
+
     if not getattr(event, 'query', None) and query:
       event.query = query
 
@@ -494,27 +720,42 @@ class ParserMediator(object):
     if event.timestamp < self._INT64_MIN or event.timestamp > self._INT64_MAX:
       raise errors.InvalidEvent('Event timestamp value out of bounds.')
 
-    event_data_hash = event_data.GetAttributeValuesHash()
-    if event_data_hash != self._last_event_data_hash:
+    parser_chain = self.GetParserChain()
+
+    # Event data produced for the same file entry with the same content and
+    # parser chain is stored once and shared by the events that refer to it.
+    cache_key = (parser_chain, self._GetEventDataContentIdentifier(event_data))
+
+    self._event_data_cache_lookups += 1
+    event_data_identifier = self._event_data_cache.pop(cache_key, None)
+    if event_data_identifier:
+      self._event_data_cache_hits += 1
+
+    else:
       # Make a copy of the event data before adding additional values.
       event_data = copy.deepcopy(event_data)
 
       # TODO: refactor to ProcessEventData.
       self.ProcessEvent(
-          event_data, parser_chain=self.GetParserChain(),
-          file_entry=self._file_entry)
+          event_data, parser_chain=parser_chain, file_entry=self._file_entry)
 
       self._storage_writer.AddEventData(event_data)
 
-      self._last_event_data_hash = event_data_hash
-      self._last_event_data_identifier = event_data.GetIdentifier()
+      event_data_identifier = event_data.GetIdentifier()
+
+      if len(self._event_data_cache) >= self._MAXIMUM_CACHED_EVENT_DATA:
+        self._event_data_cache.popitem(last=False)
 
-    if self._last_event_data_identifier:
-      event.SetEventDataIdentifier(self._last_event_data_identifier)
+    # Re-insert the identifier so that the cache is ordered by least
+    # recently used.
+    self._event_data_cache[cache_key] = event_data_identifier
+
+    if event_data_identifier:
+      event.SetEventDataIdentifier(event_data_identifier)
 
     # TODO: remove this after structural fix is in place
     # https://github.com/log2timeline/plaso/issues/1691
-    event.parser = self.GetParserChain()
+    event.parser = parser_chain
 
     self._storage_writer.AddEvent(event)
     self._number_of_events += 1
@@ -547,6 +788,34 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceRecordRangeEventSource(self, parser_name, record_range):
+    """Produces an event source for a range of records of the data stream.
+
+    The attributes that are set on all events produced, such as the results
+    of the analyzers of the data stream, are stored in the event source, so
+    that they can be set on the events produced from the record range.
+
+    Args:
+      parser_name (str): name of the parser that parses the records.
+      record_range (tuple[int, int]): first and last record of the range,
+          where the last record is not included.
+
+    Raises:
+      RuntimeError: when the file entry or data stream name is not set.
+    """
+    if not self._file_entry or self._data_stream_name is None:
+      raise RuntimeError('File entry or data stream name not set.')
+
+    event_source = event_sources.RecordRangeEventSource(
+        path_spec=self._file_entry.path_spec)
+    event_source.data_stream_name = self._data_stream_name
+    event_source.event_attributes = dict(self._extra_event_attributes)
+    event_source.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+    event_source.parser_name = parser_name
+    event_source.record_range = record_range
+
+    self.ProduceEventSource(event_source)
+
   def RemoveEventAttribute(self, attribute_name):
     """Removes an attribute from being set on all events produced.
 
@@ -561,9 +830,18 @@ class ParserMediator(object):
 
     del self._extra_event_attributes[attribute_name]
 
+    self._event_data_cache = collections.OrderedDict()
+
   def ResetFileEntry(self):
     """Resets the active file entry."""
+    self._SampleEnrichmentTime()
+    self._SampleEventDataCache()
+
+    self._data_stream_name = None
+    self._enrichment_context = None
+    self._event_data_cache = collections.OrderedDict()
     self._file_entry = None
+    self._record_range = None
 
   def SampleMemoryUsage(self, parser_name):
     """Takes a sample of the memory usage for profiling.
@@ -578,21 +856,64 @@ class ParserMediator(object):
   def SampleStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
+    The time spent per parser is also tracked outside of profiling, since
+    it is reported as part of the process status.
+
     Args:
       parser_name (str): name of the parser.
     """
+    self._parser_start_times[parser_name] = time.time()
+
     if self._cpu_time_profiler:
       self._cpu_time_profiler.StartTiming(parser_name)
 
-  def SampleStopTiming(self, parser_name):
+  def SampleStopTiming(self, parser_name, parsed=False):
     """Stops timing a CPU time sample for profiling.
 
     Args:
       parser_name (str): name of the parser.
+      parsed (Optional[bool]): True if the parser parsed the data stream,
+          False if the parser rejected or failed to parse the data stream.
     """
+    start_time = self._parser_start_times.pop(parser_name, None)
+    if start_time is not None:
+      parser_time = time.time() - start_time
+      self._parser_timings[parser_name] = (
+          self._parser_timings.get(parser_name, 0.0) + parser_time)
+
+      # Only data streams that are parsed entirely by the parser are
+      # representative for the throughput of the parser.
+      if (parsed and self._file_entry and self._data_stream_name == '' and
+          self._record_range is None):
+        stat_object = self._file_entry.GetStat()
+        data_size = getattr(stat_object, 'size', None)
+        if data_size is not None:
+          throughput = self._parser_throughputs.setdefault(
+              parser_name, [0, 0.0])
+          throughput[0] += data_size
+          throughput[1] += parser_time
+
+        file_type = path_helper.PathHelper.GetFileTypeForPath(
+            self._file_entry.name)
+        if file_type and (
+            file_type in self._parser_names_per_file_type or
+            len(self._parser_names_per_file_type) <
+            self._MAXIMUM_NUMBER_OF_FILE_TYPES):
+          self._parser_names_per_file_type[file_type] = parser_name
+
     if self._cpu_time_profiler:
       self._cpu_time_profiler.StopTiming(parser_name)
 
+  def SetDataStreamName(self, data_stream_name):
+    """Sets the name of the data stream that is being parsed.
+
+    Args:
+      data_stream_name (str): name of the data stream, where an empty string
+          represents the default data stream and None that the data stream
+          is not known.
+    """
+    self._data_stream_name = data_stream_name
+
   def SetEventExtractionConfiguration(self, configuration):
     """Sets the event extraction configuration settings.
 
@@ -615,6 +936,7 @@ class ParserMediator(object):
     if mount_path and mount_path.endswith(os.sep):
       mount_path = mount_path[:-1]
 
+    self._enrichment_context = None
     self._mount_path = mount_path
 
   def SetFileEntry(self, file_entry):
@@ -623,7 +945,36 @@ class ParserMediator(object):
     Args:
       file_entry (dfvfs.FileEntry): file entry.
     """
+    self._SampleEnrichmentTime()
+    self._SampleEventDataCache()
+
+    # Event data is only shared between events of the same file entry.
+    self._data_stream_name = None
+    self._enrichment_context = None
+    self._event_data_cache = collections.OrderedDict()
     self._file_entry = file_entry
+    self._record_range = None
+
+  def SetRecordRange(self, record_range):
+    """Sets the range of records of the data stream to parse.
+
+    Args:
+      record_range (tuple[int, int]): first and last record of the range,
+          where the last record is not included, or None to parse all records.
+    """
+    self._record_range = record_range
+
+  def SetSplitRecordRanges(self, split_record_ranges):
+    """Sets if the records of large data streams can be split in ranges.
+
+    The record ranges, except for the first range, are produced as event
+    sources so that they can be parsed by other tasks.
+
+    Args:
+      split_record_ranges (bool): True if the records of large data streams
+          can be split in ranges.
+    """
+    self._split_record_ranges = split_record_ranges
 
   def SetStorageWriter(self, storage_writer):
     """Sets the storage writer.
@@ -633,10 +984,9 @@ class ParserMediator(object):
     """
     self._storage_writer = storage_writer
 
-    # Reset the last event data information. Each storage file should
-    # contain event data for their events.
-    self._last_event_data_hash = None
-    self._last_event_data_identifier = None
+    # Reset the event data cache. Each storage file should contain event data
+    # for their events.
+    self._event_data_cache = collections.OrderedDict()
 
   def SignalAbort(self):
     """Signals the parsers to abort."""
@@ -665,10 +1015,21 @@ class ParserMediator(object):
           identifier, configuration)
       self._memory_profiler.Start()
 
+      self._counters_profiler = profilers.CountersProfiler(
+          identifier, configuration)
+      self._counters_profiler.Start()
+
     self._process_information = process_information
 
   def StopProfiling(self):
     """Stops profiling."""
+    if self._counters_profiler:
+      self._SampleEnrichmentTime()
+      self._SampleEventDataCache()
+
+      self._counters_profiler.Stop()
+      self._counters_profiler = None
+
     if self._cpu_time_profiler:
       self._cpu_time_profiler.Stop()
       self._cpu_time_profiler = None
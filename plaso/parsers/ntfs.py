@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import struct
 import uuid
 
 import pyfsntfs  # pylint: disable=wrong-import-order
@@ -39,6 +40,10 @@ class NTFSFileStatEventData(events.EventData):
 
   DATA_TYPE = 'fs:stat:ntfs'
 
+  __slots__ = (
+      'attribute_type', 'file_attribute_flags', 'file_reference',
+      'file_system_type', 'is_allocated', 'name', 'parent_file_reference')
+
   def __init__(self):
     """Initializes event data."""
     super(NTFSFileStatEventData, self).__init__(data_type=self.DATA_TYPE)
@@ -67,6 +72,10 @@ class NTFSUSNChangeEventData(events.EventData):
 
   DATA_TYPE = 'fs:ntfs:usn_change'
 
+  __slots__ = (
+      'file_attribute_flags', 'file_reference', 'parent_file_reference',
+      'update_reason_flags', 'update_sequence_number', 'update_source_flags')
+
   def __init__(self):
     """Initializes event data."""
     super(NTFSUSNChangeEventData, self).__init__(data_type=self.DATA_TYPE)
@@ -87,6 +96,8 @@ class NTFSMFTParser(interface.FileObjectParser):
   NAME = 'mft'
   DESCRIPTION = 'Parser for NTFS $MFT metadata files.'
 
+  _RECORD_RANGE_SIZE = 250000
+
   _MFT_ATTRIBUTE_STANDARD_INFORMATION = 0x00000010
   _MFT_ATTRIBUTE_FILE_NAME = 0x00000030
   _MFT_ATTRIBUTE_OBJECT_ID = 0x00000040
@@ -291,7 +302,13 @@ class NTFSMFTParser(interface.FileObjectParser):
       parser_mediator.ProduceExtractionWarning(
           'unable to open file with error: {0!s}'.format(exception))
 
-    for entry_index in range(0, mft_metadata_file.number_of_file_entries):
+    first_entry_index, last_entry_index = self._GetRecordRange(
+        parser_mediator, file_object, mft_metadata_file.number_of_file_entries)
+
+    for entry_index in range(first_entry_index, last_entry_index):
+      if parser_mediator.abort:
+        break
+
       try:
         mft_entry = mft_metadata_file.get_file_entry(entry_index)
         self._ParseMFTEntry(parser_mediator, mft_entry)
@@ -317,6 +334,40 @@ class NTFSUsnJrnlParser(dtfabric_parser.DtFabricBaseParser):
   # TODO: add support for USN_RECORD_V3 and USN_RECORD_V4 when actually
   # seen to be used.
 
+  # Number of 100th nano seconds between January 1, 1601 (the FILETIME
+  # epoch) and January 1, 1970 (the POSIX epoch).
+  _FILETIME_TO_POSIX_BASE = 116444736000000000
+
+  # Precompiled layout of the fixed size part of an USN_RECORD_V2, which
+  # corresponds to the usn_record_v2 structure in ntfs.yaml.
+  _USN_RECORD_V2_HEADER = struct.Struct('<IHHQQQQIIIIHH')
+
+  _USN_RECORD_V2_HEADER_SIZE = _USN_RECORD_V2_HEADER.size
+
+  def _CopyFiletimeToPlasoTimestamp(self, filetime):
+    """Copies a FILETIME timestamp to a plaso timestamp.
+
+    This is equivalent to dfdatetime.Filetime.GetPlasoTimestamp() but
+    uses integer arithmetic, which is considerably faster than the decimal
+    arithmetic used by dfdatetime, for a value that is known to be a 64-bit
+    unsigned integer.
+
+    Args:
+      filetime (int): FILETIME timestamp, which contains the number of 100th
+          nano seconds since January 1, 1601, 00:00:00 UTC.
+
+    Returns:
+      int: timestamp, which contains the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+    """
+    timestamp = filetime - self._FILETIME_TO_POSIX_BASE
+
+    # Round half away from zero, as dfdatetime does.
+    if timestamp < 0:
+      return -((5 - timestamp) // 10)
+
+    return (timestamp + 5) // 10
+
   def _ParseUSNChangeJournal(self, parser_mediator, usn_change_journal):
     """Parses an USN change journal.
 
@@ -331,55 +382,96 @@ class NTFSUsnJrnlParser(dtfabric_parser.DtFabricBaseParser):
     if not usn_change_journal:
       return
 
-    usn_record_map = self._GetDataTypeMap('usn_record_v2')
-
     usn_record_data = usn_change_journal.read_usn_record()
     while usn_record_data:
       current_offset = usn_change_journal.get_offset()
 
-      try:
-        usn_record = self._ReadStructureFromByteStream(
-            usn_record_data, current_offset, usn_record_map)
-      except (ValueError, errors.ParseError) as exception:
-        raise errors.ParseError((
-            'Unable to parse USN record at offset: 0x{0:08x} with error: '
-            '{1!s}').format(current_offset, exception))
-
-      # Per MSDN we need to use name offset for forward compatibility.
-      name_offset = usn_record.name_offset - 60
-      utf16_stream = usn_record.name[name_offset:usn_record.name_size]
-
-      try:
-        name_string = utf16_stream.decode('utf-16-le')
-      except (UnicodeDecodeError, UnicodeEncodeError) as exception:
-        name_string = utf16_stream.decode('utf-16-le', errors='replace')
-        parser_mediator.ProduceExtractionWarning((
-            'unable to decode USN record name string with error: '
-            '{0:s}. Characters that cannot be decoded will be replaced '
-            'with "?" or "\\ufffd".').format(exception))
+      (file_reference, parent_file_reference, update_sequence_number,
+       update_date_time, update_reason_flags, update_source_flags,
+       file_attribute_flags, name_string) = self._ReadUSNRecordV2(
+           parser_mediator, usn_record_data, current_offset)
 
       event_data = NTFSUSNChangeEventData()
-      event_data.file_attribute_flags = usn_record.file_attribute_flags
-      event_data.file_reference = usn_record.file_reference
+      event_data.file_attribute_flags = file_attribute_flags
+      event_data.file_reference = file_reference
       event_data.filename = name_string
       event_data.offset = current_offset
-      event_data.parent_file_reference = usn_record.parent_file_reference
-      event_data.update_reason_flags = usn_record.update_reason_flags
-      event_data.update_sequence_number = usn_record.update_sequence_number
-      event_data.update_source_flags = usn_record.update_source_flags
-
-      if not usn_record.update_date_time:
-        date_time = dfdatetime_semantic_time.SemanticTime('Not set')
-      else:
-        date_time = dfdatetime_filetime.Filetime(
-            timestamp=usn_record.update_date_time)
-
-      event = time_events.DateTimeValuesEvent(
-          date_time, definitions.TIME_DESCRIPTION_ENTRY_MODIFICATION)
+      event_data.parent_file_reference = parent_file_reference
+      event_data.update_reason_flags = update_reason_flags
+      event_data.update_sequence_number = update_sequence_number
+      event_data.update_source_flags = update_source_flags
+
+      # A timestamp of 0 represents "Not set", which dfdatetime maps to
+      # a plaso timestamp of 0 as well.
+      timestamp = 0
+      if update_date_time:
+        timestamp = self._CopyFiletimeToPlasoTimestamp(update_date_time)
+
+      event = time_events.TimestampEvent(
+          timestamp, definitions.TIME_DESCRIPTION_ENTRY_MODIFICATION)
       parser_mediator.ProduceEventWithEventData(event, event_data)
 
       usn_record_data = usn_change_journal.read_usn_record()
 
+  def _ReadUSNRecordV2(self, parser_mediator, usn_record_data, file_offset):
+    """Reads an USN_RECORD_V2.
+
+    The fixed size part of the record is decoded with a precompiled struct
+    layout instead of the usn_record_v2 data type map, since the change
+    journal of a busy volume can contain tens of millions of records.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      usn_record_data (bytes): USN record data.
+      file_offset (int): offset of the USN record relative to the start of
+          the file.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int, str]: file reference, parent
+          file reference, update sequence number, update date and time,
+          update reason flags, update source flags, file attribute flags
+          and name.
+
+    Raises:
+      ParseError: if the USN record cannot be read.
+    """
+    usn_record_data_size = len(usn_record_data)
+    if usn_record_data_size < self._USN_RECORD_V2_HEADER_SIZE:
+      raise errors.ParseError((
+          'Unable to parse USN record at offset: 0x{0:08x} with error: '
+          'data size value out of bounds').format(file_offset))
+
+    (record_size, _, _, file_reference, parent_file_reference,
+     update_sequence_number, update_date_time, update_reason_flags,
+     update_source_flags, _, file_attribute_flags, name_size,
+     name_offset) = self._USN_RECORD_V2_HEADER.unpack_from(usn_record_data)
+
+    if (record_size < self._USN_RECORD_V2_HEADER_SIZE or
+        record_size > usn_record_data_size):
+      raise errors.ParseError((
+          'Unable to parse USN record at offset: 0x{0:08x} with error: '
+          'record size value out of bounds').format(file_offset))
+
+    # Per MSDN we need to use name offset for forward compatibility.
+    name_offset -= self._USN_RECORD_V2_HEADER_SIZE
+    name_data = usn_record_data[self._USN_RECORD_V2_HEADER_SIZE:record_size]
+    utf16_stream = name_data[name_offset:name_size]
+
+    try:
+      name_string = utf16_stream.decode('utf-16-le')
+    except (UnicodeDecodeError, UnicodeEncodeError) as exception:
+      name_string = utf16_stream.decode('utf-16-le', errors='replace')
+      parser_mediator.ProduceExtractionWarning((
+          'unable to decode USN record name string with error: '
+          '{0:s}. Characters that cannot be decoded will be replaced '
+          'with "?" or "\\ufffd".').format(exception))
+
+    return (
+        file_reference, parent_file_reference, update_sequence_number,
+        update_date_time, update_reason_flags, update_source_flags,
+        file_attribute_flags, name_string)
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a NTFS $UsnJrnl metadata file-like object.
 
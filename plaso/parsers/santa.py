@@ -134,6 +134,8 @@ class SantaParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'santa'
   DESCRIPTION = 'Santa Parser'
 
+  _RECORD_RANGE_SIZE = 64 * 1024 * 1024
+
   _ENCODING = 'utf-8'
 
   MAX_LINE_LENGTH = 16384
@@ -61,6 +61,8 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'selinux'
   DESCRIPTION = 'Parser for SELinux audit.log files.'
 
+  _RECORD_RANGE_SIZE = 64 * 1024 * 1024
+
   _ENCODING = 'utf-8'
 
   _SELINUX_KEY_VALUE_GROUP = pyparsing.Group(
@@ -41,6 +41,8 @@ class SophosAVLogParser(text_parser.PyparsingSingleLineTextParser):
   NAME = 'sophos_av'
   DESCRIPTION = 'Parser for Anti-Virus log (SAV.txt) files.'
 
+  _RECORD_RANGE_SIZE = 64 * 1024 * 1024
+
   _ENCODING = 'utf-16-le'
 
   MAX_LINE_LENGTH = 4096
@@ -31,6 +31,8 @@ class SyslogLineEventData(events.EventData):
 
   DATA_TYPE = 'syslog:line'
 
+  __slots__ = ('body', 'pid', 'reporter', 'severity')
+
   def __init__(self, data_type=DATA_TYPE):
     """Initializes an event data attribute container.
 
@@ -9,9 +9,11 @@ parser.
 from __future__ import unicode_literals
 
 import abc
+import os
 
 import pyparsing
 
+from dfvfs.file_io import data_range_io
 from dfvfs.helpers import text_file
 
 from plaso.lib import errors
@@ -240,9 +242,20 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
   _EMPTY_LINES = frozenset(['\n', '\r', '\r\n'])
 
+  _END_OF_LINE = '\n'
+
   # Allow for a maximum of 40 empty lines before we bail out.
   _MAXIMUM_DEPTH = 40
 
+  # The maximum number of bytes to read to find the end of a line when
+  # aligning a record range.
+  _MAXIMUM_RECORD_RANGE_ALIGNMENT_SIZE = 64 * 1024
+
+  # The records of a text file are represented by byte offsets. Text parsers
+  # that parse every line independent of the preceding lines, can set this
+  # value to the number of bytes per record range.
+  _RECORD_RANGE_SIZE = None
+
   def __init__(self):
     """Initializes a parser."""
     super(PyparsingSingleLineTextParser, self).__init__()
@@ -251,6 +264,46 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     # a structural fix.
     self._line_structures = list(self.LINE_STRUCTURES)
 
+  def _GetRecordRanges(self, file_object, number_of_records):
+    """Splits the records in ranges.
+
+    The records of a text file are byte offsets, the ranges are aligned
+    to the start of a line.
+
+    Args:
+      file_object (dvfvs.FileIO): a file-like object to parse.
+      number_of_records (int): number of records, which is the size of
+          the file-like object.
+
+    Returns:
+      list[tuple[int, int]]: first and last offset of the ranges, where
+          the last offset is not included.
+    """
+    end_of_line = self._END_OF_LINE.encode('ascii')
+
+    range_offsets = [0]
+    for range_offset in range(
+        self._RECORD_RANGE_SIZE, number_of_records, self._RECORD_RANGE_SIZE):
+      if range_offset <= range_offsets[-1]:
+        continue
+
+      file_object.seek(range_offset - 1, os.SEEK_SET)
+      data = file_object.read(self._MAXIMUM_RECORD_RANGE_ALIGNMENT_SIZE)
+
+      end_of_line_index = data.find(end_of_line)
+      if end_of_line_index == -1:
+        continue
+
+      range_offset += end_of_line_index
+      if range_offset < number_of_records:
+        range_offsets.append(range_offset)
+
+    range_offsets.append(number_of_records)
+
+    return [
+        (range_offsets[index], range_offsets[index + 1])
+        for index in range(len(range_offsets) - 1)]
+
   # Pylint is confused by the formatting of the bytes_in argument.
   # pylint: disable=missing-param-doc,missing-type-doc
   def _IsText(self, bytes_in, encoding=None):
@@ -312,6 +365,71 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
     return False
 
+  def _ParseLines(
+      self, parser_mediator, text_file_object, line, base_offset=0):
+    """Parses lines of a text file.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      text_file_object (dfvfs.TextFile): text file.
+      line (str): first line to parse.
+      base_offset (Optional[int]): offset of the text file relative to the
+          start of the file-like object, used when only a record range is
+          parsed.
+
+    Raises:
+      UnableToParseFile: when the lines cannot be parsed.
+    """
+    consecutive_line_failures = 0
+    index = None
+    # Set the offset to the beginning of the file or record range.
+    self._current_offset = base_offset
+    # Read every line in the text file.
+    while line:
+      if parser_mediator.abort:
+        break
+      parsed_structure = None
+      use_key = None
+      # Try to parse the line using all the line structures.
+      for index, (key, structure) in enumerate(self._line_structures):
+        try:
+          parsed_structure = structure.parseString(line)
+        except pyparsing.ParseException:
+          pass
+        if parsed_structure:
+          use_key = key
+          break
+
+      if parsed_structure:
+        self.ParseRecord(parser_mediator, use_key, parsed_structure)
+        consecutive_line_failures = 0
+        if index is not None and index != 0:
+          key_structure = self._line_structures.pop(index)
+          self._line_structures.insert(0, key_structure)
+      else:
+        if len(line) > 80:
+          line = '{0:s}...'.format(line[:77])
+        parser_mediator.ProduceExtractionWarning(
+            'unable to parse log line: {0:s} at offset: {1:d}'.format(
+                repr(line), self._current_offset))
+        consecutive_line_failures += 1
+        if (consecutive_line_failures >
+            self.MAXIMUM_CONSECUTIVE_LINE_FAILURES):
+          raise errors.UnableToParseFile(
+              'more than {0:d} consecutive failures to parse lines.'.format(
+                  self.MAXIMUM_CONSECUTIVE_LINE_FAILURES))
+
+      self._current_offset = base_offset + text_file_object.get_offset()
+
+      try:
+        line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
+      except UnicodeDecodeError:
+        parser_mediator.ProduceExtractionWarning(
+            'unable to read and decode log line at offset {0:d}'.format(
+                self._current_offset))
+        break
+
   def _ReadLine(self, text_file_object, max_len=None, depth=0):
     """Reads a line from a text file.
 
@@ -385,54 +503,41 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     if not self.VerifyStructure(parser_mediator, line):
       raise errors.UnableToParseFile('Wrong file structure.')
 
-    consecutive_line_failures = 0
-    index = None
-    # Set the offset to the beginning of the file.
-    self._current_offset = 0
-    # Read every line in the text file.
-    while line:
-      if parser_mediator.abort:
-        break
-      parsed_structure = None
-      use_key = None
-      # Try to parse the line using all the line structures.
-      for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          parsed_structure = structure.parseString(line)
-        except pyparsing.ParseException:
-          pass
-        if parsed_structure:
-          use_key = key
-          break
+    file_size = file_object.get_size()
 
-      if parsed_structure:
-        self.ParseRecord(parser_mediator, use_key, parsed_structure)
-        consecutive_line_failures = 0
-        if index is not None and index != 0:
-          key_structure = self._line_structures.pop(index)
-          self._line_structures.insert(0, key_structure)
-      else:
-        if len(line) > 80:
-          line = '{0:s}...'.format(line[:77])
-        parser_mediator.ProduceExtractionWarning(
-            'unable to parse log line: {0:s} at offset: {1:d}'.format(
-                repr(line), self._current_offset))
-        consecutive_line_failures += 1
-        if (consecutive_line_failures >
-            self.MAXIMUM_CONSECUTIVE_LINE_FAILURES):
-          raise errors.UnableToParseFile(
-              'more than {0:d} consecutive failures to parse lines.'.format(
-                  self.MAXIMUM_CONSECUTIVE_LINE_FAILURES))
+    # Record ranges are aligned to the end-of-line character, which is only
+    # supported for encodings that represent it as a single byte.
+    first_offset, last_offset = 0, file_size
+    if len(self._END_OF_LINE.encode(encoding)) == 1:
+      first_offset, last_offset = self._GetRecordRange(
+          parser_mediator, file_object, file_size)
+
+    if first_offset == 0 and last_offset == file_size:
+      self._ParseLines(parser_mediator, text_file_object, line)
+      return
 
-      self._current_offset = text_file_object.get_offset()
+    range_file_object = data_range_io.DataRange(
+        parser_mediator.resolver_context, file_object=file_object)
+    range_file_object.SetRange(first_offset, last_offset - first_offset)
+    range_file_object.open()
+
+    try:
+      text_file_object = text_file.TextFile(
+          range_file_object, encoding=encoding)
 
       try:
         line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
       except UnicodeDecodeError:
         parser_mediator.ProduceExtractionWarning(
             'unable to read and decode log line at offset {0:d}'.format(
-                self._current_offset))
-        break
+                first_offset))
+        return
+
+      self._ParseLines(
+          parser_mediator, text_file_object, line, base_offset=first_offset)
+
+    finally:
+      range_file_object.close()
 
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
@@ -37,6 +37,11 @@ class WinEvtxRecordEventData(events.EventData):
 
   DATA_TYPE = 'windows:evtx:record'
 
+  __slots__ = (
+      'computer_name', 'event_identifier', 'event_level',
+      'message_identifier', 'record_number', 'recovered', 'source_name',
+      'strings', 'strings_parsed', 'user_sid', 'xml_string')
+
   def __init__(self):
     """Initializes event data."""
     super(WinEvtxRecordEventData, self).__init__(data_type=self.DATA_TYPE)
@@ -61,6 +66,8 @@ class WinEvtxParser(interface.FileObjectParser):
   NAME = 'winevtx'
   DESCRIPTION = 'Parser for Windows XML EventLog (EVTX) files.'
 
+  _RECORD_RANGE_SIZE = 200000
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -205,20 +212,30 @@ class WinEvtxParser(interface.FileObjectParser):
         date_time, definitions.TIME_DESCRIPTION_WRITTEN)
     parser_mediator.ProduceEventWithEventData(event, event_data)
 
-  def _ParseRecords(self, parser_mediator, evtx_file):
+  def _ParseRecords(self, parser_mediator, evtx_file, record_range=None):
     """Parses Windows XML EventLog (EVTX) records.
 
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfvfs.
       evtx_file (pyevt.file): Windows XML EventLog (EVTX) file.
+      record_range (Optional[tuple[int, int]]): first and last index of
+          the event records to parse, where the last index is not included.
+          The recovered event records are only parsed by the range that
+          starts with the first event record. None represents all event
+          records.
     """
+    if record_range:
+      first_record_index, last_record_index = record_range
+    else:
+      first_record_index, last_record_index = 0, evtx_file.number_of_records
+
     # To handle errors when parsing a Windows XML EventLog (EVTX) file in the
     # most granular way the following code iterates over every event record.
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
+    for record_index in range(first_record_index, last_record_index):
       if parser_mediator.abort:
         break
 
@@ -231,6 +248,9 @@ class WinEvtxParser(interface.FileObjectParser):
             'unable to parse event record: {0:d} with error: {1!s}'.format(
                 record_index, exception))
 
+    if first_record_index != 0:
+      return
+
     for record_index in range(evtx_file.number_of_recovered_records):
       if parser_mediator.abort:
         break
@@ -264,7 +284,9 @@ class WinEvtxParser(interface.FileObjectParser):
       return
 
     try:
-      self._ParseRecords(parser_mediator, evtx_file)
+      record_range = self._GetRecordRange(
+          parser_mediator, file_object, evtx_file.number_of_records)
+      self._ParseRecords(parser_mediator, evtx_file, record_range=record_range)
     finally:
       evtx_file.close()
 
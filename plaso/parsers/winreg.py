@@ -11,7 +11,6 @@ from dfwinreg import registry_searcher as dfwinreg_registry_searcher
 
 from plaso.engine import artifact_filters
 from plaso.lib import specification
-from plaso.filters import path_filter
 from plaso.parsers import interface
 from plaso.parsers import logger
 from plaso.parsers import manager
@@ -58,11 +57,11 @@ class WinRegistryParser(interface.FileObjectParser):
   def __init__(self):
     """Initializes a parser object."""
     super(WinRegistryParser, self).__init__()
+    self._plugin_key_path_prefixes = set()
     self._plugin_per_key_path = {}
     self._plugins_without_key_paths = []
 
     default_plugin_list_index = None
-    key_paths = []
 
     for list_index, plugin in enumerate(self._plugins):
       if plugin.NAME == 'winreg_default':
@@ -88,30 +87,43 @@ class WinRegistryParser(interface.FileObjectParser):
 
           self._plugin_per_key_path[plugin_key_path] = plugin
 
-          key_paths.append(plugin_key_path)
+          # The key paths of the keys that have the key path of a plugin in
+          # their subtree, which are the only keys that need to be matched
+          # against the key paths of the plugins.
+          path_segments = plugin_key_path.split('\\')
+          for segment_index in range(1, len(path_segments) + 1):
+            self._plugin_key_path_prefixes.add(
+                '\\'.join(path_segments[:segment_index]))
 
     if default_plugin_list_index is not None:
       self._default_plugin = self._plugins.pop(default_plugin_list_index)
 
-    self._path_filter = path_filter.PathFilterScanTree(
-        key_paths, case_sensitive=False, path_segment_separator='\\')
-
-  def _CanProcessKeyWithPlugin(self, registry_key, plugin):
+  def _CanProcessKeyWithPlugin(self, registry_key, plugin, value_names=None):
     """Determines if a plugin can process a Windows Registry key or its values.
 
     Args:
       registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
       plugin (WindowsRegistryPlugin): Windows Registry plugin.
+      value_names (Optional[frozenset[str]]): names of the values in the key,
+          where None represents that the names were not determined.
 
     Returns:
       bool: True if the Registry key can be processed with the plugin.
     """
     for registry_key_filter in plugin.FILTERS:
       # Skip filters that define key paths since they are already
-      # checked by the path filter.
+      # checked by the key path lookup.
       if getattr(registry_key_filter, 'key_paths', []):
         continue
 
+      # A filter that requires values cannot match a key that does not
+      # contain all of them, which is cheaper to determine than matching
+      # the filter against the key.
+      filter_value_names = getattr(registry_key_filter, 'value_names', None)
+      if (filter_value_names and value_names is not None and
+          not filter_value_names.issubset(value_names)):
+        continue
+
       if registry_key_filter.Match(registry_key):
         return True
 
@@ -124,6 +136,55 @@ class WinRegistryParser(interface.FileObjectParser):
     format_specification.AddNewSignature(b'regf', offset=0)
     return format_specification
 
+  def _GetNormalizedKeyPathWithPlugins(self, key_path):
+    """Retrieves the normalized key path if its subtree has plugin key paths.
+
+    Args:
+      key_path (str): Windows Registry key path.
+
+    Returns:
+      str: normalized Windows Registry key path or None if neither the key
+          nor its subkeys can match the key path of a plugin.
+    """
+    normalized_key_path = self._NormalizeKeyPath(key_path)
+    if normalized_key_path not in self._plugin_key_path_prefixes:
+      return None
+
+    return normalized_key_path
+
+  def _GetPluginForKey(self, registry_key, normalized_key_path):
+    """Retrieves the plugin to parse a Windows Registry key with.
+
+    Args:
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+      normalized_key_path (str): normalized Windows Registry key path or None
+          if the key cannot match the key path of a plugin.
+
+    Returns:
+      WindowsRegistryPlugin: Windows Registry plugin or None if no plugin
+          matches the key and there is no default plugin.
+    """
+    if normalized_key_path:
+      matching_plugin = self._plugin_per_key_path.get(
+          normalized_key_path, None)
+      if matching_plugin:
+        return matching_plugin
+
+    if self._plugins_without_key_paths:
+      # The value names are determined once for all plugins.
+      value_names = frozenset()
+      if registry_key.number_of_values:
+        value_names = frozenset([
+            registry_value.name
+            for registry_value in registry_key.GetValues()])
+
+      for plugin in self._plugins_without_key_paths:
+        if self._CanProcessKeyWithPlugin(
+            registry_key, plugin, value_names=value_names):
+          return plugin
+
+    return self._default_plugin
+
   def _ParseKeyWithPlugin(self, parser_mediator, registry_key, plugin):
     """Parses the Registry key with a specific plugin.
 
@@ -167,35 +228,54 @@ class WinRegistryParser(interface.FileObjectParser):
       parser_mediator (ParserMediator): parser mediator.
       registry_key (dfwinreg.WinRegistryKey): Windwos Registry key.
     """
-    matching_plugin = None
-
     normalized_key_path = self._NormalizeKeyPath(registry_key.path)
-    if self._path_filter.CheckPath(normalized_key_path):
-      matching_plugin = self._plugin_per_key_path[normalized_key_path]
-    else:
-      for plugin in self._plugins_without_key_paths:
-        if self._CanProcessKeyWithPlugin(registry_key, plugin):
-          matching_plugin = plugin
-          break
-
-    if not matching_plugin:
-      matching_plugin = self._default_plugin
-
+    matching_plugin = self._GetPluginForKey(registry_key, normalized_key_path)
     if matching_plugin:
       self._ParseKeyWithPlugin(parser_mediator, registry_key, matching_plugin)
 
   def _ParseRecurseKeys(self, parser_mediator, root_key):
     """Parses the Registry keys recursively.
 
+    The keys are parsed in the same order as RecurseKeys, but only the keys
+    of which the subtree contains the key path of a plugin are matched
+    against the key paths of the plugins.
+
     Args:
       parser_mediator (ParserMediator): parser mediator.
       root_key (dfwinreg.WinRegistryKey): root Windows Registry key.
     """
-    for registry_key in root_key.RecurseKeys():
+    registry_key = root_key
+    normalized_key_path = self._GetNormalizedKeyPathWithPlugins(root_key.path)
+
+    # Stack of the subkeys that remain to be parsed per ancestor key and
+    # the normalized key path of the ancestor key.
+    subkeys_stack = []
+
+    while registry_key is not None:
       if parser_mediator.abort:
         break
 
-      self._ParseKey(parser_mediator, registry_key)
+      matching_plugin = self._GetPluginForKey(registry_key, normalized_key_path)
+      if matching_plugin:
+        self._ParseKeyWithPlugin(
+            parser_mediator, registry_key, matching_plugin)
+
+      subkeys_stack.append((registry_key.GetSubkeys(), normalized_key_path))
+
+      registry_key = None
+      while subkeys_stack and registry_key is None:
+        subkeys, parent_normalized_key_path = subkeys_stack[-1]
+
+        registry_key = next(subkeys, None)
+        if registry_key is None:
+          subkeys_stack.pop()
+
+        elif parent_normalized_key_path:
+          normalized_key_path = self._GetNormalizedKeyPathWithPlugins(
+              registry_key.path)
+
+        else:
+          normalized_key_path = None
 
   def _ParseKeysFromFindSpecs(self, parser_mediator, win_registry, find_specs):
     """Parses the Registry keys from FindSpecs.
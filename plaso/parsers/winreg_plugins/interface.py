@@ -184,6 +184,11 @@ class WindowsRegistryKeyWithValuesFilter(BaseWindowsRegistryKeyFilter):
     super(WindowsRegistryKeyWithValuesFilter, self).__init__()
     self._value_names = frozenset(value_names)
 
+  @property
+  def value_names(self):
+    """frozenset[str]: names of values that should be present in the key."""
+    return self._value_names
+
   def Match(self, registry_key):
     """Determines if a Windows Registry key matches the filter.
 
@@ -9,8 +9,9 @@ class EventTagIndex(object):
 
   The event tag index is used to map event tags to events.
 
-  It is necessary for the ZIP storage files since previously
-  stored event tags cannot be altered.
+  It is necessary since previously stored event tags cannot be altered.
+  If the store maintains an event tag index itself, the event tags are
+  looked up in the store, otherwise the index is built in memory.
   """
 
   def __init__(self):
@@ -39,7 +40,10 @@ class EventTagIndex(object):
     Returns:
       EventTag: event tag or None if the event has no event tag.
     """
-    if not self._index:
+    if self._index is None:
+      if storage_file.HasEventTagIndex():
+        return storage_file.GetEventTagByEventIdentifier(event_identifier)
+
       self._Build(storage_file)
 
     lookup_key = event_identifier.CopyToString()
@@ -52,9 +56,17 @@ class EventTagIndex(object):
   def SetEventTag(self, event_tag):
     """Sets an event tag in the index.
 
+    Event tags are only set in an index that was built in memory, since
+    a store that maintains an event tag index updates it when the event tag
+    is added, and an index that was not built yet will contain the event tag
+    when it is built.
+
     Args:
       event_tag (EventTag): event tag.
     """
+    if self._index is None:
+      return
+
     event_identifier = event_tag.GetEventIdentifier()
 
     lookup_key = event_identifier.CopyToString()
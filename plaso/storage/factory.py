@@ -46,20 +46,24 @@ class StorageFactory(object):
     return None
 
   @classmethod
-  def CreateStorageWriter(cls, storage_format, session, path):
+  def CreateStorageWriter(
+      cls, storage_format, session, path, compression_level=None):
     """Creates a storage writer.
 
     Args:
       session (Session): session the storage changes are part of.
       path (str): path to the storage file.
       storage_format (str): storage format.
+      compression_level (Optional[int]): compression level, where None
+          represents the default of the storage format.
 
     Returns:
       StorageWriter: a storage writer or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if storage_format == definitions.STORAGE_FORMAT_SQLITE:
-      return sqlite_writer.SQLiteStorageFileWriter(session, path)
+      return sqlite_writer.SQLiteStorageFileWriter(
+          session, path, compression_level=compression_level)
 
     return None
 
@@ -13,6 +13,8 @@ class FakeIdentifier(containers_interface.AttributeContainerIdentifier):
     attribute_values_hash (int): hash value of the attribute values.
   """
 
+  __slots__ = ('attribute_values_hash',)
+
   def __init__(self, attribute_values_hash):
     """Initializes a fake attribute container identifier.
 
@@ -47,6 +49,8 @@ class SerializedStreamIdentifier(
     entry_index (int): number of the serialized event within the stream.
   """
 
+  __slots__ = ('entry_index', 'stream_number')
+
   def __init__(self, stream_number, entry_index):
     """Initializes a serialized stream attribute container identifier.
 
@@ -82,6 +86,8 @@ class SQLTableIdentifier(containers_interface.AttributeContainerIdentifier):
     row_identifier (int): unique identifier of the row in the table.
   """
 
+  __slots__ = ('name', 'row_identifier')
+
   def __init__(self, name, row_identifier):
     """Initializes a SQL table attribute container identifier.
 
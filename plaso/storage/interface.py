@@ -196,6 +196,20 @@ class BaseStore(object):
       EventSource: event source.
     """
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      NotImplementedError: if the store does not maintain an event tag index.
+    """
+    raise NotImplementedError('Event tag index not supported.')
+
   @abc.abstractmethod
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
@@ -262,6 +276,14 @@ class BaseStore(object):
       bool: True if the store contains analysis reports.
     """
 
+  def HasEventTagIndex(self):
+    """Determines if the store maintains an event tag index.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return False
+
   @abc.abstractmethod
   def HasWarnings(self):
     """Determines if a store contains extraction warnings.
@@ -642,6 +664,21 @@ class StorageReader(object):
       EventSourceObject: event source.
     """
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      NotImplementedError: if the storage reader does not maintain an event
+          tag index.
+    """
+    raise NotImplementedError('Event tag index not supported.')
+
   @abc.abstractmethod
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
@@ -708,6 +745,14 @@ class StorageReader(object):
       bool: True if the store contains event tags.
     """
 
+  def HasEventTagIndex(self):
+    """Determines if the storage reader maintains an event tag index.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return False
+
   @abc.abstractmethod
   def HasWarnings(self):
     """Determines if a store contains extraction warnings.
@@ -837,6 +882,17 @@ class StorageFileReader(StorageReader):
     """
     return self._storage_file.GetEventSources()
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+    """
+    return self._storage_file.GetEventTagByEventIdentifier(event_identifier)
+
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
 
@@ -903,6 +959,14 @@ class StorageFileReader(StorageReader):
     """
     return self._storage_file.HasEventTags()
 
+  def HasEventTagIndex(self):
+    """Determines if the store maintains an event tag index.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return self._storage_file.HasEventTagIndex()
+
   def HasWarnings(self):
     """Determines if a store contains extraction warnings.
 
@@ -1054,6 +1118,21 @@ class StorageWriter(object):
       EventObject: event.
     """
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      NotImplementedError: if the storage writer does not maintain an event
+          tag index.
+    """
+    raise NotImplementedError('Event tag index not supported.')
+
   @abc.abstractmethod
   def GetFirstWrittenEventSource(self):
     """Retrieves the first event source that was written after open.
@@ -1100,6 +1179,14 @@ class StorageWriter(object):
     """
     raise NotImplementedError()
 
+  def HasEventTagIndex(self):
+    """Determines if the storage writer maintains an event tag index.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return False
+
   @abc.abstractmethod
   def Open(self):
     """Opens the storage writer."""
@@ -1492,6 +1579,17 @@ class StorageFileWriter(StorageWriter):
     """
     return self._storage_file.GetEvents()
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (AttributeContainerIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+    """
+    return self._storage_file.GetEventTagByEventIdentifier(event_identifier)
+
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
 
@@ -1626,6 +1724,14 @@ class StorageFileWriter(StorageWriter):
           'Unable to rename task storage file: {0:s} with error: '
           '{1!s}').format(storage_file_path, exception))
 
+  def HasEventTagIndex(self):
+    """Determines if the store maintains an event tag index.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return self._storage_file.HasEventTagIndex()
+
   def Open(self):
     """Opens the storage writer.
 
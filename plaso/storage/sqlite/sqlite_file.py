@@ -3,10 +3,15 @@
 
 from __future__ import unicode_literals
 
+import base64
+import multiprocessing
 import os
 import sqlite3
+import sys
 import zlib
 
+from multiprocessing import pool
+
 from plaso.containers import artifacts
 from plaso.containers import event_sources
 from plaso.containers import events
@@ -20,6 +25,11 @@ from plaso.storage import identifiers
 from plaso.storage import interface
 from plaso.storage import logger
 
+if sys.version_info[0] < 3:
+  from urllib import pathname2url  # pylint: disable=no-name-in-module
+else:
+  from urllib.request import pathname2url  # pylint: disable=import-error
+
 
 class SQLiteStorageFile(interface.BaseStorageFile):
   """SQLite-based storage file.
@@ -30,7 +40,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     storage_type (str): storage type.
   """
 
-  _FORMAT_VERSION = 20190309
+  _FORMAT_VERSION = 20190331
+
+  # The earliest format version, stored in-file, that this class
+  # is able to append to.
+  _APPEND_COMPATIBLE_FORMAT_VERSION = 20190309
 
   # The earliest format version, stored in-file, that this class
   # is able to read.
@@ -64,11 +78,22 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       _CONTAINER_TYPE_TASK_COMPLETION,
       _CONTAINER_TYPE_TASK_START)
 
-  # Container types that are referenced from other container types.
+  # Container types that are compressed with a compression dictionary when
+  # the compression format is zlib with a dictionary. These container types
+  # are only written by _WriteSerializedAttributeContainerList.
+  _COMPRESSION_DICTIONARY_CONTAINER_TYPES = frozenset([
+      _CONTAINER_TYPE_EVENT,
+      _CONTAINER_TYPE_EVENT_DATA,
+      _CONTAINER_TYPE_EVENT_SOURCE,
+      _CONTAINER_TYPE_EVENT_TAG])
+
+  # Container types that are referenced from other container types or from
+  # the event tag index.
   _REFERENCED_CONTAINER_TYPES = (
       _CONTAINER_TYPE_EVENT,
       _CONTAINER_TYPE_EVENT_DATA,
-      _CONTAINER_TYPE_EVENT_SOURCE)
+      _CONTAINER_TYPE_EVENT_SOURCE,
+      _CONTAINER_TYPE_EVENT_TAG)
 
   _CREATE_METADATA_TABLE_QUERY = (
       'CREATE TABLE metadata (key TEXT, value TEXT);')
@@ -84,6 +109,17 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       '_timestamp BIGINT,'
       '_data {1:s});')
 
+  # The event tag index maps the row identifier of an event to the row
+  # identifier of its most recently added event tag.
+  _CREATE_EVENT_TAG_INDEX_TABLE_QUERY = (
+      'CREATE TABLE event_tag_index ('
+      '_event_row_identifier INTEGER PRIMARY KEY,'
+      '_event_tag_row_identifier INTEGER);')
+
+  # Prefix of the metadata key of the compression dictionary of a container
+  # type.
+  _COMPRESSION_DICTIONARY_METADATA_KEY_PREFIX = 'compression_dictionary_'
+
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master '
       'WHERE type = "table" AND name = "{0:s}"')
@@ -92,38 +128,100 @@ class SQLiteStorageFile(interface.BaseStorageFile):
   # a flush to disk (64 MiB).
   _MAXIMUM_BUFFER_SIZE = 64 * 1024 * 1024
 
+  # The maximum size of a compression dictionary in bytes.
+  _MAXIMUM_COMPRESSION_DICTIONARY_SIZE = 8 * 1024
+
+  # The zlib window size (16 KiB) and memory level used to compress with a
+  # compression dictionary. The window fits the compression dictionary and
+  # a typical serialized attribute container, and the smaller compression
+  # state makes copying it per attribute container cheap.
+  _COMPRESSION_DICTIONARY_WINDOW_BITS = 14
+  _COMPRESSION_DICTIONARY_MEMORY_LEVEL = 4
+
+  # The maximum number of threads used to compress serialized attribute
+  # containers.
+  _MAXIMUM_NUMBER_OF_COMPRESSION_THREADS = 4
+
+  # The number of rows that are fetched at once when reading attribute
+  # containers.
+  _MAXIMUM_NUMBER_OF_FETCHED_ROWS = 1000
+
+  # The minimum number of serialized attribute containers that are compressed
+  # by the compression threads, smaller lists are compressed directly.
+  _MINIMUM_NUMBER_OF_THREADED_COMPRESSIONS = 1000
+
+  # The number of serialized attribute containers, written first, that
+  # a compression dictionary is sampled from.
+  _NUMBER_OF_COMPRESSION_DICTIONARY_SAMPLES = 1000
+
+  # The page size of a new storage file in bytes.
+  _PAGE_SIZE = 32 * 1024
+
+  # The size of the page cache of a read-only store in KiB (256 MiB).
+  _READ_ONLY_CACHE_SIZE = 256 * 1024
+
+  # The maximum number of bytes of a read-only store that are accessed using
+  # memory-mapped I/O (2 GiB). Note that SQLite limits this value to the
+  # maximum that it was compiled with.
+  _READ_ONLY_MMAP_SIZE = 2 * 1024 * 1024 * 1024
+
   def __init__(
-      self, maximum_buffer_size=0,
+      self, compression_level=None, maximum_buffer_size=0,
       storage_type=definitions.STORAGE_TYPE_SESSION):
     """Initializes a store.
 
     Args:
+      compression_level (Optional[int]): zlib compression level, from 0 to 9,
+          where None represents the zlib default.
       maximum_buffer_size (Optional[int]):
           maximum size of a single storage stream. A value of 0 indicates
           the limit is _MAXIMUM_BUFFER_SIZE.
       storage_type (Optional[str]): storage type.
 
     Raises:
-      ValueError: if the maximum buffer size value is out of bounds.
+      ValueError: if the compression level or maximum buffer size value is
+          out of bounds.
     """
+    if compression_level is not None and (
+        compression_level < 0 or compression_level > 9):
+      raise ValueError('Compression level value out of bounds.')
+
     if (maximum_buffer_size < 0 or
         maximum_buffer_size > self._MAXIMUM_BUFFER_SIZE):
       raise ValueError('Maximum buffer size value out of bounds.')
 
+    if compression_level is None:
+      compression_level = zlib.Z_DEFAULT_COMPRESSION
+
     if not maximum_buffer_size:
       maximum_buffer_size = self._MAXIMUM_BUFFER_SIZE
 
+    try:
+      number_of_cpus = multiprocessing.cpu_count()
+    except NotImplementedError:
+      number_of_cpus = 1
+
     super(SQLiteStorageFile, self).__init__()
+    self._compression_dictionaries = {}
+    self._compression_level = compression_level
+    self._compression_thread_pool = None
     self._connection = None
     self._cursor = None
+    self._event_tag_index = {}
+    self._has_event_tag_index = False
     self._last_session = 0
     self._maximum_buffer_size = maximum_buffer_size
+    self._number_of_compression_threads = min(
+        number_of_cpus, self._MAXIMUM_NUMBER_OF_COMPRESSION_THREADS)
     self._serialized_event_heap = event_heaps.SerializedEventHeap()
 
-    if storage_type == definitions.STORAGE_TYPE_SESSION:
+    if storage_type != definitions.STORAGE_TYPE_SESSION:
+      self.compression_format = definitions.COMPRESSION_FORMAT_NONE
+    elif sys.version_info[0] < 3:
+      # Compression dictionaries are not supported by the Python 2 zlib module.
       self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
     else:
-      self.compression_format = definitions.COMPRESSION_FORMAT_NONE
+      self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB_DICTIONARY
 
     self.format_version = self._FORMAT_VERSION
     self.serialization_format = definitions.SERIALIZER_FORMAT_JSON
@@ -175,6 +273,20 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     if self._serialized_event_heap.data_size > self._maximum_buffer_size:
       self._WriteSerializedAttributeContainerList(self._CONTAINER_TYPE_EVENT)
 
+  def _BuildEventTagIndex(self):
+    """Builds the event tag index from the stored event tags.
+
+    This is needed for a store that was written before the event tag index
+    was maintained.
+    """
+    for event_tag in self._GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG, order_by='_identifier'):
+      event_tag_identifier = event_tag.GetIdentifier()
+      self._event_tag_index[event_tag.event_row_identifier] = (
+          event_tag_identifier.row_identifier)
+
+    self._WriteEventTagIndex()
+
   @classmethod
   def _CheckStorageMetadata(cls, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
@@ -199,7 +311,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     except (TypeError, ValueError):
       raise IOError('Invalid format version: {0!s}.'.format(format_version))
 
-    if not check_readable_only and format_version != cls._FORMAT_VERSION:
+    if (not check_readable_only and
+        format_version < cls._APPEND_COMPATIBLE_FORMAT_VERSION):
       raise IOError('Format version: {0:d} is not supported.'.format(
           format_version))
 
@@ -220,6 +333,12 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       raise IOError('Unsupported compression format: {0:s}'.format(
           compression_format))
 
+    if (compression_format == definitions.COMPRESSION_FORMAT_ZLIB_DICTIONARY
+        and sys.version_info[0] < 3):
+      raise IOError(
+          'Compression format: {0:s} is not supported on Python 2.'.format(
+              compression_format))
+
     serialization_format = metadata_values.get('serialization_format', None)
     if serialization_format != definitions.SERIALIZER_FORMAT_JSON:
       raise IOError('Unsupported serialization format: {0:s}'.format(
@@ -230,6 +349,100 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       raise IOError('Unsupported storage type: {0:s}'.format(
           storage_type))
 
+  def _CompressSerializedData(
+      self, serialized_data_list, compression_dictionary=None):
+    """Compresses serialized attribute containers.
+
+    Large lists are divided over the compression threads, which compress
+    concurrently since zlib releases the GIL while compressing.
+
+    Args:
+      serialized_data_list (list[bytes]): serialized attribute containers.
+      compression_dictionary (Optional[bytes]): compression dictionary or
+          None if no compression dictionary should be used.
+
+    Returns:
+      list[bytes]: compressed serialized attribute containers, in the order
+          of the serialized attribute containers.
+    """
+    compression_level = self._compression_level
+
+    primed_compressor = None
+    if compression_dictionary:
+      # Priming a compressor with the compression dictionary is more costly
+      # than copying the primed compressor for every attribute container.
+      primed_compressor = zlib.compressobj(
+          compression_level, zlib.DEFLATED,
+          self._COMPRESSION_DICTIONARY_WINDOW_BITS,
+          self._COMPRESSION_DICTIONARY_MEMORY_LEVEL, zlib.Z_DEFAULT_STRATEGY,
+          compression_dictionary)
+
+    def _CompressList(serialized_data_chunk):
+      """Compresses a list of serialized attribute containers.
+
+      Args:
+        serialized_data_chunk (list[bytes]): serialized attribute containers.
+
+      Returns:
+        list[bytes]: compressed serialized attribute containers.
+      """
+      if not primed_compressor:
+        return [
+            zlib.compress(serialized_data, compression_level)
+            for serialized_data in serialized_data_chunk]
+
+      compressed_data_chunk = []
+      for serialized_data in serialized_data_chunk:
+        compressor = primed_compressor.copy()
+        compressed_data_chunk.append(
+            compressor.compress(serialized_data) + compressor.flush())
+
+      return compressed_data_chunk
+
+    if (not self._compression_thread_pool or len(serialized_data_list) <
+        self._MINIMUM_NUMBER_OF_THREADED_COMPRESSIONS):
+      return _CompressList(serialized_data_list)
+
+    number_of_containers = len(serialized_data_list)
+    chunk_size, remainder = divmod(
+        number_of_containers, self._number_of_compression_threads)
+    if remainder:
+      chunk_size += 1
+
+    chunks = [
+        serialized_data_list[index:index + chunk_size]
+        for index in range(0, number_of_containers, chunk_size)]
+
+    compressed_chunks = self._compression_thread_pool.map(_CompressList, chunks)
+
+    return [
+        compressed_data for compressed_chunk in compressed_chunks
+        for compressed_data in compressed_chunk]
+
+  @classmethod
+  def _ConnectReadOnly(cls, path):
+    """Connects to a database file in read-only mode.
+
+    The database file is opened as immutable, which disables locking and
+    change detection, hence it must not be modified while it is open.
+
+    Args:
+      path (str): path of the database file.
+
+    Returns:
+      sqlite3.Connection: database connection.
+
+    Raises:
+      sqlite3.DatabaseError: if the database file cannot be opened.
+    """
+    if sys.version_info[0] < 3:
+      # URI filenames are not supported by the Python 2 sqlite3 module.
+      return sqlite3.connect(path)
+
+    uri = 'file:{0:s}?mode=ro&immutable=1'.format(
+        pathname2url(os.path.abspath(path)))
+    return sqlite3.connect(uri, uri=True)
+
   def _CountStoredAttributeContainers(self, container_type):
     """Counts the number of attribute containers of the given type.
 
@@ -260,6 +473,76 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     return row[0] or 0
 
+  def _DecompressSerializedData(self, container_type, compressed_data):
+    """Decompresses a serialized attribute container.
+
+    Args:
+      container_type (str): attribute container type.
+      compressed_data (bytes): compressed serialized attribute container.
+
+    Returns:
+      bytes: serialized attribute container.
+    """
+    compression_dictionary = self._compression_dictionaries.get(
+        container_type, None)
+    if not compression_dictionary:
+      return zlib.decompress(compressed_data)
+
+    decompressor = zlib.decompressobj(zdict=compression_dictionary)
+    return decompressor.decompress(compressed_data) + decompressor.flush()
+
+  def _GetCompressionDictionary(self, container_type, serialized_data_list):
+    """Retrieves the compression dictionary of a container type.
+
+    The compression dictionary is created from samples of the first serialized
+    attribute containers of the type that are written and is stored in the
+    metadata, such that all attribute containers of the type are compressed
+    with the same compression dictionary.
+
+    Args:
+      container_type (str): attribute container type.
+      serialized_data_list (list[bytes]): serialized attribute containers
+          that are about to be written.
+
+    Returns:
+      bytes: compression dictionary or None if the container type is not
+          compressed with a compression dictionary.
+    """
+    if (self.compression_format !=
+        definitions.COMPRESSION_FORMAT_ZLIB_DICTIONARY or
+        container_type not in self._COMPRESSION_DICTIONARY_CONTAINER_TYPES):
+      return None
+
+    compression_dictionary = self._compression_dictionaries.get(
+        container_type, None)
+    if compression_dictionary or not serialized_data_list:
+      return compression_dictionary
+
+    samples = serialized_data_list[
+        :self._NUMBER_OF_COMPRESSION_DICTIONARY_SAMPLES]
+
+    average_sample_size = max(
+        1, sum([len(sample) for sample in samples]) // len(samples))
+    number_of_samples = max(
+        1, self._MAXIMUM_COMPRESSION_DICTIONARY_SIZE // average_sample_size)
+    sample_step = max(1, len(samples) // number_of_samples)
+
+    # zlib references recent data with the shortest distances, hence the end
+    # of the sampled data is kept.
+    compression_dictionary = b''.join(samples[::sample_step])
+    compression_dictionary = compression_dictionary[
+        -self._MAXIMUM_COMPRESSION_DICTIONARY_SIZE:]
+
+    query = 'INSERT INTO metadata (key, value) VALUES (?, ?)'
+    key = '{0:s}{1:s}'.format(
+        self._COMPRESSION_DICTIONARY_METADATA_KEY_PREFIX, container_type)
+    value = base64.b64encode(compression_dictionary).decode('ascii')
+    self._cursor.execute(query, (key, value))
+
+    self._compression_dictionaries[container_type] = compression_dictionary
+
+    return compression_dictionary
+
   def _GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -289,8 +572,9 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       identifier = identifiers.SQLTableIdentifier(
           container_type, sequence_number)
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        serialized_data = zlib.decompress(row[0])
+      if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+        serialized_data = self._DecompressSerializedData(
+            container_type, row[0])
       else:
         serialized_data = row[0]
 
@@ -351,25 +635,27 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       raise IOError('Unable to query storage file with error: {0!s}'.format(
           exception))
 
-    row = cursor.fetchone()
-    while row:
-      identifier = identifiers.SQLTableIdentifier(container_type, row[0])
+    rows = cursor.fetchmany(size=self._MAXIMUM_NUMBER_OF_FETCHED_ROWS)
+    while rows:
+      for row in rows:
+        identifier = identifiers.SQLTableIdentifier(container_type, row[0])
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        serialized_data = zlib.decompress(row[1])
-      else:
-        serialized_data = row[1]
+        if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+          serialized_data = self._DecompressSerializedData(
+              container_type, row[1])
+        else:
+          serialized_data = row[1]
 
-      if self._storage_profiler:
-        self._storage_profiler.Sample(
-            'read', container_type, len(serialized_data), len(row[1]))
+        if self._storage_profiler:
+          self._storage_profiler.Sample(
+              'read', container_type, len(serialized_data), len(row[1]))
 
-      attribute_container = self._DeserializeAttributeContainer(
-          container_type, serialized_data)
-      attribute_container.SetIdentifier(identifier)
-      yield attribute_container
+        attribute_container = self._DeserializeAttributeContainer(
+            container_type, serialized_data)
+        attribute_container.SetIdentifier(identifier)
+        yield attribute_container
 
-      row = cursor.fetchone()
+      rows = cursor.fetchmany(size=self._MAXIMUM_NUMBER_OF_FETCHED_ROWS)
 
   # TODO: determine if this method should account for non-stored attribute
   # containers or that it is better to rename the method to
@@ -422,6 +708,14 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     self.serialization_format = metadata_values['serialization_format']
     self.storage_type = metadata_values['storage_type']
 
+    self._compression_dictionaries = {}
+    for key, value in iter(metadata_values.items()):
+      if key.startswith(self._COMPRESSION_DICTIONARY_METADATA_KEY_PREFIX):
+        container_type = key[
+            len(self._COMPRESSION_DICTIONARY_METADATA_KEY_PREFIX):]
+        self._compression_dictionaries[container_type] = base64.b64decode(
+            value)
+
   def _WriteAttributeContainer(self, attribute_container):
     """Writes an attribute container.
 
@@ -435,8 +729,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     else:
       serialized_data = self._SerializeAttributeContainer(attribute_container)
 
-    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-      compressed_data = zlib.compress(serialized_data)
+    if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+      compressed_data = self._CompressSerializedData(
+          [serialized_data], compression_dictionary=(
+              self._compression_dictionaries.get(
+                  attribute_container.CONTAINER_TYPE, None)))[0]
       serialized_data = sqlite3.Binary(compressed_data)
     else:
       compressed_data = ''
@@ -458,6 +755,18 @@ class SQLiteStorageFile(interface.BaseStorageFile):
         attribute_container.CONTAINER_TYPE, self._cursor.lastrowid)
     attribute_container.SetIdentifier(identifier)
 
+  def _WriteEventTagIndex(self):
+    """Writes the event tag index entries that have not been written."""
+    if not self._event_tag_index:
+      return
+
+    query = (
+        'INSERT OR REPLACE INTO event_tag_index (_event_row_identifier, '
+        '_event_tag_row_identifier) VALUES (?, ?)')
+    self._cursor.executemany(query, list(self._event_tag_index.items()))
+
+    self._event_tag_index = {}
+
   def _WriteSerializedAttributeContainerList(self, container_type):
     """Writes a serialized attribute container list.
 
@@ -487,31 +796,51 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     else:
       query = 'INSERT INTO {0:s} (_data) VALUES (?)'.format(container_type)
 
-    # TODO: directly use container_list instead of values_tuple_list.
-    values_tuple_list = []
+    timestamps = []
+    serialized_data_list = []
     for _ in range(number_of_attribute_containers):
       if container_type == self._CONTAINER_TYPE_EVENT:
         timestamp, serialized_data = self._serialized_event_heap.PopEvent()
+        timestamps.append(timestamp)
       else:
         serialized_data = container_list.PopAttributeContainer()
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
-        serialized_data = sqlite3.Binary(compressed_data)
+      serialized_data_list.append(serialized_data)
+
+    if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+      compression_dictionary = self._GetCompressionDictionary(
+          container_type, serialized_data_list)
+      compressed_data_list = self._CompressSerializedData(
+          serialized_data_list, compression_dictionary=compression_dictionary)
+    else:
+      compressed_data_list = None
+
+    values_tuple_list = []
+    for index, serialized_data in enumerate(serialized_data_list):
+      if compressed_data_list:
+        compressed_data = compressed_data_list[index]
+        data = sqlite3.Binary(compressed_data)
       else:
         compressed_data = ''
+        data = serialized_data
 
       if self._storage_profiler:
         self._storage_profiler.Sample(
             'write', container_type, len(serialized_data), len(compressed_data))
 
       if container_type == self._CONTAINER_TYPE_EVENT:
-        values_tuple_list.append((timestamp, serialized_data))
+        values_tuple_list.append((timestamps[index], data))
       else:
-        values_tuple_list.append((serialized_data, ))
+        values_tuple_list.append((data, ))
 
     self._cursor.executemany(query, values_tuple_list)
 
+    if container_type == self._CONTAINER_TYPE_EVENT_TAG:
+      self._WriteEventTagIndex()
+
+    # Every flushed buffer is committed as a single transaction.
+    self._connection.commit()
+
     if self._serializers_profiler:
       self._serializers_profiler.StopTiming('write')
 
@@ -649,6 +978,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     self._AddAttributeContainer(self._CONTAINER_TYPE_EVENT_TAG, event_tag)
 
+    # An event tag replaces the previously added event tag of the event.
+    event_tag_identifier = event_tag.GetIdentifier()
+    self._event_tag_index[event_identifier.row_identifier] = (
+        event_tag_identifier.row_identifier)
+
   def AddEventTags(self, event_tags):
     """Adds event tags.
 
@@ -680,8 +1014,7 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       bool: True if the format is supported.
     """
     try:
-      connection = sqlite3.connect(
-          path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
+      connection = cls._ConnectReadOnly(path)
 
       cursor = connection.cursor()
 
@@ -722,6 +1055,15 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       self._WriteSerializedAttributeContainerList(
           self._CONTAINER_TYPE_EXTRACTION_WARNING)
 
+      # Event tags added after the last flush of the event tags can still
+      # have unwritten event tag index entries.
+      self._WriteEventTagIndex()
+
+    if self._compression_thread_pool:
+      self._compression_thread_pool.close()
+      self._compression_thread_pool.join()
+      self._compression_thread_pool = None
+
     if self._connection:
       # We need to run commit or not all data is stored in the database.
       self._connection.commit()
@@ -730,6 +1072,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       self._connection = None
       self._cursor = None
 
+    self._event_tag_index = {}
+    self._has_event_tag_index = False
     self._is_open = False
 
   def GetAnalysisReports(self):
@@ -826,6 +1170,42 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     """
     return self._GetAttributeContainers(self._CONTAINER_TYPE_EVENT_SOURCE)
 
+  def GetEventTagByEventIdentifier(self, event_identifier):
+    """Retrieves the most recently added event tag of an event.
+
+    Args:
+      event_identifier (SQLTableIdentifier): event identifier.
+
+    Returns:
+      EventTag: event tag or None if the event has no event tag.
+
+    Raises:
+      NotImplementedError: if the store does not contain an event tag index.
+    """
+    if not self._has_event_tag_index:
+      raise NotImplementedError('Event tag index not supported.')
+
+    # The unwritten event tag index entries are more recent than the written
+    # ones.
+    event_tag_row_identifier = self._event_tag_index.get(
+        event_identifier.row_identifier, None)
+
+    if event_tag_row_identifier is None:
+      query = (
+          'SELECT _event_tag_row_identifier FROM event_tag_index '
+          'WHERE _event_row_identifier = ?')
+      self._cursor.execute(query, (event_identifier.row_identifier, ))
+
+      row = self._cursor.fetchone()
+      if not row:
+        return None
+
+      event_tag_row_identifier = row[0]
+
+    event_tag_identifier = identifiers.SQLTableIdentifier(
+        self._CONTAINER_TYPE_EVENT_TAG, event_tag_row_identifier)
+    return self.GetEventTagByIdentifier(event_tag_identifier)
+
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
 
@@ -986,6 +1366,17 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     """
     return self._HasAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG)
 
+  def HasEventTagIndex(self):
+    """Determines if a store contains an event tag index.
+
+    Stores written before the event tag index was maintained only contain
+    an event tag index after they have been opened for writing.
+
+    Returns:
+      bool: True if the event tags can be retrieved by event identifier.
+    """
+    return self._has_event_tag_index
+
   # pylint: disable=arguments-differ
   def Open(self, path=None, read_only=True, **unused_kwargs):
     """Opens the storage.
@@ -993,7 +1384,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     Args:
       path (Optional[str]): path to the storage file.
       read_only (Optional[bool]): True if the file should be opened in
-          read-only mode.
+          read-only mode. A storage file opened in read-only mode must not
+          be modified while it is open.
 
     Raises:
       IOError: if the storage file is already opened or if the database
@@ -1010,8 +1402,16 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     path = os.path.abspath(path)
 
-    connection = sqlite3.connect(
-        path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
+    if read_only:
+      try:
+        connection = self._ConnectReadOnly(path)
+      except sqlite3.DatabaseError as exception:
+        raise IOError('Unable to open storage file with error: {0!s}'.format(
+            exception))
+
+    else:
+      connection = sqlite3.connect(
+          path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
 
     cursor = connection.cursor()
     if not cursor:
@@ -1023,19 +1423,35 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     self._read_only = read_only
 
     if read_only:
+      # Reading a store is mostly sequential hence a large page cache and
+      # memory-mapped I/O reduce the number of read system calls.
+      self._cursor.execute('PRAGMA cache_size=-{0:d}'.format(
+          self._READ_ONLY_CACHE_SIZE))
+      self._cursor.execute('PRAGMA mmap_size={0:d}'.format(
+          self._READ_ONLY_MMAP_SIZE))
+
       self._ReadAndCheckStorageMetadata(check_readable_only=True)
-    else:
-      # self._cursor.execute('PRAGMA journal_mode=MEMORY')
 
+      self._has_event_tag_index = self._HasTable('event_tag_index')
+    else:
       # Turn off insert transaction integrity since we want to do bulk insert.
       self._cursor.execute('PRAGMA synchronous=OFF')
 
       if not self._HasTable('metadata'):
+        # The rollback journal of a new storage file is kept in memory,
+        # which avoids writing every changed page twice while a failed
+        # transaction can still be rolled back. An existing storage file,
+        # such as the one psort adds analysis results to, keeps its rollback
+        # journal on disk. The page size must be set before the first table
+        # is created.
+        self._cursor.execute('PRAGMA page_size={0:d}'.format(self._PAGE_SIZE))
+        self._cursor.execute('PRAGMA journal_mode=MEMORY')
+
         self._WriteStorageMetadata()
       else:
         self._ReadAndCheckStorageMetadata()
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
         data_column_type = 'BLOB'
       else:
         data_column_type = 'TEXT'
@@ -1050,8 +1466,22 @@ class SQLiteStorageFile(interface.BaseStorageFile):
                 container_type, data_column_type)
           self._cursor.execute(query)
 
+      if not self._HasTable('event_tag_index'):
+        self._cursor.execute(self._CREATE_EVENT_TAG_INDEX_TABLE_QUERY)
+        self._BuildEventTagIndex()
+
+      self._has_event_tag_index = True
+
       self._connection.commit()
 
+      # Only the session storage file receives enough attribute containers
+      # to compress concurrently, task storage files are not compressed.
+      if (self.storage_type == definitions.STORAGE_TYPE_SESSION and
+          self.compression_format != definitions.COMPRESSION_FORMAT_NONE and
+          self._number_of_compression_threads > 1):
+        self._compression_thread_pool = pool.ThreadPool(
+            processes=self._number_of_compression_threads)
+
     last_session_start = self._CountStoredAttributeContainers(
         self._CONTAINER_TYPE_SESSION_START)
 
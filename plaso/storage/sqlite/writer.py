@@ -10,13 +10,32 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageFileWriter(interface.StorageFileWriter):
   """SQLite-based storage file writer."""
 
+  def __init__(
+      self, session, output_file, compression_level=None,
+      storage_type=definitions.STORAGE_TYPE_SESSION, task=None):
+    """Initializes a storage writer.
+
+    Args:
+      session (Session): session the storage changes are part of.
+      output_file (str): path to the output file.
+      compression_level (Optional[int]): zlib compression level, from 0 to 9,
+          where None represents the zlib default.
+      storage_type (Optional[str]): storage type.
+      task(Optional[Task]): task.
+    """
+    super(SQLiteStorageFileWriter, self).__init__(
+        session, output_file, storage_type=storage_type, task=task)
+    self._compression_level = compression_level
+
   def _CreateStorageFile(self):
     """Creates a storage file.
 
     Returns:
       SQLiteStorageFile: storage file.
     """
-    return sqlite_file.SQLiteStorageFile(storage_type=self._storage_type)
+    return sqlite_file.SQLiteStorageFile(
+        compression_level=self._compression_level,
+        storage_type=self._storage_type)
 
   def _CreateTaskStorageMergeReader(self, path):
     """Creates a task storage merge reader.
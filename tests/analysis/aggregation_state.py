@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the state of the values aggregated by an analysis plugin."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.analysis import aggregation_state
+
+from tests import test_lib as shared_test_lib
+
+
+class AggregationStateTest(shared_test_lib.BaseTestCase):
+  """Tests for the state of the values aggregated by an analysis plugin."""
+
+  # pylint: disable=protected-access
+
+  def testAddAndGetSetValues(self):
+    """Tests the AddSetValue and GetSetValues functions."""
+    for maximum_number_of_buffered_values in (3, 100):
+      state = aggregation_state.AggregationState(
+          maximum_number_of_buffered_values=maximum_number_of_buffered_values)
+
+      for value in ['c.com', 'a.com', 'c.com', 'b.com', 'a.com', 'd.com']:
+        state.AddSetValue('domains', value)
+      state.AddSetValue('other', 'a.com')
+
+      self.assertEqual(
+          state._connection is not None, maximum_number_of_buffered_values == 3)
+
+      values = list(state.GetSetValues('domains'))
+      self.assertEqual(values, ['a.com', 'b.com', 'c.com', 'd.com'])
+
+      values = list(state.GetSetValues('bogus'))
+      self.assertEqual(values, [])
+
+      state.Close()
+
+  def testIncrementAndGetCounterValues(self):
+    """Tests the IncrementCounter and GetCounterValues functions."""
+    for maximum_number_of_buffered_values in (2, 100):
+      state = aggregation_state.AggregationState(
+          maximum_number_of_buffered_values=maximum_number_of_buffered_values)
+
+      for key in [0, 0, 1, 2, 0, 10, 2, 1]:
+        state.IncrementCounter('sessions', key)
+      state.IncrementCounter('sessions', 10, increment=5)
+
+      counter_values = list(state.GetCounterValues('sessions'))
+      self.assertEqual(counter_values, [(0, 3), (1, 2), (2, 2), (10, 6)])
+
+      state.Close()
+
+  def testAddAndGetGroups(self):
+    """Tests the AddGroupValue and GetGroups functions."""
+    for maximum_number_of_buffered_values in (2, 100):
+      state = aggregation_state.AggregationState(
+          maximum_number_of_buffered_values=maximum_number_of_buffered_values)
+
+      state.AddGroupValue('services', 'zeta', ('SYSTEM', 'ControlSet001'))
+      state.AddGroupValue('services', 'alpha', ('SYSTEM', 'ControlSet001'))
+      state.AddGroupValue('services', 'zeta', ('SYSTEM', 'ControlSet002'))
+      state.AddGroupValue('services', 'beta', ('SYSTEM', 'ControlSet002'))
+      state.AddGroupValue('services', 'alpha', ('SYSTEM', 'ControlSet002'))
+
+      groups = list(state.GetGroups('services'))
+      self.assertEqual(groups, [
+          ('zeta', [('SYSTEM', 'ControlSet001'), ('SYSTEM', 'ControlSet002')]),
+          ('alpha', [('SYSTEM', 'ControlSet001'), ('SYSTEM', 'ControlSet002')]),
+          ('beta', [('SYSTEM', 'ControlSet002')])])
+
+      state.Close()
+      self.assertIsNone(state._connection)
+      self.assertEqual(list(state.GetGroups('services')), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -8,11 +8,129 @@ import unittest
 
 from plaso.analysis import browser_search
 from plaso.parsers import sqlite
+from plaso.parsers import sqlite_plugins  # pylint: disable=unused-import
 
 from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
+class BrowserSearchURLMatchingTest(shared_test_lib.BaseTestCase):
+  """Tests for the URL matching of the browser search analysis plugin."""
+
+  # pylint: disable=protected-access
+
+  _URLS = [
+      'https://www.bing.com/search?q=funny+cats&qs=n&form=QBLH',
+      'https://www.bing.com/images/search?q=cats&FORM=HDRSC2',
+      'https://duckduckgo.com/?q=plaso+timeline&t=h_&ia=web',
+      'https://duckduckgo.com/?t=h_&ia=web',
+      'https://mail.google.com/mail/u/0/#search/invoice+2018',
+      'https://mail.google.com/mail/u/0/#search/flight/15f1c1a7b7c1a2b3',
+      'https://mail.google.com/mail/u/0/#inbox',
+      'https://docs.google.com/document/u/0/?q=budget+2019&tgif=d',
+      'https://docs.google.com/spreadsheets/d/1abc/edit#gid=0',
+      'https://drive.google.com/drive/search?q=tax%20return',
+      'https://drive.google.com/drive/my-drive',
+      'https://www.google.com/search?q=really+really+funny+cats&ie=utf-8',
+      'https://www.google.nl/search?source=hp&q=java+plugin&oq=java',
+      'https://encrypted.google.com/search?hl=en&q=funnycats.exe',
+      'https://www.google.com/search?q=caf%C3%A9+parijs',
+      'https://www.google.com/search?q=%E4%B8%AD%E6%96%87',
+      'https://www.google.com/search?q=bad%ff%fe+encoding',
+      'https://www.google.com/search?q=youtube.com+duckduckgo.com',
+      'https://www.google.com/webhp?hl=en',
+      'https://www.google.com/url?q=https://www.bing.com/search%3Fq%3Dx',
+      'https://sites.google.com/site/plaso/system/app/pages/search?q=parser',
+      'https://sites.google.com/site/plaso/home',
+      'https://search.yahoo.com/search?p=weather+amsterdam&fr=yfp-t',
+      'https://search.yahoo.com/search;_ylt=A0geK?p=plaso&fr2=sb-top',
+      'https://search.yahoo.com/search?fr=yfp-t',
+      'https://www.yandex.com/search/?text=forensic+timeline&lr=87',
+      'https://yandex.com/search/?lr=87',
+      'https://www.youtube.com/results?search_query=log2timeline+tutorial',
+      'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+      'https://github.com/search?q=plaso&type=Repositories',
+      'https://en.wikipedia.org/wiki/Special:Search?search=timeline',
+      'http://www.example.com/index.html',
+      'file:///C:/Users/test/Documents/report.pdf',
+      'about:blank',
+      '']
+
+  def _GetSearchQueriesWithFilters(self, plugin, url):
+    """Retrieves the search queries of an URL by trying every filter.
+
+    This is how the plugin matched URLs before the filters were combined
+    into a single expression.
+
+    Args:
+      plugin (BrowserSearchPlugin): browser search analysis plugin.
+      url (str): URL.
+
+    Returns:
+      list[tuple[str, str]]: search engine and decoded search query, per
+          filter that matches the URL.
+    """
+    search_queries = []
+    for engine, url_expression, method_name in plugin._URL_FILTERS:
+      if not url_expression.search(url):
+        continue
+
+      search_query = getattr(plugin, method_name)(url)
+      if not search_query:
+        continue
+
+      search_query = plugin._DecodeURL(search_query)
+      if search_query:
+        search_queries.append((engine, search_query))
+
+    return search_queries
+
+  def testGetSearchQueries(self):
+    """Tests the _GetSearchQueries function."""
+    plugin = browser_search.BrowserSearchPlugin()
+
+    for url in self._URLS:
+      expected_search_queries = self._GetSearchQueriesWithFilters(plugin, url)
+      self.assertEqual(
+          plugin._GetSearchQueries(url), expected_search_queries, msg=url)
+
+      # The search queries of the second lookup come from the cache.
+      self.assertEqual(
+          plugin._GetSearchQueries(url), expected_search_queries, msg=url)
+
+    search_queries = plugin._GetSearchQueries(
+        'https://www.google.com/search?q=youtube.com+duckduckgo.com')
+    self.assertEqual(search_queries, [
+        ('DuckDuckGo', 'youtube.com duckduckgo.com'),
+        ('Google Search', 'youtube.com duckduckgo.com'),
+        ('Youtube', 'youtube.com duckduckgo.com')])
+
+    search_queries = plugin._GetSearchQueries(
+        'https://www.google.com/search?q=caf%C3%A9+parijs')
+    self.assertEqual(search_queries, [('Google Search', 'caf\xe9 parijs')])
+
+    self.assertEqual(
+        plugin._GetSearchQueries('http://www.example.com/index.html'), [])
+
+  def testSearchQueriesCache(self):
+    """Tests that the number of cached search queries is bounded."""
+    plugin = browser_search.BrowserSearchPlugin()
+    plugin._MAXIMUM_CACHED_URLS = 10
+
+    for index in range(100):
+      url = 'https://www.google.com/search?q=term{0:d}'.format(index)
+      search_queries = plugin._GetSearchQueries(url)
+      self.assertEqual(
+          search_queries, [('Google Search', 'term{0:d}'.format(index))])
+
+    self.assertEqual(len(plugin._search_queries_cache), 10)
+
+    # URLs that do not match any filter are not cached.
+    plugin._GetSearchQueries('http://www.example.com/index.html')
+    self.assertNotIn(
+        'http://www.example.com/index.html', plugin._search_queries_cache)
+
+
 @shared_test_lib.skipUnlessHasTestFile(['History'])
 class BrowserSearchAnalysisTest(test_lib.AnalysisPluginTestCase):
   """Tests for the browser search analysis plugin."""
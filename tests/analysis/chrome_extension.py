@@ -5,55 +5,115 @@
 from __future__ import unicode_literals
 
 import os
+import threading
+import time
 import unittest
 
+try:
+  from http import server as http_server
+except ImportError:
+  import BaseHTTPServer as http_server  # pylint: disable=import-error
+
+try:
+  import socketserver
+except ImportError:
+  import SocketServer as socketserver  # pylint: disable=import-error
+
 from plaso.analysis import chrome_extension
+from plaso.analysis import chrome_extension_resolvers
 
 from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
-class MockChromeExtensionPlugin(chrome_extension.ChromeExtensionPlugin):
-  """Chrome extension analysis plugin used for testing."""
+class _WebStoreRequestHandler(http_server.BaseHTTPRequestHandler):
+  """Request handler of a local Chrome Web Store stand-in for testing."""
 
-  NAME = 'chrome_extension_test'
-
-  _TEST_DATA_PATH = os.path.join(os.getcwd(), 'test_data')
+  # The following methods are part of the BaseHTTPRequestHandler interface,
+  # hence their names do not follow the style guide.
+  # pylint: disable=invalid-name
 
-  def _GetChromeWebStorePage(self, extension_identifier):
-    """Retrieves the page for the extension from the Chrome store website.
+  def do_GET(self):
+    """Answers a GET request with the page of an extension."""
+    with self.server.lock:
+      self.server.number_of_requests += 1
 
-    Args:
-      extension_identifier (str): Chrome extension identifier.
+    if self.server.delay:
+      time.sleep(self.server.delay)
 
-    Returns:
-      str: page content or None if not available.
-    """
-    chrome_web_store_file = shared_test_lib.GetTestFilePath([
+    extension_identifier = self.path.strip('/')
+    page_path = shared_test_lib.GetTestFilePath([
         'chrome_extensions', extension_identifier])
-    if not os.path.exists(chrome_web_store_file):
-      return None
 
-    with open(chrome_web_store_file, 'rb') as file_object:
+    if not extension_identifier.isalpha() or not os.path.isfile(page_path):
+      self.send_response(404)
+      self.end_headers()
+      return
+
+    with open(page_path, 'rb') as file_object:
       page_content = file_object.read()
 
-    return page_content.decode('utf-8')
+    self.send_response(200)
+    self.send_header('Content-Type', 'text/html; charset=utf-8')
+    self.send_header('Content-Length', '{0:d}'.format(len(page_content)))
+    self.end_headers()
+    self.wfile.write(page_content)
 
-  def _GetTestFilePath(self, path_segments):
-    """Retrieves the path of a test file in the test data directory.
+  # pylint: disable=redefined-builtin,unused-argument
+  def log_message(self, format, *args):
+    """Does not log requests."""
+    return
 
-    Args:
-    path_segments (list[str]): path segments inside the test data directory.
 
-    Returns:
-      str: path of the test file.
-    """
-    # Note that we need to pass the individual path segments to os.path.join
-    # and not a list.
-    return os.path.join(self._TEST_DATA_PATH, *path_segments)
+class _WebStoreServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
+  """Local Chrome Web Store stand-in for testing.
+
+  Attributes:
+    delay (float): number of seconds to wait before answering a request.
+    lock (threading.Lock): lock of the number of requests.
+    number_of_requests (int): number of requests answered.
+  """
+
+  daemon_threads = True
+
+  def __init__(self):
+    """Initializes a Chrome Web Store stand-in."""
+    http_server.HTTPServer.__init__(
+        self, ('127.0.0.1', 0), _WebStoreRequestHandler)
+    self.delay = 0
+    self.lock = threading.Lock()
+    self.number_of_requests = 0
 
+  @property
+  def web_store_url(self):
+    """str: format string of the URL of the page of an extension."""
+    return 'http://127.0.0.1:{0:d}/'.format(self.server_address[1]) + '{xid}'
 
-class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
+
+class WebStoreTestCase(test_lib.AnalysisPluginTestCase):
+  """Test case that runs a local Chrome Web Store stand-in."""
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._server = _WebStoreServer()
+    self._server_thread = threading.Thread(target=self._server.serve_forever)
+    self._server_thread.daemon = True
+    self._server_thread.start()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    self._server.shutdown()
+    self._server.server_close()
+    self._server_thread.join()
+
+
+class MockChromeExtensionPlugin(chrome_extension.ChromeExtensionPlugin):
+  """Chrome extension analysis plugin used for testing."""
+
+  NAME = 'chrome_extension_test'
+
+
+class ChromeExtensionTest(WebStoreTestCase):
   """Tests for the chrome extension analysis plugin."""
 
   # pylint: disable=protected-access
@@ -91,10 +151,20 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
       {'name': 'dude', 'path': 'C:\\Users\\dude', 'sid': 'S-1'},
       {'name': 'frank', 'path': 'C:\\Users\\frank', 'sid': 'S-2'}]
 
+  def _CreatePlugin(self):
+    """Creates a plugin that uses the Chrome Web Store stand-in.
+
+    Returns:
+      MockChromeExtensionPlugin: Chrome extension analysis plugin.
+    """
+    plugin = MockChromeExtensionPlugin()
+    plugin._WEB_STORE_URL = self._server.web_store_url
+    return plugin
+
   @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
   def testGetPathSegmentSeparator(self):
     """Tests the _GetPathSegmentSeparator function."""
-    plugin = MockChromeExtensionPlugin()
+    plugin = self._CreatePlugin()
 
     for path in self._MACOS_PATHS:
       path_segment_separator = plugin._GetPathSegmentSeparator(path)
@@ -105,6 +175,7 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
       self.assertEqual(path_segment_separator, '\\')
 
   @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions.json'])
   def testExamineEventAndCompileReportMacOSPaths(self):
     """Tests the ExamineEvent and CompileReport functions on MacOS paths."""
     events = []
@@ -118,10 +189,16 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
       event = self._CreateTestEventObject(event_dictionary)
       events.append(event)
 
-    plugin = MockChromeExtensionPlugin()
+    plugin = self._CreatePlugin()
+    plugin.SetDatabasePath(
+        shared_test_lib.GetTestFilePath(['chrome_extensions.json']))
+
     storage_writer = self._AnalyzeEvents(
         events, plugin, knowledge_base_values={'users': self._MACOS_USERS})
 
+    # The names of the extensions are in the local database.
+    self.assertEqual(self._server.number_of_requests, 0)
+
     self.assertEqual(len(storage_writer.analysis_reports), 1)
 
     analysis_report = storage_writer.analysis_reports[0]
@@ -159,10 +236,12 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
       event = self._CreateTestEventObject(event_dictionary)
       events.append(event)
 
-    plugin = MockChromeExtensionPlugin()
+    plugin = self._CreatePlugin()
     storage_writer = self._AnalyzeEvents(
         events, plugin, knowledge_base_values={'users': self._WINDOWS_USERS})
 
+    self.assertEqual(self._server.number_of_requests, 3)
+
     self.assertEqual(len(storage_writer.analysis_reports), 1)
 
     analysis_report = storage_writer.analysis_reports[0]
@@ -188,5 +267,187 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
     self.assertEqual(set(analysis_report.report_dict.keys()), expected_keys)
 
 
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
+  def testExamineEventAndCompileReportOffline(self):
+    """Tests the ExamineEvent and CompileReport functions without network."""
+    events = []
+    for path in self._WINDOWS_PATHS:
+      event_dictionary = {
+          'data_type': 'fs:stat',
+          'filename': path,
+          'timestamp': 12345,
+          'timestamp_desc': 'Some stuff'}
+
+      event = self._CreateTestEventObject(event_dictionary)
+      events.append(event)
+
+    plugin = self._CreatePlugin()
+    plugin.SetNetworkLookup(False)
+
+    storage_writer = self._AnalyzeEvents(
+        events, plugin, knowledge_base_values={'users': self._WINDOWS_USERS})
+
+    self.assertEqual(self._server.number_of_requests, 0)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    # Unresolved extensions are reported by their identifier.
+    expected_text = '\n'.join([
+        ' == USER: dude ==',
+        ('  hmjkmjkepdijhoojdojkdfohbdgmmhki '
+         '[hmjkmjkepdijhoojdojkdfohbdgmmhki]'),
+        '',
+        ' == USER: frank ==',
+        ('  blpcfgokakmgnkcojhhkbfbldkacnbeo '
+         '[blpcfgokakmgnkcojhhkbfbldkacnbeo]'),
+        ('  icppfcnhkcmnfdhfhphakoifcfokfdhg '
+         '[icppfcnhkcmnfdhfhphakoifcfokfdhg]'),
+        '',
+        ''])
+
+    self.assertEqual(analysis_report.text, expected_text)
+
+
+class ChromeExtensionResolversTest(WebStoreTestCase):
+  """Tests for the resolvers of the titles of Chrome extensions."""
+
+  # pylint: disable=protected-access
+
+  _EXTENSION_IDENTIFIERS = [
+      'apdfllckaahabafndbhieahigkjlhalf',
+      'blpcfgokakmgnkcojhhkbfbldkacnbeo',
+      'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa']
+
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions.json'])
+  def testDatabaseResolveTitles(self):
+    """Tests the ResolveTitles function of the database resolver."""
+    resolver = chrome_extension_resolvers.DatabaseChromeExtensionResolver(
+        shared_test_lib.GetTestFilePath(['chrome_extensions.json']))
+
+    titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+    self.assertEqual(titles, {
+        'apdfllckaahabafndbhieahigkjlhalf': 'Google Drive'})
+
+    resolver = chrome_extension_resolvers.DatabaseChromeExtensionResolver(
+        shared_test_lib.GetTestFilePath(['bogus.json']))
+
+    titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+    self.assertEqual(titles, {})
+
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
+  def testCachingResolveTitles(self):
+    """Tests the ResolveTitles function of the caching resolver."""
+    expected_titles = {
+        'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa': None,
+        'apdfllckaahabafndbhieahigkjlhalf': 'Google Drive',
+        'blpcfgokakmgnkcojhhkbfbldkacnbeo': 'YouTube'}
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      for _ in range(2):
+        web_store_resolver = (
+            chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+                web_store_url=self._server.web_store_url))
+        resolver = chrome_extension_resolvers.CachingChromeExtensionResolver(
+            path, resolver=web_store_resolver)
+
+        titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+        resolver.Close()
+
+        self.assertEqual(titles, expected_titles)
+
+        # The second time the titles, and the extension without a title, are
+        # resolved from the cache.
+        self.assertEqual(self._server.number_of_requests, 3)
+
+      resolver = chrome_extension_resolvers.CachingChromeExtensionResolver(
+          path, time_to_live=0)
+      resolver._GetConnection().execute(
+          'UPDATE chrome_extensions SET lookup_time = lookup_time - 10')
+
+      titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+      resolver.Close()
+
+      self.assertEqual(titles, {})
+
+    with self.assertRaises(ValueError):
+      chrome_extension_resolvers.CachingChromeExtensionResolver(
+          'cache.db', time_to_live=-1)
+
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
+  def testCachingResolveTitlesWithDatabaseErrors(self):
+    """Tests that database errors of the caching resolver are cache misses."""
+    expected_titles = {
+        'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa': None,
+        'apdfllckaahabafndbhieahigkjlhalf': 'Google Drive',
+        'blpcfgokakmgnkcojhhkbfbldkacnbeo': 'YouTube'}
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+      with open(path, 'wb') as file_object:
+        file_object.write(b'not a database' * 1024)
+
+      web_store_resolver = (
+          chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+              web_store_url=self._server.web_store_url))
+      resolver = chrome_extension_resolvers.CachingChromeExtensionResolver(
+          path, resolver=web_store_resolver)
+
+      titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+      self.assertEqual(titles, expected_titles)
+      self.assertIsNone(resolver._connection)
+
+      resolver.Close()
+
+      path = os.path.join(temp_directory, 'missing', 'cache.db')
+      resolver = chrome_extension_resolvers.CachingChromeExtensionResolver(
+          path)
+
+      titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+      self.assertEqual(titles, {})
+
+      resolver.Close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions'])
+  def testWebStoreResolveTitles(self):
+    """Tests the ResolveTitles function of the Chrome Web Store resolver."""
+    resolver = chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+        web_store_url=self._server.web_store_url)
+
+    titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+    self.assertEqual(titles, {
+        'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa': None,
+        'apdfllckaahabafndbhieahigkjlhalf': 'Google Drive',
+        'blpcfgokakmgnkcojhhkbfbldkacnbeo': 'YouTube'})
+
+    # Extensions that are not resolved before the deadline are not returned.
+    self._server.delay = 2
+
+    resolver = chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+        deadline=0.5, web_store_url=self._server.web_store_url)
+
+    start_time = time.time()
+    titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+    self.assertLess(time.time() - start_time, 1.5)
+
+    self.assertEqual(titles, {})
+
+    # Pages are not retrieved after the deadline.
+    number_of_requests = self._server.number_of_requests
+
+    result = resolver._GetChromeWebStorePage(
+        'apdfllckaahabafndbhieahigkjlhalf', time.time())
+    self.assertIsNone(result)
+    self.assertEqual(self._server.number_of_requests, number_of_requests)
+
+    # Extensions of which the page cannot be retrieved are not resolved.
+    resolver = chrome_extension_resolvers.WebStoreChromeExtensionResolver(
+        web_store_url='http://127.0.0.1:1/{xid}')
+
+    titles = resolver.ResolveTitles(self._EXTENSION_IDENTIFIERS)
+    self.assertEqual(titles, {})
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the hash lookup cache."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from plaso.analysis import hash_lookup_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class HashLookupCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash lookup cache."""
+
+  # pylint: disable=protected-access
+
+  _MD5_HASH = '2d79fcc6b02a2e183a0cb30e0e25d103'
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    lookup_cache = hash_lookup_cache.HashLookupCache('cache.db')
+    self.assertIsNotNone(lookup_cache)
+
+    with self.assertRaises(ValueError):
+      hash_lookup_cache.HashLookupCache('cache.db', time_to_live=-1)
+
+  def testAddAndGetHashInformation(self):
+    """Tests the AddHashInformation and GetHashInformation functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.AddHashInformation('nsrlsvr', 'md5', {
+          self._MD5_HASH: True,
+          'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa': False,
+          'bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb': None})
+      lookup_cache.AddHashInformation('viper', 'md5', {
+          self._MD5_HASH: {'default': []}})
+      lookup_cache.Close()
+
+      # The cache is persistent.
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', [
+              self._MD5_HASH.upper(), 'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa',
+              'bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb'])
+
+      expected_hash_information_per_digest = {
+          self._MD5_HASH.upper(): True,
+          'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa': False}
+      self.assertEqual(
+          hash_information_per_digest, expected_hash_information_per_digest)
+
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'viper', 'md5', [self._MD5_HASH])
+      self.assertEqual(
+          hash_information_per_digest, {self._MD5_HASH: {'default': []}})
+
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'sha1', [self._MD5_HASH])
+      self.assertEqual(hash_information_per_digest, {})
+
+      # Digests are looked up in multiple queries.
+      digests = ['{0:032x}'.format(index) for index in range(1200)]
+      lookup_cache.AddHashInformation(
+          'nsrlsvr', 'md5', {digest: True for digest in digests})
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', digests)
+      self.assertEqual(len(hash_information_per_digest), 1200)
+
+      lookup_cache.Close()
+
+      # Expired results are not returned.
+      lookup_cache = hash_lookup_cache.HashLookupCache(path, time_to_live=3600)
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', [self._MD5_HASH])
+      self.assertEqual(hash_information_per_digest, {self._MD5_HASH: True})
+
+      connection = lookup_cache._GetConnection()
+      connection.execute(
+          'UPDATE hash_lookups SET lookup_time = lookup_time - 7200')
+      connection.commit()
+
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', [self._MD5_HASH])
+      self.assertEqual(hash_information_per_digest, {})
+
+      lookup_cache.Close()
+
+  def testDatabaseErrors(self):
+    """Tests that database errors are treated as cache misses."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+      with open(path, 'wb') as file_object:
+        file_object.write(b'not a database' * 1024)
+
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.AddHashInformation('nsrlsvr', 'md5', {self._MD5_HASH: True})
+
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', [self._MD5_HASH])
+      self.assertEqual(hash_information_per_digest, {})
+      self.assertIsNone(lookup_cache._connection)
+
+      lookup_cache.Close()
+
+      path = os.path.join(temp_directory, 'missing', 'cache.db')
+      lookup_cache = hash_lookup_cache.HashLookupCache(path)
+      lookup_cache.AddHashInformation('nsrlsvr', 'md5', {self._MD5_HASH: True})
+
+      hash_information_per_digest = lookup_cache.GetHashInformation(
+          'nsrlsvr', 'md5', [self._MD5_HASH])
+      self.assertEqual(hash_information_per_digest, {})
+
+      lookup_cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
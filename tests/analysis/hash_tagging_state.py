@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the state of the events pending a hash lookup."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.analysis import hash_tagging_state
+from plaso.storage import identifiers
+
+from tests import test_lib as shared_test_lib
+
+
+class HashTaggingStateTest(shared_test_lib.BaseTestCase):
+  """Tests for the state of the events pending a hash lookup."""
+
+  # pylint: disable=protected-access
+
+  def testAddAndGetEventIdentifiers(self):
+    """Tests the AddEventIdentifier, AddHash and GetEventIdentifiers."""
+    tagging_state = hash_tagging_state.HashTaggingState()
+
+    digests = []
+    for index in range(10):
+      path_spec_key = 'file{0:d}'.format(index)
+      event_identifier = identifiers.SQLTableIdentifier('event', index + 1)
+
+      digests.extend(tagging_state.AddEventIdentifier(
+          path_spec_key, event_identifier))
+      digests.extend(tagging_state.AddHash(
+          'digest{0:d}'.format(index % 4), path_spec_key))
+
+    # A path specification with multiple events with the same hash.
+    event_identifier = identifiers.SQLTableIdentifier('event', 11)
+    digests.extend(tagging_state.AddEventIdentifier('file9', event_identifier))
+    digests.extend(tagging_state.AddHash('digest1', 'file9'))
+
+    # Hashes are only returned when the buffered state is written.
+    self.assertEqual(digests, [])
+    digests = tagging_state.Flush()
+    self.assertEqual(digests, ['digest0', 'digest1', 'digest2', 'digest3'])
+
+    self.assertEqual(tagging_state.Flush(), [])
+
+    results = list(tagging_state.GetEventIdentifiers([
+        'digest3', 'digest1', 'bogus']))
+    self.assertEqual(len(results), 2)
+
+    digest, number_of_path_specs, event_identifiers = results[0]
+    self.assertEqual(digest, 'digest1')
+    self.assertEqual(number_of_path_specs, 4)
+    self.assertEqual(
+        [identifier.CopyToString() for identifier in event_identifiers],
+        ['event.2', 'event.6', 'event.10', 'event.11'])
+
+    digest, number_of_path_specs, event_identifiers = results[1]
+    self.assertEqual(digest, 'digest3')
+    self.assertEqual(number_of_path_specs, 2)
+    self.assertEqual(
+        [identifier.CopyToString() for identifier in event_identifiers],
+        ['event.4', 'event.8'])
+
+    tagging_state.Close()
+
+  def testBufferedState(self):
+    """Tests that the buffered state is bounded."""
+    tagging_state = hash_tagging_state.HashTaggingState()
+    tagging_state._MAXIMUM_NUMBER_OF_BUFFERED_ROWS = 100
+
+    digests = []
+    for index in range(1000):
+      path_spec_key = 'file{0:d}'.format(index)
+      event_identifier = identifiers.SQLTableIdentifier('event', index + 1)
+
+      digests.extend(tagging_state.AddEventIdentifier(
+          path_spec_key, event_identifier))
+      digests.extend(tagging_state.AddHash(
+          'digest{0:d}'.format(index % 500), path_spec_key))
+
+      self.assertLess(len(tagging_state._event_identifier_rows), 100)
+      self.assertLess(len(tagging_state._path_spec_rows), 100)
+
+    self.assertEqual(len(digests), 500)
+    self.assertEqual(len(set(digests)), 500)
+
+    digests.sort()
+    results = list(tagging_state.GetEventIdentifiers(digests))
+    self.assertEqual([result[0] for result in results], digests)
+
+    number_of_event_identifiers = sum(
+        len(event_identifiers) for _, _, event_identifiers in results)
+    self.assertEqual(number_of_event_identifiers, 1000)
+
+    tagging_state.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -16,7 +16,8 @@ class AnalysisImportTest(test_lib.ImportCheckTestCase):
   _ANALYSIS_PATH = os.path.join(os.getcwd(), 'plaso', 'analysis')
   _IGNORABLE_FILES = frozenset([
       'logger.py', 'manager.py', 'definitions.py', 'mediator.py',
-      'interface.py'])
+      'interface.py', 'aggregation_state.py', 'chrome_extension_resolvers.py',
+      'hash_lookup_cache.py', 'hash_tagging_state.py', 'temporary_state.py'])
 
   def testAnalysisPluginsImported(self):
     """Tests that all parsers are imported."""
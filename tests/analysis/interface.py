@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the analysis plugin interface."""
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+import time
+import unittest
+
+if sys.version_info[0] < 3:
+  import Queue  # pylint: disable=import-error
+else:
+  import queue as Queue  # pylint: disable=import-error
+
+# pylint: disable=wrong-import-position
+from plaso.analysis import interface
+
+from tests import test_lib as shared_test_lib
+
+
+class _TestHashAnalyzer(interface.HashAnalyzer):
+  """Hash analyzer for testing.
+
+  Attributes:
+    batches (list[list[str]]): batches of hashes that were analyzed.
+    maximum_number_of_concurrent_analyses (int): maximum number of batches
+        that were analyzed concurrently.
+  """
+
+  SUPPORTED_HASHES = ['md5']
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a hash analyzer for testing.
+
+    Args:
+      hash_queue (Queue.queue): contains hashes to be analyzed.
+      hash_analysis_queue (Queue.queue): that the analyzer will append
+          HashAnalysis objects this queue.
+    """
+    super(_TestHashAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self._number_of_concurrent_analyses = 0
+    self.batches = []
+    self.maximum_number_of_concurrent_analyses = 0
+
+  def Analyze(self, hashes):
+    """Analyzes a list of hashes.
+
+    Args:
+      hashes (list[str]): list of hashes to look up.
+
+    Returns:
+      list[HashAnalysis]: list of results of analyzing the hashes.
+    """
+    with self._lock:
+      self.batches.append(hashes)
+      self._number_of_concurrent_analyses += 1
+      self.maximum_number_of_concurrent_analyses = max(
+          self.maximum_number_of_concurrent_analyses,
+          self._number_of_concurrent_analyses)
+
+    # Simulate the latency of a remote lookup.
+    time.sleep(0.1)
+
+    with self._lock:
+      self._number_of_concurrent_analyses -= 1
+
+    return [interface.HashAnalysis(digest, True) for digest in hashes]
+
+
+class HashAnalyzerTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash analyzer interface."""
+
+  # pylint: disable=protected-access
+
+  def testGetHashes(self):
+    """Tests the _GetHashes function."""
+    hash_queue = Queue.Queue()
+    analyzer = _TestHashAnalyzer(hash_queue, Queue.Queue())
+    analyzer.BATCH_WAIT_TIME = 0.1
+    analyzer.EMPTY_QUEUE_WAIT_TIME = 0.1
+
+    hashes = analyzer._GetHashes(hash_queue, 10)
+    self.assertEqual(hashes, [])
+
+    for index in range(15):
+      hash_queue.put('{0:d}'.format(index))
+
+    hashes = analyzer._GetHashes(hash_queue, 10)
+    self.assertEqual(len(hashes), 10)
+
+    # A partial batch is returned after the batch wait time.
+    hashes = analyzer._GetHashes(hash_queue, 10)
+    self.assertEqual(len(hashes), 5)
+
+  def testRun(self):
+    """Tests the run function."""
+    hash_analysis_queue = Queue.Queue()
+    hash_queue = Queue.Queue()
+
+    analyzer = _TestHashAnalyzer(
+        hash_queue, hash_analysis_queue, hashes_per_batch=10,
+        number_of_concurrent_batches=4)
+    analyzer.BATCH_WAIT_TIME = 0.1
+    analyzer.EMPTY_QUEUE_WAIT_TIME = 0.1
+
+    for index in range(100):
+      hash_queue.put('{0:d}'.format(index))
+
+    analyzer.start()
+
+    join_thread = threading.Thread(target=hash_queue.join)
+    join_thread.daemon = True
+    join_thread.start()
+    join_thread.join(timeout=30)
+
+    analyzer.SignalAbort()
+    analyzer.join(timeout=30)
+
+    self.assertFalse(join_thread.is_alive())
+    self.assertFalse(analyzer.is_alive())
+    self.assertEqual(hash_analysis_queue.qsize(), 100)
+    self.assertEqual(len(analyzer.batches), 10)
+    self.assertEqual(analyzer.analyses_performed, 10)
+    self.assertGreater(analyzer.maximum_number_of_concurrent_analyses, 1)
+    self.assertLessEqual(analyzer.maximum_number_of_concurrent_analyses, 4)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the local hash set analysis plugin."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import unittest
+
+from dfvfs.path import fake_path_spec
+
+from plaso.analysis import local_hashset
+from plaso.lib import definitions
+from plaso.lib import timelib
+
+from tests import test_lib as shared_test_lib
+from tests.analysis import test_lib
+
+
+def _GenerateDigests(first_index, last_index):
+  """Generates MD5 digests.
+
+  Args:
+    first_index (int): index of the first digest.
+    last_index (int): index of the last digest, exclusive.
+
+  Returns:
+    list[bytes]: binary digests.
+  """
+  return [
+      hashlib.md5('{0:d}'.format(index).encode('ascii')).digest()
+      for index in range(first_index, last_index)]
+
+
+class HashSetFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash set file and writer."""
+
+  # pylint: disable=protected-access
+
+  _NUMBER_OF_DIGESTS = 200000
+
+  def testGetBloomFilterSize(self):
+    """Tests the _GetBloomFilterSize function."""
+    bloom_filter_size, number_of_hashes = (
+        local_hashset.HashSetFile._GetBloomFilterSize(10000000))
+    self.assertEqual(bloom_filter_size, 12500000)
+    self.assertEqual(number_of_hashes, 7)
+
+    bloom_filter_size, _ = local_hashset.HashSetFile._GetBloomFilterSize(0)
+    self.assertEqual(bloom_filter_size, 2)
+
+  def testWriteAndContains(self):
+    """Tests the Write and Contains functions."""
+    present_digests = _GenerateDigests(0, self._NUMBER_OF_DIGESTS)
+    absent_digests = _GenerateDigests(
+        self._NUMBER_OF_DIGESTS, 2 * self._NUMBER_OF_DIGESTS)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'md5.hashset')
+
+      writer = local_hashset.HashSetFileWriter(
+          'md5', maximum_number_of_digests_in_memory=50000)
+      for digest in present_digests:
+        writer.AddDigest(digest)
+
+      # Duplicate digests are only stored once.
+      writer.AddDigest(present_digests[0])
+
+      self.assertEqual(len(writer._spill_file_paths), 4)
+
+      number_of_digests = writer.Write(path)
+      writer.Close()
+      self.assertEqual(number_of_digests, self._NUMBER_OF_DIGESTS)
+
+      hash_set_file = local_hashset.HashSetFile()
+      hash_set_file.Open(path)
+
+      self.assertEqual(hash_set_file.digest_size, 16)
+      self.assertEqual(
+          hash_set_file.number_of_digests, self._NUMBER_OF_DIGESTS)
+
+      stored_digests = list(hash_set_file.GetDigests())
+      self.assertEqual(stored_digests, sorted(present_digests))
+
+      for digest in present_digests:
+        self.assertTrue(hash_set_file.Contains(digest))
+
+      number_of_bloom_filter_hits = 0
+      for digest in absent_digests:
+        self.assertFalse(hash_set_file.Contains(digest))
+        if hash_set_file._ContainsInBloomFilter(digest):
+          number_of_bloom_filter_hits += 1
+
+      # The Bloom filter is sized for a false positive rate of about 1%.
+      self.assertLess(
+          number_of_bloom_filter_hits, self._NUMBER_OF_DIGESTS // 50)
+
+      self.assertFalse(hash_set_file.Contains(b''))
+      self.assertFalse(hash_set_file.Contains(b'\x00' * 20))
+
+      hash_set_file.Close()
+
+      with self.assertRaises(IOError):
+        hash_set_file.Close()
+
+  def testAddHashListAndCompaction(self):
+    """Tests the AddHashList and AddHashSetFile functions."""
+    digests = _GenerateDigests(0, 1000)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      rds_path = os.path.join(temp_directory, 'NSRLFile.txt')
+      with open(rds_path, 'wb') as file_object:
+        file_object.write((
+            b'"SHA-1","MD5","CRC32","FileName","FileSize","ProductCode",'
+            b'"OpSystemCode","SpecialCode"\r\n'))
+        for digest in digests[:600]:
+          file_object.write((
+              b'"0000000000000000000000000000000000000000",'
+              b'"' + hashlib.md5(digest).hexdigest().upper().encode('ascii') +
+              b'","00000000","file,name.dll",1024,1,"362",""\r\n'))
+
+      delta_path = os.path.join(temp_directory, 'delta.txt')
+      with open(delta_path, 'wb') as file_object:
+        file_object.write(b'# Delta hash list\n\n')
+        for digest in digests[500:]:
+          file_object.write(
+              hashlib.md5(digest).hexdigest().encode('ascii') + b'  file\n')
+        file_object.write(b'not a digest\n')
+
+      path = os.path.join(temp_directory, 'md5.hashset')
+
+      writer = local_hashset.HashSetFileWriter('md5')
+      result = writer.AddHashList(rds_path)
+      self.assertEqual(result, (600, 0))
+      self.assertEqual(writer.Write(path), 600)
+      writer.Close()
+
+      writer = local_hashset.HashSetFileWriter('md5')
+      writer.AddHashSetFile(path)
+      result = writer.AddHashList(delta_path)
+      self.assertEqual(result, (500, 1))
+      self.assertEqual(writer.Write(path), 1000)
+      writer.Close()
+
+      hash_set_file = local_hashset.HashSetFile()
+      hash_set_file.Open(path)
+      for digest in digests:
+        self.assertTrue(hash_set_file.Contains(hashlib.md5(digest).digest()))
+      hash_set_file.Close()
+
+      writer = local_hashset.HashSetFileWriter('sha1')
+      with self.assertRaises(IOError):
+        writer.AddHashSetFile(path)
+
+      writer = local_hashset.HashSetFileWriter('sha256')
+      with self.assertRaises(ValueError):
+        writer.AddHashList(rds_path)
+
+    with self.assertRaises(ValueError):
+      local_hashset.HashSetFileWriter('bogus')
+
+
+class LocalHashSetTest(test_lib.AnalysisPluginTestCase):
+  """Tests for the local hash set analysis plugin."""
+
+  _EVENT_1_HASH = '2d79fcc6b02a2e183a0cb30e0e25d103'
+
+  _EVENT_2_HASH = 'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'
+
+  _TEST_EVENTS = [
+      {'timestamp': timelib.Timestamp.CopyFromString('2015-01-01 17:00:00'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION,
+       'md5_hash': _EVENT_1_HASH,
+       'data_type': 'fs:stat',
+       'pathspec': fake_path_spec.FakePathSpec(
+           location='C:\\WINDOWS\\system32\\good.exe')
+      },
+      {'timestamp': timelib.Timestamp.CopyFromString('2016-01-01 17:00:00'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION,
+       'md5_hash': _EVENT_2_HASH,
+       'data_type': 'fs:stat:ntfs',
+       'pathspec': fake_path_spec.FakePathSpec(
+           location='C:\\WINDOWS\\system32\\evil.exe')}]
+
+  def testExamineEventAndCompileReport(self):
+    """Tests the ExamineEvent and CompileReport functions."""
+    events = []
+    for event_dictionary in self._TEST_EVENTS:
+      event = self._CreateTestEventObject(event_dictionary)
+      events.append(event)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      hash_list_path = os.path.join(temp_directory, 'hashes.txt')
+      with open(hash_list_path, 'wb') as file_object:
+        file_object.write(self._EVENT_1_HASH.encode('ascii'))
+
+      path = os.path.join(temp_directory, 'md5.hashset')
+
+      writer = local_hashset.HashSetFileWriter('md5')
+      writer.AddHashList(hash_list_path)
+      writer.Write(path)
+      writer.Close()
+
+      plugin = local_hashset.LocalHashSetAnalysisPlugin()
+      plugin.SetHashSetPath(path)
+      plugin.SetLabel('known_file')
+      plugin.SetLookupHash('md5')
+
+      self.assertTrue(plugin.TestHashSet())
+
+      storage_writer = self._AnalyzeEvents(events, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+    self.assertEqual(storage_writer.number_of_event_tags, 1)
+
+    report = storage_writer.analysis_reports[0]
+    self.assertIsNotNone(report)
+
+    expected_text = (
+        'local_hashset hash tagging results\n'
+        '1 path specifications tagged with label: known_file\n')
+    self.assertEqual(report.text, expected_text)
+
+    labels = []
+    for event_tag in storage_writer.GetEventTags():
+      labels.extend(event_tag.labels)
+
+    expected_labels = ['known_file']
+    self.assertEqual(labels, expected_labels)
+
+  def testTestHashSet(self):
+    """Tests the TestHashSet function."""
+    plugin = local_hashset.LocalHashSetAnalysisPlugin()
+    self.assertFalse(plugin.TestHashSet())
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'md5.hashset')
+
+      writer = local_hashset.HashSetFileWriter('md5')
+      writer.Write(path)
+      writer.Close()
+
+      plugin.SetHashSetPath(path)
+      plugin.SetLookupHash('md5')
+      self.assertTrue(plugin.TestHashSet())
+
+      plugin.SetLookupHash('sha1')
+      self.assertFalse(plugin.TestHashSet())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,8 @@
 
 from __future__ import unicode_literals
 
+import os
+import threading
 import unittest
 
 try:
@@ -13,10 +15,12 @@ except ImportError:
 
 from dfvfs.path import fake_path_spec
 
+from plaso.analysis import hash_lookup_cache
 from plaso.analysis import nsrlsvr
 from plaso.lib import definitions
 from plaso.lib import timelib
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -137,6 +141,138 @@ class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
     expected_labels = ['nsrl_present']
     self.assertEqual(labels, expected_labels)
 
+  def testExamineEventWithoutPathSpec(self):
+    """Tests the ExamineEvent function with an event without path spec."""
+    event_dictionary = dict(self._TEST_EVENTS[0])
+    del event_dictionary['pathspec']
+
+    events = [self._CreateTestEventObject(event_dictionary)]
+    for event_dictionary in self._TEST_EVENTS:
+      event = self._CreateTestEventObject(event_dictionary)
+      events.append(event)
+
+    plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+    plugin.SetHost('localhost')
+    plugin.SetPort(9120)
+    plugin.SetLabel('nsrl_present')
+
+    storage_writer = self._AnalyzeEvents(events, plugin)
+
+    # Only the event of the file with the known hash is tagged.
+    self.assertEqual(storage_writer.number_of_event_tags, 1)
+
+    report = storage_writer.analysis_reports[0]
+    expected_text = (
+        'nsrlsvr hash tagging results\n'
+        '1 path specifications tagged with label: nsrl_present\n')
+    self.assertEqual(report.text, expected_text)
+
+
+class NsrlSvrLookupCacheTest(test_lib.AnalysisPluginTestCase):
+  """Tests for the nsrlsvr analysis plugin with a lookup cache."""
+
+  _NUMBER_OF_EVENTS = 250
+
+  def _CreateTestEvents(self):
+    """Creates test events with distinct MD5 hashes.
+
+    Returns:
+      list[EventObject]: test events.
+    """
+    timestamp = timelib.Timestamp.CopyFromString('2015-01-01 17:00:00')
+
+    events = []
+    for index in range(self._NUMBER_OF_EVENTS):
+      event = self._CreateTestEventObject({
+          'timestamp': timestamp,
+          'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION,
+          'md5_hash': '{0:032x}'.format(index),
+          'data_type': 'fs:stat',
+          'pathspec': fake_path_spec.FakePathSpec(
+              location='C:\\file{0:d}.exe'.format(index))})
+      events.append(event)
+
+    return events
+
+  def _CreatePlugin(self, server, cache_path):
+    """Creates a nsrlsvr analysis plugin that uses a lookup cache.
+
+    Args:
+      server (NsrlsvrServer): nsrlsvr stand-in.
+      cache_path (str): path of the lookup cache.
+
+    Returns:
+      NsrlsvrAnalysisPlugin: nsrlsvr analysis plugin.
+    """
+    plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+    plugin.SetHost('127.0.0.1')
+    plugin.SetPort(server.server_address[1])
+    plugin.SetLabel('nsrl_present')
+    plugin.SetLookupHash('md5')
+    plugin.SetLookupCache(hash_lookup_cache.HashLookupCache(cache_path))
+    return plugin
+
+  def testExamineEventAndCompileReport(self):
+    """Tests the ExamineEvent and CompileReport functions."""
+    # Every fifth hash is present.
+    digests = set([
+        '{0:032x}'.format(index).encode('ascii')
+        for index in range(0, self._NUMBER_OF_EVENTS, 5)])
+
+    server = test_lib.NsrlsvrServer(digests)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    try:
+      with shared_test_lib.TempDirectory() as temp_directory:
+        cache_path = os.path.join(temp_directory, 'cache.db')
+
+        plugin = self._CreatePlugin(server, cache_path)
+        storage_writer = self._AnalyzeEvents(self._CreateTestEvents(), plugin)
+
+        self.assertEqual(server.number_of_queries, self._NUMBER_OF_EVENTS)
+        self.assertEqual(storage_writer.number_of_event_tags, 50)
+
+        # The results of the second analysis come from the lookup cache.
+        plugin = self._CreatePlugin(server, cache_path)
+        storage_writer = self._AnalyzeEvents(self._CreateTestEvents(), plugin)
+
+        self.assertEqual(server.number_of_queries, self._NUMBER_OF_EVENTS)
+        self.assertEqual(storage_writer.number_of_event_tags, 50)
+
+    finally:
+      server.shutdown()
+      server.server_close()
+
+  def testExamineEventAndCompileReportWithDamagedCache(self):
+    """Tests the ExamineEvent and CompileReport functions with a bad cache."""
+    digests = set([
+        '{0:032x}'.format(index).encode('ascii')
+        for index in range(0, self._NUMBER_OF_EVENTS, 5)])
+
+    server = test_lib.NsrlsvrServer(digests)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    try:
+      with shared_test_lib.TempDirectory() as temp_directory:
+        cache_path = os.path.join(temp_directory, 'cache.db')
+        with open(cache_path, 'wb') as file_object:
+          file_object.write(b'not a database' * 1024)
+
+        # The hashes are looked up as if they were not in the lookup cache.
+        plugin = self._CreatePlugin(server, cache_path)
+        storage_writer = self._AnalyzeEvents(self._CreateTestEvents(), plugin)
+
+        self.assertEqual(server.number_of_queries, self._NUMBER_OF_EVENTS)
+        self.assertEqual(storage_writer.number_of_event_tags, 50)
+
+    finally:
+      server.shutdown()
+      server.server_close()
+
 
 if __name__ == '__main__':
   unittest.main()
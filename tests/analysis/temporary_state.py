@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the state stored in a temporary database."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.analysis import temporary_state
+
+from tests import test_lib as shared_test_lib
+
+
+class _TestTemporaryDatabaseState(temporary_state.TemporaryDatabaseState):
+  """State stored in a temporary database for testing."""
+
+  _CREATE_TABLE_QUERIES = [
+      'CREATE TABLE values_table (value TEXT)']
+
+
+class TemporaryDatabaseStateTest(shared_test_lib.BaseTestCase):
+  """Tests for the state stored in a temporary database."""
+
+  # pylint: disable=protected-access
+
+  def testGetConnectionAndClose(self):
+    """Tests the _GetConnection and Close functions."""
+    state = _TestTemporaryDatabaseState()
+    self.assertIsNone(state._connection)
+
+    connection = state._GetConnection()
+    self.assertIsNotNone(connection)
+    self.assertIs(state._GetConnection(), connection)
+
+    connection.execute('INSERT INTO values_table (value) VALUES (?)', ('a', ))
+    cursor = connection.execute('SELECT value FROM values_table')
+    self.assertEqual(cursor.fetchall(), [('a', )])
+
+    state.Close()
+    self.assertIsNone(state._connection)
+
+    # A new temporary database is created after the state was closed.
+    connection = state._GetConnection()
+    cursor = connection.execute('SELECT value FROM values_table')
+    self.assertEqual(cursor.fetchall(), [])
+
+    state.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
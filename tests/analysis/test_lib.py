@@ -3,6 +3,13 @@
 
 from __future__ import unicode_literals
 
+import threading
+
+try:
+  import socketserver
+except ImportError:
+  import SocketServer as socketserver  # pylint: disable=import-error
+
 from plaso.analysis import mediator as analysis_mediator
 from plaso.containers import artifacts
 from plaso.containers import events
@@ -15,6 +22,48 @@ from plaso.storage.fake import writer as fake_writer
 from tests import test_lib as shared_test_lib
 
 
+class _NsrlsvrRequestHandler(socketserver.StreamRequestHandler):
+  """Request handler of a local nsrlsvr stand-in for testing."""
+
+  # This method is part of the socketserver interface, hence its name does
+  # not follow the style guide.
+  def handle(self):
+    """Answers the queries of a connection."""
+    for line in self.rfile:
+      _, _, digest = line.strip().partition(b' ')
+      with self.server.lock:
+        self.server.number_of_queries += 1
+
+      if digest.lower() in self.server.digests:
+        self.wfile.write(b'OK 1\n')
+      else:
+        self.wfile.write(b'OK 0\n')
+
+
+class NsrlsvrServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+  """Local nsrlsvr stand-in for testing and benchmarking.
+
+  Attributes:
+    digests (set[bytes]): lower case hexadecimal digests in the hash set.
+    lock (threading.Lock): lock of the number of queries.
+    number_of_queries (int): number of queries answered.
+  """
+
+  daemon_threads = True
+
+  def __init__(self, digests):
+    """Initializes a nsrlsvr stand-in.
+
+    Args:
+      digests (set[bytes]): lower case hexadecimal digests in the hash set.
+    """
+    socketserver.TCPServer.__init__(
+        self, ('127.0.0.1', 0), _NsrlsvrRequestHandler)
+    self.digests = digests
+    self.lock = threading.Lock()
+    self.number_of_queries = 0
+
+
 class AnalysisPluginTestCase(shared_test_lib.BaseTestCase):
   """The unit test case for an analysis plugin."""
 
@@ -9,6 +9,7 @@ import unittest
 from dfdatetime import filetime as dfdatetime_filetime
 from dfvfs.path import fake_path_spec
 
+from plaso.analysis import aggregation_state
 from plaso.analysis import windows_services
 from plaso.containers import time_events
 from plaso.lib import definitions
@@ -21,6 +22,8 @@ from tests.analysis import test_lib
 class WindowsServicesTest(test_lib.AnalysisPluginTestCase):
   """Tests for the Windows Services analysis plugin."""
 
+  # pylint: disable=protected-access
+
   _TEST_EVENTS = [
       {'key_path': '\\ControlSet001\\services\\TestbDriver',
        'regvalue': {'ImagePath': 'C:\\Dell\\testdriver.sys', 'Type': 2,
@@ -89,6 +92,18 @@ class WindowsServicesTest(test_lib.AnalysisPluginTestCase):
     self.assertEqual(expected_text, analysis_report.text)
     self.assertEqual(analysis_report.plugin_name, 'windows_services')
 
+    # The services are grouped when they are written to the database.
+    plugin = windows_services.WindowsServicesAnalysisPlugin()
+    plugin._aggregation_state = aggregation_state.AggregationState(
+        maximum_number_of_buffered_values=1)
+
+    storage_writer = self._AnalyzeEvents(events, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+
+    analysis_report = storage_writer.analysis_reports[0]
+    self.assertEqual(expected_text, analysis_report.text)
+
   @shared_test_lib.skipUnlessHasTestFile(['SYSTEM'])
   def testExamineEventAndCompileReportOnSystemFile(self):
     """Tests the ExamineEvent and CompileReport functions on a SYSTEM file."""
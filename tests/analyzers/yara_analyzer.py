@@ -4,8 +4,14 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from plaso.containers import analyzer_result
 from plaso.analyzers import yara_analyzer
 
@@ -20,6 +26,205 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
 
   _RULE_FILE = ['yara.rules']
 
+  _STRING_RULES = '\n'.join([
+      'rule PlasoText {',
+      '  strings:',
+      '    $text = "plaso\\x20block\\x20boundary"',
+      '  condition:',
+      '    $text',
+      '}',
+      'rule PlasoHex {',
+      '  strings:',
+      '    $hex = { 70 6C 61 73 6F ?? 68 65 78 }',
+      '  condition:',
+      '    $hex',
+      '}'])
+
+  _CONDITION_RULES = '\n'.join([
+      'rule PlasoHeader {',
+      '  strings:',
+      '    $header = "PLSO"',
+      '  condition:',
+      '    $header at 0 and filesize > 64',
+      '}',
+      'rule NoPlasoText {',
+      '  strings:',
+      '    $text = "plaso block boundary"',
+      '  condition:',
+      '    not $text',
+      '}',
+      'rule PlasoSmallFile {',
+      '  condition:',
+      '    uint32(0) == 0x4f534c50 and filesize < 64',
+      '}'])
+
+  def testAnalyzeBlocks(self):
+    """Tests the Analyze function with strings that cross blocks."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(self._STRING_RULES)
+
+    analyzer.Analyze(b'\x00' * 64 + b'plaso bl')
+    analyzer.Analyze(b'ock bou')
+    analyzer.Analyze(b'ndary' + b'\x00' * 64 + b'plaso')
+    analyzer.Analyze(b'_hex' + b'\x00' * 64)
+
+    temporary_path = analyzer._temporary_path
+    self.assertIsNotNone(temporary_path)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PlasoText,PlasoHex')
+
+    analyzer.Reset()
+    self.assertIsNone(analyzer._data)
+    self.assertIsNone(analyzer._temporary_path)
+    self.assertFalse(os.path.exists(temporary_path))
+
+    analyzer.Analyze(b'ndary plaso_hex')
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PlasoHex')
+
+    analyzer.Reset()
+
+  def testAnalyzeBlocksWithConditions(self):
+    """Tests the Analyze function with conditions on the entire file."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(self._CONDITION_RULES)
+
+    # The conditions are evaluated over the entire file and not per block.
+    analyzer.Analyze(b'PLSO' + b'\x00' * 12)
+    analyzer.Analyze(b'\x00' * 64 + b'plaso block boundary')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PlasoHeader')
+
+    analyzer.Reset()
+
+    analyzer.Analyze(b'PLSO' + b'\x00' * 12)
+
+    results = analyzer.GetResults()
+    self.assertEqual(
+        results[0].attribute_value, 'NoPlasoText,PlasoSmallFile')
+
+    analyzer.Reset()
+
+  def testAnalyzeWithWriteError(self):
+    """Tests the Analyze function when the temporary file cannot be written."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(self._STRING_RULES)
+
+    def _OpenFullFile(file_descriptor, unused_mode):
+      """Opens a temporary file that cannot be written to."""
+      file_object = mock.MagicMock()
+      file_object.write.side_effect = IOError('No space left on device')
+      file_object.close.side_effect = lambda: os.close(file_descriptor)
+      return file_object
+
+    with mock.patch.object(
+        yara_analyzer.os, 'fdopen', side_effect=_OpenFullFile):
+      analyzer.Analyze(b'plaso_hex')
+      analyzer.Analyze(b'plaso block boundary')
+      analyzer.Analyze(b'\x00' * 64)
+
+    self.assertIsNone(analyzer._data)
+    self.assertIsNone(analyzer._temporary_file_object)
+    self.assertIsNone(analyzer._temporary_path)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, '')
+
+    analyzer.Reset()
+
+    # The blocks of the next file are not appended to the previous file.
+    analyzer.Analyze(b'\x00' * 64 + b'plaso bl')
+    analyzer.Analyze(b'ock boundary')
+
+    temporary_path = analyzer._temporary_path
+    self.assertIsNotNone(temporary_path)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PlasoText')
+
+    analyzer.Reset()
+    self.assertFalse(os.path.exists(temporary_path))
+
+  def testAnalyzeWithFileSizeLimit(self):
+    """Tests the Analyze function with a file size limit."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetFileSizeLimit(128)
+    analyzer.SetRules(self._STRING_RULES)
+
+    analyzer.Analyze(b'\x00' * 64 + b'plaso bl')
+    analyzer.Analyze(b'ock boundary' + b'\x00' * 64)
+
+    self.assertIsNone(analyzer._data)
+    self.assertIsNone(analyzer._temporary_path)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, '')
+
+    analyzer.Reset()
+
+    analyzer.Analyze(b'\x00' * 64 + b'plaso bl')
+    analyzer.Analyze(b'ock boundary')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PlasoText')
+
+    analyzer.Reset()
+
+  def testAnalyzeWithTemporaryDirectory(self):
+    """Tests the Analyze function with a temporary directory."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      analyzer = yara_analyzer.YaraAnalyzer()
+      analyzer.SetRules(self._STRING_RULES)
+      analyzer.SetTemporaryDirectory(temp_directory)
+
+      analyzer.Analyze(b'\x00' * 64 + b'plaso bl')
+      analyzer.Analyze(b'ock boundary')
+
+      temporary_path = analyzer._temporary_path
+      self.assertEqual(os.path.dirname(temporary_path), temp_directory)
+
+      results = analyzer.GetResults()
+      self.assertEqual(results[0].attribute_value, 'PlasoText')
+
+      analyzer.Reset()
+      self.assertEqual(os.listdir(temp_directory), [])
+
+  def testSetRulesWithCache(self):
+    """Tests the SetRules function with a compiled rules cache."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      analyzer = yara_analyzer.YaraAnalyzer()
+      analyzer.SetRules(self._STRING_RULES, cache_directory=temp_directory)
+
+      cached_rules_path = analyzer._GetCachedRulesPath(
+          self._STRING_RULES, temp_directory)
+      self.assertEqual(os.listdir(temp_directory), [
+          os.path.basename(cached_rules_path)])
+
+      analyzer = yara_analyzer.YaraAnalyzer()
+      rules = analyzer._LoadCachedRules(cached_rules_path)
+      self.assertIsNotNone(rules)
+
+      analyzer.SetRules(self._STRING_RULES, cache_directory=temp_directory)
+      analyzer.Analyze(b'plaso_hex')
+      results = analyzer.GetResults()
+      self.assertEqual(results[0].attribute_value, 'PlasoHex')
+
+      # Corrupt compiled rules are compiled and stored again.
+      with open(cached_rules_path, 'wb') as file_object:
+        file_object.write(b'corrupt')
+
+      rules = analyzer._LoadCachedRules(cached_rules_path)
+      self.assertIsNone(rules)
+
+      analyzer = yara_analyzer.YaraAnalyzer()
+      analyzer.SetRules(self._STRING_RULES, cache_directory=temp_directory)
+      self.assertIsNotNone(analyzer._rules)
+
+      rules = analyzer._LoadCachedRules(cached_rules_path)
+      self.assertIsNotNone(rules)
+
   def testFileRuleParse(self):
     """Tests that the Yara analyzer can read rules."""
     analyzer = yara_analyzer.YaraAnalyzer()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the Chrome extension analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.analysis import chrome_extension
+from plaso.analysis import tagging
+from plaso.lib import errors
+from plaso.cli.helpers import chrome_extension_analysis
+
+from tests import test_lib as shared_test_lib
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class ChromeExtensionAnalysisArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the Chrome extension analysis plugin CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--chrome-extension-cache PATH]
+                     [--chrome-extension-cache-ttl SECONDS]
+                     [--chrome-extension-database PATH]
+                     [--chrome-extension-deadline SECONDS]
+                     [--chrome-extension-offline]
+
+Test argument parser.
+
+optional arguments:
+  --chrome-extension-cache PATH, --chrome_extension_cache PATH
+                        Path of a SQLite database file to cache the names of
+                        Chrome extensions in, so that analyzing the same
+                        extensions again does not require network lookups.
+  --chrome-extension-cache-ttl SECONDS, --chrome_extension_cache_ttl SECONDS
+                        Number of seconds a cached name of a Chrome extension
+                        remains valid, the default is: 2592000.
+  --chrome-extension-database PATH, --chrome_extension_database PATH
+                        Path of a JSON file with the names of Chrome
+                        extensions per extension identifier, the default is
+                        chrome_extensions.json in the data location.
+  --chrome-extension-deadline SECONDS, --chrome_extension_deadline SECONDS
+                        Number of seconds after which the Chrome Web Store
+                        lookups are abandoned, lookups that are waiting for a
+                        response time out at the deadline, the default is: 60.
+  --chrome-extension-offline, --chrome_extension_offline
+                        Do not look up the names of Chrome extensions in the
+                        Chrome Web Store.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    arguments_helper = (
+        chrome_extension_analysis.ChromeExtensionAnalysisArgumentsHelper)
+    arguments_helper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  @shared_test_lib.skipUnlessHasTestFile(['chrome_extensions.json'])
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    arguments_helper = (
+        chrome_extension_analysis.ChromeExtensionAnalysisArgumentsHelper)
+
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = chrome_extension.ChromeExtensionPlugin()
+
+    arguments_helper.ParseOptions(options, analysis_plugin)
+
+    self.assertIsNone(analysis_plugin._cache_path)
+    self.assertIsNone(analysis_plugin._database_path)
+    self.assertTrue(analysis_plugin._use_network)
+
+    database_path = shared_test_lib.GetTestFilePath(['chrome_extensions.json'])
+
+    options.chrome_extension_cache = 'cache.db'
+    options.chrome_extension_cache_ttl = 3600
+    options.chrome_extension_database = database_path
+    options.chrome_extension_deadline = 5
+    options.chrome_extension_offline = True
+
+    arguments_helper.ParseOptions(options, analysis_plugin)
+
+    self.assertEqual(analysis_plugin._cache_path, 'cache.db')
+    self.assertEqual(analysis_plugin._cache_time_to_live, 3600)
+    self.assertEqual(analysis_plugin._database_path, database_path)
+    self.assertEqual(analysis_plugin._network_deadline, 5)
+    self.assertFalse(analysis_plugin._use_network)
+
+    options.chrome_extension_cache_ttl = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      arguments_helper.ParseOptions(options, analysis_plugin)
+
+    options.chrome_extension_cache_ttl = 3600
+    options.chrome_extension_database = shared_test_lib.GetTestFilePath([
+        'bogus.json'])
+
+    with self.assertRaises(errors.BadConfigOption):
+      arguments_helper.ParseOptions(options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      arguments_helper.ParseOptions(options, tagging.TaggingAnalysisPlugin())
+
+
+if __name__ == '__main__':
+  unittest.main()
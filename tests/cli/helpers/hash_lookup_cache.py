@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the hash lookup cache CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.analysis import nsrlsvr
+from plaso.analysis import tagging
+from plaso.lib import errors
+from plaso.cli.helpers import hash_lookup_cache
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class HashLookupCacheArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the hash lookup cache CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--hash-lookup-cache PATH]
+                     [--hash-lookup-cache-ttl SECONDS]
+
+Test argument parser.
+
+optional arguments:
+  --hash-lookup-cache PATH, --hash_lookup_cache PATH
+                        Path of a SQLite database file to cache the results of
+                        hash lookups in, so that analyzing the same files
+                        again does not require remote lookups.
+  --hash-lookup-cache-ttl SECONDS, --hash_lookup_cache_ttl SECONDS
+                        Number of seconds a cached hash lookup result remains
+                        valid, the default is: 604800.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.AddArguments(
+        argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+    self.assertIsNone(analysis_plugin._analyzer._lookup_cache)
+
+    options.hash_lookup_cache = 'cache.db'
+    options.hash_lookup_cache_ttl = 3600
+
+    hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+        options, analysis_plugin)
+
+    lookup_cache = analysis_plugin._analyzer._lookup_cache
+    self.assertIsNotNone(lookup_cache)
+    self.assertEqual(lookup_cache._path, 'cache.db')
+    self.assertEqual(lookup_cache.time_to_live, 3600)
+    self.assertEqual(analysis_plugin._analyzer._lookup_cache_name, 'nsrlsvr')
+
+    options.hash_lookup_cache_ttl = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      hash_lookup_cache.HashLookupCacheArgumentsHelper.ParseOptions(
+          options, tagging.TaggingAnalysisPlugin())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the local hash set analysis plugin CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import os
+import unittest
+
+from plaso.analysis import local_hashset
+from plaso.lib import errors
+from plaso.cli.helpers import local_hashset_analysis
+
+from tests import test_lib as shared_test_lib
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class LocalHashSetAnalysisArgumentsHelperTest(
+    test_lib.AnalysisPluginArgumentsHelperTest):
+  """Tests the local hash set analysis plugin CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--local-hashset-hash HASH] [--local-hashset-label LABEL]
+                     [--local-hashset-path PATH]
+
+Test argument parser.
+
+optional arguments:
+  --local-hashset-hash HASH, --local_hashset_hash HASH
+                        Type of hash to look up in the hash set file, the
+                        default is: md5. Supported options: md5, sha1, sha256
+  --local-hashset-label LABEL, --local_hashset_label LABEL
+                        Label to apply to events, the default is: known_file.
+  --local-hashset-path PATH, --local_hashset_path PATH
+                        Path of the hash set file, as created by
+                        utils/build_hashset.py, to look up hashes in.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    local_hashset_analysis.LocalHashSetAnalysisArgumentsHelper.AddArguments(
+        argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    analysis_plugin = local_hashset.LocalHashSetAnalysisPlugin()
+
+    options.local_hashset_hash = 'md5'
+    options.local_hashset_label = 'KNOWN'
+
+    with self.assertRaises(errors.BadConfigOption):
+      local_hashset_analysis.LocalHashSetAnalysisArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+    self.assertEqual(analysis_plugin._label, 'KNOWN')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'md5.hashset')
+
+      writer = local_hashset.HashSetFileWriter('md5')
+      writer.Write(path)
+      writer.Close()
+
+      options.local_hashset_path = path
+      local_hashset_analysis.LocalHashSetAnalysisArgumentsHelper.ParseOptions(
+          options, analysis_plugin)
+
+      self.assertEqual(analysis_plugin._analyzer._hash_set_path, path)
+
+      options.local_hashset_hash = 'sha1'
+      with self.assertRaises(errors.BadConfigOption):
+        local_hashset_analysis.LocalHashSetAnalysisArgumentsHelper.ParseOptions(
+            options, analysis_plugin)
+
+    with self.assertRaises(errors.BadConfigObject):
+      local_hashset_analysis.LocalHashSetAnalysisArgumentsHelper.ParseOptions(
+          options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the metrics CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.cli import tools
+from plaso.cli.helpers import metrics
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+
+
+class MetricsArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
+  """Tests for the metrics CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--metrics_port PORT]
+
+Test argument parser.
+
+optional arguments:
+  --metrics_port PORT, --metrics-port PORT
+                        Port of a HTTP server on 127.0.0.1 that exposes
+                        processing metrics, such as events per second, parser
+                        timings, task queue depths and memory usage per
+                        process, in the Prometheus text format at /metrics.
+                        Use 0 to let the operating system select a port. The
+                        metrics server is only available in multi process mode
+                        and is disabled by default.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py', description='Test argument parser.',
+        add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    metrics.MetricsArgumentsHelper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+
+    test_tool = tools.CLITool()
+    metrics.MetricsArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertIsNone(test_tool._metrics_port)
+
+    options.metrics_port = 9100
+    metrics.MetricsArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._metrics_port, 9100)
+
+    with self.assertRaises(errors.BadConfigObject):
+      metrics.MetricsArgumentsHelper.ParseOptions(options, None)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.metrics_port = 'bogus'
+      metrics.MetricsArgumentsHelper.ParseOptions(options, test_tool)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.metrics_port = 65536
+      metrics.MetricsArgumentsHelper.ParseOptions(options, test_tool)
+
+
+if __name__ == '__main__':
+  unittest.main()
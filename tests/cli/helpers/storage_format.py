@@ -20,11 +20,18 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT]
+usage: cli_helper.py [--storage_compression_level LEVEL]
+                     [--storage_format FORMAT]
 
 Test argument parser.
 
 optional arguments:
+  --storage_compression_level LEVEL, --storage-compression-level LEVEL
+                        Compression level of the storage file, from 0 (no
+                        compression) to 9 (best compression). Lower levels
+                        reduce the time spent compressing at the cost of a
+                        larger storage file. The default is the default of the
+                        storage format.
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
@@ -51,11 +58,23 @@ optional arguments:
     storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._storage_format, options.storage_format)
+    self.assertIsNone(test_tool._storage_compression_level)
+
+    options.storage_compression_level = 1
+    storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._storage_compression_level, 1)
 
     with self.assertRaises(errors.BadConfigObject):
       storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
 
     with self.assertRaises(errors.BadConfigOption):
+      options.storage_compression_level = 10
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.storage_compression_level = None
       options.storage_format = 'bogus'
       storage_format.StorageFormatArgumentsHelper.ParseOptions(
           options, test_tool)
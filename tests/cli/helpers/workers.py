@@ -20,11 +20,20 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--workers WORKERS]
+usage: cli_helper.py [--maximum_workers WORKERS] [--worker_memory_limit SIZE]
+                     [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --maximum_workers WORKERS, --maximum-workers WORKERS
+                        Maximum number of worker processes. If larger than the
+                        number of worker processes, the number of worker
+                        processes is adapted during extraction to the task
+                        queue depth, merge backlog, CPU utilization, I/O wait
+                        and available memory, where --workers defines the
+                        initial number of worker processes. The default is 0,
+                        which represents a fixed number of worker processes.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -56,6 +65,7 @@ optional arguments:
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertEqual(test_tool._maximum_number_of_extraction_workers, 0)
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
@@ -68,6 +78,14 @@ optional arguments:
       options.workers = -1
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    options.workers = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.maximum_workers = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.maximum_workers = 0
+
     with self.assertRaises(errors.BadConfigOption):
       options.worker_memory_limit = 'bogus'
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import argparse
 import unittest
 
+from plaso.analyzers import yara_analyzer
 from plaso.cli import tools
 from plaso.cli.helpers import yara_rules
 from plaso.lib import errors
@@ -21,13 +22,24 @@ class YaraRulesArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--yara_rules PATH]
+usage: cli_helper.py [--yara_file_size_limit SIZE] [--yara_rules PATH]
+                     [--yara_rules_cache PATH]
 
 Test argument parser.
 
 optional arguments:
+  --yara_file_size_limit SIZE, --yara-file-size-limit SIZE
+                        Define the maximum file size in bytes that Yara rules
+                        should be matched against. Any larger file will be
+                        skipped. A size of 0 represents no limit. Files larger
+                        than a single block are written to the temporary
+                        directory to be matched, the default is: 268435456.
   --yara_rules PATH, --yara-rules PATH
                         Path to a file containing Yara rules definitions.
+  --yara_rules_cache PATH, --yara-rules-cache PATH
+                        Path to a directory to cache the compiled Yara rules
+                        in, so that the worker processes load the compiled
+                        rules instead of compiling the rules definitions.
 """
 
   def testAddArguments(self):
@@ -52,10 +64,17 @@ optional arguments:
     yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertIsNotNone(test_tool._yara_rules_string)
+    self.assertEqual(
+        test_tool._yara_file_size_limit,
+        yara_analyzer.YaraAnalyzer.DEFAULT_FILE_SIZE_LIMIT)
 
     with self.assertRaises(errors.BadConfigObject):
       yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, None)
 
+    options.yara_file_size_limit = -1
+    with self.assertRaises(errors.BadConfigOption):
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -8,6 +8,17 @@ import io
 import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue  # pylint: disable=import-error
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver as path_spec_resolver
@@ -61,36 +72,159 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     return results
 
-  @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
-  def testCalculateDigestHash(self):
-    """Tests the _CalculateDigestHash function."""
+  # TODO: add tests for _CreateSanitizedDestination.
+
+  def _CreateExportTask(self, display_name, target_directory, data):
+    """Creates a data stream export task with all its data queued.
+
+    Args:
+      display_name (str): display name of the data stream.
+      target_directory (str): path of the directory of the exported file.
+      data (bytes): data of the data stream.
+
+    Returns:
+      _DataStreamExportTask: data stream export task.
+    """
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    target_path = os.path.join(target_directory, display_name)
+
+    task = image_export_tool._DataStreamExportTask(
+        display_name, output_writer, target_directory, target_path)
+    task.data_blocks.put(data)
+    task.data_blocks.put(None)
+    return task
+
+  def testDigestIndex(self):
+    """Tests the _OpenDigestIndex and _WriteDigestIndexEntry functions."""
     test_tool = image_export_tool.ImageExportTool()
 
-    test_path = self._GetTestFilePath(['ímynd.dd'])
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_tool._OpenDigestIndex(temp_directory)
+      test_tool._WriteDigestIndexEntry(
+          'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16',
+          'TSK:/a_directory/another_file')
+      test_tool._CloseDigestIndex()
+
+      digest_index_path = os.path.join(
+          temp_directory, '$image_export_digests.jsonl')
+      self.assertEqual(
+          self._RecursiveList(temp_directory), [digest_index_path])
+
+      # Simulate an entry that was partially written by an interrupted
+      # export.
+      with io.open(digest_index_path, 'ab') as file_object:
+        file_object.write(b'{"display_name": "TSK:/a_f')
+
+      test_tool = image_export_tool.ImageExportTool()
+      test_tool._OpenDigestIndex(temp_directory)
+      test_tool._WriteDigestIndexEntry(
+          '3a0b9e4a1b6e2d8aa4f4b1e9f4b8b3c6d9e5f8a4b4c2d1e0f9a8b7c6d5e4f3a2',
+          'TSK:/a_directory/a_file')
+      test_tool._CloseDigestIndex()
+
+      test_tool = image_export_tool.ImageExportTool()
+      test_tool._OpenDigestIndex(temp_directory)
+      test_tool._CloseDigestIndex()
+
+    expected_digests = {
+        '3a0b9e4a1b6e2d8aa4f4b1e9f4b8b3c6d9e5f8a4b4c2d1e0f9a8b7c6d5e4f3a2': (
+            'TSK:/a_directory/a_file'),
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16': (
+            'TSK:/a_directory/another_file')}
+    self.assertEqual(test_tool._digests, expected_digests)
+
+  def testExportDataStream(self):
+    """Tests the _ExportDataStream function."""
+    test_tool = image_export_tool.ImageExportTool()
 
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    digest_hash = test_tool._CalculateDigestHash(file_entry, '')
-    expected_digest_hash = (
-        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
-    self.assertEqual(digest_hash, expected_digest_hash)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_tool._OpenDigestIndex(temp_directory)
 
-    test_path = self._GetTestFilePath(['ímynd.dd'])
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
-        location='/a_directory', parent=os_path_spec)
+      task = self._CreateExportTask('file1', temp_directory, b'data')
+      test_tool._ExportDataStream(task)
 
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    with self.assertRaises(IOError):
-      test_tool._CalculateDigestHash(file_entry, '')
+      # The content of file2 is a duplicate of that of file1.
+      task = self._CreateExportTask('file2', temp_directory, b'data')
+      test_tool._ExportDataStream(task)
+
+      output = task.output_writer.ReadOutput()
+      self.assertIn('file2 is a duplicate of: file1', output)
+
+      # Duplicates are exported if not skipped.
+      task = self._CreateExportTask('file3', temp_directory, b'data')
+      test_tool._ExportDataStream(task, skip_duplicates=False)
+
+      test_tool._CloseDigestIndex()
+
+      expected_extracted_files = [
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
+          os.path.join(temp_directory, 'file1'),
+          os.path.join(temp_directory, 'file3')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+      # A resumed export skips the content exported by the previous export.
+      test_tool = image_export_tool.ImageExportTool()
+      test_tool._OpenDigestIndex(temp_directory)
+
+      task = self._CreateExportTask('file4', temp_directory, b'data')
+      test_tool._ExportDataStream(task)
+
+      output = task.output_writer.ReadOutput()
+      self.assertIn('file4 is a duplicate of: file1', output)
+
+      task = self._CreateExportTask('file5', temp_directory, b'other data')
+      test_tool._ExportDataStream(task)
+
+      test_tool._CloseDigestIndex()
+
+      expected_extracted_files = [
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
+          os.path.join(temp_directory, 'file1'),
+          os.path.join(temp_directory, 'file3'),
+          os.path.join(temp_directory, 'file5')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+    self.assertEqual(len(test_tool._digests), 2)
+
+  def testExportWorkerMain(self):
+    """Tests the _ExportWorkerMain function."""
+    test_tool = image_export_tool.ImageExportTool()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      failed_task = self._CreateExportTask('file1', temp_directory, b'data')
+      task = self._CreateExportTask('file2', temp_directory, b'data')
+
+      test_tool._export_task_queue = Queue.Queue()
+      test_tool._export_task_queue.put(failed_task)
+      test_tool._export_task_queue.put(task)
+      test_tool._export_task_queue.put(None)
+
+      hasher_object = mock.MagicMock()
+      hasher_object.Update.side_effect = ValueError('unexpected error')
+
+      get_hasher = image_export_tool.hashers_manager.HashersManager.GetHasher
+      with mock.patch.object(
+          image_export_tool.hashers_manager.HashersManager, 'GetHasher',
+          side_effect=[hasher_object, get_hasher('sha256')]):
+        test_tool._ExportWorkerMain()
+
+      self.assertTrue(failed_task.failed)
+      self.assertTrue(failed_task.end_of_data)
+      self.assertIsNone(failed_task.temporary_path)
+
+      output = failed_task.output_writer.ReadOutput()
+      self.assertIn(
+          'unable to export contents of file entry: file1 with error: '
+          'unexpected error', output)
+
+      self.assertFalse(task.failed)
+
+      expected_extracted_files = [os.path.join(temp_directory, 'file2')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(extracted_files, expected_extracted_files)
 
-  # TODO: add tests for _CreateSanitizedDestination.
   # TODO: add tests for _Extract.
 
   @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
@@ -108,8 +242,42 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
-      test_tool._ExtractDataStream(
-          file_entry, '', temp_directory, output_writer)
+      with self.assertRaises(RuntimeError):
+        test_tool._ExtractDataStream(
+            file_entry, '', temp_directory, output_writer)
+
+      test_tool._StartExportWorkers()
+      try:
+        test_tool._ExtractDataStream(
+            file_entry, '', temp_directory, output_writer)
+      finally:
+        test_tool._StopExportWorkers()
+
+      expected_extracted_files = [
+          os.path.join(temp_directory, 'a_directory'),
+          os.path.join(temp_directory, 'a_directory', 'another_file')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+      with open(expected_extracted_files[1], 'rb') as file_object:
+        data = file_object.read()
+      self.assertEqual(data, b'This is another file.\n')
+
+      # The file entry is skipped because the exported file already exists.
+      test_tool._StartExportWorkers()
+      try:
+        test_tool._ExtractDataStream(
+            file_entry, '', temp_directory, output_writer)
+      finally:
+        test_tool._StopExportWorkers()
+
+      output = output_writer.ReadOutput()
+      self.assertIn('already exists', output)
+
+    expected_digests = {
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16': (
+            'TSK:/a_directory/another_file')}
+    self.assertEqual(test_tool._digests, expected_digests)
 
   @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
   def testExtractFileEntry(self):
@@ -125,12 +293,54 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
         location='/a_directory/another_file', parent=os_path_spec)
 
     with shared_test_lib.TempDirectory() as temp_directory:
-      test_tool._ExtractFileEntry(
-          tsk_path_spec, temp_directory, output_writer)
+      test_tool._StartExportWorkers()
+      try:
+        test_tool._ExtractFileEntry(
+            tsk_path_spec, temp_directory, output_writer)
+      finally:
+        test_tool._StopExportWorkers()
+
+      expected_extracted_files = [
+          os.path.join(temp_directory, 'a_directory'),
+          os.path.join(temp_directory, 'a_directory', 'another_file')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_extracted_files)
 
   # TODO: add tests for _ExtractWithFilter.
   # TODO: add tests for _GetSourceFileSystem.
 
+  def testRemoveTemporaryFiles(self):
+    """Tests the _RemoveTemporaryFiles function."""
+    test_tool = image_export_tool.ImageExportTool()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      sub_directory = os.path.join(temp_directory, 'a_directory')
+      os.mkdir(sub_directory)
+
+      temporary_paths = [
+          os.path.join(temp_directory, '.image_export-abc123'),
+          os.path.join(sub_directory, '.image_export-def456')]
+
+      for path in temporary_paths + [
+          os.path.join(temp_directory, '.image_export-ghi789'),
+          os.path.join(temp_directory, 'a_file')]:
+        with open(path, 'wb') as file_object:
+          file_object.write(b'data')
+
+      test_tool._temporary_paths.update(temporary_paths)
+      test_tool._RemoveTemporaryFiles()
+
+      self.assertEqual(test_tool._temporary_paths, set())
+
+      # Files that were not created by the export, such as temporary files
+      # of a previous export, are not removed.
+      expected_files = [
+          os.path.join(temp_directory, '.image_export-ghi789'),
+          os.path.join(temp_directory, 'a_directory'),
+          os.path.join(temp_directory, 'a_file')]
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_files)
+
   def testParseExtensionsString(self):
     """Tests the _ParseExtensionsString function."""
     test_tool = image_export_tool.ImageExportTool()
@@ -161,23 +371,6 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
   # TODO: add tests for _Preprocess.
   # TODO: add tests for _ReadSpecificationFile.
 
-  @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
-  def testWriteFileEntry(self):
-    """Tests the _WriteFileEntry function."""
-    test_tool = image_export_tool.ImageExportTool()
-
-    test_path = self._GetTestFilePath(['ímynd.dd'])
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
-
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    with shared_test_lib.TempDirectory() as temp_directory:
-      destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
-
   # TODO: add tests for AddFilterOptions.
 
   def testListSignatureIdentifiers(self):
@@ -309,6 +502,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'a_file')])
 
@@ -335,6 +529,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'passwords.txt')])
 
       extracted_files = self._RecursiveList(temp_directory)
@@ -360,6 +555,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file')])
 
@@ -390,6 +586,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'filter.txt'),
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
@@ -420,6 +617,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
           os.path.join(temp_directory, 'a_directory', 'a_file')])
@@ -449,6 +647,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'a_directory'),
           os.path.join(temp_directory, 'a_directory', 'another_file'),
           os.path.join(temp_directory, 'a_directory', 'a_file'),
@@ -478,6 +677,7 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool.ProcessSources()
 
       expected_extracted_files = sorted([
+          os.path.join(temp_directory, '$image_export_digests.jsonl'),
           os.path.join(temp_directory, 'logs'),
           os.path.join(temp_directory, 'logs', 'sys.tgz')])
 
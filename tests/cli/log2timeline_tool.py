@@ -35,6 +35,7 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
     _EXPECTED_PROCESSING_OPTIONS = ("""\
 usage: log2timeline_test.py [--single_process]
                             [--temporary_directory DIRECTORY]
+                            [--maximum_workers WORKERS]
                             [--worker_memory_limit SIZE] [--workers WORKERS]
                             [--disable_zeromq]
 
@@ -44,6 +45,14 @@ optional arguments:
   --disable_zeromq, --disable-zeromq
                         Disable queueing using ZeroMQ. A Multiprocessing queue
                         will be used instead.
+  --maximum_workers WORKERS, --maximum-workers WORKERS
+                        Maximum number of worker processes. If larger than the
+                        number of worker processes, the number of worker
+                        processes is adapted during extraction to the task
+                        queue depth, merge backlog, CPU utilization, I/O wait
+                        and available memory, where --workers defines the
+                        initial number of worker processes. The default is 0,
+                        which represents a fixed number of worker processes.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
@@ -62,6 +71,7 @@ optional arguments:
     _EXPECTED_PROCESSING_OPTIONS = ("""\
 usage: log2timeline_test.py [--single_process] [--process_memory_limit SIZE]
                             [--temporary_directory DIRECTORY]
+                            [--maximum_workers WORKERS]
                             [--worker_memory_limit SIZE] [--workers WORKERS]
                             [--disable_zeromq]
 
@@ -71,6 +81,14 @@ optional arguments:
   --disable_zeromq, --disable-zeromq
                         Disable queueing using ZeroMQ. A Multiprocessing queue
                         will be used instead.
+  --maximum_workers WORKERS, --maximum-workers WORKERS
+                        Maximum number of worker processes. If larger than the
+                        number of worker processes, the number of worker
+                        processes is adapted during extraction to the task
+                        queue depth, merge backlog, CPU utilization, I/O wait
+                        and available memory, where --workers defines the
+                        initial number of worker processes. The default is 0,
+                        which represents a fixed number of worker processes.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
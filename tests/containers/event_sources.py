@@ -19,7 +19,9 @@ class EventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.EventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_stream_name', 'data_type', 'event_attributes',
+        'file_entry_type', 'file_size', 'parser_name', 'path_spec',
+        'record_range']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -34,7 +36,26 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.FileEntryEventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_stream_name', 'data_type', 'event_attributes',
+        'file_entry_type', 'file_size', 'parser_name', 'path_spec',
+        'record_range']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
+class RecordRangeEventSourceTest(shared_test_lib.BaseTestCase):
+  """Tests for the record range event source attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.RecordRangeEventSource()
+
+    expected_attribute_names = [
+        'data_stream_name', 'data_type', 'event_attributes',
+        'file_entry_type', 'file_size', 'parser_name', 'path_spec',
+        'record_range']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -4,6 +4,8 @@
 
 from __future__ import unicode_literals
 
+import copy
+import pickle
 import unittest
 
 from plaso.containers import interface
@@ -23,9 +25,38 @@ class AttributeContainerIdentifierTest(shared_test_lib.BaseTestCase):
     self.assertEqual(identifier_string, expected_identifier_string)
 
 
+class TestSlotsAttributeContainer(interface.AttributeContainer):
+  """Attribute container with attributes stored in slots for testing."""
+
+  __slots__ = ('_protected_value', 'slot_value')
+
+  def __init__(self):
+    """Initializes an attribute container."""
+    super(TestSlotsAttributeContainer, self).__init__()
+    self._protected_value = None
+    self.slot_value = None
+
+
 class AttributeContainerTest(shared_test_lib.BaseTestCase):
   """Tests for the attribute container interface."""
 
+  # pylint: disable=protected-access
+
+  def testCopyAndPickleWithSlots(self):
+    """Tests copying and pickling an attribute container with slots."""
+    attribute_container = TestSlotsAttributeContainer()
+    attribute_container._protected_value = 'protected'
+    attribute_container.attribute_value = 'attribute_value'
+    attribute_container.slot_value = 'slot_value'
+
+    for copied_container in (
+        copy.deepcopy(attribute_container),
+        pickle.loads(pickle.dumps(attribute_container, protocol=2))):
+      self.assertEqual(copied_container._protected_value, 'protected')
+      self.assertEqual(copied_container.attribute_value, 'attribute_value')
+      self.assertEqual(copied_container.slot_value, 'slot_value')
+      self.assertIsNotNone(copied_container.GetIdentifier())
+
   def testCopyToDict(self):
     """Tests the CopyToDict function."""
     attribute_container = interface.AttributeContainer()
@@ -52,6 +83,15 @@ class AttributeContainerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+    attribute_container = TestSlotsAttributeContainer()
+    attribute_container.attribute_value = 'attribute_value'
+
+    expected_attribute_names = ['attribute_value', 'slot_value']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
   def testGetAttributes(self):
     """Tests the GetAttributes function."""
     attribute_container = interface.AttributeContainer()
@@ -66,6 +106,25 @@ class AttributeContainerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attributes, expected_attributes)
 
+    attribute_container = TestSlotsAttributeContainer()
+    attribute_container.attribute_value = 'attribute_value'
+
+    expected_attributes = [('attribute_value', 'attribute_value')]
+
+    attributes = sorted(attribute_container.GetAttributes())
+
+    self.assertEqual(attributes, expected_attributes)
+
+    attribute_container.slot_value = 'slot_value'
+
+    expected_attributes = [
+        ('attribute_value', 'attribute_value'),
+        ('slot_value', 'slot_value')]
+
+    attributes = sorted(attribute_container.GetAttributes())
+
+    self.assertEqual(attributes, expected_attributes)
+
   def testGetAttributeValueHash(self):
     """Tests the GetAttributeValuesHash function."""
     attribute_container = interface.AttributeContainer()
@@ -41,13 +41,19 @@ class TaskTest(shared_test_lib.BaseTestCase):
     """Tests the CreateRetryTask function."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
+    task.event_attributes = {'sha256_hash': 'test_hash'}
+    task.file_size = 1024
     task.path_spec = 'test_path_spec'
+    task.record_range = (0, 10)
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
+    self.assertEqual(retry_task.event_attributes, task.event_attributes)
+    self.assertEqual(retry_task.file_size, task.file_size)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertEqual(retry_task.record_range, task.record_range)
 
   def testCreateTaskCompletion(self):
     """Tests the CreateTaskCompletion function."""
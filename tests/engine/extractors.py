@@ -14,7 +14,11 @@ from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import sessions
 from plaso.engine import extractors
+from plaso.engine import knowledge_base
+from plaso.parsers import mediator as parsers_mediator
+from plaso.storage.fake import writer as fake_writer
 
 from tests import test_lib as shared_test_lib
 
@@ -29,6 +33,42 @@ class EventExtractorTest(shared_test_lib.BaseTestCase):
   # TODO: add test for _ParseFileEntryWithParser
   # TODO: add test for _ParseFileEntryWithParsers
   # TODO: add test for ParseDataStream
+
+  @shared_test_lib.skipUnlessHasTestFile(['System.evtx'])
+  def testParseDataStreamWithParser(self):
+    """Tests the ParseDataStreamWithParser function."""
+    test_extractor = extractors.EventExtractor(
+        parser_filter_expression='winevtx')
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    resolver_context = context.Context()
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object,
+        resolver_context=resolver_context)
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=resolver_context)
+
+    parser_mediator.SetFileEntry(file_entry)
+    parser_mediator.SetRecordRange((100, 200))
+
+    test_extractor.ParseDataStreamWithParser(
+        parser_mediator, file_entry, '', 'winevtx')
+
+    self.assertEqual(storage_writer.number_of_event_sources, 0)
+    self.assertEqual(storage_writer.number_of_events, 100)
+
+    with self.assertRaises(RuntimeError):
+      test_extractor.ParseDataStreamWithParser(
+          parser_mediator, file_entry, '', 'bogus')
+
   # TODO: add test for ParseFileEntryMetadata
   # TODO: add test for ParseMetadataFile
 
@@ -347,6 +347,22 @@ class PathHelperTest(shared_test_lib.BaseTestCase):
         dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
     self.assertIsNone(display_name)
 
+  def testGetFileTypeForPath(self):
+    """Tests the GetFileTypeForPath function."""
+    file_type = path_helper.PathHelper.GetFileTypeForPath(
+        '/Windows/System32/winevt/Logs/System.EVTX')
+    self.assertEqual(file_type, '.evtx')
+
+    file_type = path_helper.PathHelper.GetFileTypeForPath(
+        'C:\\Windows\\System32\\config\\SYSTEM')
+    self.assertEqual(file_type, 'system')
+
+    file_type = path_helper.PathHelper.GetFileTypeForPath('/Windows/')
+    self.assertIsNone(file_type)
+
+    file_type = path_helper.PathHelper.GetFileTypeForPath(None)
+    self.assertIsNone(file_type)
+
   def testGetRelativePathForPathSpec(self):
     """Tests the GetRelativePathForPathSpec function."""
     test_path = self._GetTestFilePath(['syslog.gz'])
@@ -5,6 +5,7 @@
 from __future__ import unicode_literals
 
 import os
+import time
 import unittest
 
 from plaso.engine import process_info
@@ -22,6 +23,23 @@ class ProcessInfoTest(unittest.TestCase):
     with self.assertRaises(IOError):
       process_info.ProcessInfo(-1)
 
+  def testGetCPUUtilization(self):
+    """Tests the GetCPUUtilization function."""
+    pid = os.getpid()
+    process_information = process_info.ProcessInfo(pid)
+
+    cpu_utilization = process_information.GetCPUUtilization()
+    self.assertIsNotNone(cpu_utilization)
+
+  def testGetCreationTime(self):
+    """Tests the GetCreationTime function."""
+    pid = os.getpid()
+    process_information = process_info.ProcessInfo(pid)
+
+    creation_time = process_information.GetCreationTime()
+    self.assertIsNotNone(creation_time)
+    self.assertLessEqual(creation_time, time.time())
+
   def testGetUsedMemory(self):
     """Tests the GetUsedMemory function."""
     pid = os.getpid()
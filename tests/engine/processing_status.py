@@ -106,6 +106,28 @@ class ProcessingStatusTest(unittest.TestCase):
     status = processing_status.ProcessingStatus()
     status.UpdateTasksStatus(task_status)
 
+  def testUpdateWorkerPoolStatus(self):
+    """Tests the UpdateWorkerPoolStatus function."""
+    status = processing_status.ProcessingStatus()
+    self.assertIsNone(status.worker_pool_status)
+
+    status.UpdateWorkerPoolStatus(2, 8, 4)
+    self.assertIsNotNone(status.worker_pool_status)
+    self.assertEqual(status.worker_pool_status.number_of_worker_processes, 4)
+    self.assertEqual(status.worker_pool_status.number_of_scale_ups, 0)
+    self.assertIsNone(status.worker_pool_status.last_scaling_reason)
+
+    status.UpdateWorkerPoolStatus(2, 8, 5, scaling_reason='test up')
+    self.assertEqual(status.worker_pool_status.number_of_scale_ups, 1)
+    self.assertEqual(status.worker_pool_status.number_of_scale_downs, 0)
+    self.assertEqual(
+        status.worker_pool_status.last_scaling_reason, 'test up')
+
+    status.UpdateWorkerPoolStatus(2, 8, 3, scaling_reason='test down')
+    self.assertEqual(status.worker_pool_status.number_of_scale_ups, 1)
+    self.assertEqual(status.worker_pool_status.number_of_scale_downs, 1)
+    self.assertEqual(status.worker_pool_status.number_of_worker_processes, 3)
+
   def testUpdateWorkerStatus(self):
     """Tests the UpdateWorkerStatus function."""
     status = processing_status.ProcessingStatus()
@@ -123,5 +145,14 @@ class TasksStatusTest(unittest.TestCase):
     self.assertIsNotNone(task_status)
 
 
+class WorkerPoolStatusTest(unittest.TestCase):
+  """Tests the worker pool status."""
+
+  def testInitialization(self):
+    """Tests the __init__ function."""
+    worker_pool_status = processing_status.WorkerPoolStatus()
+    self.assertIsNotNone(worker_pool_status)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,9 @@
 
 from __future__ import unicode_literals
 
+import codecs
+import gzip
+import os
 import time
 import unittest
 
@@ -57,6 +60,39 @@ class SampleFileProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class CountersProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the counters profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.CountersProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for value in range(5):
+        test_profiler.Sample('test_counter', value)
+
+      test_profiler.Stop()
+
+      path = os.path.join(temp_directory, 'counters-test.csv.gz')
+      with gzip.open(path, 'rb') as file_object:
+        lines = codecs.decode(file_object.read(), 'utf-8').split('\n')
+
+    self.assertEqual(lines[0], 'Time\tName\tValue')
+    self.assertEqual(lines[-1], '')
+
+    samples = [line.split('\t')[1:] for line in lines[1:-1]]
+    expected_samples = [
+        ['test_counter', '{0:d}'.format(value)] for value in range(5)]
+    self.assertEqual(samples, expected_samples)
+
+
 class CPUTimeProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the CPU time profiler."""
 
@@ -241,6 +277,11 @@ class TasksProfilerTest(shared_test_lib.BaseTestCase):
         test_profiler.Sample(task, 'queued')
         time.sleep(0.01)
 
+      task = tasks.Task()
+      task.estimated_cost = 0.5
+      task.file_size = 1024
+      test_profiler.Sample(task, 'scheduled')
+
       test_profiler.Stop()
 
 
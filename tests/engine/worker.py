@@ -4,10 +4,17 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver as path_spec_resolver
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import sessions
@@ -15,6 +22,7 @@ from plaso.engine import configurations
 from plaso.engine import knowledge_base
 from plaso.engine import worker
 from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import selinux
 from plaso.storage.fake import writer as fake_writer
 
 from tests.analyzers import manager as analyzers_manager_test
@@ -109,6 +117,45 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = mediator._extra_event_attributes.get('test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  def testAnalyzeFileObjectYaraLargeFile(self):
+    """Tests the _AnalyzeFileObject function with a large file and Yara."""
+    rules_string = (
+        'rule LargeFile { strings: $text = "plaso large file" '
+        'condition: $text }')
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetYaraRules(rules_string)
+
+    analyzer_object = extraction_worker._analyzers[0]
+    block_size = analyzer_object.SIZE_LIMIT
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base.KnowledgeBase())
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'large_file')
+      with open(path, 'wb') as file_object:
+        # The string crosses the boundary of the first and second block.
+        file_object.write(b'\x00' * (block_size - 5))
+        file_object.write(b'plaso large file')
+        file_object.write(b'\x00' * block_size)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+      mediator.SetFileEntry(file_entry)
+
+      file_object = file_entry.GetFileObject()
+      try:
+        extraction_worker._AnalyzeFileObject(mediator, file_object)
+      finally:
+        file_object.close()
+
+    event_attribute = mediator._extra_event_attributes.get('yara_match', None)
+    self.assertEqual(event_attribute, 'LargeFile')
+
   @shared_test_lib.skipUnlessHasTestFile(['syslog'])
   def testProcessPathSpecFile(self):
     """Tests the ProcessPathSpec function on a file."""
@@ -260,6 +307,55 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     storage_writer.Close()
 
+  @shared_test_lib.skipUnlessHasTestFile(['selinux.log'])
+  def testExtractionWorkerHashingInRecordRanges(self):
+    """Tests that the worker sets the hashes on events of record ranges."""
+    extraction_worker = worker.EventExtractionWorker(
+        parser_filter_expression='selinux')
+    extraction_worker._SetHashers('sha256')
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    knowledge_base_object.SetValue('year', 2013)
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    storage_writer.WriteSessionStart()
+
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object,
+        resolver_context=context.Context())
+    mediator.SetSplitRecordRanges(True)
+
+    path_spec = self._GetTestFilePathSpec(['selinux.log'])
+
+    with mock.patch.object(selinux.SELinuxParser, '_RECORD_RANGE_SIZE', 256):
+      extraction_worker.ProcessPathSpec(mediator, path_spec)
+
+      number_of_events = storage_writer.number_of_events
+      self.assertGreater(number_of_events, 0)
+
+      event_sources = list(storage_writer.GetEventSources())
+      self.assertGreater(len(event_sources), 1)
+
+      for event_source in event_sources:
+        extraction_worker.ProcessRecordRange(
+            mediator, event_source.path_spec, event_source.data_stream_name,
+            event_source.parser_name, event_source.record_range,
+            event_attributes=event_source.event_attributes)
+
+    storage_writer.WriteSessionCompletion()
+
+    self.assertGreater(storage_writer.number_of_events, number_of_events)
+
+    expected_sha256_hash = (
+        '73704381a54be840bdae7866609c36069d3da314f639879dabddb82450c16d4c')
+    for event in storage_writer.GetSortedEvents():
+      sha256_hash = getattr(event, 'sha256_hash', None)
+      self.assertEqual(sha256_hash, expected_sha256_hash)
+
+    storage_writer.Close()
+
   @shared_test_lib.skipUnlessHasTestFile(['yara.rules'])
   @shared_test_lib.skipUnlessHasTestFile(['test_pe.exe'])
   def testExtractionWorkerYara(self):
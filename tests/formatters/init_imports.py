@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from plaso.formatters import manifest
+
 from tests import test_lib
 
 
@@ -15,13 +17,14 @@ class FormattersImportTest(test_lib.ImportCheckTestCase):
 
   _CLI_HELPERS_PATH = os.path.join(os.getcwd(), 'plaso', 'formatters')
   _IGNORABLE_FILES = frozenset([
-      'default.py', 'interface.py', 'logger.py', 'manager.py', 'mediator.py',
-      'winevt_rc.py'])
+      'default.py', 'interface.py', 'logger.py', 'manager.py', 'manifest.py',
+      'mediator.py', 'winevt_rc.py'])
 
   def testFormattersImported(self):
-    """Tests that all parsers are imported."""
-    self._AssertFilesImportedInInit(
-        self._CLI_HELPERS_PATH, self._IGNORABLE_FILES)
+    """Tests that all formatters are defined in the manifest."""
+    self._AssertFilesDefinedInManifest(
+        self._CLI_HELPERS_PATH, 'plaso.formatters',
+        set(manifest.FORMATTERS.values()), self._IGNORABLE_FILES)
 
 
 if __name__ == '__main__':
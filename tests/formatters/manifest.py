@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the formatters manifest."""
+
+from __future__ import unicode_literals
+
+import importlib
+import pkgutil
+import unittest
+
+from plaso import formatters
+from plaso.formatters import manager
+from plaso.formatters import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class FormattersManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the formatters manifest."""
+
+  # pylint: disable=protected-access
+
+  def testManifest(self):
+    """Tests that the manifest defines the modules of all formatters."""
+    for _, module_name, _ in pkgutil.walk_packages(
+        formatters.__path__, prefix='plaso.formatters.'):
+      importlib.import_module(module_name)
+
+    data_types = []
+    for data_type, formatter_class in iter(
+        manager.FormattersManager._formatter_classes.items()):
+      # Ignore formatters that are registered by tests.
+      if not formatter_class.__module__.startswith('plaso.formatters.'):
+        continue
+
+      data_types.append(data_type)
+
+      module_name = manifest.FORMATTERS.get(data_type, None)
+      self.assertEqual(module_name, formatter_class.__module__)
+
+    self.assertEqual(sorted(data_types), sorted(manifest.FORMATTERS.keys()))
+
+  def testGetFormatterObject(self):
+    """Tests that GetFormatterObject imports the formatter module."""
+    formatter_object = manager.FormattersManager.GetFormatterObject(
+        'syslog:line')
+    self.assertEqual(formatter_object.DATA_TYPE, 'syslog:line')
+
+
+if __name__ == '__main__':
+  unittest.main()
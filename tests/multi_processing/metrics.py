@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the processing metrics and metrics HTTP server."""
+
+from __future__ import unicode_literals
+
+import socket
+import sys
+import unittest
+
+# pylint: disable=import-error,no-name-in-module,wrong-import-order
+if sys.version_info[0] < 3:
+  import urllib2 as urllib_request
+  from urllib2 import HTTPError
+else:
+  from urllib import request as urllib_request
+  from urllib.error import HTTPError
+
+# pylint: disable=wrong-import-position
+from plaso.engine import processing_status
+from plaso.multi_processing import metrics
+
+from tests import test_lib as shared_test_lib
+
+
+class ProcessingMetricsTest(shared_test_lib.BaseTestCase):
+  """Tests the processing metrics."""
+
+  # pylint: disable=protected-access
+
+  def _CreateProcessingStatus(self, number_of_produced_events):
+    """Creates a processing status.
+
+    Args:
+      number_of_produced_events (int): number of events produced by
+          the worker.
+
+    Returns:
+      ProcessingStatus: processing status.
+    """
+    status = processing_status.ProcessingStatus()
+    status.UpdateForemanStatus(
+        'Main', 'running', 1000, 4096, '', 1, 2, 3, 4, 0, 0, 0, 0, 0, 0)
+    status.UpdateWorkerStatus(
+        'Worker_00', 'extracting', 1001, 8192, 'OS:/tmp/syslog', 1, 2, 0,
+        number_of_produced_events, 0, 0, 0, 0, 0, 1)
+
+    tasks_status = processing_status.TasksStatus()
+    tasks_status.number_of_queued_tasks = 5
+    tasks_status.number_of_tasks_pending_merge = 2
+    tasks_status.number_of_tasks_processing = 1
+    tasks_status.total_number_of_tasks = 8
+    status.UpdateTasksStatus(tasks_status)
+
+    status.UpdateWorkerPoolStatus(2, 8, 3, scaling_reason='test')
+
+    return status
+
+  def testFormatLabels(self):
+    """Tests the _FormatLabels function."""
+    test_metrics = metrics.ProcessingMetrics()
+
+    labels = test_metrics._FormatLabels([('process', 'Main'), ('pid', 1)])
+    self.assertEqual(labels, '{process="Main",pid="1"}')
+
+    labels = test_metrics._FormatLabels([('parser', 'a"b\\c')])
+    self.assertEqual(labels, '{parser="a\\"b\\\\c"}')
+
+  def testUpdateEventsPerSecond(self):
+    """Tests the _UpdateEventsPerSecond function."""
+    test_metrics = metrics.ProcessingMetrics()
+
+    events_per_second = test_metrics._UpdateEventsPerSecond(
+        'Worker_00', 100, 10.0)
+    self.assertEqual(events_per_second, 0.0)
+
+    events_per_second = test_metrics._UpdateEventsPerSecond(
+        'Worker_00', 300, 12.0)
+    self.assertEqual(events_per_second, 100.0)
+
+    # The previous rate is retained when no time has passed.
+    events_per_second = test_metrics._UpdateEventsPerSecond(
+        'Worker_00', 300, 12.0)
+    self.assertEqual(events_per_second, 100.0)
+
+  def testUpdateProcessingStatus(self):
+    """Tests the UpdateProcessingStatus and UpdateProcessStatus functions."""
+    test_metrics = metrics.ProcessingMetrics()
+
+    self.assertEqual(test_metrics.GetText(), '')
+
+    test_metrics.UpdateProcessStatus('Worker_00', {
+        'last_activity_timestamp': 1.0,
+        'number_of_processed_bytes': '3221225472',
+        'parser_timings': {'syslog': 1.5, 'filestat': 0.25},
+        'startup_time': 0.5})
+
+    test_metrics.UpdateProcessingStatus(self._CreateProcessingStatus(10))
+
+    lines = test_metrics.GetText().split('\n')
+
+    self.assertIn('# TYPE plaso_process_events_total counter', lines)
+    self.assertIn(
+        'plaso_process_events_total{process="Main",pid="1000"} 4', lines)
+    self.assertIn(
+        'plaso_process_events_total{process="Worker_00",pid="1001"} 10',
+        lines)
+    self.assertIn((
+        'plaso_process_processed_bytes_total{process="Worker_00",'
+        'pid="1001"} 3221225472'), lines)
+    self.assertIn(
+        'plaso_process_used_memory_bytes{process="Worker_00",pid="1001"} 8192',
+        lines)
+    self.assertIn(
+        'plaso_process_startup_seconds{process="Worker_00",pid="1001"} 0.5',
+        lines)
+    self.assertIn((
+        'plaso_process_status{process="Worker_00",pid="1001",'
+        'status="extracting"} 1'), lines)
+    self.assertIn(
+        'plaso_parser_seconds_total{process="Worker_00",parser="syslog"} 1.5',
+        lines)
+    self.assertIn('plaso_tasks{state="queued"} 5', lines)
+    self.assertIn('plaso_tasks{state="pending_merge"} 2', lines)
+    self.assertIn('plaso_tasks_total 8', lines)
+    self.assertIn('plaso_worker_processes{bound="current"} 3', lines)
+    self.assertIn('plaso_worker_processes{bound="maximum"} 8', lines)
+    self.assertIn('plaso_worker_pool_scaling_total{direction="up"} 1', lines)
+
+    idle_lines = [
+        line for line in lines
+        if line.startswith('plaso_process_idle_seconds{')]
+    self.assertEqual(len(idle_lines), 1)
+
+
+class MetricsHTTPServerTest(shared_test_lib.BaseTestCase):
+  """Tests the metrics HTTP server."""
+
+  def testStartAndStop(self):
+    """Tests the Start and Stop functions."""
+    test_metrics = metrics.ProcessingMetrics()
+    test_metrics.UpdateProcessingStatus(processing_status.ProcessingStatus())
+
+    test_server = metrics.MetricsHTTPServer(test_metrics)
+    self.assertIsNone(test_server.port)
+
+    result = test_server.Start(0)
+    self.assertTrue(result)
+
+    try:
+      port = test_server.port
+      self.assertIsNotNone(port)
+
+      url = 'http://127.0.0.1:{0:d}/metrics'.format(port)
+      response = urllib_request.urlopen(url)
+      try:
+        self.assertEqual(response.getcode(), 200)
+        content_type = response.info().get('Content-Type')
+        self.assertTrue(content_type.startswith('text/plain'))
+
+        data = response.read().decode('utf-8')
+        self.assertIn('plaso_processing_start_time_seconds', data)
+
+      finally:
+        response.close()
+
+      url = 'http://127.0.0.1:{0:d}/bogus'.format(port)
+      with self.assertRaises(HTTPError):
+        urllib_request.urlopen(url)
+
+      # A port that is in use cannot be bound.
+      other_server = metrics.MetricsHTTPServer(test_metrics)
+      result = other_server.Start(port)
+      self.assertFalse(result)
+
+    finally:
+      test_server.Stop()
+
+    self.assertIsNone(test_server.port)
+
+  def testStartWithIdleConnection(self):
+    """Tests that an idle connection does not block other requests."""
+    test_metrics = metrics.ProcessingMetrics()
+    test_metrics.UpdateProcessingStatus(processing_status.ProcessingStatus())
+
+    test_server = metrics.MetricsHTTPServer(test_metrics)
+    result = test_server.Start(0)
+    self.assertTrue(result)
+
+    idle_connection = None
+    try:
+      port = test_server.port
+
+      # The idle connection does not send a request.
+      idle_connection = socket.create_connection(('127.0.0.1', port))
+
+      url = 'http://127.0.0.1:{0:d}/metrics'.format(port)
+      response = urllib_request.urlopen(url, timeout=5)
+      try:
+        self.assertEqual(response.getcode(), 200)
+      finally:
+        response.close()
+
+    finally:
+      if idle_connection:
+        idle_connection.close()
+      test_server.Stop()
+
+
+if __name__ == '__main__':
+  unittest.main()
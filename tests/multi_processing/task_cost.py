@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests the estimation of the cost of extraction tasks."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.path import fake_path_spec
+
+from plaso.containers import event_sources
+from plaso.multi_processing import task_cost
+
+from tests import test_lib as shared_test_lib
+
+
+class TaskCostEstimatorTest(shared_test_lib.BaseTestCase):
+  """Tests the task cost estimator."""
+
+  # pylint: disable=protected-access
+
+  _MEGABYTE = 1024 * 1024
+
+  def testCalculateBytesPerSecond(self):
+    """Tests the _CalculateBytesPerSecond function."""
+    estimator = task_cost.TaskCostEstimator()
+
+    bytes_per_second = estimator._CalculateBytesPerSecond(
+        4 * self._MEGABYTE, 2.0)
+    self.assertEqual(bytes_per_second, 2 * self._MEGABYTE)
+
+    bytes_per_second = estimator._CalculateBytesPerSecond(1024, 2.0)
+    self.assertIsNone(bytes_per_second)
+
+    bytes_per_second = estimator._CalculateBytesPerSecond(
+        4 * self._MEGABYTE, 0.0)
+    self.assertIsNone(bytes_per_second)
+
+  def testEstimateCost(self):
+    """Tests the EstimateCost function."""
+    estimator = task_cost.TaskCostEstimator()
+
+    event_source = event_sources.FileEntryEventSource()
+    estimated_cost = estimator.EstimateCost(event_source)
+    self.assertIsNone(estimated_cost)
+
+    event_source.file_size = 20 * self._MEGABYTE
+    estimated_cost = estimator.EstimateCost(event_source)
+    self.assertEqual(estimated_cost, 2.0)
+
+    estimator.UpdateParserThroughputs('Worker_00', {
+        'filestat': ['{0:d}'.format(8 * self._MEGABYTE), 1.0],
+        'winreg': ['{0:d}'.format(2 * self._MEGABYTE), 4.0]})
+
+    estimated_cost = estimator.EstimateCost(event_source)
+    self.assertEqual(estimated_cost, 10.0)
+
+    event_source.parser_name = 'winreg'
+    estimated_cost = estimator.EstimateCost(event_source)
+    self.assertEqual(estimated_cost, 40.0)
+
+    # The parser of a file entry is predicted from its file type.
+    event_source = event_sources.FileEntryEventSource(
+        path_spec=fake_path_spec.FakePathSpec(location='/Users/NTUSER.DAT'))
+    event_source.file_size = 20 * self._MEGABYTE
+
+    estimator.UpdateParserNamesPerFileType({'.dat': 'winreg'})
+    estimated_cost = estimator.EstimateCost(event_source)
+    self.assertEqual(estimated_cost, 40.0)
+
+    record_range_event_source = event_sources.RecordRangeEventSource()
+    record_range_event_source.file_size = 20 * self._MEGABYTE
+    estimated_cost = estimator.EstimateCost(record_range_event_source)
+    self.assertIsNone(estimated_cost)
+
+  def testGetParserName(self):
+    """Tests the GetParserName function."""
+    estimator = task_cost.TaskCostEstimator()
+
+    event_source = event_sources.FileEntryEventSource(
+        path_spec=fake_path_spec.FakePathSpec(
+            location='/Windows/System32/config/SYSTEM'))
+
+    parser_name = estimator.GetParserName(event_source)
+    self.assertIsNone(parser_name)
+
+    estimator.UpdateParserNamesPerFileType({
+        '.evtx': 'winevtx', 'system': 'winreg'})
+
+    parser_name = estimator.GetParserName(event_source)
+    self.assertEqual(parser_name, 'winreg')
+
+    record_range_event_source = event_sources.RecordRangeEventSource(
+        path_spec=event_source.path_spec)
+    record_range_event_source.parser_name = 'usnjrnl'
+
+    parser_name = estimator.GetParserName(record_range_event_source)
+    self.assertEqual(parser_name, 'usnjrnl')
+
+  def testUpdateParserThroughputs(self):
+    """Tests the UpdateParserThroughputs function."""
+    estimator = task_cost.TaskCostEstimator()
+
+    self.assertEqual(
+        estimator.GetBytesPerSecond(),
+        estimator._DEFAULT_BYTES_PER_SECOND)
+
+    estimator.UpdateParserThroughputs('Worker_00', {
+        'winreg': ['{0:d}'.format(4 * self._MEGABYTE), 4.0]})
+    estimator.UpdateParserThroughputs('Worker_01', {
+        'winreg': ['{0:d}'.format(2 * self._MEGABYTE), 4.0],
+        'olecf': ['1024', 1.0]})
+
+    self.assertEqual(
+        estimator.GetBytesPerSecond(parser_name='winreg'),
+        6 * self._MEGABYTE / 8.0)
+
+    # Too little data was observed to determine the throughput of olecf.
+    self.assertEqual(
+        estimator.GetBytesPerSecond(parser_name='olecf'),
+        estimator.GetBytesPerSecond())
+
+    # The throughputs of a worker process are replaced by the latest update.
+    estimator.UpdateParserThroughputs('Worker_01', {
+        'winreg': ['{0:d}'.format(4 * self._MEGABYTE), 4.0]})
+
+    self.assertEqual(
+        estimator.GetBytesPerSecond(parser_name='winreg'), self._MEGABYTE)
+
+
+if __name__ == '__main__':
+  unittest.main()
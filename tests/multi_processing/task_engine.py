@@ -7,22 +7,212 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
 from plaso.engine import configurations
+from plaso.engine import plaso_queue
+from plaso.engine import processing_status
+from plaso.lib import definitions
+from plaso.multi_processing import task_cost
 from plaso.multi_processing import task_engine
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def _CreateEventSource(self, location, file_entry_type, file_size=None):
+    """Creates an event source.
+
+    Args:
+      location (str): location of the file entry.
+      file_entry_type (str): dfVFS file entry type.
+      file_size (Optional[int]): size of the file entry in bytes.
+
+    Returns:
+      FileEntryEventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    event_source.file_entry_type = file_entry_type
+    event_source.file_size = file_size
+    return event_source
+
+  def testIsFull(self):
+    """Tests the IsFull function."""
+    event_source_heap = task_engine._EventSourceHeap(maximum_number_of_items=1)
+    self.assertFalse(event_source_heap.IsFull())
+
+    event_source = self._CreateEventSource(
+        '/a', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    event_source_heap.PushEventSource(event_source)
+    self.assertTrue(event_source_heap.IsFull())
+
+  def testPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = task_engine._EventSourceHeap(
+        task_cost_estimator=task_cost.TaskCostEstimator())
+
+    for location, file_entry_type, file_size in (
+        ('/small', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 1024),
+        ('/unknown', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, None),
+        ('/large', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 1024 * 1024),
+        ('/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY, None)):
+      event_source = self._CreateEventSource(
+          location, file_entry_type, file_size=file_size)
+      event_source_heap.PushEventSource(event_source)
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    self.assertEqual(
+        locations, ['/directory', '/large', '/small', '/unknown'])
+
+    # A smaller file that is parsed by a slower parser is scheduled first.
+    estimator = task_cost.TaskCostEstimator()
+    estimator.UpdateParserNamesPerFileType({'.dat': 'winreg', '.txt': 'text'})
+    estimator.UpdateParserThroughputs('Worker_00', {
+        'text': ['{0:d}'.format(40 * 1024 * 1024), 1.0],
+        'winreg': ['{0:d}'.format(2 * 1024 * 1024), 8.0]})
+
+    event_source_heap = task_engine._EventSourceHeap(
+        task_cost_estimator=estimator)
+
+    for location, file_size in (
+        ('/large.txt', 4 * 1024 * 1024), ('/NTUSER.DAT', 1024 * 1024)):
+      event_source = self._CreateEventSource(
+          location, dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          file_size=file_size)
+      event_source_heap.PushEventSource(event_source)
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    self.assertEqual(locations, ['/NTUSER.DAT', '/large.txt'])
+
+
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
+  def _CreateTestProcess(self, pid, is_alive=True, exitcode=None):
+    """Creates a test worker process.
+
+    Args:
+      pid (int): process identifier (PID).
+      is_alive (Optional[bool]): True if the process is alive.
+      exitcode (Optional[int]): exit code of the process.
+
+    Returns:
+      mock.MagicMock: test worker process.
+    """
+    process = mock.MagicMock()
+    process.exitcode = exitcode
+    process.is_alive.return_value = is_alive
+    process.name = 'Worker_{0:02d}'.format(pid)
+    process.pid = pid
+    return process
+
+  def testCheckStoppedWorkerProcess(self):
+    """Tests the _CheckStoppedWorkerProcess function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    for pid, is_alive, exitcode in ((1, True, None), (2, False, 0)):
+      process = self._CreateTestProcess(
+          pid, is_alive=is_alive, exitcode=exitcode)
+      test_engine._processes_per_pid[pid] = process
+      test_engine._process_information_per_pid[pid] = mock.MagicMock()
+
+    # No worker process was asked to stop.
+    self.assertFalse(test_engine._CheckStoppedWorkerProcess(2))
+
+    test_engine._number_of_worker_processes_to_stop = 1
+
+    self.assertFalse(test_engine._CheckStoppedWorkerProcess(1))
+    self.assertTrue(test_engine._CheckStoppedWorkerProcess(2))
+
+    self.assertEqual(test_engine._number_of_worker_processes_to_stop, 0)
+    self.assertEqual(list(test_engine._process_information_per_pid), [1])
+
+    workers_status = test_engine._processing_status.workers_status
+    self.assertEqual(len(workers_status), 1)
+    self.assertEqual(
+        workers_status[0].status, definitions.PROCESSING_STATUS_COMPLETED)
+
+  def testUpdateWorkerPool(self):
+    """Tests the _UpdateWorkerPool function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+    test_engine._task_queue = mock.MagicMock()
+
+    for pid in (1, 2, 3):
+      process_information = mock.MagicMock()
+      process_information.GetCPUUtilization.return_value = 10.0
+      process_information.GetUsedMemory.return_value = 1024
+      test_engine._process_information_per_pid[pid] = process_information
+
+    test_engine._number_of_produced_sources = 10
+    test_engine._number_of_consumed_sources = 4
+
+    controller = mock.MagicMock()
+    controller.DetermineNumberOfWorkers.return_value = (2, 'idle workers')
+    controller.GetSystemResourceUsage.return_value = (None, None)
+    test_engine._worker_pool_controller = controller
+    test_engine._processing_status.UpdateWorkerPoolStatus(2, 8, 3)
+
+    tasks_status = processing_status.TasksStatus()
+    test_engine._UpdateWorkerPool(tasks_status)
+
+    # The number of pending event sources is passed as the backlog.
+    call_arguments = controller.DetermineNumberOfWorkers.call_args[0]
+    self.assertEqual(call_arguments[0], 3)
+    self.assertEqual(call_arguments[1], 6)
+
+    # A worker process is asked to stop through the task queue.
+    self.assertEqual(test_engine._task_queue.PushItem.call_count, 1)
+    queue_item = test_engine._task_queue.PushItem.call_args[0][0]
+    self.assertIsInstance(queue_item, plaso_queue.QueueAbort)
+    self.assertEqual(test_engine._number_of_worker_processes_to_stop, 1)
+
+    # The worker process that was asked to stop is not reported.
+    worker_pool_status = test_engine._processing_status.worker_pool_status
+    self.assertEqual(worker_pool_status.number_of_worker_processes, 2)
+    self.assertEqual(worker_pool_status.number_of_scale_downs, 1)
+
+    # A worker process that was asked to stop is not considered part of
+    # the worker pool.
+    controller.DetermineNumberOfWorkers.return_value = (2, None)
+    test_engine._UpdateWorkerPool(tasks_status)
+
+    call_arguments = controller.DetermineNumberOfWorkers.call_args[0]
+    self.assertEqual(call_arguments[0], 2)
+    self.assertEqual(test_engine._task_queue.PushItem.call_count, 1)
+
+    worker_pool_status = test_engine._processing_status.worker_pool_status
+    self.assertEqual(worker_pool_status.number_of_worker_processes, 2)
+
   @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests the adaptive sizing of the worker process pool."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.multi_processing import worker_pool
+
+from tests import test_lib as shared_test_lib
+
+
+class WorkerPoolControllerTest(shared_test_lib.BaseTestCase):
+  """Tests the worker pool controller."""
+
+  # pylint: disable=protected-access
+
+  _GIGABYTE = 1024 * 1024 * 1024
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    controller = worker_pool.WorkerPoolController(2, 8)
+    self.assertIsNotNone(controller)
+
+    with self.assertRaises(ValueError):
+      worker_pool.WorkerPoolController(0, 8)
+
+    with self.assertRaises(ValueError):
+      worker_pool.WorkerPoolController(4, 2)
+
+  def testGetScaleUpStep(self):
+    """Tests the _GetScaleUpStep function."""
+    controller = worker_pool.WorkerPoolController(2, 64)
+
+    self.assertEqual(controller._GetScaleUpStep(2), 1)
+    self.assertEqual(controller._GetScaleUpStep(16), 4)
+
+  def testDetermineNumberOfWorkers(self):
+    """Tests the DetermineNumberOfWorkers function."""
+    controller = worker_pool.WorkerPoolController(2, 64)
+
+    # CPU bound with pending event sources.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        16, 100, 0, 0, [95.0] * 16, [self._GIGABYTE] * 16,
+        64 * self._GIGABYTE, 1.0, 100.0)
+    self.assertEqual(number_of_workers, 20)
+    self.assertEqual(reason, 'CPU bound with pending event sources')
+
+    # Within the cool down period.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        20, 100, 0, 0, [95.0] * 20, [self._GIGABYTE] * 20,
+        64 * self._GIGABYTE, 1.0, 110.0)
+    self.assertEqual(number_of_workers, 20)
+    self.assertIsNone(reason)
+
+    # Scaling up is limited by the available memory.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        20, 100, 0, 0, [95.0] * 20, [self._GIGABYTE] * 20,
+        3 * self._GIGABYTE, 1.0, 200.0)
+    self.assertEqual(number_of_workers, 22)
+    self.assertEqual(reason, 'CPU bound with pending event sources')
+
+    # Memory pressure.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        22, 100, 0, 0, [95.0] * 22, [self._GIGABYTE] * 22,
+        self._GIGABYTE // 2, 1.0, 300.0)
+    self.assertEqual(number_of_workers, 21)
+    self.assertEqual(reason, 'memory pressure')
+
+    # Merge backlog.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        21, 100, 200, 0, [95.0] * 21, [self._GIGABYTE] * 21,
+        64 * self._GIGABYTE, 1.0, 400.0)
+    self.assertEqual(number_of_workers, 20)
+    self.assertEqual(reason, 'merge backlog')
+
+    # I/O bound.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        20, 100, 0, 0, [5.0] * 20, [self._GIGABYTE] * 20,
+        64 * self._GIGABYTE, 60.0, 500.0)
+    self.assertEqual(number_of_workers, 19)
+    self.assertEqual(reason, 'I/O bound')
+
+    # Idle workers.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        19, 0, 0, 10, [0.0] * 19, [self._GIGABYTE] * 19,
+        64 * self._GIGABYTE, None, 600.0)
+    self.assertEqual(number_of_workers, 18)
+    self.assertEqual(reason, 'idle workers')
+
+    # Not scaled below the minimum.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        2, 0, 0, 2, [0.0] * 2, [self._GIGABYTE] * 2,
+        64 * self._GIGABYTE, None, 700.0)
+    self.assertEqual(number_of_workers, 2)
+    self.assertIsNone(reason)
+
+    # Not scaled up if there are less pending event sources than worker
+    # processes.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        8, 4, 0, 0, [95.0] * 8, [self._GIGABYTE] * 8,
+        64 * self._GIGABYTE, 1.0, 750.0)
+    self.assertEqual(number_of_workers, 8)
+    self.assertIsNone(reason)
+
+    # Not scaled up if not CPU bound.
+    number_of_workers, reason = controller.DetermineNumberOfWorkers(
+        8, 100, 0, 0, [50.0] * 8, [self._GIGABYTE] * 8,
+        64 * self._GIGABYTE, 1.0, 800.0)
+    self.assertEqual(number_of_workers, 8)
+    self.assertIsNone(reason)
+
+  def testGetSystemResourceUsage(self):
+    """Tests the GetSystemResourceUsage function."""
+    controller = worker_pool.WorkerPoolController(2, 8)
+
+    available_memory, _ = controller.GetSystemResourceUsage()
+    self.assertIsNotNone(available_memory)
+
+
+if __name__ == '__main__':
+  unittest.main()
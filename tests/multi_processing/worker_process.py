@@ -100,6 +100,25 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
 
     test_process._Main()
 
+    self.assertIsNotNone(test_process._startup_time)
+
+  def testMainWithExtractionWorker(self):
+    """Tests the _Main function with an initialized extraction worker."""
+    task_queue = multi_process_queue.MultiProcessingQueue(timeout=1)
+
+    configuration = configurations.ProcessingConfiguration()
+    extraction_worker = TestEventExtractionWorker()
+
+    test_process = worker_process.WorkerProcess(
+        task_queue, None, None, None, None, configuration,
+        extraction_worker=extraction_worker, name='TestWorker')
+    test_process._abort = True
+    test_process._pid = 0
+
+    test_process._Main()
+
+    self.assertIsNotNone(test_process._startup_time)
+
   def testProcessPathSpec(self):
     """Tests the _ProcessPathSpec function."""
     configuration = configurations.ProcessingConfiguration()
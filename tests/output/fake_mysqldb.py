@@ -4,12 +4,25 @@
 from __future__ import unicode_literals
 
 
-class Error(object):
+class Error(Exception):
   """Fake implementation of MySQLdb Error class for testing."""
 
 
 class FakeMySQLdbConnection(object):
-  """Fake implementation of MySQLdb Connection class for testing."""
+  """Fake implementation of MySQLdb Connection class for testing.
+
+  Attributes:
+    committed_query_args (list[object]): parameters of the queries that were
+        executed and committed.
+    uncommitted_query_args (list[object]): parameters of the queries that
+        were executed but not yet committed.
+  """
+
+  def __init__(self):
+    """Initializes the connection."""
+    super(FakeMySQLdbConnection, self).__init__()
+    self.committed_query_args = []
+    self.uncommitted_query_args = []
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the MySQL database connection interface.
@@ -21,7 +34,8 @@ class FakeMySQLdbConnection(object):
 
   def commit(self):
     """Commits changes to the database."""
-    return
+    self.committed_query_args.extend(self.uncommitted_query_args)
+    self.uncommitted_query_args = []
 
   def cursor(self):
     """Retrieves a database cursor.
@@ -29,7 +43,11 @@ class FakeMySQLdbConnection(object):
     Returns:
       FakeMySQLCursor: cursor.
     """
-    return FakeMySQLdbCursor()
+    return FakeMySQLdbCursor(connection=self)
+
+  def rollback(self):
+    """Rolls back the changes to the database that were not committed."""
+    self.uncommitted_query_args = []
 
   # pylint: disable=unused-argument
   def set_character_set(self, character_set):
@@ -45,16 +63,30 @@ class FakeMySQLdbCursor(object):
   """Fake implementation of MySQLdb Cursor class for testing.
 
   Attributes:
+    error_query_args (list[object]): sequences or mappings of parameters for
+        which the execute method raises an error.
     expected_query (str): query expected to be passed to the execute method.
+    expected_query_args (object): sequence or mapping of the parameters
+        expected to be passed to the execute method.
+    number_of_executed_rows (int): number of rows passed to the execute
+        and executemany methods.
     query_results (list[object]): rows to return as results of the query.
   """
 
-  def __init__(self):
-    """Initializes the cursor."""
+  def __init__(self, connection=None):
+    """Initializes the cursor.
+
+    Args:
+      connection (Optional[FakeMySQLdbConnection]): connection that tracks
+          the parameters of the executed queries.
+    """
     super(FakeMySQLdbCursor, self).__init__()
+    self._connection = connection
     self._result_index = 0
+    self.error_query_args = []
     self.expected_query = None
     self.expected_query_args = None
+    self.number_of_executed_rows = 0
     self.query_results = []
 
   # Note: that the following functions do not follow the style guide
@@ -74,6 +106,7 @@ class FakeMySQLdbCursor(object):
           with the query.
 
     Raises:
+      Error: if the query arguments are set to raise an error.
       ValueError: if the query or query arguments do not match the expected
           values.
     """
@@ -84,7 +117,46 @@ class FakeMySQLdbCursor(object):
         self.expected_query_args != args):
       raise ValueError('Query arguments mismatch.')
 
+    if args in self.error_query_args:
+      raise Error('Unable to execute query.')
+
     self._result_index = 0
+    self.number_of_executed_rows += 1
+
+    if self._connection:
+      self._connection.uncommitted_query_args.append(args)
+
+  def executemany(self, query, args):
+    """Executes the query for every set of parameters.
+
+    Args:
+      query (str): SQL query.
+      args (list[object]): sequences or mappings of the parameters to use with
+          the query.
+
+    Raises:
+      Error: if the query arguments are set to raise an error, where
+          the query is executed for the parameters preceding those query
+          arguments.
+      ValueError: if the query or query arguments do not match the expected
+          values.
+    """
+    for query_args in args:
+      self.execute(query, args=query_args)
+
+  def fetchall(self):
+    """Fetches the remaining rows of the results returned by execute.
+
+    Returns:
+      list[object]: rows.
+    """
+    rows = []
+    row = self.fetchone()
+    while row:
+      rows.append(row)
+      row = self.fetchone()
+
+    return rows
 
   def fetchone(self):
     """Fetches a single row of the results returned by execute.
@@ -104,14 +176,14 @@ class FakeMySQLdbCursor(object):
 # Note: that the following function does not follow the style guide
 # because they are part of the MySQL database module interface.
 # pylint: disable=invalid-name,unused-argument
-def connect(hostname, username, password, database_name):
+def connect(hostname, username, password, database_name=None):
   """Connects to the MySQL database server.
 
   Args:
     hostname (str): hostname of the server.
     username (str): username to use to connect to the server.
     password (str): password to use to connect to the server.
-    database_name (str): name of the database on the server.
+    database_name (Optional[str]): name of the database on the server.
 
   Returns:
     FakeMySQLdbConnection: connection
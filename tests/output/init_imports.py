@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from plaso.output import manifest
+
 from tests import test_lib
 
 
@@ -15,12 +17,14 @@ class OutputImportTest(test_lib.ImportCheckTestCase):
 
   _OUTPUT_PATH = os.path.join(os.getcwd(), 'plaso', 'output')
   _IGNORABLE_FILES = frozenset([
-      'logger.py', 'manager.py', 'mediator.py', 'interface.py',
+      'logger.py', 'manager.py', 'manifest.py', 'mediator.py', 'interface.py',
       'shared_4n6time.py', 'shared_elastic.py'])
 
   def testOutputModulesImported(self):
-    """Tests that all output modules are imported."""
-    self._AssertFilesImportedInInit(self._OUTPUT_PATH, self._IGNORABLE_FILES)
+    """Tests that all output modules are defined in the manifest."""
+    self._AssertFilesDefinedInManifest(
+        self._OUTPUT_PATH, 'plaso.output',
+        set(manifest.OUTPUT_MODULES.values()), self._IGNORABLE_FILES)
 
 
 if __name__ == '__main__':
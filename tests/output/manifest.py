@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the output modules manifest."""
+
+from __future__ import unicode_literals
+
+import importlib
+import pkgutil
+import unittest
+
+from plaso import output
+from plaso.output import manager
+from plaso.output import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class OutputModulesManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the output modules manifest."""
+
+  def testManifest(self):
+    """Tests that the manifest defines the modules of all output modules."""
+    for _, module_name, _ in pkgutil.walk_packages(
+        output.__path__, prefix='plaso.output.'):
+      importlib.import_module(module_name)
+
+    output_classes = list(manager.OutputManager.GetOutputClasses())
+    output_classes.extend(manager.OutputManager.GetDisabledOutputClasses())
+
+    names = []
+    for name, output_class in output_classes:
+      # Ignore output modules that are registered by tests.
+      if not output_class.__module__.startswith('plaso.output.'):
+        continue
+
+      name = name.lower()
+      names.append(name)
+
+      module_name = manifest.OUTPUT_MODULES.get(name, None)
+      self.assertEqual(module_name, output_class.__module__)
+
+    self.assertEqual(sorted(names), sorted(manifest.OUTPUT_MODULES.keys()))
+
+
+if __name__ == '__main__':
+  unittest.main()
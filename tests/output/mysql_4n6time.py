@@ -7,7 +7,6 @@ from __future__ import unicode_literals
 import unittest
 
 from plaso.containers import events
-from plaso import formatters   # pylint: disable=unused-import
 from plaso.lib import definitions
 from plaso.lib import timelib
 from plaso.output import mysql_4n6time
@@ -44,34 +43,61 @@ class MySQL4n6TimeOutputModuleTest(test_lib.OutputModuleTestCase):
 
   # pylint: disable=protected-access
 
-  def testGetTags(self):
-    """Tests the _GetTags function."""
+  def testInsertRows(self):
+    """Tests the _InsertRows function."""
     fake_cursor = fake_mysqldb.FakeMySQLdbCursor()
-    fake_cursor.expected_query = 'SELECT DISTINCT tag FROM log2timeline'
-    fake_cursor.query_results = [('one',), ('two,three',), ('four',)]
+    fake_cursor.expected_query = (
+        mysql_4n6time.MySQL4n6TimeOutputModule._INSERT_QUERY)
 
     output_mediator = self._CreateOutputMediator()
     output_module = mysql_4n6time.MySQL4n6TimeOutputModule(output_mediator)
+    output_module._connection = fake_mysqldb.FakeMySQLdbConnection()
     output_module._cursor = fake_cursor
 
-    expected_tags = ['one', 'two', 'three', 'four']
-    tags = output_module._GetTags()
-    self.assertEqual(tags, expected_tags)
+    rows = [{'host': 'one'}, {'host': 'two'}, {'host': 'three'}]
+    inserted_rows = output_module._InsertRows(rows)
+    self.assertEqual(inserted_rows, rows)
+    self.assertEqual(fake_cursor.number_of_executed_rows, 3)
 
-  def testGetUniqueValues(self):
-    """Tests the _GetUniqueValues function."""
-    fake_cursor = fake_mysqldb.FakeMySQLdbCursor()
+  def testInsertRowsWithFailedBatch(self):
+    """Tests the _InsertRows function with a batch that fails partway."""
+    fake_connection = fake_mysqldb.FakeMySQLdbConnection()
+
+    fake_cursor = fake_connection.cursor()
+    fake_cursor.error_query_args = [{'host': 'two'}]
     fake_cursor.expected_query = (
-        'SELECT source, COUNT(source) FROM log2timeline GROUP BY source')
-    fake_cursor.query_results = [('one', 1), ('two', 2), ('three', 3)]
+        mysql_4n6time.MySQL4n6TimeOutputModule._INSERT_QUERY)
 
     output_mediator = self._CreateOutputMediator()
     output_module = mysql_4n6time.MySQL4n6TimeOutputModule(output_mediator)
+    output_module._connection = fake_connection
     output_module._cursor = fake_cursor
 
-    expected_unique_values = {'one': 1, 'two': 2, 'three': 3}
-    unique_values = output_module._GetUniqueValues('source')
-    self.assertEqual(unique_values, expected_unique_values)
+    rows = [{'host': 'one'}, {'host': 'two'}, {'host': 'three'}]
+    inserted_rows = output_module._InsertRows(rows)
+
+    # The rows inserted by the failed batch are rolled back, so that the rows
+    # are not inserted twice.
+    expected_rows = [{'host': 'one'}, {'host': 'three'}]
+    self.assertEqual(inserted_rows, expected_rows)
+    self.assertEqual(fake_connection.committed_query_args, expected_rows)
+    self.assertEqual(fake_connection.uncommitted_query_args, [])
+
+  def testWriteMetadata(self):
+    """Tests the _WriteMetadata function."""
+    fake_cursor = fake_mysqldb.FakeMySQLdbCursor()
+
+    output_mediator = self._CreateOutputMediator()
+    output_module = mysql_4n6time.MySQL4n6TimeOutputModule(output_mediator)
+
+    output_module._AddMetadata([
+        {'host': 'one', 'source': 'LOG', 'tag': 'one,two'},
+        {'host': 'two', 'source': 'LOG', 'tag': 'three'}])
+
+    output_module._WriteMetadata(fake_cursor, '%s')
+
+    # A DELETE query for every metadata table, 3 metadata values and 3 tags.
+    self.assertEqual(fake_cursor.number_of_executed_rows, 14)
 
   # TODO: add test for Open and Close
 
@@ -188,7 +214,7 @@ class MySQL4n6TimeOutputModuleTest(test_lib.OutputModuleTestCase):
 
     output_mediator = self._CreateOutputMediator()
     output_module = mysql_4n6time.MySQL4n6TimeOutputModule(output_mediator)
-    output_module._count = 0
+    output_module._connection = fake_mysqldb.FakeMySQLdbConnection()
     output_module._cursor = fake_cursor
 
     timestamp = timelib.Timestamp.CopyFromString(
@@ -196,6 +222,14 @@ class MySQL4n6TimeOutputModuleTest(test_lib.OutputModuleTestCase):
     event = MySQL4n6TimeTestEvent(timestamp)
     output_module.WriteEventBody(event)
 
+    # The rows are buffered until the buffer is full or the module is closed.
+    self.assertEqual(fake_cursor.number_of_executed_rows, 0)
+
+    output_module._FlushRows()
+    self.assertEqual(fake_cursor.number_of_executed_rows, 1)
+    self.assertEqual(output_module._count, 1)
+    self.assertEqual(output_module._meta_field_values['host']['ubuntu'], 1)
+
 
 if __name__ == '__main__':
   unittest.main()
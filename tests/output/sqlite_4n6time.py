@@ -43,6 +43,8 @@ class TestEventData(events.EventData):
 class SqliteOutputModuleTest(test_lib.OutputModuleTestCase):
   """Tests for the 4n6time SQLite output module."""
 
+  # pylint: disable=protected-access
+
   # TODO: remove after event data refactor.
   def _MergeEventAndEventData(self, event, event_data):
     """Merges the event data with the event.
@@ -116,6 +118,77 @@ class SqliteOutputModuleTest(test_lib.OutputModuleTestCase):
       row_dict = dict(zip(row.keys(), row))
       self.assertDictContainsSubset(expected_dict, row_dict)
 
+  def testOutputMetadata(self):
+    """Tests the metadata tables written by the 4n6time SQLite output."""
+    timestamp = timelib.Timestamp.CopyFromString(
+        '2012-06-27 18:17:01+00:00')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      sqlite_file = os.path.join(temp_directory, '4n6time.db')
+
+      for append, hostnames in ((False, ['ubuntu', 'debian', 'ubuntu']),
+                                (True, ['ubuntu', 'fedora'])):
+        output_mediator = self._CreateOutputMediator()
+        sqlite_output = sqlite_4n6time.SQLite4n6TimeOutputModule(
+            output_mediator)
+        sqlite_output._MAXIMUM_NUMBER_OF_BUFFERED_ROWS = 2
+        sqlite_output.SetAppendMode(append)
+        sqlite_output.SetFilename(sqlite_file)
+
+        sqlite_output.Open()
+        for index, hostname in enumerate(hostnames):
+          event = time_events.TimestampEvent(
+              timestamp, definitions.TIME_DESCRIPTION_WRITTEN)
+          self._MergeEventAndEventData(event, TestEventData())
+          event.hostname = hostname
+          event.record_number = index
+          sqlite_output.WriteEventBody(event)
+
+        sqlite_output.Close()
+
+      sqlite_connection = sqlite3.connect(sqlite_file)
+
+      cursor = sqlite_connection.execute(
+          'SELECT COUNT(*) FROM log2timeline')
+      self.assertEqual(cursor.fetchone()[0], 5)
+
+      # The metadata maintained while writing should match the metadata
+      # determined from the log2timeline table.
+      for field in sqlite_4n6time.SQLite4n6TimeOutputModule._META_FIELDS:
+        cursor = sqlite_connection.execute((
+            'SELECT {0:s}, COUNT({0:s}) FROM log2timeline '
+            'GROUP BY {0:s}').format(field))
+        expected_values = {
+            value: frequency for value, frequency in cursor if value}
+
+        cursor = sqlite_connection.execute(
+            'SELECT {0:s}s, frequency FROM l2t_{0:s}s'.format(field))
+        self.assertEqual(dict(cursor.fetchall()), expected_values)
+
+      cursor = sqlite_connection.execute(
+          'SELECT hosts, frequency FROM l2t_hosts')
+      self.assertEqual(
+          dict(cursor.fetchall()), {'debian': 1, 'fedora': 1, 'ubuntu': 3})
+
+      sqlite_connection.close()
+
+  def testAddMetadata(self):
+    """Tests the _AddMetadata function."""
+    output_mediator = self._CreateOutputMediator()
+    sqlite_output = sqlite_4n6time.SQLite4n6TimeOutputModule(output_mediator)
+
+    sqlite_output._AddMetadata([
+        {'host': 'ubuntu', 'record_number': 0, 'tag': 'one,two', 'user': ''},
+        {'host': 'ubuntu', 'record_number': 1, 'tag': 'two,three',
+         'user': None}])
+
+    self.assertEqual(
+        sqlite_output._meta_field_values['host'], {'ubuntu': 2})
+    self.assertEqual(
+        sqlite_output._meta_field_values['record_number'], {'0': 1, '1': 1})
+    self.assertEqual(sqlite_output._meta_field_values['user'], {})
+    self.assertEqual(list(sqlite_output._tags.keys()), ['one', 'two', 'three'])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+from plaso.parsers import bencode_plugins  # pylint: disable=unused-import
+
 from tests.parsers import test_lib
 
 
@@ -8,6 +8,8 @@ import glob
 import os
 import unittest
 
+from plaso.parsers import manifest
+
 from tests import test_lib
 
 
@@ -19,9 +21,20 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
       'dtfabric_parser.py', 'dtfabric_plugin.py', 'logger.py', 'manager.py',
       'presets.py', 'mediator.py', 'interface.py', 'plugins.py'])
 
+  # Modules that do not register parsers themselves, but contain super classes
+  # used by parsers in other modules.
+  _IGNORABLE_MANIFEST_FILES = frozenset([
+      'dsv_parser.py', 'manifest.py', 'text_parser.py'])
+
   def testParsersImported(self):
-    """Tests that all parsers are imported."""
-    self._AssertFilesImportedInInit(self._PARSERS_PATH, self._IGNORABLE_FILES)
+    """Tests that all parsers are defined in the manifest."""
+    module_names = set()
+    for parser_module_names in manifest.PARSERS.values():
+      module_names.update(parser_module_names)
+
+    self._AssertFilesDefinedInManifest(
+        self._PARSERS_PATH, 'plaso.parsers', module_names,
+        self._IGNORABLE_FILES.union(self._IGNORABLE_MANIFEST_FILES))
 
   def testPluginsImported(self):
     """Tests that all plugins are imported."""
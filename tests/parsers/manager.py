@@ -4,8 +4,14 @@
 
 from __future__ import unicode_literals
 
+import sys
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from plaso.parsers import interface
 from plaso.parsers import manager
 from plaso.parsers import plugins
@@ -131,6 +137,31 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
         'bogus')
     self.assertEqual(parser_names, [])
 
+  def testImportParserModules(self):
+    """Tests the _ImportParserModules function."""
+    manager.ParsersManager._ImportParserModules(
+        parser_names=['bogus', 'winreg'])
+
+    self.assertIn('plaso.parsers.winreg', sys.modules)
+    self.assertIn('plaso.parsers.winreg_plugins', sys.modules)
+
+    parser_object = manager.ParsersManager.GetParserObjectByName('winreg')
+    self.assertIsNotNone(parser_object)
+
+  def testImportParserModulesWithMissingDependency(self):
+    """Tests the _ImportParserModules function with a missing dependency."""
+    # A module of None in sys.modules causes its import to fail.
+    modules = {'lz4': None, 'plaso.parsers.winlnk': None}
+
+    with mock.patch.dict(sys.modules, modules):
+      sys.modules.pop('plaso.parsers.systemd_journal', None)
+
+      manager.ParsersManager._ImportParserModules(
+          parser_names=['systemd_journal'])
+
+      with self.assertRaises(ImportError):
+        manager.ParsersManager._ImportParserModules(parser_names=['lnk'])
+
   def testReduceParserFilters(self):
     """Tests the _ReduceParserFilters function."""
     includes = {}
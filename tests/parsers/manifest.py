@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the parsers manifest."""
+
+from __future__ import unicode_literals
+
+import importlib
+import pkgutil
+import unittest
+
+from plaso import parsers
+from plaso.parsers import manager
+from plaso.parsers import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class ParsersManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the parsers manifest."""
+
+  # pylint: disable=protected-access
+
+  def testManifest(self):
+    """Tests that the manifest defines the modules of all parsers."""
+    for _, module_name, _ in pkgutil.walk_packages(
+        parsers.__path__, prefix='plaso.parsers.'):
+      importlib.import_module(module_name)
+
+    parser_names = []
+    for parser_name, parser_class in manager.ParsersManager.GetParsers():
+      # Ignore parsers that are registered by tests.
+      if not parser_class.__module__.startswith('plaso.parsers.'):
+        continue
+
+      parser_names.append(parser_name)
+
+      module_names = manifest.PARSERS.get(parser_name, [])
+      self.assertIn(parser_class.__module__, module_names)
+
+      if parser_class.SupportsPlugins():
+        for _, plugin_class in parser_class.GetPlugins():
+          package_name, _, _ = plugin_class.__module__.rpartition('.')
+          self.assertIn(package_name, module_names)
+
+    self.assertEqual(sorted(parser_names), sorted(manifest.PARSERS.keys()))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -41,6 +41,77 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     # TODO: improve test coverage.
 
+  def testGetEnrichmentContext(self):
+    """Tests the _GetEnrichmentContext function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+    parsers_mediator.SetFileEntry(file_entry)
+
+    enrichment_context = parsers_mediator._GetEnrichmentContext(file_entry)
+    self.assertIsNotNone(enrichment_context)
+    self.assertEqual(
+        enrichment_context.display_name, 'OS:{0:s}'.format(test_path))
+    self.assertEqual(enrichment_context.filename, test_path)
+    self.assertIsNotNone(enrichment_context.inode)
+    self.assertEqual(enrichment_context.path_spec, os_path_spec)
+
+    # The enrichment context of the active file entry is cached.
+    self.assertIs(
+        parsers_mediator._GetEnrichmentContext(file_entry), enrichment_context)
+
+    parsers_mediator.ResetFileEntry()
+    self.assertIsNone(parsers_mediator._enrichment_context)
+
+    # The enrichment context of another file entry is not cached.
+    other_enrichment_context = parsers_mediator._GetEnrichmentContext(
+        file_entry)
+    self.assertIsNot(other_enrichment_context, enrichment_context)
+    self.assertIsNone(parsers_mediator._enrichment_context)
+
+  def testGetEventDataContentIdentifier(self):
+    """Tests the _GetEventDataContentIdentifier function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data = events.EventData(data_type='test:event')
+    event_data.values = {'b': 2, 'a': 1}
+
+    content_identifier = parsers_mediator._GetEventDataContentIdentifier(
+        event_data)
+    expected_content_identifier = (
+        ('data_type', (type('test:event').__name__, 'test:event')),
+        ('values', ('dict', (
+            ((type('a').__name__, 'a'), ('int', 1)),
+            ((type('b').__name__, 'b'), ('int', 2))))))
+    self.assertEqual(content_identifier, expected_content_identifier)
+
+    # Values that compare equal but are of different types have different
+    # identifiers.
+    content_identifiers = set()
+    for value in (
+        True, 1, 1.0, {'a': 1}, [('a', 1)], (('a', 1), ), [True], [1],
+        [[1, 2], [3]]):
+      event_data.values = value
+      content_identifiers.add(
+          parsers_mediator._GetEventDataContentIdentifier(event_data))
+
+    self.assertEqual(len(content_identifiers), 9)
+
+    event_data.values = set([1, 2])
+
+    content_identifier = parsers_mediator._GetEventDataContentIdentifier(
+        event_data)
+    self.assertEqual(
+        content_identifier, event_data.GetAttributeValuesString())
+
   # TODO: add tests for _GetInode.
 
   def testGetLatestYearFromFileEntry(self):
@@ -175,6 +246,39 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
   # TODO: add tests for GetParserChain.
   # TODO: add tests for PopFromParserChain.
   # TODO: add tests for ProcessEvent.
+  def testProcessEvent(self):
+    """Tests the ProcessEvent function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+    parsers_mediator.SetFileEntry(file_entry)
+
+    for _ in range(2):
+      event_data = events.EventData()
+      parsers_mediator.ProcessEvent(event_data, parser_chain='test')
+
+      self.assertEqual(event_data.display_name, 'OS:{0:s}'.format(test_path))
+      self.assertEqual(event_data.filename, test_path)
+      self.assertIsNotNone(event_data.inode)
+      self.assertEqual(event_data.parser, 'test')
+      self.assertEqual(event_data.pathspec, os_path_spec)
+
+    event_data = events.EventData()
+    event_data.filename = 'filename'
+    event_data.user_sid = 'S-1-5-18'
+    parsers_mediator.ProcessEvent(event_data)
+
+    self.assertEqual(event_data.filename, 'filename')
+    self.assertFalse(hasattr(event_data, 'username'))
+    self.assertEqual(
+        parsers_mediator._enrichment_context.usernames, {'S-1-5-18': ''})
+
   # TODO: add tests for ProduceEventSource.
 
   def testProduceEventWithEventData(self):
@@ -198,7 +302,85 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
       parsers_mediator.ProduceEventWithEventData(
           event_without_timestamp, event_data)
 
+  def testProduceEventWithEventDataInterleaved(self):
+    """Tests the ProduceEventWithEventData method with interleaved data."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    date_time = fake_time.FakeTime()
+
+    first_event_data = events.EventData(data_type='test:first')
+    second_event_data = events.EventData(data_type='test:second')
+
+    for event_data in (
+        first_event_data, second_event_data, first_event_data,
+        second_event_data):
+      event = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      parsers_mediator.ProduceEventWithEventData(event, event_data)
+
+    self.assertEqual(storage_writer.number_of_events, 4)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 2)
+    self.assertEqual(parsers_mediator._event_data_cache_hits, 2)
+    self.assertEqual(parsers_mediator._event_data_cache_lookups, 4)
+
+    # Event data is not shared between file entries.
+    parsers_mediator.ResetFileEntry()
+    self.assertEqual(parsers_mediator._event_data_cache_lookups, 0)
+
+    event = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventData(event, first_event_data)
+
+    self.assertEqual(parsers_mediator._event_data_cache_hits, 0)
+    self.assertEqual(parsers_mediator._event_data_cache_lookups, 1)
+
   # TODO: add tests for ProduceExtractionWarning.
+
+  def testProduceRecordRangeEventSource(self):
+    """Tests the ProduceRecordRangeEventSource function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    with self.assertRaises(RuntimeError):
+      parsers_mediator.ProduceRecordRangeEventSource('test', (10, 20))
+
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+    parsers_mediator.SetFileEntry(file_entry)
+    parsers_mediator.SetSplitRecordRanges(True)
+    self.assertFalse(parsers_mediator.split_record_ranges)
+
+    parsers_mediator.SetDataStreamName('')
+    self.assertTrue(parsers_mediator.split_record_ranges)
+
+    parsers_mediator.AddEventAttribute('sha256_hash', 'test_hash')
+    parsers_mediator.ProduceRecordRangeEventSource('test', (10, 20))
+    self.assertEqual(storage_writer.number_of_event_sources, 1)
+
+    event_source = list(storage_writer.GetEventSources())[0]
+    self.assertEqual(event_source.data_stream_name, '')
+    self.assertEqual(
+        event_source.event_attributes, {'sha256_hash': 'test_hash'})
+    self.assertEqual(event_source.parser_name, 'test')
+    self.assertEqual(event_source.path_spec, os_path_spec)
+    self.assertEqual(event_source.record_range, (10, 20))
+
+    # Record ranges are not split further.
+    parsers_mediator.SetRecordRange((10, 20))
+    self.assertFalse(parsers_mediator.split_record_ranges)
+
+    parsers_mediator.ResetFileEntry()
+    self.assertIsNone(parsers_mediator.record_range)
+    self.assertFalse(parsers_mediator.split_record_ranges)
+
   # TODO: add tests for RemoveEventAttribute.
 
   def testResetFileEntry(self):
@@ -209,6 +391,53 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     parsers_mediator.ResetFileEntry()
 
+  @shared_test_lib.skipUnlessHasTestFile(['syslog'])
+  def testSampleTiming(self):
+    """Tests the SampleStartTiming and SampleStopTiming functions."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    self.assertEqual(parsers_mediator.parser_timings, {})
+
+    parsers_mediator.SampleStartTiming('test')
+    parsers_mediator.SampleStopTiming('test')
+    parsers_mediator.SampleStartTiming('test')
+    parsers_mediator.SampleStopTiming('test')
+
+    # Stopping a timing that was not started is ignored.
+    parsers_mediator.SampleStopTiming('bogus')
+
+    self.assertEqual(list(parsers_mediator.parser_timings.keys()), ['test'])
+    self.assertGreaterEqual(parsers_mediator.parser_timings['test'], 0.0)
+
+    # Throughputs are only determined for the default data stream.
+    self.assertEqual(parsers_mediator.parser_throughputs, {})
+
+    test_path = self._GetTestFilePath(['syslog'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+    parsers_mediator.SetFileEntry(file_entry)
+    parsers_mediator.SetDataStreamName('')
+
+    # Throughputs are only determined for parsers that parsed the data stream.
+    parsers_mediator.SampleStartTiming('rejected')
+    parsers_mediator.SampleStopTiming('rejected')
+
+    parsers_mediator.SampleStartTiming('test')
+    parsers_mediator.SampleStopTiming('test', parsed=True)
+
+    self.assertEqual(list(parsers_mediator.parser_throughputs.keys()), ['test'])
+
+    data_size, parser_time = parsers_mediator.parser_throughputs['test']
+    self.assertEqual(data_size, file_entry.GetStat().size)
+    self.assertGreaterEqual(parser_time, 0.0)
+
+    self.assertEqual(
+        parsers_mediator.parser_names_per_file_type, {'syslog': 'test'})
+
   # TODO: add tests for SetEventExtractionConfiguration.
   # TODO: add tests for SetInputSourceConfiguration.
 
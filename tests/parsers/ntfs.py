@@ -4,13 +4,16 @@
 
 from __future__ import unicode_literals
 
+import struct
 import unittest
 
+from dfdatetime import filetime as dfdatetime_filetime
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.formatters import file_system  # pylint: disable=unused-import
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.parsers import ntfs
 
 from tests import test_lib as shared_test_lib
@@ -170,9 +173,160 @@ class NTFSMFTParserTest(test_lib.ParserTestCase):
     self.assertEqual(storage_writer.number_of_events, 184)
 
 
+class TestUSNChangeJournal(object):
+  """USN change journal for testing.
+
+  Provides the subset of the pyfsntfs.usn_change_journal interface used by
+  the parser.
+  """
+
+  def __init__(self, usn_records_data):
+    """Initializes an USN change journal.
+
+    Args:
+      usn_records_data (list[bytes]): data of the USN records.
+    """
+    super(TestUSNChangeJournal, self).__init__()
+    self._offset = 0
+    self._usn_records_data = list(usn_records_data)
+
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset.
+
+    Returns:
+      int: current offset.
+    """
+    return self._offset
+
+  def read_usn_record(self):
+    """Reads an USN record.
+
+    Returns:
+      bytes: USN record data or None if no more records are available.
+    """
+    if not self._usn_records_data:
+      return None
+
+    usn_record_data = self._usn_records_data.pop(0)
+    self._offset += len(usn_record_data)
+    return usn_record_data
+
+
 class NTFSUsnJrnlParser(test_lib.ParserTestCase):
   """Tests for NTFS $UsnJrnl metadata file parser."""
 
+  def _CreateUSNRecordV2Data(self, name, update_date_time):
+    """Creates USN_RECORD_V2 data.
+
+    Args:
+      name (str): name of the file.
+      update_date_time (int): FILETIME timestamp of the update.
+
+    Returns:
+      bytes: USN record data.
+    """
+    name_data = name.encode('utf-16-le')
+    record_size = 60 + len(name_data)
+    record_size += (8 - (record_size % 8)) % 8
+
+    header_data = struct.pack(
+        '<IHHQQQQIIIIHH', record_size, 2, 0, 0x000100000000001e,
+        0x0005000000000005, 1234567, update_date_time, 0x00000100, 0, 0,
+        0x00000020, len(name_data), 60)
+
+    return b''.join([
+        header_data, name_data,
+        b'\x00' * (record_size - 60 - len(name_data))])
+
+  def testCopyFiletimeToPlasoTimestamp(self):
+    """Tests the _CopyFiletimeToPlasoTimestamp function."""
+    parser = ntfs.NTFSUsnJrnlParser()
+
+    for filetime in (
+        1, 5, 15, 116444735999999995, 116444736000000000, 116444736000000005,
+        130933917272031250, 0xffffffffffffffff):
+      date_time = dfdatetime_filetime.Filetime(timestamp=filetime)
+      timestamp = parser._CopyFiletimeToPlasoTimestamp(filetime)
+      self.assertEqual(timestamp, date_time.GetPlasoTimestamp())
+
+  def testReadUSNRecordV2(self):
+    """Tests the _ReadUSNRecordV2 function."""
+    parser = ntfs.NTFSUsnJrnlParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    usn_record_map = parser._GetDataTypeMap('usn_record_v2')
+    usn_record_data = self._CreateUSNRecordV2Data(
+        'Nieuw - Tekstdocument.txt', 130933917272031250)
+
+    usn_record = parser._ReadStructureFromByteStream(
+        usn_record_data, 0, usn_record_map)
+
+    (file_reference, parent_file_reference, update_sequence_number,
+     update_date_time, update_reason_flags, update_source_flags,
+     file_attribute_flags, name_string) = parser._ReadUSNRecordV2(
+         parser_mediator, usn_record_data, 0)
+
+    self.assertEqual(file_reference, usn_record.file_reference)
+    self.assertEqual(parent_file_reference, usn_record.parent_file_reference)
+    self.assertEqual(
+        update_sequence_number, usn_record.update_sequence_number)
+    self.assertEqual(update_date_time, usn_record.update_date_time)
+    self.assertEqual(update_reason_flags, usn_record.update_reason_flags)
+    self.assertEqual(update_source_flags, usn_record.update_source_flags)
+    self.assertEqual(file_attribute_flags, usn_record.file_attribute_flags)
+    self.assertEqual(name_string, 'Nieuw - Tekstdocument.txt')
+
+    with self.assertRaises(errors.ParseError):
+      parser._ReadUSNRecordV2(parser_mediator, usn_record_data[:32], 0)
+
+    with self.assertRaises(errors.ParseError):
+      parser._ReadUSNRecordV2(parser_mediator, usn_record_data[:64], 0)
+
+  def testParseUSNChangeJournal(self):
+    """Tests the _ParseUSNChangeJournal function."""
+    parser = ntfs.NTFSUsnJrnlParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    usn_change_journal = TestUSNChangeJournal([
+        self._CreateUSNRecordV2Data(
+            'Nieuw - Tekstdocument.txt', 130933917272031250),
+        self._CreateUSNRecordV2Data('unset.txt', 0)])
+
+    parser._ParseUSNChangeJournal(parser_mediator, usn_change_journal)
+
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 2)
+
+    events = list(storage_writer.GetEvents())
+
+    event = events[0]
+
+    self.CheckTimestamp(event.timestamp, '2015-11-30 21:15:27.203125')
+    self.assertEqual(
+        event.timestamp_desc, definitions.TIME_DESCRIPTION_ENTRY_MODIFICATION)
+    self.assertEqual(event.filename, 'Nieuw - Tekstdocument.txt')
+    self.assertEqual(event.file_reference, 0x000100000000001e)
+    self.assertEqual(event.offset, 112)
+    self.assertEqual(event.update_sequence_number, 1234567)
+
+    expected_message = (
+        'Nieuw - Tekstdocument.txt '
+        'File reference: 30-1 '
+        'Parent file reference: 5-5 '
+        'Update reason: USN_REASON_FILE_CREATE')
+
+    expected_short_message = (
+        'Nieuw - Tekstdocument.txt 30-1 USN_REASON_FILE_CREATE')
+
+    self._TestGetMessageStrings(event, expected_message, expected_short_message)
+
+    event = events[1]
+    self.assertEqual(event.timestamp, 0)
+
   @shared_test_lib.skipUnlessHasTestFile(['usnjrnl.qcow2'])
   def testParseImage(self):
     """Tests the Parse function on a storage media image."""
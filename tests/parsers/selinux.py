@@ -76,6 +76,20 @@ class SELinuxUnitTest(test_lib.ParserTestCase):
 
     self._TestGetMessageStrings(event, expected_message, expected_short_message)
 
+  @shared_test_lib.skipUnlessHasTestFile(['selinux.log'])
+  def testParseInRecordRanges(self):
+    """Tests the Parse function in record ranges."""
+    parser = selinux.SELinuxParser()
+    parser._RECORD_RANGE_SIZE = 256  # pylint: disable=protected-access
+
+    knowledge_base_values = {'year': 2013}
+    storage_writer = self._ParseFileInRecordRanges(
+        ['selinux.log'], parser, knowledge_base_values=knowledge_base_values)
+
+    self.assertGreater(storage_writer.number_of_event_sources, 1)
+    self.assertEqual(storage_writer.number_of_warnings, 4)
+    self.assertEqual(storage_writer.number_of_events, 7)
+
 
 if __name__ == '__main__':
   unittest.main()
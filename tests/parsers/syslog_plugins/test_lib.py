@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 from plaso.containers import sessions
 from plaso.parsers import syslog
+from plaso.parsers import syslog_plugins  # pylint: disable=unused-import
 from plaso.storage.fake import writer as fake_writer
 
 from tests.parsers import test_lib
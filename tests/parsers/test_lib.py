@@ -149,6 +149,54 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
 
     return storage_writer
 
+  def _ParseFileInRecordRanges(
+      self, path_segments, parser, knowledge_base_values=None):
+    """Parses a file in record ranges and writes results to a storage writer.
+
+    The file is first parsed with splitting record ranges enabled, after which
+    the record ranges produced as event sources are parsed.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+      parser (BaseParser): parser.
+      knowledge_base_values (Optional[dict]): knowledge base values.
+
+    Returns:
+      FakeStorageWriter: storage writer.
+    """
+    path = self._GetTestFilePath(path_segments)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+
+    storage_writer = self._CreateStorageWriter()
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry,
+        knowledge_base_values=knowledge_base_values)
+    parser_mediator.SetDataStreamName('')
+    parser_mediator.SetSplitRecordRanges(True)
+
+    record_ranges = [None]
+    while record_ranges:
+      record_range = record_ranges.pop(0)
+
+      if record_range:
+        parser_mediator.SetFileEntry(file_entry)
+        parser_mediator.SetRecordRange(record_range)
+
+      file_object = file_entry.GetFileObject()
+      try:
+        parser.Parse(parser_mediator, file_object)
+      finally:
+        file_object.close()
+
+      if not record_range:
+        record_ranges = [
+            event_source.record_range
+            for event_source in storage_writer.GetEventSources()]
+
+    return storage_writer
+
   def _TestGetMessageStrings(
       self, event, expected_message, expected_short_message):
     """Tests the formatting of the message strings.
@@ -163,6 +163,22 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
 
     self.assertEqual(event.event_identifier, 4648)
 
+  @shared_test_lib.skipUnlessHasTestFile(['System.evtx'])
+  def testParseInRecordRanges(self):
+    """Tests the Parse function in record ranges."""
+    parser = winevtx.WinEvtxParser()
+    parser._RECORD_RANGE_SIZE = 500  # pylint: disable=protected-access
+
+    storage_writer = self._ParseFileInRecordRanges(['System.evtx'], parser)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 3)
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 1601)
+
+    record_numbers = set([
+        event.record_number for event in storage_writer.GetEvents()])
+    self.assertEqual(len(record_numbers), 1601)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -8,6 +8,8 @@ import unittest
 
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
 
 from plaso.engine import artifact_filters
 from plaso.engine import knowledge_base as knowledge_base_engine
@@ -19,6 +21,30 @@ from tests import test_lib as shared_test_lib
 from tests.parsers import test_lib
 
 
+class _TestWinRegistryParser(winreg.WinRegistryParser):
+  """Windows Registry file parser that records the plugins used per key.
+
+  Attributes:
+    parsed_keys (list[tuple[str, str]]): key path and plugin name of the
+        parsed keys, in the order the keys were parsed.
+  """
+
+  def __init__(self):
+    """Initializes a parser object."""
+    super(_TestWinRegistryParser, self).__init__()
+    self.parsed_keys = []
+
+  def _ParseKeyWithPlugin(self, parser_mediator, registry_key, plugin):
+    """Records the Registry key and plugin instead of parsing the key.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      registry_key (dfwinreg.WinRegistryKey): Windwos Registry key.
+      plugin (WindowsRegistryPlugin): Windows Registry plugin.
+    """
+    self.parsed_keys.append((registry_key.path, plugin.NAME))
+
+
 class WinRegistryParserTest(test_lib.ParserTestCase):
   """Tests for the Windows Registry file parser."""
 
@@ -43,6 +69,41 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
     """Generate the correct parser chain for a given plugin."""
     return 'winreg/{0:s}'.format(plugin_name)
 
+  def _CreateTestSystemKey(self):
+    """Creates a SYSTEM Registry root key for testing.
+
+    Returns:
+      dfwinreg.WinRegistryKey: Windows Registry key.
+    """
+    root_key = dfwinreg_fake.FakeWinRegistryKey(
+        '', key_path='HKEY_LOCAL_MACHINE\\System')
+
+    control_set_key = dfwinreg_fake.FakeWinRegistryKey('ControlSet001')
+    root_key.AddSubkey(control_set_key)
+
+    enum_key = dfwinreg_fake.FakeWinRegistryKey('Enum')
+    control_set_key.AddSubkey(enum_key)
+
+    usbstor_key = dfwinreg_fake.FakeWinRegistryKey('USBSTOR')
+    enum_key.AddSubkey(usbstor_key)
+
+    services_key = dfwinreg_fake.FakeWinRegistryKey('Services')
+    control_set_key.AddSubkey(services_key)
+
+    service_key = dfwinreg_fake.FakeWinRegistryKey('Tcpip')
+    services_key.AddSubkey(service_key)
+
+    for value_name in ('Start', 'Type'):
+      registry_value = dfwinreg_fake.FakeWinRegistryValue(
+          value_name, data=b'\x02\x00\x00\x00',
+          data_type=dfwinreg_definitions.REG_DWORD_LITTLE_ENDIAN)
+      service_key.AddValue(registry_value)
+
+    select_key = dfwinreg_fake.FakeWinRegistryKey('Select')
+    root_key.AddSubkey(select_key)
+
+    return root_key
+
   def testEnablePlugins(self):
     """Tests the EnablePlugins function."""
     parser = winreg.WinRegistryParser()
@@ -53,6 +114,46 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
     self.assertNotEqual(parser._plugins, [])
     self.assertEqual(len(parser._plugins), 1)
 
+  def testGetNormalizedKeyPathWithPlugins(self):
+    """Tests the _GetNormalizedKeyPathWithPlugins function."""
+    parser = winreg.WinRegistryParser()
+
+    normalized_key_path = parser._GetNormalizedKeyPathWithPlugins(
+        'HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Enum')
+    self.assertEqual(
+        normalized_key_path,
+        'hkey_local_machine\\system\\currentcontrolset\\enum')
+
+    normalized_key_path = parser._GetNormalizedKeyPathWithPlugins(
+        'HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Enum\\USBSTOR')
+    self.assertEqual(
+        normalized_key_path,
+        'hkey_local_machine\\system\\currentcontrolset\\enum\\usbstor')
+
+    normalized_key_path = parser._GetNormalizedKeyPathWithPlugins(
+        'HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services')
+    self.assertIsNone(normalized_key_path)
+
+  def testGetPluginForKey(self):
+    """Tests the _GetPluginForKey function."""
+    parser = winreg.WinRegistryParser()
+    root_key = self._CreateTestSystemKey()
+
+    registry_key = root_key.GetSubkeyByPath('ControlSet001\\Enum\\USBSTOR')
+    plugin = parser._GetPluginForKey(
+        registry_key,
+        'hkey_local_machine\\system\\currentcontrolset\\enum\\usbstor')
+    self.assertEqual(plugin.NAME, 'windows_usbstor_devices')
+
+    # A key that cannot match a plugin key path is only matched against the
+    # plugins without key paths.
+    plugin = parser._GetPluginForKey(registry_key, None)
+    self.assertEqual(plugin.NAME, 'winreg_default')
+
+    registry_key = root_key.GetSubkeyByPath('ControlSet001\\Services\\Tcpip')
+    plugin = parser._GetPluginForKey(registry_key, None)
+    self.assertEqual(plugin.NAME, 'windows_services')
+
   @shared_test_lib.skipUnlessHasTestFile(['NTUSER.DAT'])
   def testParseNTUserDat(self):
     """Tests the Parse function on a NTUSER.DAT file."""
@@ -77,6 +178,34 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
     self.assertEqual(storage_writer.number_of_warnings, 0)
     self.assertEqual(storage_writer.number_of_events, 0)
 
+  def testParseRecurseKeys(self):
+    """Tests the _ParseRecurseKeys function."""
+    parser = _TestWinRegistryParser()
+    parser_mediator = self._CreateParserMediator(self._CreateStorageWriter())
+    root_key = self._CreateTestSystemKey()
+
+    parser._ParseRecurseKeys(parser_mediator, root_key)
+
+    expected_parsed_keys = [
+        ('HKEY_LOCAL_MACHINE\\System', 'winreg_default'),
+        ('HKEY_LOCAL_MACHINE\\System\\ControlSet001', 'winreg_default'),
+        ('HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Enum',
+         'winreg_default'),
+        ('HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Enum\\USBSTOR',
+         'windows_usbstor_devices'),
+        ('HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services',
+         'winreg_default'),
+        ('HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services\\Tcpip',
+         'windows_services'),
+        ('HKEY_LOCAL_MACHINE\\System\\Select', 'winreg_default')]
+    self.assertEqual(parser.parsed_keys, expected_parsed_keys)
+
+    # The keys are parsed in the same order as they are recursed.
+    expected_key_paths = [
+        registry_key.path for registry_key in root_key.RecurseKeys()]
+    self.assertEqual(
+        [key_path for key_path, _ in parser.parsed_keys], expected_key_paths)
+
   @shared_test_lib.skipUnlessHasTestFile(['SYSTEM'])
   def testParseSystem(self):
     """Tests the Parse function on a SYSTEM file."""
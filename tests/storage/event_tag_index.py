@@ -5,8 +5,10 @@
 from __future__ import unicode_literals
 
 import os
+import sqlite3
 import unittest
 
+from plaso.containers import events
 from plaso.storage import event_tag_index
 from plaso.storage import identifiers
 from plaso.storage.sqlite import sqlite_file
@@ -76,9 +78,62 @@ class EventTagIndexTest(test_lib.StorageTestCase):
           storage_file, event_identifier)
       self.assertIsNone(event_tag)
 
+      # The event tags are looked up in the event tag index of the store.
+      self.assertIsNone(test_index._index)
+
+      storage_file.Close()
+
+  def testGetEventTagByIdentifierWithoutEventTagIndex(self):
+    """Tests the GetEventTagByIdentifier function without a store index."""
+    test_index = event_tag_index.EventTagIndex()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFileWithTags(temp_file)
+
+      connection = sqlite3.connect(temp_file)
+      connection.execute('DROP TABLE event_tag_index')
+      connection.commit()
+      connection.close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      event_identifier = identifiers.SQLTableIdentifier('event', 2)
+      event_tag = test_index.GetEventTagByIdentifier(
+          storage_file, event_identifier)
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Interesting'])
+
+      self.assertEqual(len(test_index._index), 3)
+
       storage_file.Close()
 
-  # TODO: add test for SetEventTag.
+  def testSetEventTag(self):
+    """Tests the SetEventTag function."""
+    test_index = event_tag_index.EventTagIndex()
+
+    event_tag = events.EventTag()
+    event_tag.SetEventIdentifier(identifiers.SQLTableIdentifier('event', 1))
+    event_tag.SetIdentifier(identifiers.SQLTableIdentifier('event_tag', 1))
+
+    # An index that was not built yet is not changed.
+    test_index.SetEventTag(event_tag)
+    self.assertIsNone(test_index._index)
+
+    test_index._index = {}
+    test_index.SetEventTag(event_tag)
+    self.assertEqual(len(test_index._index), 1)
+
+    event_tag = events.EventTag()
+    event_tag.SetEventIdentifier(identifiers.SQLTableIdentifier('event', 1))
+    event_tag.SetIdentifier(identifiers.SQLTableIdentifier('event_tag', 2))
+
+    test_index.SetEventTag(event_tag)
+    self.assertEqual(len(test_index._index), 1)
+
+    event_tag_identifier = test_index._index['event.1']
+    self.assertEqual(event_tag_identifier.row_identifier, 2)
 
 
 if __name__ == '__main__':
@@ -5,7 +5,9 @@
 from __future__ import unicode_literals
 
 import os
+import sqlite3
 import unittest
+import zlib
 
 from plaso.containers import events
 from plaso.containers import event_sources
@@ -14,6 +16,7 @@ from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.containers import warnings
 from plaso.lib import definitions
+from plaso.storage import identifiers
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -24,6 +27,7 @@ class _TestSQLiteStorageFileV1(sqlite_file.SQLiteStorageFile):
   """Test class for testing format compatibility checks."""
 
   _FORMAT_VERSION = 1
+  _APPEND_COMPATIBLE_FORMAT_VERSION = 1
   _COMPATIBLE_FORMAT_VERSION = 1
 
 
@@ -31,6 +35,15 @@ class _TestSQLiteStorageFileV2(sqlite_file.SQLiteStorageFile):
   """Test class for testing format compatibility checks."""
 
   _FORMAT_VERSION = 2
+  _APPEND_COMPATIBLE_FORMAT_VERSION = 2
+  _COMPATIBLE_FORMAT_VERSION = 1
+
+
+class _TestSQLiteStorageFileV3(sqlite_file.SQLiteStorageFile):
+  """Test class for testing format compatibility checks."""
+
+  _FORMAT_VERSION = 3
+  _APPEND_COMPATIBLE_FORMAT_VERSION = 1
   _COMPATIBLE_FORMAT_VERSION = 1
 
 
@@ -39,6 +52,17 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # pylint: disable=protected-access
 
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    storage_file = sqlite_file.SQLiteStorageFile(compression_level=1)
+    self.assertIsNotNone(storage_file)
+
+    with self.assertRaises(ValueError):
+      sqlite_file.SQLiteStorageFile(compression_level=10)
+
+    with self.assertRaises(ValueError):
+      sqlite_file.SQLiteStorageFile(maximum_buffer_size=-1)
+
   def testAddAttributeContainer(self):
     """Tests the _AddAttributeContainer function."""
     event_data = events.EventData()
@@ -66,6 +90,140 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testBuildEventTagIndex(self):
+    """Tests the _BuildEventTagIndex function."""
+    test_events = self._CreateTestEvents()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for event in test_events:
+        storage_file.AddEvent(event)
+
+      test_event_tags = self._CreateTestEventTags(test_events)
+      for event_tag in test_event_tags:
+        storage_file.AddEventTag(event_tag)
+
+      storage_file.Close()
+
+      # Remove the event tag index to mimic a store that was written before
+      # the event tag index was maintained.
+      connection = sqlite3.connect(temp_file)
+      connection.execute('DROP TABLE event_tag_index')
+      connection.commit()
+      connection.close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertFalse(storage_file.HasEventTagIndex())
+
+      with self.assertRaises(NotImplementedError):
+        storage_file.GetEventTagByEventIdentifier(
+            test_events[0].GetIdentifier())
+
+      storage_file.Close()
+
+      # Opening the store for writing builds the event tag index.
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertTrue(storage_file.HasEventTagIndex())
+
+      event_tag = storage_file.GetEventTagByEventIdentifier(
+          test_events[1].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Interesting'])
+
+      storage_file.Close()
+
+  def testCompressSerializedData(self):
+    """Tests the _CompressSerializedData function."""
+    serialized_data_list = [
+        'serialized data: {0:d}'.format(number).encode('utf-8')
+        for number in range(10)]
+
+    storage_file = sqlite_file.SQLiteStorageFile(compression_level=1)
+    storage_file._MINIMUM_NUMBER_OF_THREADED_COMPRESSIONS = 2
+    storage_file._number_of_compression_threads = 3
+
+    compressed_data_list = storage_file._CompressSerializedData(
+        serialized_data_list)
+    self.assertEqual(
+        [zlib.decompress(data) for data in compressed_data_list],
+        serialized_data_list)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertIsNotNone(storage_file._compression_thread_pool)
+
+      compressed_data_list = storage_file._CompressSerializedData(
+          serialized_data_list)
+      self.assertEqual(
+          [zlib.decompress(data) for data in compressed_data_list],
+          serialized_data_list)
+
+      compression_dictionary = b'serialized data: '
+      compressed_data_list = storage_file._CompressSerializedData(
+          serialized_data_list, compression_dictionary=compression_dictionary)
+
+      decompressed_data_list = []
+      for compressed_data in compressed_data_list:
+        decompressor = zlib.decompressobj(zdict=compression_dictionary)
+        decompressed_data_list.append(
+            decompressor.decompress(compressed_data) + decompressor.flush())
+
+      self.assertEqual(decompressed_data_list, serialized_data_list)
+
+      storage_file.Close()
+
+    self.assertIsNone(storage_file._compression_thread_pool)
+
+    storage_file = sqlite_file.SQLiteStorageFile(
+        compression_level=1, storage_type=definitions.STORAGE_TYPE_TASK)
+    storage_file._number_of_compression_threads = 3
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertIsNone(storage_file._compression_thread_pool)
+
+      storage_file.Close()
+
+  def testConnectReadOnly(self):
+    """Tests the _ConnectReadOnly function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso storage ë.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+      storage_file.Close()
+
+      connection = sqlite_file.SQLiteStorageFile._ConnectReadOnly(temp_file)
+
+      cursor = connection.cursor()
+      cursor.execute('SELECT key, value FROM metadata')
+      self.assertNotEqual(cursor.fetchall(), [])
+
+      with self.assertRaises(sqlite3.DatabaseError):
+        cursor.execute('DELETE FROM metadata')
+
+      connection.close()
+
+      temp_file = os.path.join(temp_directory, 'bogus.sqlite')
+      with self.assertRaises(sqlite3.DatabaseError):
+        sqlite_file.SQLiteStorageFile._ConnectReadOnly(temp_file)
+
+      self.assertFalse(os.path.exists(temp_file))
+
   def testCountStoredAttributeContainers(self):
     """Tests the _CountStoredAttributeContainers function."""
     event_data = events.EventData()
@@ -102,6 +260,25 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testDecompressSerializedData(self):
+    """Tests the _DecompressSerializedData function."""
+    storage_file = sqlite_file.SQLiteStorageFile()
+
+    compressed_data = zlib.compress(b'serialized data')
+    serialized_data = storage_file._DecompressSerializedData(
+        storage_file._CONTAINER_TYPE_EVENT, compressed_data)
+    self.assertEqual(serialized_data, b'serialized data')
+
+    compression_dictionary = b'serialized data'
+    storage_file._compression_dictionaries[
+        storage_file._CONTAINER_TYPE_EVENT] = compression_dictionary
+
+    compressed_data = storage_file._CompressSerializedData(
+        [b'serialized data'], compression_dictionary=compression_dictionary)
+    serialized_data = storage_file._DecompressSerializedData(
+        storage_file._CONTAINER_TYPE_EVENT, compressed_data[0])
+    self.assertEqual(serialized_data, b'serialized data')
+
   def testGetAttributeContainerByIndex(self):
     """Tests the _GetAttributeContainerByIndex function."""
     event_data = events.EventData()
@@ -156,6 +333,70 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+      # Test reading more rows than are fetched at once.
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file._MAXIMUM_NUMBER_OF_FETCHED_ROWS = 2
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for _ in range(4):
+        storage_file._AddAttributeContainer(
+            storage_file._CONTAINER_TYPE_EVENT_DATA, events.EventData())
+      storage_file._WriteSerializedAttributeContainerList(
+          storage_file._CONTAINER_TYPE_EVENT_DATA)
+
+      storage_file.Close()
+
+      storage_file.Open(path=temp_file, read_only=True)
+
+      containers = list(storage_file._GetAttributeContainers(
+          storage_file._CONTAINER_TYPE_EVENT_DATA))
+      self.assertEqual(len(containers), 5)
+
+      identifiers = [
+          container.GetIdentifier().row_identifier
+          for container in containers]
+      self.assertEqual(identifiers, [1, 2, 3, 4, 5])
+
+      storage_file.Close()
+
+  def testGetCompressionDictionary(self):
+    """Tests the _GetCompressionDictionary function."""
+    serialized_data_list = [
+        '{{"data_type": "test:event", "number": {0:d}}}'.format(
+            number).encode('utf-8')
+        for number in range(5000)]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      compression_dictionary = storage_file._GetCompressionDictionary(
+          storage_file._CONTAINER_TYPE_EVENT_DATA, serialized_data_list)
+      self.assertIsNotNone(compression_dictionary)
+      self.assertLessEqual(
+          len(compression_dictionary),
+          storage_file._MAXIMUM_COMPRESSION_DICTIONARY_SIZE)
+      self.assertIn(b'"data_type": "test:event"', compression_dictionary)
+
+      # The compression dictionary of a container type does not change.
+      compression_dictionary2 = storage_file._GetCompressionDictionary(
+          storage_file._CONTAINER_TYPE_EVENT_DATA, [b'{}'])
+      self.assertEqual(compression_dictionary2, compression_dictionary)
+
+      compression_dictionary = storage_file._GetCompressionDictionary(
+          storage_file._CONTAINER_TYPE_SESSION_START, serialized_data_list)
+      self.assertIsNone(compression_dictionary)
+
+      storage_file.Close()
+
+    storage_file = sqlite_file.SQLiteStorageFile(
+        storage_type=definitions.STORAGE_TYPE_TASK)
+
+    compression_dictionary = storage_file._GetCompressionDictionary(
+        storage_file._CONTAINER_TYPE_EVENT_DATA, serialized_data_list)
+    self.assertIsNone(compression_dictionary)
+
   def testHasAttributeContainers(self):
     """Tests the _HasAttributeContainers function."""
     event_data = events.EventData()
@@ -451,6 +692,84 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testGetEventTagByEventIdentifier(self):
+    """Tests the GetEventTagByEventIdentifier function."""
+    test_events = self._CreateTestEvents()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertTrue(storage_file.HasEventTagIndex())
+
+      for event in test_events:
+        storage_file.AddEvent(event)
+
+      test_event_tags = self._CreateTestEventTags(test_events)
+      for event_tag in test_event_tags:
+        storage_file.AddEventTag(event_tag)
+
+      # The second event is tagged twice, the most recently added event tag
+      # replaces the previous one.
+      event_tag = storage_file.GetEventTagByEventIdentifier(
+          test_events[1].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Interesting'])
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertTrue(storage_file.HasEventTagIndex())
+
+      event_tag = storage_file.GetEventTagByEventIdentifier(
+          test_events[0].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.comment, 'My comment')
+
+      event_tag = storage_file.GetEventTagByEventIdentifier(
+          test_events[1].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Interesting'])
+
+      event_identifier = identifiers.SQLTableIdentifier('event', 99)
+      event_tag = storage_file.GetEventTagByEventIdentifier(event_identifier)
+      self.assertIsNone(event_tag)
+
+      storage_file.Close()
+
+      # Event tags added to an existing store replace the stored ones.
+      storage_file = sqlite_file.SQLiteStorageFile(maximum_buffer_size=1)
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for label in ('Replaced', 'Replaced_again'):
+        event_tag = events.EventTag()
+        event_tag.SetEventIdentifier(test_events[2].GetIdentifier())
+        event_tag.AddLabel(label)
+        storage_file.AddEventTag(event_tag)
+
+        event_tag = storage_file.GetEventTagByEventIdentifier(
+            test_events[2].GetIdentifier())
+        self.assertIsNotNone(event_tag)
+        self.assertEqual(event_tag.labels, [label])
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      event_tag = storage_file.GetEventTagByEventIdentifier(
+          test_events[2].GetIdentifier())
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Replaced_again'])
+
+      test_event_tags = list(storage_file.GetEventTags())
+      self.assertEqual(len(test_event_tags), 6)
+
+      storage_file.Close()
+
   def testGetEventTags(self):
     """Tests the GetEventTags function."""
     test_events = self._CreateTestEvents()
@@ -515,6 +834,85 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for ReadPreprocessingInformation
   # TODO: add tests for WritePreprocessingInformation
 
+  def testOpenReadOnly(self):
+    """Tests the Open function in read-only mode."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+      storage_file.AddEventData(events.EventData())
+      storage_file.Close()
+
+      storage_file.Open(path=temp_file, read_only=True)
+
+      event_data = list(storage_file.GetEventData())
+      self.assertEqual(len(event_data), 1)
+
+      with self.assertRaises(IOError):
+        storage_file.AddEventData(events.EventData())
+
+      storage_file.Close()
+
+      temp_file = os.path.join(temp_directory, 'bogus.sqlite')
+      with self.assertRaises(IOError):
+        storage_file.Open(path=temp_file, read_only=True)
+
+  def testOpenRollback(self):
+    """Tests that a failed transaction of a new storage file rolls back."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      storage_file._cursor.execute('PRAGMA journal_mode')
+      self.assertEqual(storage_file._cursor.fetchone()[0], 'memory')
+
+      storage_file.AddEventData(events.EventData())
+      storage_file._WriteSerializedAttributeContainerList('event_data')
+
+      query = 'INSERT INTO event_data (_data) VALUES (?)'
+      storage_file._cursor.executemany(query, [(b'data', )] * 1000)
+      storage_file._connection.rollback()
+
+      number_of_containers = storage_file._CountStoredAttributeContainers(
+          'event_data')
+      self.assertEqual(number_of_containers, 1)
+
+      storage_file.Close()
+
+  def testCompressionDictionaries(self):
+    """Tests reading and writing with compression dictionaries."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertEqual(
+          storage_file.compression_format,
+          definitions.COMPRESSION_FORMAT_ZLIB_DICTIONARY)
+
+      for event in self._CreateTestEvents():
+        storage_file.AddEvent(event)
+
+      storage_file.AddEventData(events.EventData())
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=True)
+
+      self.assertEqual(
+          sorted(storage_file._compression_dictionaries.keys()),
+          ['event', 'event_data'])
+
+      test_events = list(storage_file.GetSortedEvents())
+      self.assertEqual(len(test_events), 4)
+
+      event_data = list(storage_file.GetEventData())
+      self.assertEqual(len(event_data), 1)
+
+      storage_file.Close()
+
   def testWriteSessionStartAndCompletion(self):
     """Tests the WriteSessionStart and WriteSessionCompletion functions."""
     session = sessions.Session()
@@ -572,6 +970,15 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       v2_storage_file_ro.Open(path=v1_storage_path, read_only=True)
       v2_storage_file_ro.Close()
 
+      v3_storage_file_rw = _TestSQLiteStorageFileV3(
+          storage_type=definitions.STORAGE_TYPE_SESSION)
+      v3_storage_file_rw.Open(path=v1_storage_path, read_only=False)
+      v3_storage_file_rw.Close()
+
+      v1_storage_file.Open(path=v1_storage_path, read_only=True)
+      self.assertEqual(v1_storage_file.format_version, 1)
+      v1_storage_file.Close()
+
 
 # TODO: add tests for SQLiteStorageMergeReader
 # TODO: add tests for SQLiteStorageFileReader
@@ -137,6 +137,32 @@ class ImportCheckTestCase(BaseTestCase):
             init_content, import_expression,
             '{0:s} not imported in {1:s}'.format(module_name, init_path))
 
+  def _AssertFilesDefinedInManifest(
+      self, path, package_name, manifest_module_names, ignorable_files):
+    """Checks that files in path are defined in a manifest.
+
+    Args:
+      path (str): path to directory containing Python files which should be
+          defined in the manifest.
+      package_name (str): name of the Python package of the directory,
+          for example 'plaso.parsers'.
+      manifest_module_names (set[str]): names of the Python modules defined
+          in the manifest.
+      ignorable_files (list[str]): names of Python files that don't need to
+          appear in the manifest. For example, 'manager.py'.
+    """
+    for file_path in os.listdir(path):
+      filename = os.path.basename(file_path)
+      if filename in ignorable_files:
+        continue
+      if self._FILENAME_REGEXP.search(filename):
+        module_name, _, _ = filename.partition('.')
+        module_name = '{0:s}.{1:s}'.format(package_name, module_name)
+
+        self.assertIn(
+            module_name, manifest_module_names,
+            '{0:s} not defined in manifest'.format(module_name))
+
 
 class TempDirectory(object):
   """Class that implements a temporary directory."""
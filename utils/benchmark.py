@@ -0,0 +1,1333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the extraction, storage and export hot paths.
+
+The benchmarks run on synthetic inputs that are generated from the test data,
+hence no network access or additional input files are required. The results
+are written as JSON so that they can be compared between revisions, for
+example:
+
+  python utils/benchmark.py --output before.json
+  python utils/benchmark.py --compare before.json --output after.json
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import binascii
+import datetime
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Change PYTHONPATH to include the source directory, which contains the test
+# helpers that the benchmarks use as stand-ins for network services.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from dfdatetime import filetime as dfdatetime_filetime
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context as dfvfs_context
+from dfvfs.resolver import resolver as path_spec_resolver
+from dfwinreg import regf as dfwinreg_regf
+
+import plaso
+
+from plaso.analysis import browser_search
+from plaso.analysis import local_hashset
+from plaso.analysis import mediator as analysis_mediator
+from plaso.analysis import nsrlsvr
+from plaso.analysis import tagging
+from plaso.analysis import unique_domains_visited
+from plaso.cli import tools as cli_tools
+from plaso.containers import events
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.containers import time_events
+from plaso.engine import configurations
+from plaso.engine import knowledge_base
+from plaso.engine import single_process
+from plaso.engine import worker
+from plaso.filters import event_filter
+from plaso.formatters import mediator as formatters_mediator
+from plaso.lib import definitions
+from plaso.multi_processing import psort
+from plaso.multi_processing import task_engine
+from plaso.output import manager as output_manager
+from plaso.output import mediator as output_mediator
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import ntfs
+from plaso.parsers import winreg
+from plaso.parsers import winreg_plugins  # pylint: disable=unused-import
+from plaso.storage import factory as storage_factory
+from plaso.storage import identifiers
+
+from tests.analysis import test_lib as analysis_test_lib
+
+
+def _StartExtractionWorker(queue, processing_configuration, extraction_worker):
+  """Starts an extraction worker in a benchmark worker process.
+
+  Args:
+    queue (multiprocessing.Queue): queue to signal the parent process that
+        the extraction worker was started.
+    processing_configuration (ProcessingConfiguration): processing
+        configuration.
+    extraction_worker (EventExtractionWorker): extraction worker initialized
+        by the parent process or None if the extraction worker should be
+        initialized by the worker process.
+  """
+  if not extraction_worker:
+    extraction_worker = worker.EventExtractionWorker(
+        parser_filter_expression=(
+            processing_configuration.parser_filter_expression))
+    extraction_worker.SetExtractionConfiguration(
+        processing_configuration.extraction)
+
+  queue.put(os.getpid())
+
+
+class BenchmarkResult(object):
+  """Benchmark result.
+
+  Attributes:
+    elapsed_time (float): elapsed wall-clock time in seconds.
+    error (str): error that caused the benchmark to fail or None.
+    name (str): name of the benchmark.
+    number_of_events (int): number of events processed by the benchmark.
+  """
+
+  def __init__(self, name):
+    """Initializes a benchmark result.
+
+    Args:
+      name (str): name of the benchmark.
+    """
+    super(BenchmarkResult, self).__init__()
+    self.elapsed_time = 0.0
+    self.error = None
+    self.name = name
+    self.number_of_events = 0
+
+  @property
+  def events_per_second(self):
+    """float: number of events processed per second."""
+    if not self.elapsed_time:
+      return 0.0
+    return self.number_of_events / self.elapsed_time
+
+  def CopyToDict(self):
+    """Copies the benchmark result to a dictionary.
+
+    Returns:
+      dict[str, object]: benchmark result values per name.
+    """
+    result_dict = {
+        'elapsed_time': round(self.elapsed_time, 6),
+        'events_per_second': round(self.events_per_second, 2),
+        'number_of_events': self.number_of_events}
+
+    if self.error:
+      result_dict['error'] = self.error
+
+    return result_dict
+
+
+class BenchmarkCorpus(object):
+  """Synthetic benchmark input generated from the test data.
+
+  The corpus consists of:
+  * a large syslog file with chronologically ordered lines;
+  * copies of Windows XML EventLog (EVTX) files;
+  * many tiny files to measure the per file entry overhead;
+  * copies of SQLite database files.
+  """
+
+  _EVTX_FILENAMES = ['System.evtx', 'System2.evtx']
+
+  _SQLITE_FILENAMES = ['History', 'places.sqlite', 'cookies.db']
+
+  _SYSLOG_LINE = (
+      '{0:s} {1:2d} {2:02d}:{3:02d}:{4:02d} myhostname.myhost.com '
+      'process{5:d}[{6:d}]: synthetic benchmark message number {7:d}\n')
+
+  def __init__(self, path, test_data_path):
+    """Initializes a benchmark corpus.
+
+    Args:
+      path (str): path of the directory to generate the corpus in.
+      test_data_path (str): path of the test data directory.
+    """
+    super(BenchmarkCorpus, self).__init__()
+    self.path = path
+    self.test_data_path = test_data_path
+
+  def _CopyTestFiles(self, directory_name, filenames, number_of_copies):
+    """Copies test data files.
+
+    Args:
+      directory_name (str): name of the corpus directory to copy the files to.
+      filenames (list[str]): names of the test data files.
+      number_of_copies (int): number of copies per test data file.
+    """
+    directory = os.path.join(self.path, directory_name)
+    os.mkdir(directory)
+
+    for filename in filenames:
+      source_path = os.path.join(self.test_data_path, filename)
+      if not os.path.isfile(source_path):
+        continue
+
+      name, extension = os.path.splitext(filename)
+      for copy_index in range(number_of_copies):
+        destination_path = os.path.join(directory, '{0:s}-{1:d}{2:s}'.format(
+            name, copy_index, extension))
+        shutil.copyfile(source_path, destination_path)
+
+  def _GenerateSyslogFile(self, number_of_lines):
+    """Generates a syslog file.
+
+    Args:
+      number_of_lines (int): number of lines in the syslog file.
+    """
+    directory = os.path.join(self.path, 'syslog')
+    os.mkdir(directory)
+
+    path = os.path.join(directory, 'syslog')
+    timestamp = datetime.datetime(2018, 1, 1)
+    time_delta = datetime.timedelta(seconds=3)
+
+    with io.open(path, 'w', encoding='utf-8') as file_object:
+      for line_number in range(number_of_lines):
+        file_object.write(self._SYSLOG_LINE.format(
+            timestamp.strftime('%b'), timestamp.day, timestamp.hour,
+            timestamp.minute, timestamp.second, line_number % 16,
+            1000 + (line_number % 4096), line_number))
+        timestamp += time_delta
+
+  def _GenerateTinyFiles(self, number_of_files):
+    """Generates tiny files.
+
+    Args:
+      number_of_files (int): number of tiny files.
+    """
+    directory = os.path.join(self.path, 'tiny')
+    os.mkdir(directory)
+
+    for file_index in range(number_of_files):
+      sub_directory = os.path.join(directory, '{0:03d}'.format(
+          file_index // 100))
+      if not os.path.isdir(sub_directory):
+        os.mkdir(sub_directory)
+
+      path = os.path.join(sub_directory, 'file{0:d}.txt'.format(file_index))
+      with io.open(path, 'w', encoding='utf-8') as file_object:
+        file_object.write('tiny file {0:d}\n'.format(file_index))
+
+  def Generate(self, scale=1):
+    """Generates the corpus.
+
+    Args:
+      scale (Optional[int]): scale factor of the size of the corpus.
+    """
+    self._GenerateSyslogFile(50000 * scale)
+    self._CopyTestFiles('evtx', self._EVTX_FILENAMES, 4 * scale)
+    self._GenerateTinyFiles(1000 * scale)
+    self._CopyTestFiles('sqlite', self._SQLITE_FILENAMES, 8 * scale)
+
+
+class BenchmarkRunner(object):
+  """Runs the benchmarks."""
+
+  BENCHMARK_NAMES = [
+      'single_process_extraction',
+      'cli_startup',
+      'multi_process_extraction',
+      'task_merge',
+      'get_events',
+      'get_sorted_events',
+      'event_filter',
+      'tagging',
+      'browser_search',
+      'unique_domains_visited',
+      'hash_lookup_local_hashset',
+      'hash_lookup_nsrlsvr',
+      'output',
+      '4n6time_sqlite',
+      '4n6time_mysql',
+      'usnjrnl_dtfabric',
+      'usnjrnl_struct',
+      'winreg',
+      'worker_startup',
+      'worker_startup_preinitialized']
+
+  # Command lines of the CLI tools of which the startup time is benchmarked.
+  _CLI_STARTUP_COMMANDS = [
+      ['log2timeline.py', '--help'],
+      ['pinfo.py', '--help'],
+      ['psort.py', '--help'],
+      ['psort.py', '--output-format', 'list']]
+
+  _EVENT_FILTER_EXPRESSIONS = [
+      'timestamp > 0',
+      'data_type is \'syslog:line\'',
+      'parser contains \'sqlite\' or filename contains \'evtx\'',
+      'message contains \'benchmark message number 4\'']
+
+  # Search URLs and other URLs of the synthetic browser history events.
+  _BROWSER_HISTORY_URLS = [
+      'https://www.google.com/search?q=benchmark+term+{0:d}&ie=utf-8',
+      'https://www.bing.com/search?q=benchmark%20term%20{0:d}',
+      'https://duckduckgo.com/?q=benchmark+term+{0:d}&t=h_',
+      'https://www.youtube.com/watch?v={0:d}',
+      'https://en.wikipedia.org/wiki/Page_{0:d}',
+      'https://github.com/log2timeline/plaso/issues/{0:d}',
+      'https://www.example.com/news/article{0:d}.html',
+      'https://mail.google.com/mail/u/0/#inbox/{0:d}',
+      'https://docs.python.org/3/library/re.html#section{0:d}',
+      'http://www.example.org/products?id={0:d}',
+      'https://www.reddit.com/r/computerforensics/comments/{0:d}/',
+      'https://stackoverflow.com/questions/{0:d}/regular-expressions',
+      'https://www.amazon.com/dp/B00{0:d}?ref=nav',
+      'https://news.ycombinator.com/item?id={0:d}',
+      'https://www.linkedin.com/feed/update/{0:d}',
+      'https://twitter.com/log2timeline/status/{0:d}',
+      'https://outlook.live.com/mail/0/inbox/id/{0:d}',
+      'https://www.nytimes.com/2019/03/{0:d}/technology.html',
+      'https://login.microsoftonline.com/common/oauth2?state={0:d}',
+      'https://cdn.example.net/static/js/app.{0:d}.js']
+
+  _NUMBER_OF_4N6TIME_EVENTS = 5000000
+
+  # Number of distinct 4n6time events, which are written repeatedly to keep
+  # the memory usage of the benchmark low.
+  _NUMBER_OF_DISTINCT_4N6TIME_EVENTS = 100000
+
+  # Name of the database the 4n6time MySQL benchmark writes to, on a local
+  # MySQL or MariaDB server that uses the default credentials of the output
+  # module.
+  _4N6TIME_MYSQL_DATABASE_NAME = 'plaso_benchmark'
+
+  _NUMBER_OF_BROWSER_HISTORY_EVENTS = 10000000
+
+  # Number of distinct browser history events, which are examined repeatedly
+  # to keep the memory usage of the benchmark low.
+  _NUMBER_OF_DISTINCT_BROWSER_HISTORY_EVENTS = 100000
+
+  _NUMBER_OF_DOMAINS_VISITED_EVENTS = 20000000
+
+  _NUMBER_OF_HASH_LOOKUPS = 20000
+
+  _NUMBER_OF_HASH_SET_DIGESTS = 1000000
+
+  # Number of Windows Registry keys to parse, the test data hives are parsed
+  # repeatedly until this number is reached.
+  _NUMBER_OF_REGISTRY_KEYS = 200000
+
+  _NUMBER_OF_USN_RECORDS = 200000
+
+  _NUMBER_OF_WORKER_PROCESSES = 4
+
+  _WINREG_FILENAMES = ['NTUSER-WIN7.DAT', 'NTUSER.DAT', 'Amcache.hve']
+
+  # Output modules that require a server are not benchmarked.
+  _OUTPUT_MODULES_REQUIRING_SERVER = frozenset([
+      '4n6time_mysql', 'elastic', 'timesketch'])
+
+  def __init__(
+      self, corpus, data_location, temporary_directory,
+      number_of_worker_processes=0):
+    """Initializes a benchmark runner.
+
+    Args:
+      corpus (BenchmarkCorpus): corpus to benchmark with.
+      data_location (str): path of the plaso data files.
+      temporary_directory (str): path of the directory to write the storage
+          and output files to.
+      number_of_worker_processes (Optional[int]): number of worker processes
+          of the multi-process extraction, where 0 represents the default.
+    """
+    super(BenchmarkRunner, self).__init__()
+    self._corpus = corpus
+    self._data_location = data_location
+    self._events = None
+    self._hash_set_digests = None
+    self._number_of_worker_processes = number_of_worker_processes
+    self._storage_file_path = None
+    self._temporary_directory = temporary_directory
+    self._usn_records_data = None
+
+  def _Benchmark4n6TimeOutputModule(self, result, output_module_name):
+    """Benchmarks writing events with a 4n6time output module.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+      output_module_name (str): name of the 4n6time output module.
+    """
+    events_list = []
+    for index in range(self._NUMBER_OF_DISTINCT_4N6TIME_EVENTS):
+      event = time_events.TimestampEvent(
+          1500000000000000 + index, definitions.TIME_DESCRIPTION_WRITTEN)
+      event.body = 'benchmark message number {0:d}'.format(index)
+      event.data_type = 'syslog:line'
+      event.display_name = 'OS:/var/log/syslog.{0:d}'.format(index % 10)
+      event.filename = '/var/log/syslog.{0:d}'.format(index % 10)
+      event.hostname = 'host{0:d}'.format(index % 25)
+      event.parser = 'syslog'
+      event.pid = index % 32768
+      event.reporter = 'cron'
+      event.tag = None
+      events_list.append(event)
+
+    formatter_mediator = formatters_mediator.FormatterMediator(
+        data_location=self._data_location)
+    mediator = output_mediator.OutputMediator(
+        knowledge_base.KnowledgeBase(), formatter_mediator)
+
+    output_module = output_manager.OutputManager.NewOutputModule(
+        output_module_name, mediator)
+
+    output_path = None
+    if output_module_name == '4n6time_mysql':
+      output_module.SetDatabaseName(self._4N6TIME_MYSQL_DATABASE_NAME)
+    else:
+      output_path = os.path.join(
+          self._temporary_directory, 'output.{0:s}'.format(output_module_name))
+      output_module.SetFilename(output_path)
+
+    try:
+      start_time = time.time()
+      output_module.Open()
+      for index in range(self._NUMBER_OF_4N6TIME_EVENTS):
+        output_module.WriteEventBody(events_list[
+            index % self._NUMBER_OF_DISTINCT_4N6TIME_EVENTS])
+      output_module.Close()
+
+      result.elapsed_time = time.time() - start_time
+      result.number_of_events = self._NUMBER_OF_4N6TIME_EVENTS
+
+    finally:
+      if output_path and os.path.exists(output_path):
+        os.remove(output_path)
+
+  def _BenchmarkBrowserSearch(self, result):
+    """Benchmarks extracting search terms from browser history events.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    events_list = []
+    for index in range(self._NUMBER_OF_DISTINCT_BROWSER_HISTORY_EVENTS):
+      url_format = self._BROWSER_HISTORY_URLS[
+          index % len(self._BROWSER_HISTORY_URLS)]
+
+      event = time_events.TimestampEvent(
+          1500000000000000 + index, definitions.TIME_DESCRIPTION_LAST_VISITED)
+      event.data_type = 'chrome:history:page_visited'
+      event.parser = 'sqlite/chrome_27_history'
+      # Search terms repeat, as they do in browser histories.
+      event.url = url_format.format(index % 1000)
+      event.SetIdentifier(identifiers.SQLTableIdentifier('event', index + 1))
+      events_list.append(event)
+
+    session = sessions.Session()
+    storage_file_path = os.path.join(
+        self._temporary_directory, 'browser_search.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+    storage_writer.Open()
+
+    mediator = analysis_mediator.AnalysisMediator(
+        storage_writer, knowledge_base.KnowledgeBase(),
+        data_location=self._data_location)
+
+    plugin = browser_search.BrowserSearchPlugin()
+
+    start_time = time.time()
+    for index in range(self._NUMBER_OF_BROWSER_HISTORY_EVENTS):
+      plugin.ExamineEvent(mediator, events_list[
+          index % self._NUMBER_OF_DISTINCT_BROWSER_HISTORY_EVENTS])
+
+    plugin.CompileReport(mediator)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = self._NUMBER_OF_BROWSER_HISTORY_EVENTS
+
+    storage_writer.Close()
+
+  def _BenchmarkCLIStartup(self, result):
+    """Benchmarks the startup of the CLI tools.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+
+    Raises:
+      RuntimeError: if a CLI tool fails.
+    """
+    source_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    tools_path = os.path.join(source_path, 'tools')
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = source_path
+
+    start_time = time.time()
+    for arguments in self._CLI_STARTUP_COMMANDS:
+      command = [sys.executable, os.path.join(tools_path, arguments[0])]
+      command.extend(arguments[1:])
+
+      with open(os.devnull, 'wb') as devnull:
+        exit_code = subprocess.call(
+            command, env=environment, stderr=devnull, stdout=devnull)
+
+      if exit_code != 0:
+        raise RuntimeError('{0:s} failed with exit code: {1:d}'.format(
+            ' '.join(arguments), exit_code))
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = len(self._CLI_STARTUP_COMMANDS)
+
+  def _BenchmarkEventFilter(self, result):
+    """Benchmarks event filter matching.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    events_list = self._GetEvents()
+
+    filter_objects = []
+    for filter_expression in self._EVENT_FILTER_EXPRESSIONS:
+      filter_object = event_filter.EventObjectFilter()
+      filter_object.CompileFilter(filter_expression)
+      filter_objects.append(filter_object)
+
+    start_time = time.time()
+    for filter_object in filter_objects:
+      for event in events_list:
+        filter_object.Match(event)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = len(events_list) * len(filter_objects)
+
+  def _BenchmarkGetEvents(self, result):
+    """Benchmarks reading all events in storage order from storage.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    storage_reader = self._OpenStorageReader()
+
+    try:
+      start_time = time.time()
+      for _ in storage_reader.GetEvents():
+        result.number_of_events += 1
+
+      result.elapsed_time = time.time() - start_time
+
+    finally:
+      storage_reader.Close()
+
+  def _BenchmarkGetSortedEvents(self, result):
+    """Benchmarks reading events in chronological order from storage.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    storage_reader = self._OpenStorageReader()
+
+    try:
+      start_time = time.time()
+      for _ in storage_reader.GetSortedEvents():
+        result.number_of_events += 1
+
+      result.elapsed_time = time.time() - start_time
+
+    finally:
+      storage_reader.Close()
+
+  def _BenchmarkHashLookup(self, result, use_local_hashset):
+    """Benchmarks looking up file hashes in a known file hash set.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+      use_local_hashset (bool): True if the hashes should be looked up in
+          a local hash set file, False if in a local stand-in of nsrlsvr.
+    """
+    digests = self._GetHashSetDigests()
+
+    # Half of the looked up hashes are in the hash set.
+    first_index = (
+        self._NUMBER_OF_HASH_SET_DIGESTS - self._NUMBER_OF_HASH_LOOKUPS // 2)
+    hashes = [
+        hashlib.md5('{0:d}'.format(index).encode('ascii')).hexdigest()
+        for index in range(
+            first_index, first_index + self._NUMBER_OF_HASH_LOOKUPS)]
+
+    server = None
+    if use_local_hashset:
+      path = os.path.join(self._temporary_directory, 'md5.hashset')
+      writer = local_hashset.HashSetFileWriter('md5')
+      try:
+        for digest in digests:
+          writer.AddDigest(digest)
+        writer.Write(path)
+      finally:
+        writer.Close()
+
+      analyzer = local_hashset.LocalHashSetAnalyzer(None, None)
+      analyzer.SetHashSetPath(path)
+
+    else:
+      server = analysis_test_lib.NsrlsvrServer(set(
+          binascii.hexlify(digest) for digest in digests))
+      server_thread = threading.Thread(target=server.serve_forever)
+      server_thread.daemon = True
+      server_thread.start()
+
+      analyzer = nsrlsvr.NsrlsvrAnalyzer(None, None)
+      analyzer.SetHost('127.0.0.1')
+      analyzer.SetPort(server.server_address[1])
+
+    analyzer.SetLookupHash('md5')
+
+    try:
+      start_time = time.time()
+      for batch_index in range(0, len(hashes), analyzer.hashes_per_batch):
+        hash_analyses = analyzer.Analyze(
+            hashes[batch_index:batch_index + analyzer.hashes_per_batch])
+        result.number_of_events += len(hash_analyses)
+
+      result.elapsed_time = time.time() - start_time
+
+    finally:
+      if server:
+        server.shutdown()
+        server.server_close()
+
+  def _BenchmarkMultiProcessExtraction(self, result):
+    """Benchmarks multi-process extraction.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    session = sessions.Session()
+    storage_file_path = os.path.join(
+        self._temporary_directory, 'multi_process.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+
+    extraction_engine = task_engine.TaskMultiProcessEngine()
+    configuration = self._CreateProcessingConfiguration()
+
+    start_time = time.time()
+    extraction_engine.ProcessSources(
+        session.identifier, [self._GetSourcePathSpec()], storage_writer,
+        configuration,
+        number_of_worker_processes=self._number_of_worker_processes)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = storage_writer.number_of_events
+
+  def _BenchmarkOutputModule(self, result, output_module_name):
+    """Benchmarks exporting events with an output module.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+      output_module_name (str): name of the output module.
+    """
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    formatter_mediator = formatters_mediator.FormatterMediator(
+        data_location=self._data_location)
+    mediator = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    output_module = output_manager.OutputManager.NewOutputModule(
+        output_module_name, mediator)
+
+    output_path = os.path.join(
+        self._temporary_directory, 'output.{0:s}'.format(output_module_name))
+
+    file_object = None
+    if output_manager.OutputManager.IsLinearOutputModule(output_module_name):
+      file_object = open(output_path, 'wb')
+      output_module.SetOutputWriter(
+          cli_tools.FileObjectOutputWriter(file_object))
+
+    elif hasattr(output_module, 'SetFilename'):
+      output_module.SetFilename(output_path)
+
+    storage_reader = self._OpenStorageReader()
+
+    try:
+      storage_reader.ReadPreprocessingInformation(knowledge_base_object)
+
+      # The export loop is invoked directly so that the measurement does not
+      # include the status update thread of the engine.
+      export_engine = psort.PsortMultiProcessEngine(use_zeromq=False)
+
+      start_time = time.time()
+      output_module.Open()
+      output_module.WriteHeader()
+
+      events_counter = export_engine._ExportEvents(
+          storage_reader, output_module)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      result.elapsed_time = time.time() - start_time
+      result.number_of_events = events_counter['Events processed']
+
+    finally:
+      storage_reader.Close()
+      if file_object:
+        file_object.close()
+
+      if os.path.exists(output_path):
+        os.remove(output_path)
+
+  def _BenchmarkSingleProcessExtraction(self, result):
+    """Benchmarks single process extraction.
+
+    The resulting storage file is used by the storage and export benchmarks.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    session = sessions.Session()
+    storage_file_path = os.path.join(
+        self._temporary_directory, 'single_process.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+
+    extraction_engine = single_process.SingleProcessEngine()
+    configuration = self._CreateProcessingConfiguration()
+
+    start_time = time.time()
+    extraction_engine.ProcessSources(
+        [self._GetSourcePathSpec()], storage_writer, dfvfs_context.Context(),
+        configuration)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = storage_writer.number_of_events
+
+    self._storage_file_path = storage_file_path
+
+  def _BenchmarkTagging(self, result):
+    """Benchmarks tagging events.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    events_list = self._GetEvents()
+
+    session = sessions.Session()
+    storage_file_path = os.path.join(self._temporary_directory, 'tags.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+    storage_writer.Open()
+
+    mediator = analysis_mediator.AnalysisMediator(
+        storage_writer, knowledge_base.KnowledgeBase(),
+        data_location=self._data_location)
+
+    plugin = tagging.TaggingAnalysisPlugin()
+    plugin.SetAndLoadTagFile(os.path.join(
+        self._data_location, 'tag_windows.txt'))
+
+    start_time = time.time()
+    for event in events_list:
+      plugin.ExamineEvent(mediator, event)
+
+    plugin.CompileReport(mediator)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = len(events_list)
+
+    storage_writer.Close()
+
+  def _BenchmarkTaskMerge(self, result):
+    """Benchmarks merging a task storage into a session storage.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    events_list = self._GetEvents()
+
+    session = sessions.Session()
+    storage_file_path = os.path.join(self._temporary_directory, 'merge.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+
+    storage_writer.Open()
+    storage_writer.WriteSessionStart()
+    storage_writer.StartTaskStorage()
+
+    try:
+      task = tasks.Task(session_identifier=session.identifier)
+      task_storage_writer = storage_writer.CreateTaskStorage(task)
+      task_storage_writer.Open()
+      task_storage_writer.WriteTaskStart()
+
+      for event in events_list:
+        event_data = events.EventData()
+        event_data.CopyFromDict(event.CopyToDict())
+        task_storage_writer.AddEventData(event_data)
+
+        task_event = events.EventObject()
+        task_event.timestamp = event.timestamp
+        task_event.timestamp_desc = event.timestamp_desc
+        task_event.SetEventDataIdentifier(event_data.GetIdentifier())
+        task_storage_writer.AddEvent(task_event)
+
+      task_storage_writer.WriteTaskCompletion()
+      task_storage_writer.Close()
+
+      storage_writer.FinalizeTaskStorage(task)
+      storage_writer.PrepareMergeTaskStorage(task)
+
+      start_time = time.time()
+      merge_reader = storage_writer.StartMergeTaskStorage(task)
+      while not merge_reader.MergeAttributeContainers():
+        pass
+
+      result.elapsed_time = time.time() - start_time
+      result.number_of_events = storage_writer.number_of_events
+
+    finally:
+      storage_writer.StopTaskStorage(abort=True)
+      storage_writer.WriteSessionCompletion()
+      storage_writer.Close()
+
+  def _BenchmarkUniqueDomainsVisited(self, result):
+    """Benchmarks aggregating the domains of browser history events.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+    """
+    events_list = []
+    for index in range(self._NUMBER_OF_DISTINCT_BROWSER_HISTORY_EVENTS):
+      event = time_events.TimestampEvent(
+          1500000000000000 + index, definitions.TIME_DESCRIPTION_LAST_VISITED)
+      event.data_type = 'chrome:history:page_visited'
+      event.parser = 'sqlite/chrome_27_history'
+      # Every distinct event has a distinct domain.
+      event.url = 'https://www{0:d}.example.com/index.html'.format(index)
+      events_list.append(event)
+
+    mediator = analysis_mediator.AnalysisMediator(
+        None, knowledge_base.KnowledgeBase(),
+        data_location=self._data_location)
+
+    plugin = unique_domains_visited.UniqueDomainsVisitedPlugin()
+
+    start_time = time.time()
+    for index in range(self._NUMBER_OF_DOMAINS_VISITED_EVENTS):
+      plugin.ExamineEvent(mediator, events_list[
+          index % self._NUMBER_OF_DISTINCT_BROWSER_HISTORY_EVENTS])
+
+    plugin.CompileReport(mediator)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = self._NUMBER_OF_DOMAINS_VISITED_EVENTS
+
+  def _BenchmarkUSNRecordDecoding(self, result, use_dtfabric):
+    """Benchmarks decoding USN change journal records into events.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+      use_dtfabric (bool): True if the records should be decoded with the
+          usn_record_v2 data type map instead of the precompiled struct
+          layout used by the parser.
+    """
+    # pylint: disable=protected-access
+    usn_records_data = self._GetUSNRecordsData()
+
+    parser = ntfs.NTFSUsnJrnlParser()
+    parser_mediator = parsers_mediator.ParserMediator(
+        None, knowledge_base.KnowledgeBase())
+    usn_record_map = parser._GetDataTypeMap('usn_record_v2')
+
+    start_time = time.time()
+    for usn_record_data in usn_records_data:
+      if use_dtfabric:
+        usn_record = parser._ReadStructureFromByteStream(
+            usn_record_data, 0, usn_record_map)
+        name_offset = usn_record.name_offset - 60
+        usn_record.name[name_offset:usn_record.name_size].decode('utf-16-le')
+
+        date_time = dfdatetime_filetime.Filetime(
+            timestamp=usn_record.update_date_time)
+        time_events.DateTimeValuesEvent(
+            date_time, definitions.TIME_DESCRIPTION_ENTRY_MODIFICATION)
+
+      else:
+        values = parser._ReadUSNRecordV2(
+            parser_mediator, usn_record_data, 0)
+        timestamp = parser._CopyFiletimeToPlasoTimestamp(values[3])
+        time_events.TimestampEvent(
+            timestamp, definitions.TIME_DESCRIPTION_ENTRY_MODIFICATION)
+
+    result.elapsed_time = time.time() - start_time
+    result.number_of_events = len(usn_records_data)
+
+  def _BenchmarkWinRegistryParser(self, result):
+    """Benchmarks parsing Windows Registry files with the plugins.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+
+    Raises:
+      RuntimeError: if none of the Windows Registry test files are available.
+    """
+    number_of_keys_per_path = {}
+    for filename in self._WINREG_FILENAMES:
+      path = os.path.join(self._corpus.test_data_path, filename)
+      if not os.path.isfile(path):
+        continue
+
+      registry_file = dfwinreg_regf.REGFWinRegistryFile()
+      with open(path, 'rb') as file_object:
+        registry_file.Open(file_object)
+        number_of_keys_per_path[path] = sum(
+            1 for _ in registry_file.RecurseKeys())
+        registry_file.Close()
+
+    if not number_of_keys_per_path:
+      raise RuntimeError('Missing Windows Registry test files.')
+
+    session = sessions.Session()
+    storage_file_path = os.path.join(
+        self._temporary_directory, 'winreg.plaso')
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE, session, storage_file_path)
+    storage_writer.Open()
+
+    parser = winreg.WinRegistryParser()
+    parser_mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base.KnowledgeBase())
+
+    number_of_keys = 0
+    start_time = time.time()
+    try:
+      while number_of_keys < self._NUMBER_OF_REGISTRY_KEYS:
+        for path, number_of_file_keys in sorted(
+            number_of_keys_per_path.items()):
+          path_spec = path_spec_factory.Factory.NewPathSpec(
+              dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+          file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+          parser_mediator.SetFileEntry(file_entry)
+
+          file_object = file_entry.GetFileObject()
+          try:
+            parser.Parse(parser_mediator, file_object)
+          finally:
+            file_object.close()
+
+          number_of_keys += number_of_file_keys
+
+      result.elapsed_time = time.time() - start_time
+      result.number_of_events = number_of_keys
+
+    finally:
+      storage_writer.Close()
+
+  def _BenchmarkWorkerStartup(self, result, preinitialize):
+    """Benchmarks starting worker processes with an extraction worker.
+
+    Args:
+      result (BenchmarkResult): benchmark result.
+      preinitialize (bool): True if the extraction worker should be
+          initialized once by the parent process and inherited by the forked
+          worker processes.
+    """
+    configuration = self._CreateProcessingConfiguration()
+    number_of_worker_processes = (
+        self._number_of_worker_processes or self._NUMBER_OF_WORKER_PROCESSES)
+
+    start_time = time.time()
+
+    extraction_worker = None
+    if preinitialize:
+      extraction_worker = worker.EventExtractionWorker(
+          parser_filter_expression=configuration.parser_filter_expression)
+      extraction_worker.SetExtractionConfiguration(configuration.extraction)
+
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_StartExtractionWorker,
+            args=(queue, configuration, extraction_worker))
+        for _ in range(number_of_worker_processes)]
+
+    try:
+      for process in processes:
+        process.start()
+
+      for _ in processes:
+        queue.get(timeout=300)
+
+      result.elapsed_time = time.time() - start_time
+      result.number_of_events = number_of_worker_processes
+
+    finally:
+      for process in processes:
+        if process.is_alive():
+          process.join(timeout=60)
+
+  def _CreateProcessingConfiguration(self):
+    """Creates a processing configuration.
+
+    Returns:
+      ProcessingConfiguration: processing configuration.
+    """
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = self._data_location
+    configuration.temporary_directory = self._temporary_directory
+    return configuration
+
+  def _GetEvents(self):
+    """Retrieves the events, with their event data, from the storage file.
+
+    Returns:
+      list[EventObject]: events in chronological order.
+    """
+    if self._events is None:
+      storage_reader = self._OpenStorageReader()
+
+      self._events = []
+      try:
+        for event in storage_reader.GetSortedEvents():
+          event_data_identifier = event.GetEventDataIdentifier()
+          if event_data_identifier:
+            event_data = storage_reader.GetEventDataByIdentifier(
+                event_data_identifier)
+            if event_data:
+              for attribute_name, attribute_value in event_data.GetAttributes():
+                setattr(event, attribute_name, attribute_value)
+
+          self._events.append(event)
+
+      finally:
+        storage_reader.Close()
+
+    return self._events
+
+  def _GetHashSetDigests(self):
+    """Retrieves synthetic MD5 digests of a known file hash set.
+
+    Returns:
+      list[bytes]: binary digests.
+    """
+    if self._hash_set_digests is None:
+      self._hash_set_digests = [
+          hashlib.md5('{0:d}'.format(index).encode('ascii')).digest()
+          for index in range(self._NUMBER_OF_HASH_SET_DIGESTS)]
+
+    return self._hash_set_digests
+
+  def _GetSourcePathSpec(self):
+    """Retrieves the path specification of the corpus.
+
+    Returns:
+      dfvfs.PathSpec: path specification of the corpus.
+    """
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=self._corpus.path)
+
+  def _GetUSNRecordsData(self):
+    """Retrieves synthetic USN change journal records.
+
+    Returns:
+      list[bytes]: data of the USN_RECORD_V2 records.
+    """
+    if self._usn_records_data is None:
+      self._usn_records_data = []
+
+      update_date_time = 130933917272031250
+      for record_index in range(self._NUMBER_OF_USN_RECORDS):
+        name_data = 'file{0:d}.txt'.format(record_index).encode('utf-16-le')
+        record_size = 60 + len(name_data)
+        record_size += (8 - (record_size % 8)) % 8
+
+        header_data = struct.pack(
+            '<IHHQQQQIIIIHH', record_size, 2, 0,
+            0x0001000000000000 | record_index, 0x0005000000000005,
+            record_index * record_size, update_date_time, 0x00000100, 0, 0,
+            0x00000020, len(name_data), 60)
+
+        self._usn_records_data.append(b''.join([
+            header_data, name_data,
+            b'\x00' * (record_size - 60 - len(name_data))]))
+
+        update_date_time += 10000
+
+    return self._usn_records_data
+
+  def _OpenStorageReader(self):
+    """Opens a storage reader of the single process extraction storage file.
+
+    Returns:
+      StorageReader: storage reader.
+
+    Raises:
+      RuntimeError: if the single process extraction did not run.
+    """
+    if not self._storage_file_path:
+      raise RuntimeError(
+          'Missing storage file, single process extraction did not run.')
+
+    return storage_factory.StorageFactory.CreateStorageReaderForFile(
+        self._storage_file_path)
+
+  def _RunBenchmark(self, name, function, *args):
+    """Runs a benchmark.
+
+    Args:
+      name (str): name of the benchmark.
+      function (function): function that runs the benchmark.
+      args (list[object]): additional arguments of the function.
+
+    Returns:
+      BenchmarkResult: benchmark result.
+    """
+    result = BenchmarkResult(name)
+    try:
+      function(result, *args)
+    except Exception as exception:  # pylint: disable=broad-except
+      result.error = '{0!s}'.format(exception)
+
+    return result
+
+  def Run(self, benchmark_names):
+    """Runs benchmarks.
+
+    Args:
+      benchmark_names (list[str]): names of the benchmarks to run.
+
+    Yields:
+      BenchmarkResult: benchmark result.
+    """
+    functions = {
+        'browser_search': self._BenchmarkBrowserSearch,
+        'cli_startup': self._BenchmarkCLIStartup,
+        'event_filter': self._BenchmarkEventFilter,
+        'get_events': self._BenchmarkGetEvents,
+        'get_sorted_events': self._BenchmarkGetSortedEvents,
+        'multi_process_extraction': self._BenchmarkMultiProcessExtraction,
+        'tagging': self._BenchmarkTagging,
+        'task_merge': self._BenchmarkTaskMerge,
+        'unique_domains_visited': self._BenchmarkUniqueDomainsVisited,
+        'winreg': self._BenchmarkWinRegistryParser}
+
+    # The storage, filter, tagging and export benchmarks depend on the
+    # storage file produced by the single process extraction.
+    yield self._RunBenchmark(
+        'single_process_extraction', self._BenchmarkSingleProcessExtraction)
+
+    for name in self.BENCHMARK_NAMES[1:]:
+      if name not in benchmark_names:
+        continue
+
+      if name.startswith('4n6time_'):
+        yield self._RunBenchmark(
+            name, self._Benchmark4n6TimeOutputModule, name)
+        continue
+
+      if name.startswith('hash_lookup_'):
+        yield self._RunBenchmark(
+            name, self._BenchmarkHashLookup,
+            name == 'hash_lookup_local_hashset')
+        continue
+
+      if name.startswith('usnjrnl_'):
+        yield self._RunBenchmark(
+            name, self._BenchmarkUSNRecordDecoding,
+            name == 'usnjrnl_dtfabric')
+        continue
+
+      if name.startswith('worker_startup'):
+        yield self._RunBenchmark(
+            name, self._BenchmarkWorkerStartup,
+            name == 'worker_startup_preinitialized')
+        continue
+
+      if name != 'output':
+        yield self._RunBenchmark(name, functions[name])
+        continue
+
+      output_classes = sorted(
+          output_manager.OutputManager.GetOutputClasses())
+      for output_module_name, _ in output_classes:
+        if output_module_name in self._OUTPUT_MODULES_REQUIRING_SERVER:
+          continue
+
+        yield self._RunBenchmark(
+            'output_{0:s}'.format(output_module_name),
+            self._BenchmarkOutputModule, output_module_name)
+
+
+def CompareResults(previous_results, results, threshold):
+  """Compares benchmark results with those of a previous run.
+
+  Args:
+    previous_results (dict[str, object]): previous benchmark results.
+    results (dict[str, object]): benchmark results.
+    threshold (float): percentage of decrease in events per second that is
+        considered a regression.
+
+  Returns:
+    list[str]: names of the benchmarks that regressed.
+  """
+  regressions = []
+
+  previous_benchmarks = previous_results.get('benchmarks', {})
+  for name, result_dict in sorted(results['benchmarks'].items()):
+    previous_result_dict = previous_benchmarks.get(name, None)
+    if not previous_result_dict:
+      continue
+
+    previous_events_per_second = previous_result_dict.get(
+        'events_per_second', 0.0)
+    events_per_second = result_dict.get('events_per_second', 0.0)
+    if not previous_events_per_second or not events_per_second:
+      continue
+
+    change = ((events_per_second - previous_events_per_second) /
+              previous_events_per_second) * 100.0
+
+    status = ''
+    if change < -threshold:
+      regressions.append(name)
+      status = ' REGRESSION'
+
+    print('{0:s}: {1:.2f} -> {2:.2f} events/s ({3:+.1f}%){4:s}'.format(
+        name, previous_events_per_second, events_per_second, change, status))
+
+  return regressions
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the extraction, storage and export hot paths.'))
+
+  argument_parser.add_argument(
+      '--benchmarks', dest='benchmarks', type=str, action='store',
+      default=','.join(BenchmarkRunner.BENCHMARK_NAMES), help=(
+          'comma separated list of the benchmarks to run, supported '
+          'benchmarks are: {0:s}. The single process extraction is always '
+          'run since the other benchmarks use its results.').format(
+              ', '.join(BenchmarkRunner.BENCHMARK_NAMES)))
+
+  argument_parser.add_argument(
+      '--compare', dest='compare_file', type=str, action='store', help=(
+          'path of a JSON file with the results of a previous run to compare '
+          'the results with.'))
+
+  argument_parser.add_argument(
+      '--output', dest='output_file', type=str, action='store', help=(
+          'path of the JSON file to write the results to, by default the '
+          'results are written to stdout.'))
+
+  argument_parser.add_argument(
+      '--scale', dest='scale', type=int, action='store', default=1, help=(
+          'scale factor of the size of the generated input.'))
+
+  argument_parser.add_argument(
+      '--threshold', dest='threshold', type=float, action='store',
+      default=10.0, help=(
+          'percentage of decrease in events per second that is considered '
+          'a regression when comparing results.'))
+
+  argument_parser.add_argument(
+      '--workers', dest='workers', type=int, action='store', default=0, help=(
+          'number of worker processes of the multi-process extraction.'))
+
+  options = argument_parser.parse_args()
+
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  benchmark_names = [
+      name.strip() for name in options.benchmarks.split(',') if name.strip()]
+  unsupported_names = set(benchmark_names).difference(
+      BenchmarkRunner.BENCHMARK_NAMES)
+  if unsupported_names:
+    print('Unsupported benchmarks: {0:s}'.format(
+        ', '.join(sorted(unsupported_names))))
+    return False
+
+  previous_results = None
+  if options.compare_file:
+    with io.open(options.compare_file, 'r', encoding='utf-8') as file_object:
+      previous_results = json.load(file_object)
+
+  source_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+  data_location = os.path.join(source_path, 'data')
+  test_data_path = os.path.join(source_path, 'test_data')
+
+  temporary_directory = tempfile.mkdtemp(prefix='plaso-benchmark-')
+  try:
+    corpus_path = os.path.join(temporary_directory, 'corpus')
+    os.mkdir(corpus_path)
+
+    corpus = BenchmarkCorpus(corpus_path, test_data_path)
+    corpus.Generate(scale=options.scale)
+
+    runner = BenchmarkRunner(
+        corpus, data_location, temporary_directory,
+        number_of_worker_processes=options.workers)
+
+    benchmarks = {}
+    for result in runner.Run(benchmark_names):
+      benchmarks[result.name] = result.CopyToDict()
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  results = {
+      'benchmarks': benchmarks,
+      'platform': platform.platform(),
+      'plaso_version': plaso.__version__,
+      'python_version': platform.python_version(),
+      'scale': options.scale,
+      'timestamp': datetime.datetime.utcnow().isoformat()}
+
+  output_data = json.dumps(results, indent=2, sort_keys=True)
+  if options.output_file:
+    with io.open(options.output_file, 'w', encoding='utf-8') as file_object:
+      file_object.write('{0:s}\n'.format(output_data))
+  else:
+    print(output_data)
+
+  if previous_results:
+    regressions = CompareResults(previous_results, results, options.threshold)
+    if regressions:
+      return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
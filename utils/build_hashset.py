@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to build a hash set file for the local_hashset analysis plugin.
+
+The hash set file is built from hash lists, such as the NSRL Reference Data
+Set (RDS) NSRLFile.txt or plain-text lists of hexadecimal digests. To compact
+a hash set file with delta hash lists, pass the hash set file as both the
+output and a --merge hash set file, for example:
+
+  python utils/build_hashset.py --hash md5 nsrl.hashset NSRLFile.txt
+  python utils/build_hashset.py --hash md5 --merge nsrl.hashset \
+      nsrl.hashset delta.txt
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import sys
+import time
+
+from plaso.analysis import local_hashset
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Builds a hash set file for the local_hashset analysis plugin.'))
+
+  argument_parser.add_argument(
+      '--hash', dest='hash_type', type=str, action='store', default='md5',
+      choices=local_hashset.LocalHashSetAnalyzer.SUPPORTED_HASHES, help=(
+          'type of hash of the digests in the hash lists, the default is: '
+          'md5.'))
+
+  argument_parser.add_argument(
+      '--memory_digests', '--memory-digests', dest='memory_digests',
+      type=int, action='store', default=1000000, help=(
+          'maximum number of digests to sort in memory before they are '
+          'written to a temporary file, the default is: 1000000.'))
+
+  argument_parser.add_argument(
+      '--merge', dest='merge_paths', action='append', default=[],
+      metavar='PATH', help=(
+          'path of an existing hash set file to merge into the output, can '
+          'be specified multiple times.'))
+
+  argument_parser.add_argument(
+      'output_path', type=str, help='path of the hash set file to write.')
+
+  argument_parser.add_argument(
+      'hash_list_paths', type=str, nargs='*', metavar='HASH_LIST', help=(
+          'path of an NSRL RDS NSRLFile.txt or a plain-text hash list.'))
+
+  options = argument_parser.parse_args()
+
+  if not options.hash_list_paths and not options.merge_paths:
+    print('Missing hash lists or hash set files to merge.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  if options.memory_digests < 1:
+    print('Invalid maximum number of digests to sort in memory.')
+    return False
+
+  for path in options.hash_list_paths + options.merge_paths:
+    if not os.path.isfile(path):
+      print('No such file: {0:s}'.format(path))
+      return False
+
+  start_time = time.time()
+
+  writer = local_hashset.HashSetFileWriter(
+      options.hash_type,
+      maximum_number_of_digests_in_memory=options.memory_digests)
+
+  try:
+    for path in options.merge_paths:
+      try:
+        writer.AddHashSetFile(path)
+      except (IOError, OSError) as exception:
+        print('Unable to merge hash set file: {0:s} with error: {1!s}'.format(
+            path, exception))
+        return False
+
+    for path in options.hash_list_paths:
+      try:
+        number_of_digests, number_of_invalid_lines = writer.AddHashList(path)
+      except ValueError as exception:
+        print('Unable to read hash list: {0:s} with error: {1!s}'.format(
+            path, exception))
+        return False
+
+      print('Read {0:d} digests from: {1:s}'.format(number_of_digests, path))
+      if number_of_invalid_lines:
+        print('Skipped {0:d} lines without a {1:s} digest.'.format(
+            number_of_invalid_lines, options.hash_type))
+
+    number_of_digests = writer.Write(options.output_path)
+
+  finally:
+    writer.Close()
+
+  print('Wrote {0:d} unique digests to: {1:s} in {2:.1f} seconds.'.format(
+      number_of_digests, options.output_path, time.time() - start_time))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)